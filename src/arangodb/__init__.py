@@ -24,90 +24,105 @@ Example Usage:
 
 __version__ = "0.1.0"
 
-# Core database connections
-from .core.arango_setup import connect_arango
-from .core.utils.config_validator import ArangoConfig
-from .core.db_connection_wrapper import DatabaseOperations
-from .core.db_operations import (
-    create_document,
-    get_document,
-    update_document,
-    delete_document,
-    query_documents,
-    create_message,
-    get_message,
-    update_message,
-    delete_message,
-    get_conversation_messages,
-    delete_conversation,
-    link_message_to_document,
-    get_documents_for_message,
-    get_messages_for_document,
-    create_relationship,
-    delete_relationship_by_key
-)
-
-# Memory management
-from .core.memory import (
-    MemoryAgent,
-    EpisodeManager,
-    ContradictionLogger
-)
-
-# Search functionality
-from .core.search import (
-    semantic_search,
-    hybrid_search,
-    bm25_search,
-    cross_encoder_rerank,
-    tag_search,
-    graph_traverse
-)
-
-# Graph operations
-from .core.graph import (
-    create_temporal_relationship,
-    create_edge_from_cli,
-    graph_traverse as graph_traverse_from_graph
-)
-
-# Models
-from .core.models import (
-    DocumentReference,
-    SearchResult,
-    TemporalEntity
-)
-
-# Q&A Generation
-from .qa_generation import (
-    QAGenerator,
-    QAValidator,
-    QAExporter
-)
-
-# Visualization
-from .visualization import (
-    D3VisualizationEngine,
-    DataTransformer
-)
-
-# Dashboard
-from .dashboard import DashboardManager
-
-# MCP Server
-from .mcp import (
-    mcp_bm25_search,
-    mcp_semantic_search,
-    mcp_hybrid_search,
-    mcp_create_document,
-    mcp_get_document
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.utils.config_validator import ArangoConfig
+
+# Public names and the modules they come from. They are imported on first
+# attribute access so that `import arangodb` (and with it every CLI start)
+# does not load the search, memory, Q&A and visualization stacks.
+_LAZY_EXPORTS = {
+    # Core database connections
+    "connect_arango": ".core.arango_setup",
+    "ArangoConfig": ".core.utils.config_validator",
+    "DatabaseOperations": ".core.db_connection_wrapper",
+    "create_document": ".core.db_operations",
+    "get_document": ".core.db_operations",
+    "update_document": ".core.db_operations",
+    "delete_document": ".core.db_operations",
+    "query_documents": ".core.db_operations",
+    "create_message": ".core.db_operations",
+    "get_message": ".core.db_operations",
+    "update_message": ".core.db_operations",
+    "delete_message": ".core.db_operations",
+    "get_conversation_messages": ".core.db_operations",
+    "delete_conversation": ".core.db_operations",
+    "link_message_to_document": ".core.db_operations",
+    "get_documents_for_message": ".core.db_operations",
+    "get_messages_for_document": ".core.db_operations",
+    "create_relationship": ".core.db_operations",
+    "delete_relationship_by_key": ".core.db_operations",
+
+    # Memory management
+    "MemoryAgent": ".core.memory",
+    "EpisodeManager": ".core.memory",
+    "ContradictionLogger": ".core.memory",
+
+    # Search functionality
+    "semantic_search": ".core.search",
+    "hybrid_search": ".core.search",
+    "bm25_search": ".core.search",
+    "cross_encoder_rerank": ".core.search",
+    "tag_search": ".core.search",
+    "graph_traverse": ".core.search",
+
+    # Graph operations
+    "create_temporal_relationship": ".core.graph",
+    "create_edge_from_cli": ".core.graph",
+
+    # Models
+    "DocumentReference": ".core.models",
+    "SearchResult": ".core.models",
+    "TemporalEntity": ".core.models",
+
+    # Q&A Generation
+    "QAGenerator": ".qa_generation",
+    "QAValidator": ".qa_generation",
+    "QAExporter": ".qa_generation",
+
+    # Visualization
+    "D3VisualizationEngine": ".visualization",
+    "DataTransformer": ".visualization",
+
+    # Dashboard
+    "DashboardManager": ".dashboard",
+
+    # MCP Server
+    "mcp_bm25_search": ".mcp",
+    "mcp_semantic_search": ".mcp",
+    "mcp_hybrid_search": ".mcp",
+    "mcp_create_document": ".mcp",
+    "mcp_get_document": ".mcp",
+}
+
+# Exported under a different name than in its module
+_LAZY_ALIASES = {
+    "graph_traverse_from_graph": (".core.graph", "graph_traverse"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module_name, attribute = _LAZY_EXPORTS[name], name
+    elif name in _LAZY_ALIASES:
+        module_name, attribute = _LAZY_ALIASES[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_LAZY_ALIASES))
 
 # Create convenience client class
 class ArangoDBClient:
     """Main client for ArangoDB operations"""
     
-    def __init__(self, config: ArangoConfig = None):
+    def __init__(self, config: "ArangoConfig" = None):
         """Initialize ArangoDBClient
         
         Args:
@@ -119,6 +134,8 @@ class ArangoDBClient:
         
     def connect(self):
         """Connect to ArangoDB"""
+        from .core.arango_setup import connect_arango
+        
         # connect_arango uses environment variables, not config parameter
         self._db = connect_arango()
         return self._db
@@ -132,6 +149,8 @@ class ArangoDBClient:
         
     def get_operations(self):
         """Get DatabaseOperations instance"""
+        from .core.db_connection_wrapper import DatabaseOperations
+        
         return DatabaseOperations(self.db)
 
 # Export main interfaces
@@ -6,6 +6,10 @@ This module provides database connection handling for the CLI layer,
 connecting to the ArangoDB instance and ensuring all necessary collections,
 graphs, and views exist before executing commands.
 
+Connections come from the process-wide ConnectionManager, so repeated calls
+reuse one pooled HTTP session, and the ensure-* checks run once per schema
+version rather than on every command.
+
 Functions:
 - get_db_connection(): Connects to ArangoDB and ensures required structures
 
@@ -27,14 +31,13 @@ from arangodb.core.utils.dependency_checker import HAS_ARANGO
 
 # Import from core layer for connection handling - these functions check for ArangoDB availability
 from arangodb.core.arango_setup import (
-    connect_arango,
-    ensure_database,
     ensure_collection,
     ensure_edge_collections,
     ensure_graph,
     ensure_memory_agent_collections,
     ensure_arangosearch_view
 )
+from arangodb.core.connection_manager import get_connection_manager
 
 # Import constants from core
 from arangodb.core.constants import (
@@ -51,6 +54,47 @@ from arangodb.core.constants import (
 # Initialize Rich console
 console = Console()
 
+def _ensure_cli_schema(db) -> bool:
+    """
+    Ensure the graph and Memory Agent structures CLI commands rely on.
+    
+    Failures are logged as warnings and do not fail the connection.
+    
+    Returns:
+        True if every check succeeded
+    """
+    ok = True
+    
+    # Ensure graph components exist upon connection
+    try:
+        logger.debug("Ensuring edge collection and graph definition exist...")
+        ensure_edge_collections(db)
+        ensure_graph(db, GRAPH_NAME, EDGE_COLLECTION_NAME, COLLECTION_NAME)
+        logger.debug("Edge collection and graph definition checked/ensured.")
+    except Exception as setup_e:
+        ok = False
+        logger.warning(
+            f"Graph/Edge setup check failed during connection: {setup_e}. Relationship/Traversal commands might fail."
+        )
+    
+    # Ensure Memory Agent components exist
+    try:
+        logger.debug("Ensuring Memory Agent collections and views exist...")
+        ensure_memory_agent_collections(db)
+        
+        # Ensure memory graph exists
+        logger.debug("Ensuring Memory graph exists...")
+        ensure_graph(db, MEMORY_GRAPH_NAME, MEMORY_EDGE_COLLECTION, MEMORY_COLLECTION)
+        
+        logger.debug("Memory Agent collections, views, and graph checked/ensured.")
+    except Exception as memory_e:
+        ok = False
+        logger.warning(
+            f"Memory Agent setup check failed during connection: {memory_e}. Memory commands might fail."
+        )
+    
+    return ok
+
 def get_db_connection():
     """
     Helper to connect and get DB object, handling errors.
@@ -72,46 +116,15 @@ def get_db_connection():
         raise typer.Exit(code=1)
         
     try:
-        logger.debug("Attempting to connect to ArangoDB...")
-        client = connect_arango()
-        if not client:
-            raise ConnectionError("connect_arango() returned None")
-        
-        logger.debug(f"Ensuring database '{ARANGO_DB_NAME}' exists...")
-        db = ensure_database(client)
+        logger.debug("Getting pooled ArangoDB connection...")
+        db = get_connection_manager().get_database()
         if not db:
             raise ConnectionError(
-                f"ensure_database() returned None for '{ARANGO_DB_NAME}'"
+                f"Connection manager returned no database for '{ARANGO_DB_NAME}'"
             )
         logger.debug(f"Successfully connected to database '{db.name}'.")
 
-        # Ensure graph components exist upon connection
-        try:
-            logger.debug("Ensuring edge collection and graph definition exist...")
-            ensure_edge_collections(db)
-            ensure_graph(db, GRAPH_NAME, EDGE_COLLECTION_NAME, COLLECTION_NAME)
-            logger.debug("Edge collection and graph definition checked/ensured.")
-        except Exception as setup_e:
-            # Log warning but don't fail connection
-            logger.warning(
-                f"Graph/Edge setup check failed during connection: {setup_e}. Relationship/Traversal commands might fail."
-            )
-        
-        # Ensure Memory Agent components exist
-        try:
-            logger.debug("Ensuring Memory Agent collections and views exist...")
-            ensure_memory_agent_collections(db)
-            
-            # Ensure memory graph exists
-            logger.debug("Ensuring Memory graph exists...")
-            ensure_graph(db, MEMORY_GRAPH_NAME, MEMORY_EDGE_COLLECTION, MEMORY_COLLECTION)
-            
-            logger.debug("Memory Agent collections, views, and graph checked/ensured.")
-        except Exception as memory_e:
-            # Log warning but don't fail connection
-            logger.warning(
-                f"Memory Agent setup check failed during connection: {memory_e}. Memory commands might fail."
-            )
+        get_connection_manager().ensure_schema(db, "cli", _ensure_cli_schema)
 
         return db
     except Exception as e:
@@ -157,7 +170,7 @@ if __name__ == "__main__":
     total_tests += 1
     try:
         # Test import paths
-        test_result = "connect_arango" in globals() and "ensure_database" in globals()
+        test_result = "ensure_collection" in globals() and "ensure_graph" in globals()
         if not test_result:
             all_validation_failures.append("Failed to import core arango_setup functions")
         else:
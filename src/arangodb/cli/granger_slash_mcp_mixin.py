@@ -41,7 +41,7 @@ def add_slash_mcp_commands(
     skip_commands: Optional[Set[str]] = None,
     command_prefix: str = "generate",
     output_dir: str = ".claude/commands",
-    prompt_registry: Optional[PromptRegistry] = None,
+    prompt_registry: Optional["PromptRegistry"] = None,
     enable_fastmcp_server: bool = True
 ) -> typer.Typer:
     """
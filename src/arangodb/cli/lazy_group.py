@@ -0,0 +1,72 @@
+"""
+Lazy Subcommand Loading for the CLI
+Module: lazy_group.py
+Description: Typer group that imports sub-apps only when their command runs
+
+Importing every command module up front pulls in the search, memory, Q&A and
+visualization stacks (and through them torch, transformers, spaCy, litellm)
+before argv is even parsed. `lazy_group` builds a TyperGroup class whose
+sub-apps are given as "module:attribute" import paths. Until a subcommand is
+invoked it is represented by a placeholder carrying only its help text, so
+`arangodb --help` and `arangodb crud get ...` import nothing they do not use.
+
+Sample Input:
+>>> app = typer.Typer(cls=lazy_group({
+...     "crud": ("arangodb.cli.crud_commands:crud_app", "CRUD operations"),
+... }))
+
+Expected Output:
+>>> # `arangodb crud list users` imports arangodb.cli.crud_commands only
+"""
+
+import importlib
+from typing import Dict, Tuple, Type
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class _LazySubcommand(TyperCommand):
+    """Stand-in listed in help output until the real sub-app is imported."""
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup resolving `lazy_subcommands` on first invocation."""
+
+    # name -> ("package.module:attribute", help text)
+    lazy_subcommands: Dict[str, Tuple[str, str]] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name, (_, help_text) in self.lazy_subcommands.items():
+            if name not in self.commands:
+                self.commands[name] = _LazySubcommand(name=name, help=help_text, short_help=help_text)
+
+    def resolve_command(self, ctx, args):
+        if args and isinstance(self.commands.get(args[0]), _LazySubcommand):
+            self.commands[args[0]] = self.load_subcommand(args[0])
+        return super().resolve_command(ctx, args)
+
+    def load_subcommand(self, name: str):
+        """Import the sub-app registered as `name` and convert it to a click group."""
+        import_path, help_text = self.lazy_subcommands[name]
+        module_name, attribute = import_path.split(":", 1)
+        sub_app = getattr(importlib.import_module(module_name), attribute)
+        group = typer.main.get_group(sub_app)
+        group.name = name
+        group.help = help_text
+        group.short_help = help_text
+        return group
+
+
+def lazy_group(subcommands: Dict[str, Tuple[str, str]]) -> Type[LazyTyperGroup]:
+    """
+    Create a LazyTyperGroup subclass for `typer.Typer(cls=...)`.
+
+    Args:
+        subcommands: Mapping of command name to ("module:attribute", help text)
+
+    Returns:
+        Group class that registers the sub-apps lazily
+    """
+    return type("LazyCommandGroup", (LazyTyperGroup,), {"lazy_subcommands": dict(subcommands)})
@@ -14,50 +14,38 @@ from loguru import logger
 from arangodb.core.utils.cli.formatters import console
 from arangodb.core.utils.cli.formatters import format_info, format_success
 
-# Import all command groups
-from arangodb.cli.crud_commands import crud_app
-from arangodb.cli.search_commands import search_app
-from arangodb.cli.search_config_commands import app as search_config_app
-from arangodb.cli.memory_commands import memory_app
-# from arangodb.cli.validate_commands import app as validate_app  # File doesn't exist
-from arangodb.cli.episode_commands import app as episode_app
-from arangodb.cli.community_commands import app as community_app
-from arangodb.cli.graph_commands import graph_app
-from arangodb.cli.compaction_commands import compaction_app
-from arangodb.cli.contradiction_commands import app as contradiction_app
-from arangodb.cli.temporal_commands import app as temporal_app
-from arangodb.cli.visualization_commands import app as visualization_app
-from arangodb.cli.qa_commands import app as qa_app
-from arangodb.cli.agent_commands import app as agent_app
-from arangodb.cli.sparta_commands import app as sparta_app
-
 # Import MCP mixin
 from arangodb.cli.granger_slash_mcp_mixin import add_slash_mcp_commands
+from arangodb.cli.lazy_group import lazy_group
+
+# Command groups, imported only when their command runs so that startup does
+# not load the search, embedding and visualization stacks
+COMMAND_GROUPS = {
+    "crud": ("arangodb.cli.crud_commands:crud_app", "CRUD operations for any collection"),
+    "search": ("arangodb.cli.search_commands:search_app", "Search operations with multiple algorithms"),
+    "search-config": ("arangodb.cli.search_config_commands:app", "Search configuration management"),
+    "memory": ("arangodb.cli.memory_commands:memory_app", "Memory and conversation management"),
+    # "validate": ("arangodb.cli.validate_commands:app", "Memory validation and verification"),  # Module doesn't exist
+    "episode": ("arangodb.cli.episode_commands:app", "Episode management"),
+    "community": ("arangodb.cli.community_commands:app", "Community detection and management"),
+    "graph": ("arangodb.cli.graph_commands:graph_app", "Graph relationship operations"),
+    "compaction": ("arangodb.cli.compaction_commands:compaction_app", "Conversation compaction operations"),
+    "contradiction": ("arangodb.cli.contradiction_commands:app", "Contradiction detection and resolution"),
+    "temporal": ("arangodb.cli.temporal_commands:app", "Temporal operations and queries"),
+    "visualize": ("arangodb.cli.visualization_commands:app", "D3.js visualization generation"),
+    "qa": ("arangodb.cli.qa_commands:app", "Q&A generation for LLM fine-tuning"),
+    "agent": ("arangodb.cli.agent_commands:app", "Inter-module communication"),
+    "sparta": ("arangodb.cli.sparta_commands:app", "SPARTA space cybersecurity threat matrix"),
+}
 
 # Create main app
 app = typer.Typer(
     name="arangodb",
     help="ArangoDB Memory Bank CLI - Consistent and powerful interface",
-    context_settings={"help_option_names": ["-h", "--help"]}
+    context_settings={"help_option_names": ["-h", "--help"]},
+    cls=lazy_group(COMMAND_GROUPS)
 )
 
-# Add all command groups
-app.add_typer(crud_app, name="crud", help="CRUD operations for any collection")
-app.add_typer(search_app, name="search", help="Search operations with multiple algorithms")
-app.add_typer(search_config_app, name="search-config", help="Search configuration management")
-app.add_typer(memory_app, name="memory", help="Memory and conversation management")
-# app.add_typer(validate_app, name="validate", help="Memory validation and verification")  # Module doesn't exist
-app.add_typer(episode_app, name="episode", help="Episode management")
-app.add_typer(community_app, name="community", help="Community detection and management")
-app.add_typer(graph_app, name="graph", help="Graph relationship operations")
-app.add_typer(compaction_app, name="compaction", help="Conversation compaction operations")
-app.add_typer(contradiction_app, name="contradiction", help="Contradiction detection and resolution")
-app.add_typer(temporal_app, name="temporal", help="Temporal operations and queries")
-app.add_typer(visualization_app, name="visualize", help="D3.js visualization generation")
-app.add_typer(qa_app, name="qa", help="Q&A generation for LLM fine-tuning")
-app.add_typer(agent_app, name="agent", help="Inter-module communication")
-app.add_typer(sparta_app, name="sparta", help="SPARTA space cybersecurity threat matrix")
-
 # Generic CRUD commands are available under 'crud' command group
 
 # Global options
@@ -8,7 +8,7 @@ using documents and relationships stored in ArangoDB. It generates question-answ
 pairs suitable for LLM fine-tuning.
 
 Key Commands:
-- generate: Generate Q&A pairs from a document
+- generate: Generate Q&A pairs from one or more documents
 - export: Export Q&A pairs in various formats
 - validate: Validate generated Q&A pairs
 - stats: Show Q&A generation statistics
@@ -18,6 +18,7 @@ External Documentation:
 - Rich: https://rich.readthedocs.io/
 """
 
+import asyncio
 import typer
 import json
 from pathlib import Path
@@ -49,7 +50,7 @@ app = typer.Typer()
 
 @app.command("generate", no_args_is_help=True)
 def generate_qa_pairs(
-    document_id: str = typer.Argument(..., help="Document ID to generate Q&A from"),
+    document_ids: List[str] = typer.Argument(..., help="Document ID(s) to generate Q&A from"),
     max_questions: int = typer.Option(
         50,
         "--max-questions",
@@ -75,7 +76,12 @@ def generate_qa_pairs(
         help="Number of concurrent requests"
     )
 ):
-    """Generate Q&A pairs from a document stored in ArangoDB."""
+    """Generate Q&A pairs from one or more documents stored in ArangoDB.
+    
+    Documents are processed in order by one generator, which prefetches the
+    next document's sections and relationships while the current one is
+    being generated.
+    """
     try:
         # Get database connection
         db = get_db_connection()
@@ -98,26 +104,31 @@ def generate_qa_pairs(
             batch_size=batch_size,
             semaphore_limit=min(batch_size, 10)
         )
+        if question_types:
+            config.question_type_weights = {t: 1.0 / len(types) for t in types}
         
         # Create generator
         generator = MarkerAwareQAGenerator(db, config)
         
         # Generate Q&A pairs
-        console.print(format_info(f"Generating Q&A pairs for document: {document_id}"))
-        qa_batch = generator.generate_from_document(
-            document_id,
-            max_questions=max_questions,
-            question_types=types
-        )
+        console.print(format_info(f"Generating Q&A pairs for {len(document_ids)} document(s): {', '.join(document_ids)}"))
+        try:
+            qa_batches = asyncio.run(generator.generate_for_documents(document_ids, max_pairs=max_questions))
+        finally:
+            generator.close()
         
         # Prepare output
-        result = {
-            "document_id": document_id,
-            "total_pairs": qa_batch.total_pairs,
-            "valid_pairs": qa_batch.valid_pairs,
-            "generation_time": qa_batch.generation_time,
-            "qa_pairs": [qa.dict() for qa in qa_batch.qa_pairs]
-        }
+        results = [
+            {
+                "document_id": document_id,
+                "total_pairs": qa_batch.total_pairs,
+                "valid_pairs": qa_batch.valid_pairs,
+                "generation_time": qa_batch.generation_time,
+                "qa_pairs": [qa.dict() for qa in qa_batch.qa_pairs]
+            }
+            for document_id, qa_batch in zip(document_ids, qa_batches)
+        ]
+        result = results[0] if len(results) == 1 else results
         
         # Save to file if specified
         if output_file:
@@ -127,34 +138,35 @@ def generate_qa_pairs(
         
         # Format output
         if output_format == "table":
-            # Create summary table
-            from rich.table import Table
-            table = Table(title="Q&A Generation Summary")
-            table.add_column("Metric", style="cyan")
-            table.add_column("Value", style="green")
+            for document_id, qa_batch in zip(document_ids, qa_batches):
+                # Create summary table
+                from rich.table import Table
+                table = Table(title="Q&A Generation Summary")
+                table.add_column("Metric", style="cyan")
+                table.add_column("Value", style="green")
             
-            table.add_row("Document ID", document_id)
-            table.add_row("Total Pairs", str(qa_batch.total_pairs))
-            table.add_row("Valid Pairs", str(qa_batch.valid_pairs))
-            table.add_row("Validation Rate", f"{(qa_batch.valid_pairs/qa_batch.total_pairs*100):.1f}%")
-            table.add_row("Generation Time", f"{qa_batch.generation_time:.2f}s")
+                table.add_row("Document ID", document_id)
+                table.add_row("Total Pairs", str(qa_batch.total_pairs))
+                table.add_row("Valid Pairs", str(qa_batch.valid_pairs))
+                table.add_row("Validation Rate", f"{(qa_batch.valid_pairs/qa_batch.total_pairs*100):.1f}%")
+                table.add_row("Generation Time", f"{qa_batch.generation_time:.2f}s")
             
-            console.print(table)
+                console.print(table)
             
-            # Sample questions
-            if qa_batch.qa_pairs:
-                sample_table = Table(title="Sample Questions")
-                sample_table.add_column("Type", style="cyan")
-                sample_table.add_column("Question", style="white")
-                sample_table.add_column("Score", style="green")
+                # Sample questions
+                if qa_batch.qa_pairs:
+                    sample_table = Table(title="Sample Questions")
+                    sample_table.add_column("Type", style="cyan")
+                    sample_table.add_column("Question", style="white")
+                    sample_table.add_column("Score", style="green")
                 
-                for qa in qa_batch.qa_pairs[:5]:
-                    sample_table.add_row(
-                        qa.question_type.value,
-                        qa.question[:80] + "..." if len(qa.question) > 80 else qa.question,
-                        f"{qa.validation_score:.2f}" if qa.validation_score else "N/A"
-                    )
-                console.print(sample_table)
+                    for qa in qa_batch.qa_pairs[:5]:
+                        sample_table.add_row(
+                            qa.question_type.value,
+                            qa.question[:80] + "..." if len(qa.question) > 80 else qa.question,
+                            f"{qa.validation_score:.2f}" if qa.validation_score else "N/A"
+                        )
+                    console.print(sample_table)
         else:
             console.print(format_output(result, output_format))
         
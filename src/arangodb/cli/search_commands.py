@@ -323,6 +323,7 @@ def search_hybrid(
     tags: Optional[str] = typer.Option(None, "--tags", help="Filter by tags (comma-separated)"),
     use_graph: bool = typer.Option(False, "--use-graph", help="Include graph traversal in search"),
     use_perplexity: bool = typer.Option(False, "--use-perplexity", help="Enrich results with Perplexity API"),
+    server_side: bool = typer.Option(False, "--server-side", help="Fuse BM25 and semantic results in one AQL query"),
 ):
     """
     Find documents using combined BM25 and semantic search with RRF re-ranking.
@@ -341,6 +342,7 @@ def search_hybrid(
         arangodb search hybrid --query "database optimization"
         arangodb search hybrid --query "AI ethics" --bm25-weight 0.3 --semantic-weight 0.7
         arangodb search hybrid --query "graph algorithms" --use-graph --output json
+        arangodb search hybrid --query "vector indexes" --server-side
     """
     logger.info(f"Hybrid search: query='{query}', collection={collection}")
     
@@ -387,7 +389,8 @@ def search_hybrid(
             top_n=limit,
             output_format="json",  # We need raw data for our formatter
             use_graph=use_graph,
-            use_perplexity=use_perplexity
+            use_perplexity=use_perplexity,
+            server_side=server_side
         )
         search_time = (datetime.now() - start_time).total_seconds() * 1000
         
@@ -598,5 +601,90 @@ def search_graph(
             console.print(format_error("Graph Search Failed", str(e)))
         raise typer.Exit(1)
 
+@search_app.command("export-snapshot")
+
+def search_export_snapshot(
+    collection: str = typer.Option("documents", "--collection", "-c", help="Collection to export"),
+    field: str = typer.Option("embedding", "--field", "-f", help="Embedding field to export"),
+    dtype: str = typer.Option("float32", "--dtype", help="Storage precision: float32, float16 or int8"),
+    keep_exact: bool = typer.Option(False, "--keep-exact", help="Also store float32 vectors for exact re-scoring"),
+    snapshot_dir: Optional[str] = typer.Option(None, "--snapshot-dir", help="Snapshot root directory"),
+    output_format: OutputFormat = typer.Option(OutputFormat.TABLE, "--output", "-o"),
+):
+    """
+    Export a collection's embeddings to a memory-mapped snapshot.
+    
+    USAGE:
+        arangodb search export-snapshot --collection documents [OPTIONS]
+    
+    WHEN TO USE:
+        Before running many PyTorch searches from fresh processes, so they
+        map the vectors from disk instead of downloading them
+    
+    OUTPUT:
+        - TABLE: Snapshot location and manifest summary
+        - JSON: Complete manifest
+    
+    EXAMPLES:
+        arangodb search export-snapshot --collection research --dtype float16
+        arangodb search export-snapshot --collection research --dtype int8 --keep-exact
+        arangodb search export-snapshot --collection documents --output json
+    """
+    logger.info(f"Exporting embedding snapshot: collection={collection}, field={field}, dtype={dtype}")
+    
+    try:
+        db = get_db_connection()
+        
+        from arangodb.core.search.embedding_snapshot import export_embedding_snapshot, snapshot_path
+        
+        start_time = datetime.now()
+        manifest = export_embedding_snapshot(
+            db=db,
+            collection_name=collection,
+            embedding_field=field,
+            snapshot_dir=snapshot_dir,
+            dtype=dtype,
+            keep_exact=keep_exact
+        )
+        export_time = (datetime.now() - start_time).total_seconds() * 1000
+        path = str(snapshot_path(collection, field, snapshot_dir))
+        
+        if output_format == OutputFormat.JSON:
+            console.print_json(data={
+                "success": True,
+                "data": {"path": path, "manifest": manifest},
+                "metadata": {"timing": {"export_ms": round(export_time, 2)}},
+                "errors": []
+            })
+        else:
+            console.print(format_success(
+                f"Exported {manifest['count']} embeddings from {collection}",
+                [
+                    f"Path: {path}",
+                    f"Dimension: {manifest['dimension']} ({manifest['dtype']})",
+                    f"Model: {manifest['model']}",
+                    f"Max _rev: {manifest['max_rev']}",
+                    f"Time: {export_time:.0f} ms"
+                ]
+            ))
+        
+    except Exception as e:
+        logger.error(f"Snapshot export failed: {e}")
+        error_response = {
+            "success": False,
+            "data": None,
+            "metadata": {},
+            "errors": [{
+                "code": "SNAPSHOT_ERROR",
+                "message": str(e),
+                "suggestion": "Check the collection exists and the snapshot directory is writable"
+            }]
+        }
+        if output_format == OutputFormat.JSON:
+            console.print_json(data=error_response)
+        else:
+            console.print(format_error("Snapshot Export Failed", str(e)))
+        raise typer.Exit(1)
+
 if __name__ == "__main__":
     search_app()
\ No newline at end of file
@@ -0,0 +1,277 @@
+"""
+Connection Manager Module
+Module: connection_manager.py
+Description: Process-wide pooled ArangoDB sessions with cached schema checks
+
+`connect_arango` + `ensure_database` build a new client, verify it against
+`_system` and then every caller re-runs the ensure-* DDL checks. Long-lived
+processes (MCP servers, agent loops) pay that on every command. This module
+keeps one client per host whose HTTP session is a keep-alive connection pool
+(`ARANGO_POOL_SIZE` connections), caches database handles, and records a
+schema fingerprint once the ensure-* checks have succeeded so they run once
+per schema version instead of once per call.
+
+The fingerprint covers `SCHEMA_VERSION`, the host, the database name and the
+database id, so recreating the database or bumping the version re-runs the
+checks. Fingerprints are remembered in memory and as marker files under
+`SCHEMA_CACHE_DIR`, which lets short-lived CLI processes share them. Set
+`ARANGO_SCHEMA_CACHE=false` to always run the checks.
+
+External Dependencies:
+- python-arango: https://python-arango.readthedocs.io/
+
+Sample Input:
+>>> manager = get_connection_manager()
+>>> db = manager.get_database()
+>>> manager.ensure_schema(db, "cli", setup_fn)
+
+Expected Output:
+>>> True   # setup_fn ran (first call) or was skipped (fingerprint cached)
+"""
+
+import hashlib
+import os
+import threading
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from loguru import logger
+
+from arango import ArangoClient
+from arango.database import StandardDatabase
+from arango.http import DefaultHTTPClient
+
+from arangodb.core.constants import (
+    ARANGO_HOST,
+    ARANGO_USER,
+    ARANGO_PASSWORD,
+    ARANGO_DB_NAME,
+    ARANGO_POOL_SIZE,
+    ARANGO_REQUEST_TIMEOUT,
+    SCHEMA_VERSION,
+    SCHEMA_CACHE_DIR,
+)
+
+SCHEMA_CACHE_ENABLED = os.getenv("ARANGO_SCHEMA_CACHE", "true").lower() in ("1", "true", "yes")
+
+
+class ConnectionManager:
+    """Pooled ArangoDB clients and database handles shared by the whole process."""
+
+    def __init__(
+        self,
+        pool_size: int = ARANGO_POOL_SIZE,
+        request_timeout: float = ARANGO_REQUEST_TIMEOUT,
+        schema_cache_dir: Optional[str] = SCHEMA_CACHE_DIR,
+        schema_cache_enabled: bool = SCHEMA_CACHE_ENABLED
+    ):
+        """
+        Initialize the manager; no connection is made until first use.
+
+        Args:
+            pool_size: Keep-alive connections kept per host
+            request_timeout: HTTP request timeout in seconds
+            schema_cache_dir: Directory for schema fingerprint markers (None for memory only)
+            schema_cache_enabled: Whether ensured schemas are remembered at all
+        """
+        self.pool_size = pool_size
+        self.request_timeout = request_timeout
+        self.schema_cache_dir = schema_cache_dir
+        self.schema_cache_enabled = schema_cache_enabled
+        self._clients: Dict[str, ArangoClient] = {}
+        self._databases: Dict[Tuple[str, str, str], StandardDatabase] = {}
+        self._db_hosts: Dict[int, str] = {}
+        # (host, database, scope) ensured by this process, and fingerprints seen
+        self._ensured_scopes: Set[Tuple[str, str, str]] = set()
+        self._ensured: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def get_client(self, host: str = ARANGO_HOST) -> ArangoClient:
+        """Return the pooled client for `host`, creating it on first use."""
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                http_client = DefaultHTTPClient(
+                    request_timeout=self.request_timeout,
+                    pool_connections=self.pool_size,
+                    pool_maxsize=self.pool_size
+                )
+                client = ArangoClient(hosts=host, http_client=http_client)
+                self._clients[host] = client
+                logger.debug(f"Created pooled ArangoDB client for {host} (pool size {self.pool_size})")
+            return client
+
+    def get_database(
+        self,
+        db_name: str = ARANGO_DB_NAME,
+        host: str = ARANGO_HOST,
+        username: str = ARANGO_USER,
+        password: str = ARANGO_PASSWORD
+    ) -> StandardDatabase:
+        """
+        Return a cached database handle, creating the database if needed.
+
+        The first call per (host, database, user) verifies the credentials and
+        creates the database if it is missing; later calls make no requests.
+
+        Args:
+            db_name: Database name
+            host: ArangoDB host URL
+            username: ArangoDB user
+            password: ArangoDB password
+
+        Returns:
+            StandardDatabase sharing the host's connection pool
+        """
+        key = (host, db_name, username)
+        with self._lock:
+            db = self._databases.get(key)
+            if db is not None:
+                return db
+
+            client = self.get_client(host)
+            sys_db = client.db(name="_system", username=username, password=password, verify=True)
+            if not sys_db.has_database(db_name):
+                logger.info(f"Creating database: {db_name}")
+                sys_db.create_database(
+                    name=db_name,
+                    users=[{"username": username, "password": password, "active": True}]
+                )
+
+            db = client.db(name=db_name, username=username, password=password)
+            self._databases[key] = db
+            self._db_hosts[id(db)] = host
+            logger.debug(f"Connected to database: {db_name}")
+            return db
+
+    def schema_fingerprint(self, db: StandardDatabase, scope: str) -> str:
+        """
+        Identify the schema a setup function would ensure on `db`.
+
+        Args:
+            db: Database the schema lives in
+            scope: Name of the setup function's schema (e.g. "cli")
+
+        Returns:
+            Hex digest of the schema version, scope, host, database name and id
+        """
+        host = self._db_hosts.get(id(db), ARANGO_HOST)
+        db_id = db.properties().get("id", "")
+        raw = f"{SCHEMA_VERSION}|{scope}|{host}|{db.name}|{db_id}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def ensure_schema(
+        self,
+        db: StandardDatabase,
+        scope: str,
+        setup_fn: Callable[[StandardDatabase], bool]
+    ) -> bool:
+        """
+        Run `setup_fn(db)` unless the same schema was already ensured.
+
+        `setup_fn` returns True when every check succeeded; only then is the
+        fingerprint recorded, so partial setups are retried next time. Repeat
+        calls within one process make no requests; the first call in a new
+        process costs one request to read the database id.
+
+        Args:
+            db: Database to ensure the schema in
+            scope: Name of the schema, part of the fingerprint
+            setup_fn: Function running the ensure-* checks
+
+        Returns:
+            True if the schema is known to be in place
+        """
+        if not self.schema_cache_enabled:
+            return bool(setup_fn(db))
+
+        scope_key = (self._db_hosts.get(id(db), ARANGO_HOST), db.name, scope)
+        if scope_key in self._ensured_scopes:
+            return True
+
+        try:
+            fingerprint = self.schema_fingerprint(db, scope)
+        except Exception as e:
+            logger.debug(f"Could not fingerprint schema '{scope}': {e}")
+            return bool(setup_fn(db))
+
+        with self._lock:
+            if fingerprint in self._ensured or self._marker_exists(fingerprint):
+                self._ensured.add(fingerprint)
+                self._ensured_scopes.add(scope_key)
+                logger.debug(f"Schema '{scope}' already ensured ({fingerprint})")
+                return True
+
+            if not setup_fn(db):
+                return False
+
+            self._ensured.add(fingerprint)
+            self._ensured_scopes.add(scope_key)
+            self._write_marker(fingerprint)
+            return True
+
+    def forget_schemas(self) -> None:
+        """Drop every remembered schema fingerprint, in memory and on disk."""
+        with self._lock:
+            self._ensured.clear()
+            self._ensured_scopes.clear()
+            if not self.schema_cache_dir or not os.path.isdir(self.schema_cache_dir):
+                return
+            for name in os.listdir(self.schema_cache_dir):
+                try:
+                    os.remove(os.path.join(self.schema_cache_dir, name))
+                except OSError as e:
+                    logger.debug(f"Could not remove schema marker {name}: {e}")
+
+    def close(self) -> None:
+        """Close every pooled client and forget the cached handles."""
+        with self._lock:
+            for client in self._clients.values():
+                try:
+                    client.close()
+                except Exception as e:
+                    logger.debug(f"Error closing ArangoDB client: {e}")
+            self._clients.clear()
+            self._databases.clear()
+            self._db_hosts.clear()
+
+    def _marker_path(self, fingerprint: str) -> Optional[str]:
+        if not self.schema_cache_dir:
+            return None
+        return os.path.join(self.schema_cache_dir, fingerprint)
+
+    def _marker_exists(self, fingerprint: str) -> bool:
+        path = self._marker_path(fingerprint)
+        return bool(path) and os.path.exists(path)
+
+    def _write_marker(self, fingerprint: str) -> None:
+        path = self._marker_path(fingerprint)
+        if not path:
+            return
+        try:
+            os.makedirs(self.schema_cache_dir, exist_ok=True)
+            with open(path, "w") as f:
+                f.write(SCHEMA_VERSION)
+        except OSError as e:
+            logger.debug(f"Could not write schema marker {path}: {e}")
+
+
+_manager: Optional[ConnectionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_connection_manager() -> ConnectionManager:
+    """Return the process-wide connection manager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ConnectionManager()
+        return _manager
+
+
+def set_connection_manager(manager: Optional[ConnectionManager]) -> None:
+    """Replace the process-wide connection manager (None resets it)."""
+    global _manager
+    with _manager_lock:
+        if _manager is not None and _manager is not manager:
+            _manager.close()
+        _manager = manager
@@ -124,6 +124,21 @@ VIEW_NAME = CONFIG["search"]["view_name"]
 
 # Embedding related constants
 DEFAULT_EMBEDDING_DIMENSIONS = CONFIG["embedding"]["dimensions"]
+DEFAULT_EMBEDDING_MODEL = CONFIG["embedding"]["model_name"]
+EMBEDDING_SNAPSHOT_DIR = os.getenv(
+    "ARANGO_EMBEDDING_SNAPSHOT_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "arangodb", "embedding_snapshots")
+)
+
+# Connection pooling and schema-ensure caching
+ARANGO_POOL_SIZE = int(os.getenv("ARANGO_POOL_SIZE", "10"))
+ARANGO_REQUEST_TIMEOUT = float(os.getenv("ARANGO_REQUEST_TIMEOUT", "60"))
+# Bump when the collections, graphs or views created at connection time change
+SCHEMA_VERSION = "1"
+SCHEMA_CACHE_DIR = os.getenv(
+    "ARANGO_SCHEMA_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "arangodb", "schema")
+)
 
 # Message types
 MESSAGE_TYPE_USER = "user"
@@ -52,6 +52,7 @@ from arango.exceptions import (
 
 # Import embedding utilities for automatic validation
 from arangodb.core.search.semantic_search import ensure_document_has_embedding
+from arangodb.core.search.readiness_registry import invalidate_collection_readiness
 
 # Import constants from core constants module
 from arangodb.core.constants import (
@@ -113,6 +114,7 @@ def create_document(
         # Get the collection and insert document
         collection = db.collection(collection_name)
         result = collection.insert(document, return_new=return_new)
+        invalidate_collection_readiness(collection_name)
 
         logger.info(f"Created document in {collection_name}: {result.get('_key', result)}")
         return result["new"] if return_new and "new" in result else result
@@ -228,6 +230,7 @@ def update_document(
             return_new=return_new,
             # **params # 'rev' is passed within merged_doc if check_rev was possible
         )
+        invalidate_collection_readiness(collection_name)
 
         logger.info(f"Replaced document in {collection_name}: {document_key}")
         return result["new"] if return_new and "new" in result else result
@@ -280,6 +283,7 @@ def delete_document(
             check_rev=check_rev,
             **params
         )
+        invalidate_collection_readiness(collection_name)
 
         if result is False and ignore_missing:
             logger.info(f"Document not found for deletion in {collection_name}: {document_key}")
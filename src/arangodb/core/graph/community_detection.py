@@ -7,6 +7,13 @@ This module implements community detection using the Louvain algorithm to automa
 group related entities in the knowledge graph. Communities help organize and understand
 the structure of stored knowledge.
 
+The graph is loaded as integer-indexed CSR adjacency (see graph_snapshot.py,
+which projects only `_id`/`_from`/`_to`/confidence and caches per revision).
+Local moving evaluates each
+candidate move with the standard modularity gain using per-community degree
+totals (O(degree) per node), and communities are repeatedly aggregated into
+super-nodes until no level improves modularity.
+
 External Documentation:
 - Louvain Algorithm: https://en.wikipedia.org/wiki/Louvain_method
 - ArangoDB Graph Algorithms: https://www.arangodb.com/docs/stable/graphs.html
@@ -33,16 +40,166 @@ Expected Output:
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from collections import defaultdict
+import time
 import uuid
 
+import numpy as np
 from arango.database import Database
 from arango.exceptions import ArangoError
 from loguru import logger
 
+from arangodb.core.graph.graph_snapshot import load_graph_snapshot
+
 # Use the correct collection names for the Graphiti-compatible implementation
 ENTITIES_COLLECTION = "agent_entities"
 RELATIONSHIPS_COLLECTION = "agent_relationships"
 
+# Louvain stops refining a level once a full pass moves no node, or after this many passes
+MAX_LOCAL_PASSES = 100
+
+# Upper bound on aggregation levels
+MAX_LEVELS = 32
+
+
+def modularity(
+    membership: np.ndarray,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    resolution: float = 1.0
+) -> float:
+    """
+    Modularity of a partition, computed in O(E) from CSR adjacency.
+
+    Q = sum_c [ in_c / 2m - resolution * (tot_c / 2m)^2 ]
+    """
+    two_m = data.sum()
+    if two_m == 0:
+        return 0.0
+    membership = np.asarray(membership)
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    internal = membership[rows] == membership[indices]
+    num_comms = int(membership.max()) + 1 if len(membership) else 0
+    tot = np.bincount(membership[rows], weights=data, minlength=num_comms)
+    return float(data[internal].sum() / two_m - resolution * np.square(tot / two_m).sum())
+
+
+def _local_moving(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    resolution: float
+) -> Tuple[List[int], bool]:
+    """
+    Louvain phase 1: move single nodes to the neighbouring community with the best gain.
+
+    Uses per-community degree totals, so evaluating a move costs O(degree):
+    the gain of inserting node i into community C is
+    k_i,C - resolution * tot_C * k_i / 2m (up to a constant factor).
+    """
+    n = len(indptr) - 1
+    two_m = float(data.sum())
+    ptr = indptr.tolist()
+    nbrs = indices.tolist()
+    wts = data.tolist()
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    degree = np.bincount(rows, weights=data, minlength=n).tolist()
+
+    community = list(range(n))
+    tot = list(degree)
+    moved_any = False
+
+    for _ in range(MAX_LOCAL_PASSES):
+        moved = False
+        for i in range(n):
+            k_i = degree[i]
+            if k_i == 0:
+                continue
+            current = community[i]
+
+            # Weight from i to each neighbouring community
+            links: Dict[int, float] = {}
+            for p in range(ptr[i], ptr[i + 1]):
+                j = nbrs[p]
+                if j != i:
+                    c = community[j]
+                    links[c] = links.get(c, 0.0) + wts[p]
+
+            tot[current] -= k_i
+            scale = resolution * k_i / two_m
+            best = current
+            best_gain = links.get(current, 0.0) - tot[current] * scale
+            for c, w in links.items():
+                gain = w - tot[c] * scale
+                if gain > best_gain + 1e-12:
+                    best, best_gain = c, gain
+            tot[best] += k_i
+
+            if best != current:
+                community[i] = best
+                moved = True
+        if not moved:
+            break
+        moved_any = True
+
+    return community, moved_any
+
+
+def _aggregate(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    membership: np.ndarray,
+    num_comms: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Louvain phase 2: collapse each community into one node, summing edge weights."""
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    pair_ids, inverse = np.unique(
+        membership[rows].astype(np.int64) * num_comms + membership[indices], return_inverse=True
+    )
+    summed = np.bincount(inverse, weights=data, minlength=len(pair_ids))
+    new_rows = pair_ids // num_comms
+    new_indptr = np.zeros(num_comms + 1, dtype=np.int64)
+    np.cumsum(np.bincount(new_rows, minlength=num_comms), out=new_indptr[1:])
+    return new_indptr, (pair_ids % num_comms).astype(np.int32), summed
+
+
+def louvain(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    resolution: float = 1.0
+) -> np.ndarray:
+    """
+    Multi-level Louvain community detection on CSR adjacency.
+
+    Alternates local moving and aggregation until a level produces no moves.
+
+    Args:
+        indptr: CSR row pointers (n + 1)
+        indices: CSR column indices
+        data: CSR edge weights
+        resolution: Resolution parameter (higher = more, smaller communities)
+
+    Returns:
+        Community id (0..c-1) for each original node
+    """
+    n = len(indptr) - 1
+    membership = np.arange(n, dtype=np.int64)
+
+    for level in range(MAX_LEVELS):
+        community, moved = _local_moving(indptr, indices, data, resolution)
+        if not moved:
+            break
+        # Renumber communities densely and project onto the original nodes
+        _, dense = np.unique(np.asarray(community, dtype=np.int64), return_inverse=True)
+        num_comms = int(dense.max()) + 1
+        membership = dense[membership]
+        logger.debug(f"Louvain level {level}: {len(indptr) - 1} nodes -> {num_comms} communities")
+        indptr, indices, data = _aggregate(indptr, indices, data, dense, num_comms)
+
+    return membership
+
 
 class CommunityDetector:
     """Detect and manage communities in entity graphs."""
@@ -65,7 +222,7 @@ class CommunityDetector:
     
     def detect_communities(self, min_size: int = 3, resolution: float = 1.0) -> Dict[str, str]:
         """
-        Detect communities using simplified Louvain algorithm.
+        Detect communities using the multi-level Louvain algorithm.
         
         Args:
             min_size: Minimum community size to keep
@@ -75,192 +232,88 @@ class CommunityDetector:
             Mapping of entity_id to community_id
         """
         logger.info(f"Starting community detection with min_size={min_size}, resolution={resolution}")
+        start_time = time.time()
         
-        # Get graph data
-        entities = self._get_all_entities()
-        relationships = self._get_all_relationships()
-        
-        if not entities:
+        # Integer-indexed CSR adjacency; entities without relationships stay singletons
+        try:
+            snapshot = load_graph_snapshot(
+                self.db, self.entities_collection, self.relationships_collection, weight_field="confidence"
+            )
+        except ArangoError as e:
+            logger.error(f"Error loading entity graph: {e}")
+            return {}
+        if snapshot.num_vertices == 0:
             logger.warning("No entities found for community detection")
             return {}
+        keys = snapshot.keys()
+        indptr, indices, data = snapshot.indptr, snapshot.indices, snapshot.weights
         
-        # Build adjacency matrix
-        adjacency = self._build_adjacency_matrix(entities, relationships)
+        membership = louvain(indptr, indices, data, resolution)
+        membership = self._merge_small_communities(membership, indptr, indices, data, min_size)
+        score = modularity(membership, indptr, indices, data, resolution)
         
-        # Initialize: each entity in its own community
-        communities = {entity['_key']: entity['_key'] for entity in entities}
+        # Name each community after its first member
+        representative = {}
+        for key, community in zip(keys, membership.tolist()):
+            representative.setdefault(community, key)
+        final_communities = {key: representative[c] for key, c in zip(keys, membership.tolist())}
         
-        # Iterate until convergence
-        improved = True
-        iteration = 0
-        best_modularity = self._calculate_modularity(communities, adjacency)
-        
-        while improved and iteration < 100:  # Max iterations to prevent infinite loops
-            improved = False
-            iteration += 1
-            
-            # For each entity, try moving it to neighboring communities
-            for entity_key in adjacency:
-                current_community = communities[entity_key]
-                best_community = current_community
-                best_gain = 0
-                
-                # Get neighboring communities
-                neighbor_communities = set()
-                for neighbor in adjacency[entity_key]:
-                    neighbor_communities.add(communities[neighbor])
-                
-                # Try each neighboring community
-                for neighbor_community in neighbor_communities:
-                    if neighbor_community == current_community:
-                        continue
-                    
-                    # Calculate modularity gain
-                    communities[entity_key] = neighbor_community
-                    new_modularity = self._calculate_modularity(communities, adjacency)
-                    gain = new_modularity - best_modularity
-                    
-                    if gain > best_gain:
-                        best_gain = gain
-                        best_community = neighbor_community
-                
-                # Move to best community if improvement found
-                if best_gain > 0:
-                    communities[entity_key] = best_community
-                    best_modularity += best_gain
-                    improved = True
-                else:
-                    communities[entity_key] = current_community
-            
-            logger.debug(f"Iteration {iteration}: Modularity = {best_modularity:.4f}")
-        
-        # Merge small communities
-        final_communities = self._merge_small_communities(communities, adjacency, min_size)
+        logger.info(
+            f"Louvain found {len(representative)} communities over {len(keys)} entities "
+            f"(modularity {score:.4f}) in {time.time() - start_time:.2f}s"
+        )
         
         # Store communities in database
-        self._store_communities(final_communities)
+        self._store_communities(final_communities, score)
         
         logger.info(f"Community detection complete: {len(set(final_communities.values()))} communities found")
         return final_communities
     
-    def _get_all_entities(self) -> List[Dict]:
-        """Get all entities from database."""
-        try:
-            query = f"FOR e IN {self.entities_collection} RETURN e"
-            return list(self.db.aql.execute(query))
-        except ArangoError as e:
-            logger.error(f"Error fetching entities: {e}")
-            return []
-    
-    def _get_all_relationships(self) -> List[Dict]:
-        """Get all relationships from database."""
-        try:
-            query = f"FOR r IN {self.relationships_collection} RETURN r"
-            return list(self.db.aql.execute(query))
-        except ArangoError as e:
-            logger.error(f"Error fetching relationships: {e}")
-            return []
-    
-    def _build_adjacency_matrix(self, entities: List[Dict], relationships: List[Dict]) -> Dict[str, Dict[str, float]]:
-        """Build adjacency matrix from entities and relationships."""
-        adjacency = defaultdict(lambda: defaultdict(float))
-        
-        # Map full IDs to keys for easier lookup
-        id_to_key = {e['_id']: e['_key'] for e in entities}
-        
-        for rel in relationships:
-            from_key = id_to_key.get(rel['_from'])
-            to_key = id_to_key.get(rel['_to'])
-            
-            if from_key and to_key:
-                weight = rel.get('confidence', 1.0)
-                adjacency[from_key][to_key] += weight
-                adjacency[to_key][from_key] += weight  # Undirected graph
-        
-        return dict(adjacency)
-    
-    def _calculate_modularity(self, communities: Dict[str, str], adjacency: Dict[str, Dict[str, float]]) -> float:
-        """Calculate modularity score for current community assignment."""
-        if not adjacency:
-            return 0.0
-        
-        # Calculate total edge weight
-        total_weight = sum(sum(neighbors.values()) for neighbors in adjacency.values()) / 2
-        
-        if total_weight == 0:
-            return 0.0
-        
-        # Group entities by community
-        community_groups = defaultdict(list)
-        for entity, community in communities.items():
-            community_groups[community].append(entity)
-        
-        modularity = 0.0
-        
-        # Calculate modularity for each community
-        for community_entities in community_groups.values():
-            # Sum of internal edges
-            internal_edges = 0
-            degree_sum = 0
-            
-            for entity in community_entities:
-                for neighbor, weight in adjacency.get(entity, {}).items():
-                    degree_sum += weight
-                    if neighbor in community_entities:
-                        internal_edges += weight
-            
-            # Modularity contribution
-            modularity += internal_edges / (2 * total_weight)
-            modularity -= (degree_sum / (2 * total_weight)) ** 2
-        
-        return modularity
-    
-    def _merge_small_communities(self, communities: Dict[str, str], adjacency: Dict[str, Dict[str, float]], 
-                                min_size: int) -> Dict[str, str]:
+    def _merge_small_communities(self, membership: np.ndarray, indptr: np.ndarray, indices: np.ndarray,
+                                data: np.ndarray, min_size: int) -> np.ndarray:
         """Merge communities smaller than min_size with their most connected neighbor."""
-        # Count community sizes
-        community_sizes = defaultdict(int)
-        for community in communities.values():
-            community_sizes[community] += 1
-        
-        # Find small communities
-        small_communities = {c for c, size in community_sizes.items() if size < min_size}
-        
-        if not small_communities:
-            return communities
-        
-        # Merge small communities
-        final_communities = communities.copy()
+        sizes = np.bincount(membership)
+        small = sizes < min_size
+        if not small[membership].any():
+            return membership
         
-        for small_community in small_communities:
-            # Find entities in this community
-            entities_in_community = [e for e, c in communities.items() if c == small_community]
-            
-            # Find most connected neighboring community
-            neighbor_connections = defaultdict(float)
-            
-            for entity in entities_in_community:
-                for neighbor, weight in adjacency.get(entity, {}).items():
-                    neighbor_community = communities[neighbor]
-                    if neighbor_community != small_community:
-                        neighbor_connections[neighbor_community] += weight
-            
-            # Merge with most connected neighbor
-            if neighbor_connections:
-                best_neighbor = max(neighbor_connections.items(), key=lambda x: x[1])[0]
-                for entity in entities_in_community:
-                    final_communities[entity] = best_neighbor
-                
-                logger.debug(f"Merged small community {small_community} into {best_neighbor}")
+        # Total weight from each small community to every other community, in one pass over the edges
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        source_comm = membership[rows]
+        target_comm = membership[indices]
+        crossing = small[source_comm] & (source_comm != target_comm)
+        connections: Dict[int, Dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        for s, t, w in zip(source_comm[crossing].tolist(), target_comm[crossing].tolist(), data[crossing].tolist()):
+            connections[s][t] += w
         
-        return final_communities
+        # Merge with most connected neighbor (isolated small communities are kept)
+        target = np.arange(len(sizes))
+        for small_community, neighbors in connections.items():
+            best_neighbor = max(neighbors.items(), key=lambda x: x[1])[0]
+            target[small_community] = best_neighbor
+            logger.debug(f"Merged small community {small_community} into {best_neighbor}")
+        return target[membership]
     
-    def _store_communities(self, communities: Dict[str, str]):
+    def _get_entity_names(self, keys: List[str]) -> Dict[str, str]:
+        """Fetch display names for the given entity keys only."""
+        try:
+            query = f"""
+            FOR e IN {self.entities_collection}
+                FILTER e._key IN @keys
+                RETURN [e._key, e.name]
+            """
+            return {key: name for key, name in self.db.aql.execute(query, bind_vars={"keys": keys}) if name}
+        except ArangoError as e:
+            logger.error(f"Error fetching entity names: {e}")
+            return {}
+    
+    def _store_communities(self, communities: Dict[str, str], modularity_score: float):
         """Store community assignments in database."""
         # Group entities by community
         community_groups = defaultdict(list)
         for entity, community in communities.items():
             community_groups[community].append(entity)
+        names = self._get_entity_names([key for members in community_groups.values() for key in members[:5]])
         
         # Clear existing communities
         try:
@@ -268,49 +321,38 @@ class CommunityDetector:
         except ArangoError as e:
             logger.error(f"Error clearing communities: {e}")
         
-        # Store each community
+        created_at = datetime.utcnow().isoformat()
+        community_docs = []
+        entity_updates = []
         for community_id, entity_ids in community_groups.items():
-            try:
-                # Get entity names for description
-                entity_names = []
-                for entity_id in entity_ids[:5]:  # First 5 entities
-                    try:
-                        entity = self.db.collection(self.entities_collection).get(entity_id)
-                        if entity:
-                            entity_names.append(entity.get('name', entity_id))
-                    except:
-                        entity_names.append(entity_id)
-                
-                community_doc = {
-                    "_key": f"community_{uuid.uuid4().hex[:8]}",
-                    "original_id": community_id,
-                    "member_count": len(entity_ids),
-                    "member_ids": entity_ids,
-                    "sample_members": entity_names,
-                    "created_at": datetime.utcnow().isoformat(),
-                    "metadata": {
-                        "algorithm": "louvain",
-                        "modularity_score": self._calculate_modularity(communities, 
-                                                                      self._build_adjacency_matrix(
-                                                                          self._get_all_entities(), 
-                                                                          self._get_all_relationships()))
-                    }
+            community_doc = {
+                "_key": f"community_{uuid.uuid4().hex[:8]}",
+                "original_id": community_id,
+                "member_count": len(entity_ids),
+                "member_ids": entity_ids,
+                "sample_members": [names.get(entity_id, entity_id) for entity_id in entity_ids[:5]],
+                "created_at": created_at,
+                "metadata": {
+                    "algorithm": "louvain",
+                    "modularity_score": modularity_score
                 }
-                
-                self.db.collection(self.communities_collection).insert(community_doc)
-                
-                # Update entities with community assignment
-                for entity_id in entity_ids:
-                    try:
-                        self.db.collection(self.entities_collection).update({
-                            "_key": entity_id,
-                            "community_id": community_doc["_key"]
-                        })
-                    except ArangoError as e:
-                        logger.error(f"Error updating entity {entity_id}: {e}")
-                
+            }
+            community_docs.append(community_doc)
+            entity_updates.extend({"_key": entity_id, "community_id": community_doc["_key"]} for entity_id in entity_ids)
+        
+        # Bulk writes: one request for the communities, batched requests for the entities
+        try:
+            self.db.collection(self.communities_collection).insert_many(community_docs)
+        except ArangoError as e:
+            logger.error(f"Error storing communities: {e}")
+            return
+        
+        entities_col = self.db.collection(self.entities_collection)
+        for start in range(0, len(entity_updates), 10000):
+            try:
+                entities_col.update_many(entity_updates[start:start + 10000])
             except ArangoError as e:
-                logger.error(f"Error storing community {community_id}: {e}")
+                logger.error(f"Error updating entity community assignments: {e}")
     
     def get_community_for_entity(self, entity_id: str) -> Optional[Dict]:
         """Get community information for a specific entity."""
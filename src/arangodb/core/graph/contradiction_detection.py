@@ -6,6 +6,10 @@ Description: Functions for contradiction detection operations
 This module provides functions to detect and resolve contradictions in graph relationships.
 It uses the bi-temporal data model to handle conflicting information efficiently.
 
+For batches of new edges, `resolve_contradictions_batch` looks up every
+(from, to, type) triple in one indexed join and applies all resolutions with
+a single bulk update.
+
 Sample input:
     edge_doc = {
         "_from": "documents/123",
@@ -90,6 +94,38 @@ except ImportError:
                         return None
                 return None
 
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _edges_overlap(valid_at: str, invalid_at: Optional[str], existing_edge: Dict[str, Any]) -> bool:
+    """
+    Check whether [valid_at, invalid_at) overlaps the validity of an existing edge.
+    
+    An edge without invalid_at is considered still valid; an existing edge
+    without valid_at cannot contradict anything.
+    """
+    existing_valid_at = existing_edge.get("valid_at")
+    existing_invalid_at = existing_edge.get("invalid_at")
+    
+    # Both edges must have valid_at to check for contradiction
+    if not existing_valid_at:
+        return False
+    
+    valid_at_dt = _parse_timestamp(valid_at)
+    existing_valid_at_dt = _parse_timestamp(existing_valid_at)
+    
+    # If new edge starts after old edge ends, there's no overlap
+    if existing_invalid_at and valid_at_dt >= _parse_timestamp(existing_invalid_at):
+        return False
+    
+    # If new edge ends before old edge starts, there's no overlap
+    if invalid_at and existing_valid_at_dt >= _parse_timestamp(invalid_at):
+        return False
+    
+    return True
+
+
 def detect_contradicting_edges(
     db: StandardDatabase,
     edge_collection: str,
@@ -237,40 +273,7 @@ def detect_temporal_contradictions(
             if "_key" in edge_doc and existing_edge.get("_key") == edge_doc["_key"]:
                 continue
             
-            # Check for temporal overlap
-            existing_valid_at = existing_edge.get("valid_at")
-            existing_invalid_at = existing_edge.get("invalid_at")
-            
-            # Both edges must have valid_at to check for contradiction
-            if not existing_valid_at:
-                continue
-            
-            # Convert string timestamps to datetime objects
-            valid_at_dt = datetime.fromisoformat(valid_at.replace('Z', '+00:00'))
-            existing_valid_at_dt = datetime.fromisoformat(existing_valid_at.replace('Z', '+00:00'))
-            
-            # Convert invalid_at to datetime if not None
-            invalid_at_dt = None
-            if invalid_at:
-                invalid_at_dt = datetime.fromisoformat(invalid_at.replace('Z', '+00:00'))
-                
-            existing_invalid_at_dt = None
-            if existing_invalid_at:
-                existing_invalid_at_dt = datetime.fromisoformat(existing_invalid_at.replace('Z', '+00:00'))
-            
-            # Check for temporal overlap:
-            # 1. New edge starts before or at same time old edge ends, AND
-            # 2. New edge ends after or at same time old edge starts
-            # Note: If either edge has no end time (invalid_at is None), it's considered "still valid"
-            has_overlap = True
-            
-            # If new edge starts after old edge ends, there's no overlap
-            if existing_invalid_at_dt and valid_at_dt >= existing_invalid_at_dt:
-                has_overlap = False
-                
-            # If new edge ends before old edge starts, there's no overlap
-            if invalid_at_dt and existing_valid_at_dt >= invalid_at_dt:
-                has_overlap = False
+            has_overlap = _edges_overlap(valid_at, invalid_at, existing_edge)
             
             if has_overlap:
                 temporal_contradictions.append(existing_edge)
@@ -612,6 +615,236 @@ def resolve_all_contradictions(
         logger.error(f"Failed to resolve all contradictions: {e}")
         return [], False
 
+# Persistent index backing the contradiction lookups of the batch API
+CONTRADICTION_INDEX_FIELDS = ["_from", "_to", "type", "invalid_at"]
+_indexed_collections = set()
+
+
+def ensure_contradiction_index(db: StandardDatabase, edge_collection: str) -> None:
+    """Create the (_from, _to, type, invalid_at) persistent index once per collection."""
+    key = (getattr(db, "name", ""), edge_collection)
+    if key in _indexed_collections:
+        return
+    try:
+        db.collection(edge_collection).add_persistent_index(
+            fields=CONTRADICTION_INDEX_FIELDS, unique=False, sparse=False, name="idx_contradiction_lookup"
+        )
+        _indexed_collections.add(key)
+    except Exception as e:
+        logger.warning(f"Could not ensure contradiction index on {edge_collection}: {e}")
+
+
+def detect_contradictions_batch(
+    db: StandardDatabase,
+    edge_collection: str,
+    edge_docs: List[Dict[str, Any]],
+    exclude_keys: Optional[List[str]] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Detect temporal contradictions for many new edges with one query.
+    
+    All (from, to, type) triples are sent in a single bind variable and
+    joined server-side against the edge collection, using the
+    (_from, _to, type, invalid_at) index for each lookup.
+    
+    Args:
+        db: ArangoDB database handle
+        edge_collection: Name of the edge collection
+        edge_docs: The new edge documents
+        exclude_keys: Optional list of edge keys to exclude from contradiction check
+        
+    Returns:
+        One list of contradicting edges per input edge, in order
+    """
+    contradictions: List[List[Dict[str, Any]]] = [[] for _ in edge_docs]
+    candidates = []
+    for index, edge_doc in enumerate(edge_docs):
+        if not all(edge_doc.get(field) for field in ("_from", "_to", "type", "valid_at")):
+            logger.error("Edge document missing required fields: _from, _to, type, valid_at")
+            continue
+        candidates.append({
+            "i": index,
+            "from": edge_doc["_from"],
+            "to": edge_doc["_to"],
+            "type": edge_doc["type"],
+            "key": edge_doc.get("_key")
+        })
+    if not candidates:
+        return contradictions
+    
+    ensure_contradiction_index(db, edge_collection)
+    aql = """
+    FOR c IN @candidates
+        FOR e IN @@collection
+            FILTER e._from == c.from AND e._to == c.to AND e.type == c.type AND e.invalid_at == null
+            FILTER e._key != c.key AND e._key NOT IN @exclude_keys
+            RETURN { i: c.i, edge: e }
+    """
+    try:
+        cursor = db.aql.execute(
+            aql,
+            bind_vars={
+                "@collection": edge_collection,
+                "candidates": candidates,
+                "exclude_keys": exclude_keys or []
+            },
+            batch_size=1000,
+            stream=True
+        )
+        for row in cursor:
+            edge_doc = edge_docs[row["i"]]
+            if _edges_overlap(edge_doc["valid_at"], edge_doc.get("invalid_at"), row["edge"]):
+                contradictions[row["i"]].append(row["edge"])
+    except AQLQueryExecuteError as e:
+        logger.error(f"AQL query error in detect_contradictions_batch: {e}")
+    
+    found = sum(len(c) for c in contradictions)
+    logger.debug(f"Found {found} temporal contradictions for {len(candidates)} new edges in one query")
+    return contradictions
+
+
+def _plan_resolution(
+    new_edge: Dict[str, Any],
+    contradicting_edge: Dict[str, Any],
+    strategy: str,
+    reason: str
+) -> Tuple[Dict[str, Any], List[Tuple[str, Dict[str, Any]]]]:
+    """
+    Decide a resolution like `resolve_contradiction`, without writing.
+    
+    Returns:
+        Tuple of (resolution result, list of (edge key, update patch)); patches
+        for a new edge that has no _key yet are applied to the dict directly
+    """
+    for edge, label in ((new_edge, "New"), (contradicting_edge, "Contradicting")):
+        validation = validate_temporal_metadata(edge)
+        if not (validation[0] if isinstance(validation, tuple) else validation):
+            return {"action": "error", "reason": f"{label} edge has invalid temporal metadata", "success": False}, []
+    
+    new_key = new_edge.get("_key")
+    contradicting_key = contradicting_edge.get("_key")
+    new_valid_at = _parse_timestamp(new_edge["valid_at"])
+    contradicting_valid_at = _parse_timestamp(contradicting_edge["valid_at"])
+    
+    def invalidate_old(invalid_from: str, why: str) -> Tuple[str, Dict[str, Any]]:
+        return contradicting_key, {"invalid_at": invalid_from, "invalidation_reason": why, "invalidated_by": new_key}
+    
+    def patch_new(patch: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        new_edge.update(patch)
+        return [(new_key, patch)] if new_key else []
+    
+    if strategy == "split_timeline" and new_valid_at == contradicting_valid_at:
+        # Default to newest wins for same start time
+        strategy = "newest_wins"
+    
+    if strategy == "newest_wins":
+        if _parse_timestamp(new_edge["created_at"]) > _parse_timestamp(contradicting_edge["created_at"]):
+            patch = invalidate_old(new_edge["valid_at"], "Superseded by newer edge")
+            return {"action": "invalidate_old", "resolved_edge": {**contradicting_edge, **patch[1]},
+                    "reason": "New edge supersedes old edge (newer information)", "success": True}, [patch]
+        return {"action": "keep_old", "resolved_edge": contradicting_edge,
+                "reason": "Old edge kept (contains newer information)", "success": True}, []
+    
+    if strategy == "merge":
+        earliest_valid_at = min(new_valid_at, contradicting_valid_at).isoformat()
+        latest_invalid_at = None
+        if new_edge.get("invalid_at") and contradicting_edge.get("invalid_at"):
+            latest_invalid_at = max(_parse_timestamp(new_edge["invalid_at"]),
+                                    _parse_timestamp(contradicting_edge["invalid_at"])).isoformat()
+        patches = patch_new({
+            "valid_at": earliest_valid_at,
+            "invalid_at": latest_invalid_at,
+            "merged_from": [new_key, contradicting_key],
+            "merging_reason": reason
+        })
+        patches.append(invalidate_old(earliest_valid_at, "Merged into a new edge"))
+        return {"action": "merge", "resolved_edge": new_edge,
+                "reason": "Merged temporal information from both edges", "success": True}, patches
+    
+    if strategy == "split_timeline":
+        if new_valid_at < contradicting_valid_at:
+            patches = patch_new({"invalid_at": contradicting_valid_at.isoformat()})
+            return {"action": "split_before", "resolved_edge": new_edge,
+                    "reason": "Split timeline - new edge valid before old edge", "success": True}, patches
+        return {"action": "split_after", "resolved_edge": new_edge,
+                "reason": "Split timeline - new edge valid after old edge", "success": True}, \
+            [invalidate_old(new_valid_at.isoformat(), "Timeline split with new edge")]
+    
+    return {"action": "error", "reason": f"Unknown contradiction resolution strategy: {strategy}", "success": False}, []
+
+
+def resolve_contradictions_batch(
+    db: StandardDatabase,
+    edge_collection: str,
+    edge_docs: List[Dict[str, Any]],
+    strategy: str = "newest_wins",
+    exclude_keys: Optional[List[str]] = None,
+    resolution_reason: Optional[str] = None
+) -> Tuple[List[List[Dict[str, Any]]], bool]:
+    """
+    Detect and resolve contradictions for many new edges with one query and one bulk update.
+    
+    Edges are resolved in input order, as if `resolve_all_contradictions` had
+    been called for each: once an existing edge has been invalidated by an
+    earlier edge of the batch it is no longer a contradiction for later ones.
+    
+    Args:
+        db: ArangoDB database handle
+        edge_collection: Name of the edge collection
+        edge_docs: The new edge documents
+        strategy: Resolution strategy (newest_wins, merge, split_timeline)
+        exclude_keys: Optional list of edge keys to exclude from contradiction check
+        resolution_reason: Optional reason recorded on merged edges
+        
+    Returns:
+        Tuple of (resolution results per input edge, overall success boolean)
+    """
+    reason = resolution_reason or "Automated contradiction resolution"
+    contradictions = detect_contradictions_batch(db, edge_collection, edge_docs, exclude_keys)
+    
+    results: List[List[Dict[str, Any]]] = [[] for _ in edge_docs]
+    patches: Dict[str, Dict[str, Any]] = {}
+    patch_owners: Dict[str, List[Dict[str, Any]]] = {}
+    invalidated = set()
+    
+    for index, (edge_doc, found) in enumerate(zip(edge_docs, contradictions)):
+        for contradicting_edge in found:
+            if contradicting_edge.get("_key") in invalidated:
+                continue
+            try:
+                result, edge_patches = _plan_resolution(edge_doc, contradicting_edge, strategy, reason)
+            except Exception as e:
+                logger.error(f"Failed to resolve contradiction: {e}")
+                result, edge_patches = {"action": "error", "reason": f"Error resolving contradiction: {e}",
+                                        "success": False}, []
+            for key, patch in edge_patches:
+                patches.setdefault(key, {"_key": key}).update(patch)
+                patch_owners.setdefault(key, []).append(result)
+                if "invalidated_by" in patch:
+                    invalidated.add(key)
+            results[index].append(result)
+    
+    if patches:
+        try:
+            write_results = db.collection(edge_collection).update_many(
+                list(patches.values()), keep_none=True, merge=True, silent=False
+            )
+            for key, write_result in zip(patches, write_results):
+                if isinstance(write_result, Exception):
+                    logger.error(f"Failed to apply resolution to edge {key}: {write_result}")
+                    for result in patch_owners[key]:
+                        result.update({"action": "error", "success": False,
+                                       "reason": f"Failed to update edge {key}: {write_result}"})
+        except Exception as e:
+            logger.error(f"Bulk contradiction resolution update failed: {e}")
+            for owners in patch_owners.values():
+                for result in owners:
+                    result.update({"action": "error", "success": False, "reason": f"Bulk update failed: {e}"})
+        logger.info(f"Applied {len(patches)} contradiction resolutions for {len(edge_docs)} edges in one update")
+    
+    overall_success = all(result["success"] for edge_results in results for result in edge_results)
+    return results, overall_success
+
 async def resolve_contradiction_with_llm(
     db: StandardDatabase,
     edge_collection: str,
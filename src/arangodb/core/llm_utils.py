@@ -26,6 +26,35 @@ litellm.enable_json_schema_validation = True
 from arangodb.core.constants import CONFIG
 # Import models for structured LLM responses
 from arangodb.core.models import LLMResponse
+from granger_common.rate_limiter import get_rate_limiter, is_rate_limit_error, retry_after_seconds
+
+
+def _rate_limited_completion(provider: str, params: Dict[str, Any]) -> Any:
+    """
+    Call litellm.completion under the provider's shared rate limiter.
+
+    A 429 lowers the limiter's rate and pauses it for the Retry-After delay,
+    so every caller drawing from the same budget backs off together.
+
+    Args:
+        provider: Rate limiter name (vertex, openai)
+        params: Keyword arguments for litellm.completion
+
+    Returns:
+        The litellm response
+    """
+    limiter = get_rate_limiter(provider)
+    # On timeout the call still goes out; a resulting 429 slows the limiter further
+    limiter.acquire()
+    try:
+        response = litellm.completion(**params)
+    except Exception as e:
+        if is_rate_limit_error(e):
+            limiter.report_throttled(retry_after_seconds(e))
+        raise
+    limiter.report_success()
+    return response
+
 
 def get_llm_client(provider: str = None, for_rationale: bool = False) -> Callable:
     """
@@ -109,7 +138,7 @@ def get_llm_client(provider: str = None, for_rationale: bool = False) -> Callabl
                     })
                 
                 # Call LiteLLM with the parameters
-                response = litellm.completion(**params)
+                response = _rate_limited_completion("vertex", params)
                 
                 # For Gemini 2.5, we need to handle the response specially
                 if is_gemini_25 and hasattr(response, 'usage') and hasattr(response.usage, 'completion_tokens_details'):
@@ -150,7 +179,7 @@ def get_llm_client(provider: str = None, for_rationale: bool = False) -> Callabl
                     else:
                         logger.warning(f"Ignoring response_format as it's not a subclass of LLMResponse: {response_format}")
                 
-                response = litellm.completion(**params)
+                response = _rate_limited_completion("openai", params)
                 return response
             except Exception as e:
                 logger.error(f"Error calling OpenAI: {e}")
@@ -9,10 +9,12 @@ Implements the Memory Interface specification.
 """
 
 import os
+import time
 import uuid
 import json
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Union, Tuple
+from itertools import islice
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable, Callable
 
 from loguru import logger
 
@@ -39,9 +41,12 @@ from arangodb.core.constants import (
     CONFIG
 )
 from arangodb.core.temporal_operations import (
+    INVALID_UNTIL_FIELD,
+    TEMPORAL_KEY_FILTER_LIMIT,
     create_temporal_entity,
     ensure_temporal_fields,
     point_in_time_query,
+    snapshot_at_time,
     temporal_range_query
 )
 
@@ -59,7 +64,7 @@ from arangodb.core.field_constants import (
     VALID_TO_FIELD,
 )
 
-from arangodb.core.utils.embedding_utils import get_embedding
+from arangodb.core.utils.embedding_utils import get_embedding, get_embeddings
 from arangodb.core.utils.workflow_tracking import WorkflowTracker
 
 # Import compact_conversation function
@@ -186,40 +191,18 @@ class MemoryAgent:
         Returns:
             Dict with the created message IDs and metadata
         """
-        # Generate conversation_id if not provided
-        if not conversation_id:
-            conversation_id = f"conv_{uuid.uuid4().hex[:10]}"
-            
-        # Use current time if point_in_time not provided
-        if not point_in_time:
-            point_in_time = datetime.now(timezone.utc)
-            
-        # Valid time defaults to point_in_time
-        if not valid_at:
-            valid_at = point_in_time
-            
-        # Process user message
-        user_msg_doc = {
-            TYPE_FIELD: MESSAGE_TYPE_USER,
-            CONTENT_FIELD: user_message,
-            CONVERSATION_ID_FIELD: conversation_id,
-            TIMESTAMP_FIELD: point_in_time.isoformat(),
-            METADATA_FIELD: metadata or {}
-        }
-        
-        # Add episode_id if provided
-        if episode_id:
-            user_msg_doc[EPISODE_ID_FIELD] = episode_id
-            
-        # Add temporal fields
-        user_msg_doc = ensure_temporal_fields(user_msg_doc, valid_at)
+        conversation_id, point_in_time, user_msg_doc, agent_msg_doc, edge_doc = self._build_exchange_documents(
+            user_message, agent_response, conversation_id, episode_id, metadata, point_in_time, valid_at
+        )
             
-        # Generate embedding for user message if auto_embed
+        # Generate embeddings for both messages in one batch if auto_embed
         if auto_embed:
             try:
-                user_msg_doc[EMBEDDING_FIELD] = get_embedding(user_message)
+                user_embedding, agent_embedding = get_embeddings([user_message, agent_response])
+                user_msg_doc[EMBEDDING_FIELD] = user_embedding
+                agent_msg_doc[EMBEDDING_FIELD] = agent_embedding
             except Exception as e:
-                logger.warning(f"Failed to generate embedding for user message: {e}")
+                logger.warning(f"Failed to generate embeddings for conversation: {e}")
         
         # Store user message
         try:
@@ -229,29 +212,6 @@ class MemoryAgent:
             logger.error(f"Failed to store user message: {e}")
             raise
             
-        # Process agent response
-        agent_msg_doc = {
-            TYPE_FIELD: MESSAGE_TYPE_AGENT,
-            CONTENT_FIELD: agent_response,
-            CONVERSATION_ID_FIELD: conversation_id,
-            TIMESTAMP_FIELD: point_in_time.isoformat(),
-            METADATA_FIELD: metadata or {}
-        }
-        
-        # Add episode_id if provided
-        if episode_id:
-            agent_msg_doc[EPISODE_ID_FIELD] = episode_id
-            
-        # Add temporal fields
-        agent_msg_doc = ensure_temporal_fields(agent_msg_doc, valid_at)
-            
-        # Generate embedding for agent response if auto_embed
-        if auto_embed:
-            try:
-                agent_msg_doc[EMBEDDING_FIELD] = get_embedding(agent_response)
-            except Exception as e:
-                logger.warning(f"Failed to generate embedding for agent response: {e}")
-                
         # Store agent response
         try:
             agent_result = self.db.collection(MEMORY_MESSAGE_COLLECTION).insert(agent_msg_doc)
@@ -266,24 +226,8 @@ class MemoryAgent:
             raise
             
         # Create relationship between messages
-        edge_doc = {
-            FROM_FIELD: user_msg_id,
-            TO_FIELD: agent_msg_id,
-            TYPE_FIELD: RELATIONSHIP_TYPE_NEXT,
-            VALID_FROM_FIELD: point_in_time.isoformat(),
-            VALID_TO_FIELD: "9999-12-31T23:59:59Z",  # Far future
-            TIMESTAMP_FIELD: point_in_time.isoformat(),
-            METADATA_FIELD: {
-                CONVERSATION_ID_FIELD: conversation_id
-            }
-        }
-        
-        # Add episode_id to edge if provided
-        if episode_id:
-            edge_doc[METADATA_FIELD][EPISODE_ID_FIELD] = episode_id
-            
-        # Add temporal fields to edge
-        edge_doc = ensure_temporal_fields(edge_doc, valid_at)
+        edge_doc[FROM_FIELD] = user_msg_id
+        edge_doc[TO_FIELD] = agent_msg_id
             
         try:
             edge_result = self.db.collection(MEMORY_EDGE_COLLECTION).insert(edge_doc)
@@ -306,6 +250,235 @@ class MemoryAgent:
             "timestamp": point_in_time.isoformat()
         }
         
+    def _build_exchange_documents(
+        self,
+        user_message: str,
+        agent_response: str,
+        conversation_id: Optional[str] = None,
+        episode_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        point_in_time: Optional[datetime] = None,
+        valid_at: Optional[datetime] = None
+    ) -> Tuple[str, datetime, Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the user message, agent message and NEXT edge documents of an exchange.
+        
+        The edge is returned without _from/_to; callers fill them in once the
+        message ids are known.
+        
+        Returns:
+            Tuple of (conversation_id, point_in_time, user_doc, agent_doc, edge_doc)
+        """
+        # Generate conversation_id if not provided
+        if not conversation_id:
+            conversation_id = f"conv_{uuid.uuid4().hex[:10]}"
+            
+        # Use current time if point_in_time not provided
+        if not point_in_time:
+            point_in_time = datetime.now(timezone.utc)
+            
+        # Valid time defaults to point_in_time
+        if not valid_at:
+            valid_at = point_in_time
+        
+        message_docs = []
+        for message_type, content in ((MESSAGE_TYPE_USER, user_message), (MESSAGE_TYPE_AGENT, agent_response)):
+            doc = {
+                TYPE_FIELD: message_type,
+                CONTENT_FIELD: content,
+                CONVERSATION_ID_FIELD: conversation_id,
+                TIMESTAMP_FIELD: point_in_time.isoformat(),
+                METADATA_FIELD: metadata or {}
+            }
+            # Add episode_id if provided
+            if episode_id:
+                doc[EPISODE_ID_FIELD] = episode_id
+            # Add temporal fields
+            message_docs.append(ensure_temporal_fields(doc, valid_at))
+        
+        edge_doc = {
+            TYPE_FIELD: RELATIONSHIP_TYPE_NEXT,
+            VALID_FROM_FIELD: point_in_time.isoformat(),
+            VALID_TO_FIELD: "9999-12-31T23:59:59Z",  # Far future
+            TIMESTAMP_FIELD: point_in_time.isoformat(),
+            METADATA_FIELD: {
+                CONVERSATION_ID_FIELD: conversation_id
+            }
+        }
+        
+        # Add episode_id to edge if provided
+        if episode_id:
+            edge_doc[METADATA_FIELD][EPISODE_ID_FIELD] = episode_id
+            
+        # Add temporal fields to edge
+        edge_doc = ensure_temporal_fields(edge_doc, valid_at)
+        
+        return conversation_id, point_in_time, message_docs[0], message_docs[1], edge_doc
+    
+    def store_conversations_bulk(
+        self,
+        exchanges: Iterable[Dict[str, Any]],
+        chunk_size: int = 500,
+        embed_batch_size: int = 64,
+        auto_embed: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Store many user-agent exchanges with batched embedding and bulk writes.
+        
+        The input is consumed lazily, `chunk_size` exchanges at a time. For each
+        chunk, all messages are embedded together, then the messages and their
+        NEXT edges are written with `insert_many` inside one stream transaction.
+        An exchange is only kept if both messages and the edge were written; its
+        partial writes are removed otherwise.
+        
+        Args:
+            exchanges: Iterable of dicts with user_message and agent_response, and
+                optionally conversation_id, episode_id, metadata, point_in_time
+                and valid_at (datetime or ISO string)
+            chunk_size: Exchanges per transaction
+            embed_batch_size: Texts per embedding forward pass
+            auto_embed: Whether to generate embeddings
+            progress_callback: Called after each chunk with a report containing
+                the chunk's per-item results and errors plus running totals
+            
+        Returns:
+            Totals: processed, stored, failed, chunks and elapsed seconds
+        """
+        start_time = time.time()
+        totals = {"processed": 0, "stored": 0, "failed": 0, "chunks": 0}
+        iterator = iter(exchanges)
+        
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            offset = totals["processed"]
+            results, errors = self._store_exchange_chunk(chunk, offset, embed_batch_size, auto_embed)
+            
+            totals["processed"] += len(chunk)
+            totals["stored"] += len(results)
+            totals["failed"] += len(errors)
+            totals["chunks"] += 1
+            logger.info(
+                f"Bulk conversation store: {totals['processed']} processed, "
+                f"{totals['stored']} stored, {totals['failed']} failed"
+            )
+            if progress_callback:
+                progress_callback({**totals, "results": results, "errors": errors})
+        
+        totals["elapsed"] = time.time() - start_time
+        return totals
+    
+    def _store_exchange_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        offset: int,
+        embed_batch_size: int,
+        auto_embed: bool
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Write one chunk of exchanges; returns (per-item results, per-item errors)."""
+        errors: List[Dict[str, Any]] = []
+        prepared = []
+        
+        for position, exchange in enumerate(chunk):
+            index = offset + position
+            try:
+                user_message = exchange["user_message"]
+                agent_response = exchange["agent_response"]
+                point_in_time = exchange.get("point_in_time")
+                valid_at = exchange.get("valid_at")
+                if isinstance(point_in_time, str):
+                    point_in_time = datetime.fromisoformat(point_in_time)
+                if isinstance(valid_at, str):
+                    valid_at = datetime.fromisoformat(valid_at)
+                built = self._build_exchange_documents(
+                    user_message, agent_response, exchange.get("conversation_id"),
+                    exchange.get("episode_id"), exchange.get("metadata"), point_in_time, valid_at
+                )
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                errors.append({"index": index, "error": f"Invalid exchange: {e}"})
+                continue
+            
+            conversation_id, point_in_time, user_doc, agent_doc, edge_doc = built
+            # Pre-assign keys so edges can be built before anything is written
+            user_doc["_key"] = uuid.uuid4().hex
+            agent_doc["_key"] = uuid.uuid4().hex
+            edge_doc[FROM_FIELD] = f"{MEMORY_MESSAGE_COLLECTION}/{user_doc['_key']}"
+            edge_doc[TO_FIELD] = f"{MEMORY_MESSAGE_COLLECTION}/{agent_doc['_key']}"
+            prepared.append((index, conversation_id, point_in_time, user_doc, agent_doc, edge_doc))
+        
+        if not prepared:
+            return [], errors
+        
+        if auto_embed:
+            texts = []
+            for _, _, _, user_doc, agent_doc, _ in prepared:
+                texts.extend([user_doc[CONTENT_FIELD], agent_doc[CONTENT_FIELD]])
+            try:
+                embeddings = get_embeddings(texts, batch_size=embed_batch_size)
+                for i, (_, _, _, user_doc, agent_doc, _) in enumerate(prepared):
+                    user_doc[EMBEDDING_FIELD] = embeddings[2 * i]
+                    agent_doc[EMBEDDING_FIELD] = embeddings[2 * i + 1]
+            except Exception as e:
+                logger.warning(f"Failed to generate embeddings for conversation chunk: {e}")
+        
+        txn = self.db.begin_transaction(
+            write=[MEMORY_MESSAGE_COLLECTION, MEMORY_EDGE_COLLECTION],
+            allow_implicit=False
+        )
+        try:
+            messages = txn.collection(MEMORY_MESSAGE_COLLECTION)
+            edges = txn.collection(MEMORY_EDGE_COLLECTION)
+            
+            message_docs = []
+            for _, _, _, user_doc, agent_doc, _ in prepared:
+                message_docs.extend([user_doc, agent_doc])
+            message_results = messages.insert_many(message_docs, silent=False)
+            
+            # Keep exchanges whose two messages were both written; roll back the halves
+            intact, orphans = [], []
+            for i, item in enumerate(prepared):
+                user_result, agent_result = message_results[2 * i], message_results[2 * i + 1]
+                failure = next((r for r in (user_result, agent_result) if isinstance(r, Exception)), None)
+                if failure is None:
+                    intact.append(item)
+                    continue
+                errors.append({"index": item[0], "error": f"Failed to store message: {failure}"})
+                orphans.extend(r["_key"] for r in (user_result, agent_result) if not isinstance(r, Exception))
+            
+            results = []
+            if intact:
+                edge_results = edges.insert_many([item[5] for item in intact], silent=False)
+                for item, edge_result in zip(intact, edge_results):
+                    index, conversation_id, point_in_time, user_doc, agent_doc, edge_doc = item
+                    if isinstance(edge_result, Exception):
+                        errors.append({"index": index, "error": f"Failed to create message relationship: {edge_result}"})
+                        orphans.extend([user_doc["_key"], agent_doc["_key"]])
+                        continue
+                    results.append({
+                        "index": index,
+                        "conversation_id": conversation_id,
+                        "user_message_id": edge_doc[FROM_FIELD],
+                        "agent_message_id": edge_doc[TO_FIELD],
+                        "relationship_id": edge_result["_id"],
+                        "timestamp": point_in_time.isoformat()
+                    })
+            
+            if orphans:
+                messages.delete_many([{"_key": key} for key in orphans], silent=True)
+            txn.commit_transaction()
+        except Exception as e:
+            logger.error(f"Bulk conversation chunk failed, rolling back {len(prepared)} exchanges: {e}")
+            try:
+                txn.abort_transaction()
+            except Exception:
+                pass
+            errors.extend({"index": item[0], "error": f"Chunk transaction failed: {e}"} for item in prepared)
+            return [], sorted(errors, key=lambda error: error["index"])
+        
+        return results, sorted(errors, key=lambda error: error["index"])
+        
     def retrieve_messages(
         self,
         conversation_id: Optional[str] = None,
@@ -688,13 +861,64 @@ class MemoryAgent:
         Returns:
             List of search results valid at the specified time
         """
-        # Use the point_in_time parameter of the search method
-        return self.search(
-            query=query,
-            conversation_id=conversation_id,
-            n_results=limit,
-            point_in_time=timestamp
-        )
+        # Hot timestamps whose valid set is small are cached per collection
+        # revision and searched by key membership. Larger sets stay in the
+        # database: the query keeps the index-friendly temporal predicate on
+        # (valid_at, invalid_until) instead of shipping the keys every time.
+        filters = {CONVERSATION_ID_FIELD: conversation_id} if conversation_id else None
+        try:
+            valid_keys = snapshot_at_time(
+                self.db, MEMORY_MESSAGE_COLLECTION, timestamp,
+                filters=filters, max_keys=TEMPORAL_KEY_FILTER_LIMIT
+            )
+        except Exception as e:
+            logger.warning(f"Temporal snapshot failed: {e}, falling back to filtered search")
+            return self.search(
+                query=query,
+                conversation_id=conversation_id,
+                n_results=limit,
+                point_in_time=timestamp
+            )
+        
+        if valid_keys is not None and not valid_keys:
+            return []
+        
+        bind_vars = {
+            "query": query,
+            "point_in_time": timestamp.isoformat(),
+            "n_results": limit
+        }
+        if valid_keys is not None:
+            temporal_filter = "FILTER doc._key IN @valid_keys"
+            bind_vars["valid_keys"] = list(valid_keys)
+        else:
+            temporal_filter = (
+                "FILTER doc.valid_at <= @point_in_time"
+                f" FILTER doc.{INVALID_UNTIL_FIELD} > @point_in_time OR doc.{INVALID_UNTIL_FIELD} == null"
+                " FILTER doc.invalid_at == null OR doc.invalid_at > @point_in_time"
+            )
+            if conversation_id:
+                temporal_filter += f" FILTER doc.{CONVERSATION_ID_FIELD} == @conversation_id"
+                bind_vars["conversation_id"] = conversation_id
+        
+        aql = f"""
+        FOR doc IN {MEMORY_VIEW_NAME}
+            SEARCH ANALYZER(doc.content IN TOKENS(@query, "text_en"), "text_en")
+            {temporal_filter}
+            FILTER doc.created_at <= @point_in_time
+            SORT BM25(doc) DESC
+            LIMIT @n_results
+            RETURN MERGE(doc, {{
+                score: BM25(doc)
+            }})
+        """
+        
+        try:
+            cursor = self.db.aql.execute(aql, bind_vars=bind_vars)
+            return list(cursor)
+        except Exception as e:
+            logger.error(f"Error searching memories at {timestamp}: {e}")
+            raise
     
     def get_conversation_at_time(
         self,
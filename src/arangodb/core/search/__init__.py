@@ -31,6 +31,9 @@ from .tag_search import tag_search, validate_tag_search
 from .graph_traverse import graph_traverse, graph_rag_search  
 from .keyword_search import search_keyword
 from .glossary_search import glossary_search, validate_glossary_search
+from .term_matcher import TermMatcher
+from .vector_index import VectorIndex, get_vector_index, drop_vector_indexes
+from .result_cache import SearchResultCache, get_search_cache, set_search_cache
 
 # Simple imports to avoid circular references
 
@@ -67,4 +70,15 @@ __all__ = [
     # Glossary search
     "glossary_search",
     "validate_glossary_search",
+    "TermMatcher",
+    
+    # Resident vector index
+    "VectorIndex",
+    "get_vector_index",
+    "drop_vector_indexes",
+    
+    # Search result cache
+    "SearchResultCache",
+    "get_search_cache",
+    "set_search_cache",
 ]
\ No newline at end of file
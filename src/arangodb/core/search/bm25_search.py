@@ -55,8 +55,10 @@ from arangodb.core.constants import (
     VIEW_NAME,
 )
 from arangodb.core.arango_setup import ensure_arangosearch_view
+from arangodb.core.search.result_cache import cache_search_results
 
 
+@cache_search_results("bm25", default_collections=[COLLECTION_NAME])
 def bm25_search(
     db: StandardDatabase,
     query_text: str,
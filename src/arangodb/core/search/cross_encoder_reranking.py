@@ -7,6 +7,12 @@ This module provides functionality to rerank search results using cross-encoder
 which can significantly improve search quality by performing a more sophisticated
 relevance assessment on the initial retrieval results.
 
+All (query, passage) pairs of a rerank are scored in a few batched `predict`
+calls. Pairs are sorted by length before batching, so each batch pads to a
+similar sequence length. Scores are kept in an LRU cache keyed on
+(model, query hash, passage hash), and repeated queries over the same
+candidates skip inference.
+
 ## Third-Party Packages:
 - sentence-transformers: https://www.sbert.net/docs/package_reference/cross_encoder.html (v4.1.0+)
 - torch: https://pytorch.org/docs/stable/index.html (v2.2.0+)
@@ -39,25 +45,27 @@ import time
 import logging
 import os
 import json
+import hashlib
+import importlib.util
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Union, Tuple, Callable
-from functools import lru_cache
 
 import numpy as np
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-# Import for type checking but with try/except to handle optional dependency
-try:
-    from sentence_transformers import CrossEncoder
-    HAS_CROSS_ENCODER = True
-except ImportError:
+# sentence-transformers (and torch with it) is imported when a model is first
+# loaded; only check that it is installed here
+HAS_CROSS_ENCODER = importlib.util.find_spec("sentence_transformers") is not None
+if not HAS_CROSS_ENCODER:
     logger.warning("sentence-transformers package not found - cross-encoder reranking will use fallback methods")
-    HAS_CROSS_ENCODER = False
 
 # Constants
 DEFAULT_CROSS_ENCODER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 FALLBACK_MODEL = "cross-encoder/ms-marco-TinyBERT-L-2-v2"  # Smaller, faster model for fallback
-CACHE_SIZE = 1024  # Number of query-passage pairs to cache
+CACHE_SIZE = int(os.getenv("RERANK_CACHE_SIZE", "10000"))  # Number of query-passage pair scores to cache
+RERANK_BATCH_SIZE = int(os.getenv("RERANK_BATCH_SIZE", "32"))  # Pairs per predict call
 MAX_LENGTH = 512   # Maximum sequence length for cross-encoder input
 
 # Define content fields to extract for reranking in order of preference
@@ -89,6 +97,8 @@ def get_cross_encoder(model_name: str = DEFAULT_CROSS_ENCODER_MODEL) -> Any:
         return _CROSS_ENCODER_INSTANCES[model_name]
     
     try:
+        from sentence_transformers import CrossEncoder
+        
         # Try to create a new model instance
         logger.info(f"Loading cross-encoder model: {model_name}")
         model = CrossEncoder(model_name, max_length=MAX_LENGTH)
@@ -138,7 +148,163 @@ def extract_text_for_reranking(doc: Dict[str, Any]) -> str:
         return ""
 
 
-@lru_cache(maxsize=CACHE_SIZE)
+class PairScoreCache:
+    """Thread-safe LRU of cross-encoder scores keyed on (model, query hash, passage hash)."""
+    
+    def __init__(self, max_entries: int = CACHE_SIZE):
+        self.max_entries = max_entries
+        self._scores: "OrderedDict[Tuple[str, bytes, bytes], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    
+    def key(self, model_name: str, query_text: str, passage_text: str) -> Tuple[str, bytes, bytes]:
+        return (model_name, self._hash(query_text), self._hash(passage_text))
+    
+    def get(self, key: Tuple[str, bytes, bytes]) -> Optional[float]:
+        with self._lock:
+            score = self._scores.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self._scores.move_to_end(key)
+            self.hits += 1
+            return score
+    
+    def put(self, key: Tuple[str, bytes, bytes], score: float) -> None:
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+            while len(self._scores) > self.max_entries:
+                self._scores.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._scores), "max_entries": self.max_entries,
+                    "hits": self.hits, "misses": self.misses}
+
+
+_pair_score_cache = PairScoreCache()
+
+
+def get_rerank_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters of the pair-score cache."""
+    return _pair_score_cache.stats()
+
+
+def clear_rerank_cache() -> None:
+    """Drop all cached cross-encoder scores."""
+    _pair_score_cache.clear()
+
+
+def _normalize_score(score: float) -> float:
+    """Map raw model output to 0-1; scores already in range are kept as-is."""
+    # Most cross-encoder models output logits, so apply a sigmoid outside [0, 1]
+    if score < 0 or score > 1:
+        return float(1.0 / (1.0 + np.exp(-score)))
+    return float(score)
+
+
+def _fallback_score(query_text: str, passage_text: str) -> float:
+    """Approximate relevance by query term overlap when no model is available."""
+    query_lower = query_text.lower()
+    passage_lower = passage_text.lower()
+    
+    # Count term overlap as simple fallback
+    query_terms = set(query_lower.split())
+    # Remove very common words
+    query_terms = {term for term in query_terms if len(term) > 2}
+    
+    if not query_terms:
+        return 0.5  # Neutral score if no meaningful query terms
+    
+    # Count matching terms
+    match_count = sum(1 for term in query_terms if term in passage_lower)
+    score = match_count / len(query_terms)
+    
+    # Normalize to 0.4-0.8 range to avoid extreme scores
+    return 0.4 + (score * 0.4)
+
+
+def compute_cross_encoder_scores(
+    query_text: str,
+    passage_texts: List[str],
+    model_name: str = DEFAULT_CROSS_ENCODER_MODEL,
+    batch_size: int = RERANK_BATCH_SIZE,
+    use_cache: bool = True
+) -> List[float]:
+    """
+    Score many passages against one query with batched cross-encoder inference.
+    
+    Cached pairs are answered from the LRU; the remaining unique passages are
+    sorted by length and scored in batches of `batch_size`.
+    
+    Args:
+        query_text: Search query text
+        passage_texts: Text content of the passages
+        model_name: Cross-encoder model name
+        batch_size: Pairs per predict call
+        use_cache: Read and populate the pair-score cache
+        
+    Returns:
+        Cross-encoder relevance scores (0-1), aligned with passage_texts
+    """
+    model = get_cross_encoder(model_name)
+    
+    # If model loading failed, return fallback scores (not cached, so a later model load takes over)
+    if model is None:
+        return [_fallback_score(query_text, passage) for passage in passage_texts]
+    
+    scores: Dict[str, float] = {}
+    pending: Dict[str, Tuple[str, bytes, bytes]] = {}
+    for passage in passage_texts:
+        if passage in scores or passage in pending:
+            continue
+        key = _pair_score_cache.key(model_name, query_text, passage)
+        cached = _pair_score_cache.get(key) if use_cache else None
+        if cached is not None:
+            scores[passage] = cached
+        else:
+            pending[passage] = key
+    
+    # Length-sorted bucketing keeps padding within each batch small
+    to_score = sorted(pending, key=len, reverse=True)
+    batch_size = max(1, batch_size)
+    for start in range(0, len(to_score), batch_size):
+        batch = to_score[start:start + batch_size]
+        try:
+            raw = model.predict([(query_text, passage) for passage in batch],
+                                batch_size=len(batch), show_progress_bar=False)
+            raw = np.asarray(raw, dtype=np.float64).reshape(len(batch), -1)[:, 0]
+        except Exception as e:
+            logger.error(f"Cross-encoder scoring failed: {e}")
+            for passage in batch:
+                scores[passage] = 0.5  # Neutral score on error, not cached
+            continue
+        for passage, value in zip(batch, raw.tolist()):
+            score = _normalize_score(value)
+            scores[passage] = score
+            if use_cache:
+                _pair_score_cache.put(pending[passage], score)
+    
+    if to_score:
+        logger.debug(
+            f"Cross-encoder scored {len(to_score)} pairs in {(len(to_score) + batch_size - 1) // batch_size} batches, "
+            f"{len(passage_texts) - len(to_score)} from cache or duplicates"
+        )
+    return [scores[passage] for passage in passage_texts]
+
+
 def compute_cross_encoder_score(
     query_text: str, 
     passage_text: str,
@@ -155,49 +321,7 @@ def compute_cross_encoder_score(
     Returns:
         Cross-encoder relevance score (0-1)
     """
-    model = get_cross_encoder(model_name)
-    
-    # If model loading failed, return a fallback score
-    if model is None:
-        # Fallback to simpler text matching as approximation
-        query_lower = query_text.lower()
-        passage_lower = passage_text.lower()
-        
-        # Count term overlap as simple fallback
-        query_terms = set(query_lower.split())
-        # Remove very common words
-        query_terms = {term for term in query_terms if len(term) > 2}
-        
-        if not query_terms:
-            return 0.5  # Neutral score if no meaningful query terms
-        
-        # Count matching terms
-        match_count = sum(1 for term in query_terms if term in passage_lower)
-        score = match_count / len(query_terms)
-        
-        # Normalize to 0.4-0.8 range to avoid extreme scores
-        return 0.4 + (score * 0.4)
-    
-    try:
-        # Use the cross-encoder to get a relevance score
-        score = model.predict([(query_text, passage_text)])
-        
-        # If score is an array/list with one element, extract the value
-        if hasattr(score, '__len__') and len(score) == 1:
-            score = float(score[0])
-        else:
-            score = float(score)
-        
-        # Most cross-encoder models output scores in different ranges
-        # Normalize to 0-1 range using sigmoid if score is not already in that range
-        if score < 0 or score > 1:
-            score = 1.0 / (1.0 + np.exp(-score))
-            
-        return score
-        
-    except Exception as e:
-        logger.error(f"Cross-encoder scoring failed: {e}")
-        return 0.5  # Neutral score on error
+    return compute_cross_encoder_scores(query_text, [passage_text], model_name)[0]
 
 
 @retry(
@@ -213,7 +337,8 @@ def cross_encoder_rerank(
     content_extraction_fn: Optional[Callable[[Dict[str, Any]], str]] = None,
     top_k: Optional[int] = None,
     score_combination_strategy: str = "replace",
-    score_combination_weights: Optional[Dict[str, float]] = None
+    score_combination_weights: Optional[Dict[str, float]] = None,
+    batch_size: int = RERANK_BATCH_SIZE
 ) -> List[Dict[str, Any]]:
     """
     Rerank a list of passages using a cross-encoder model.
@@ -228,6 +353,7 @@ def cross_encoder_rerank(
         score_combination_strategy: How to combine original and cross-encoder scores
                                    ("replace", "weighted", "max", "min")
         score_combination_weights: Weights to use for weighted combination strategy
+        batch_size: Query-passage pairs per cross-encoder predict call
         
     Returns:
         Reranked list of passages with cross-encoder scores
@@ -251,25 +377,31 @@ def cross_encoder_rerank(
     if score_combination_strategy == "weighted" and not score_combination_weights:
         score_combination_weights = {"original": 0.2, "cross_encoder": 0.8}
     
-    # Process all passages
-    scored_passages = []
+    # Extract text for all passages first so they can be scored in batches
+    candidates = []
     for passage in passages:
         doc = passage.get("doc", {})
-        original_score = passage.get(score_field, 0)
         
         # Skip if no document (shouldn't happen in practice)
         if not doc:
             logger.warning("Skipping passage with missing document")
             continue
         
-        # Extract text content for reranking
         text_content = content_extractor(doc)
         if not text_content:
             logger.warning(f"No content extracted from document {doc.get('_id', '?')}, using fallback score")
-            cross_encoder_score = original_score  # Fall back to original score
-        else:
-            # Get cross-encoder score
-            cross_encoder_score = compute_cross_encoder_score(query_text, text_content, model_name)
+        candidates.append((passage, text_content))
+    
+    texts = [text for _, text in candidates if text]
+    batch_scores = iter(compute_cross_encoder_scores(query_text, texts, model_name, batch_size) if texts else [])
+    
+    # Process all passages
+    scored_passages = []
+    for passage, text_content in candidates:
+        original_score = passage.get(score_field, 0)
+        
+        # Fall back to the original score when there was nothing to score
+        cross_encoder_score = next(batch_scores) if text_content else original_score
         
         # Combine scores according to strategy
         if score_combination_strategy == "replace":
@@ -313,7 +445,8 @@ def rerank_search_results(
     score_field: str = "score",
     top_k: Optional[int] = None,
     score_combination_strategy: str = "replace",
-    score_combination_weights: Optional[Dict[str, float]] = None
+    score_combination_weights: Optional[Dict[str, float]] = None,
+    batch_size: int = RERANK_BATCH_SIZE
 ) -> Dict[str, Any]:
     """
     Rerank the results of a search operation.
@@ -325,6 +458,7 @@ def rerank_search_results(
         top_k: Optional limit on number of results to return after reranking
         score_combination_strategy: How to combine original and cross-encoder scores
         score_combination_weights: Weights to use for weighted combination strategy
+        batch_size: Query-passage pairs per cross-encoder predict call
         
     Returns:
         Updated search results with reranked passages
@@ -370,7 +504,8 @@ def rerank_search_results(
             score_field=score_field,
             top_k=top_k,
             score_combination_strategy=score_combination_strategy,
-            score_combination_weights=score_combination_weights
+            score_combination_weights=score_combination_weights,
+            batch_size=batch_size
         )
         
         # Replace results with reranked version
@@ -0,0 +1,455 @@
+"""
+Embedding Snapshot Module
+Module: embedding_snapshot.py
+Description: Memory-mapped on-disk snapshots of collection embeddings
+
+Writes the embeddings of a collection to a versioned binary snapshot so that
+PyTorch search can start without re-reading every vector over HTTP JSON. A
+snapshot is a directory containing:
+
+- manifest.json   format version, count, dimension, dtype, model, max `_rev`
+- embeddings.bin  raw row-major float32/float16/int8 matrix (count x dimension)
+- scales.bin      int8 only: float32 per-row scales, `vector ~= codes * scale`
+- exact.bin       optional float32 copy used to re-score quantized candidates
+- ids.txt         one document `_id` per line, aligned with the matrix rows
+- metadata.jsonl  the KEEP'd document fields for each row
+
+The loader opens the matrix with `np.memmap`, so loading is O(1) and several
+worker processes searching the same snapshot share the page cache.
+
+External Dependencies:
+- numpy: https://numpy.org/doc/stable/
+- python-arango: https://python-arango.readthedocs.io/
+
+Sample Input:
+>>> manifest = export_embedding_snapshot(db, "memory_documents", dtype="float16")
+>>> snapshot = load_matching_snapshot(db, "memory_documents")
+
+Expected Output:
+>>> manifest["count"], manifest["dimension"], manifest["dtype"]
+(120000, 1024, 'float16')
+>>> snapshot.embeddings.shape
+(120000, 1024)
+"""
+
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from arangodb.core.constants import DEFAULT_EMBEDDING_MODEL, EMBEDDING_SNAPSHOT_DIR
+from arangodb.core.search.quantization import quantize_int8
+
+SNAPSHOT_FORMAT_VERSION = 1
+SUPPORTED_DTYPES = ("float32", "float16", "int8")
+
+MANIFEST_FILE = "manifest.json"
+EMBEDDINGS_FILE = "embeddings.bin"
+SCALES_FILE = "scales.bin"
+EXACT_FILE = "exact.bin"
+IDS_FILE = "ids.txt"
+METADATA_FILE = "metadata.jsonl"
+
+# Fields exported alongside each vector when none are requested explicitly
+DEFAULT_SNAPSHOT_FIELDS = ["_key", "_id", "_rev", "title", "content", "question", "problem", "solution", "context", "tags"]
+
+
+@dataclass
+class EmbeddingSnapshot:
+    """A loaded snapshot; `embeddings`, `scales` and `exact` are read-only memory maps."""
+    path: Path
+    manifest: Dict[str, Any]
+    embeddings: np.ndarray
+    ids: List[str]
+    metadata: List[Dict[str, Any]] = field(default_factory=list)
+    scales: Optional[np.ndarray] = None
+    exact: Optional[np.ndarray] = None
+
+    @property
+    def count(self) -> int:
+        return self.manifest["count"]
+
+    @property
+    def dimension(self) -> int:
+        return self.manifest["dimension"]
+
+    @property
+    def float_embeddings(self) -> Optional[np.ndarray]:
+        """Rows usable as plain float vectors, or None for int8 without an exact copy."""
+        if self.exact is not None:
+            return self.exact
+        if self.manifest["dtype"] == "int8":
+            return None
+        return self.embeddings
+
+
+# Snapshots already mapped into this process, keyed by path
+_loaded_snapshots: Dict[str, EmbeddingSnapshot] = {}
+_loaded_lock = threading.Lock()
+
+
+def snapshot_path(
+    collection_name: str,
+    embedding_field: str = "embedding",
+    snapshot_dir: Optional[str] = None
+) -> Path:
+    """Return the directory holding the snapshot for a collection and field."""
+    return Path(snapshot_dir or EMBEDDING_SNAPSHOT_DIR) / f"{collection_name}__{embedding_field}"
+
+
+def get_collection_state(db, collection_name: str, embedding_field: str = "embedding") -> Dict[str, Any]:
+    """
+    Return the count and maximum `_rev` of documents that have embeddings.
+
+    This is the fingerprint stored in a snapshot manifest and compared by
+    `snapshot_matches_collection`.
+    """
+    query = """
+    FOR doc IN @@collection
+    FILTER doc[@field] != null
+    COLLECT AGGREGATE count = LENGTH(1), max_rev = MAX(doc._rev)
+    RETURN {count: count, max_rev: max_rev}
+    """
+    cursor = db.aql.execute(query, bind_vars={"@collection": collection_name, "field": embedding_field})
+    state = next(cursor, None)
+    return state or {"count": 0, "max_rev": None}
+
+
+def export_embedding_snapshot(
+    db,
+    collection_name: str,
+    embedding_field: str = "embedding",
+    snapshot_dir: Optional[str] = None,
+    dtype: str = "float32",
+    fields_to_return: Optional[List[str]] = None,
+    model: str = DEFAULT_EMBEDDING_MODEL,
+    batch_size: int = 5000,
+    keep_exact: bool = False
+) -> Dict[str, Any]:
+    """
+    Stream a collection's embeddings into a snapshot directory.
+
+    The snapshot is written to a temporary directory and swapped into place,
+    so readers never observe a partially written snapshot.
+
+    Args:
+        db: ArangoDB database connection
+        collection_name: Collection to export
+        embedding_field: Field containing the embedding vectors
+        snapshot_dir: Root directory for snapshots (defaults to EMBEDDING_SNAPSHOT_DIR)
+        dtype: Storage dtype, "float32", "float16" or "int8"
+        fields_to_return: Document fields stored alongside each vector
+        model: Embedding model name recorded in the manifest
+        batch_size: Cursor batch size
+        keep_exact: For quantized dtypes, also write a float32 copy used to
+            re-score search candidates exactly
+
+    Returns:
+        The written manifest
+    """
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Unsupported snapshot dtype {dtype!r}, expected one of {SUPPORTED_DTYPES}")
+    keep_exact = keep_exact and dtype != "float32"
+
+    fields = [f for f in (fields_to_return or DEFAULT_SNAPSHOT_FIELDS) if f != embedding_field]
+    for required in ["_id", "_key", "_rev"]:
+        if required not in fields:
+            fields.append(required)
+
+    target = snapshot_path(collection_name, embedding_field, snapshot_dir)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    tmp.mkdir()
+
+    # Record the state before streaming: a concurrent write makes the snapshot look stale, never fresh
+    state = get_collection_state(db, collection_name, embedding_field)
+
+    query = """
+    FOR doc IN @@collection
+    FILTER doc[@field] != null
+    RETURN MERGE(KEEP(doc, @fields), {__embedding: doc[@field]})
+    """
+    cursor = db.aql.execute(
+        query,
+        bind_vars={"@collection": collection_name, "field": embedding_field, "fields": fields},
+        batch_size=batch_size,
+        stream=True
+    )
+
+    start_time = time.time()
+    count = 0
+    skipped = 0
+    dimension = None
+    rows: List[List[float]] = []
+
+    try:
+        with open(tmp / EMBEDDINGS_FILE, "wb") as emb_fh, \
+                open(tmp / IDS_FILE, "w", encoding="utf-8") as ids_fh, \
+                open(tmp / METADATA_FILE, "w", encoding="utf-8") as meta_fh, \
+                open(tmp / SCALES_FILE if dtype == "int8" else os.devnull, "wb") as scales_fh, \
+                open(tmp / EXACT_FILE if keep_exact else os.devnull, "wb") as exact_fh:
+
+            def flush():
+                if rows:
+                    if dtype == "int8":
+                        codes, scales = quantize_int8(rows)
+                        codes.tofile(emb_fh)
+                        scales.tofile(scales_fh)
+                    else:
+                        np.asarray(rows, dtype=dtype).tofile(emb_fh)
+                    if keep_exact:
+                        np.asarray(rows, dtype=np.float32).tofile(exact_fh)
+                    rows.clear()
+
+            for doc in cursor:
+                vector = doc.pop("__embedding")
+                if not isinstance(vector, list) or not vector:
+                    skipped += 1
+                    continue
+                if dimension is None:
+                    dimension = len(vector)
+                elif len(vector) != dimension:
+                    skipped += 1
+                    continue
+
+                rows.append(vector)
+                ids_fh.write(doc["_id"] + "\n")
+                meta_fh.write(json.dumps(doc) + "\n")
+                count += 1
+
+                if len(rows) >= batch_size:
+                    flush()
+            flush()
+
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "collection": collection_name,
+            "embedding_field": embedding_field,
+            "count": count,
+            "dimension": dimension or 0,
+            "dtype": dtype,
+            "exact": keep_exact,
+            "model": model,
+            "fields": fields,
+            "source_count": state["count"],
+            "max_rev": state["max_rev"],
+            "created_at": time.time()
+        }
+        with open(tmp / MANIFEST_FILE, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
+
+        # Swap into place; processes that mapped the old files keep their pages
+        old = target.with_name(f"{target.name}.old-{os.getpid()}")
+        if target.exists():
+            target.rename(old)
+        tmp.rename(target)
+        if old.exists():
+            shutil.rmtree(old)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} documents with missing or inconsistent embeddings")
+    logger.info(
+        f"Exported {count} embeddings ({dimension}-d {dtype}) from {collection_name} "
+        f"to {target} in {time.time() - start_time:.2f}s"
+    )
+    return manifest
+
+
+def read_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a snapshot manifest, returning None if it is missing or unsupported."""
+    manifest_file = Path(path) / MANIFEST_FILE
+    if not manifest_file.exists():
+        return None
+    try:
+        with open(manifest_file, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Unreadable snapshot manifest {manifest_file}: {e}")
+        return None
+
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        logger.warning(
+            f"Snapshot {path} has format version {manifest.get('format_version')}, "
+            f"expected {SNAPSHOT_FORMAT_VERSION}; ignoring it"
+        )
+        return None
+    return manifest
+
+
+def load_embedding_snapshot(
+    collection_name: str,
+    embedding_field: str = "embedding",
+    snapshot_dir: Optional[str] = None
+) -> Optional[EmbeddingSnapshot]:
+    """
+    Memory-map a snapshot without checking it against the database.
+
+    Repeated calls in the same process return the already-mapped snapshot
+    until a newer one is written.
+
+    Args:
+        collection_name: Collection the snapshot was exported from
+        embedding_field: Field containing the embedding vectors
+        snapshot_dir: Root directory for snapshots
+
+    Returns:
+        The snapshot, or None if there is no usable snapshot
+    """
+    path = snapshot_path(collection_name, embedding_field, snapshot_dir)
+    manifest = read_manifest(path)
+    if manifest is None:
+        return None
+
+    key = str(path)
+    with _loaded_lock:
+        cached = _loaded_snapshots.get(key)
+        if cached is not None and cached.manifest.get("created_at") == manifest.get("created_at"):
+            return cached
+
+        count, dimension = manifest["count"], manifest["dimension"]
+
+        def open_matrix(name, dtype, shape):
+            if count == 0:
+                return np.empty(shape, dtype=dtype)
+            return np.memmap(path / name, dtype=dtype, mode="r", shape=shape)
+
+        embeddings = open_matrix(EMBEDDINGS_FILE, manifest["dtype"], (count, dimension))
+        scales = open_matrix(SCALES_FILE, np.float32, (count,)) if manifest["dtype"] == "int8" else None
+        exact = open_matrix(EXACT_FILE, np.float32, (count, dimension)) if manifest.get("exact") else None
+
+        with open(path / IDS_FILE, encoding="utf-8") as fh:
+            ids = fh.read().splitlines()
+        metadata = []
+        if (path / METADATA_FILE).exists():
+            with open(path / METADATA_FILE, encoding="utf-8") as fh:
+                metadata = [json.loads(line) for line in fh]
+
+        if len(ids) != count or (metadata and len(metadata) != count):
+            logger.warning(f"Snapshot {path} is inconsistent with its manifest; ignoring it")
+            return None
+
+        snapshot = EmbeddingSnapshot(
+            path=path, manifest=manifest, embeddings=embeddings, ids=ids, metadata=metadata,
+            scales=scales, exact=exact
+        )
+        _loaded_snapshots[key] = snapshot
+        return snapshot
+
+
+def snapshot_matches_collection(
+    db,
+    manifest: Dict[str, Any],
+    model: Optional[str] = None
+) -> bool:
+    """
+    Check whether a snapshot manifest still describes the collection.
+
+    Args:
+        db: ArangoDB database connection
+        manifest: Snapshot manifest
+        model: If given, the embedding model the caller expects
+
+    Returns:
+        True if count, max `_rev` (and model, if given) all match
+    """
+    if model and manifest.get("model") != model:
+        return False
+    try:
+        state = get_collection_state(db, manifest["collection"], manifest["embedding_field"])
+    except Exception as e:
+        logger.warning(f"Could not read state of {manifest['collection']}: {e}")
+        return False
+    return state["count"] == manifest.get("source_count") and state["max_rev"] == manifest.get("max_rev")
+
+
+def load_matching_snapshot(
+    db,
+    collection_name: str,
+    embedding_field: str = "embedding",
+    fields_to_return: Optional[List[str]] = None,
+    snapshot_dir: Optional[str] = None
+) -> Optional[EmbeddingSnapshot]:
+    """
+    Return the snapshot for a collection only if it is current and has the requested fields.
+
+    Args:
+        db: ArangoDB database connection
+        collection_name: Collection to load
+        embedding_field: Field containing the embedding vectors
+        fields_to_return: Fields the caller needs in each row's metadata
+        snapshot_dir: Root directory for snapshots
+
+    Returns:
+        The memory-mapped snapshot, or None if the caller must load from the database
+    """
+    snapshot = load_embedding_snapshot(collection_name, embedding_field, snapshot_dir)
+    if snapshot is None:
+        return None
+
+    missing = set(fields_to_return or []) - set(snapshot.manifest["fields"]) - {embedding_field}
+    if missing:
+        logger.debug(f"Snapshot for {collection_name} lacks fields {sorted(missing)}")
+        return None
+
+    if not snapshot_matches_collection(db, snapshot.manifest):
+        logger.info(f"Snapshot for {collection_name} is stale, loading from database")
+        return None
+
+    return snapshot
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: snapshot round trip through a minimal in-memory database
+    total_tests += 1
+
+    class _AQL:
+        def __init__(self, docs):
+            self.docs = docs
+
+        def execute(self, query, bind_vars=None, **kwargs):
+            if "COLLECT AGGREGATE" in query:
+                return iter([{"count": len(self.docs), "max_rev": max(d["_rev"] for d in self.docs)}])
+            return iter([dict(d, __embedding=d["embedding"]) for d in self.docs])
+
+    class _DB:
+        def __init__(self, docs):
+            self.aql = _AQL(docs)
+
+    docs = [{"_id": f"t/{i}", "_key": str(i), "_rev": f"r{i}", "embedding": [float(i), 1.0, 0.5]} for i in range(5)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest = export_embedding_snapshot(_DB(docs), "t", snapshot_dir=tmp_dir, dtype="float16")
+        snap = load_matching_snapshot(_DB(docs), "t", snapshot_dir=tmp_dir)
+        if snap is None or snap.embeddings.shape != (5, 3) or snap.ids[4] != "t/4":
+            all_validation_failures.append(f"Round trip failed: {manifest}")
+        elif load_matching_snapshot(_DB(docs[:4]), "t", snapshot_dir=tmp_dir) is not None:
+            all_validation_failures.append("Stale snapshot was not rejected")
+
+    if all_validation_failures:
+        print(f"❌ VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"✅ VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
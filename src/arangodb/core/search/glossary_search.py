@@ -20,7 +20,6 @@ Sample Input/Output:
 """
 
 import sys
-import re
 import json
 import os
 from typing import Dict, List, Any, Set, Optional, Tuple
@@ -36,6 +35,8 @@ from arango.database import StandardDatabase
 from arango.collection import StandardCollection
 from arango.exceptions import CollectionCreateError, DocumentInsertError
 
+from arangodb.core.search.term_matcher import TermMatcher
+
 # Helper function for truncating large values
 def truncate_large_value(value, max_str_len=None, max_length=1000, max_list_elements_shown=10):
     """Truncate large values for better log readability."""
@@ -104,6 +105,7 @@ class GlossaryService:
         self.collection = None
         self._terms_cache = {}  # Cache of terms for faster lookups
         self._terms_by_length = []  # Terms sorted by length (descending)
+        self._matcher = None  # Aho-Corasick automaton over the cached terms, built on demand
         try:
             self.console = Console(force=None)  # Auto-detect terminal capabilities
         except Exception as e:
@@ -443,27 +445,12 @@ class GlossaryService:
         try:
             # Truncate large text input for matching to avoid memory issues
             safe_text = truncate_large_value(text, max_str_len=5000)
-            text_lower = safe_text.lower() if isinstance(safe_text, str) else str(safe_text).lower()
-            matched_terms = []
-            matched_positions = set()
-            
-            for term_lower, term_info in self._terms_by_length:
-                pattern = r'\b' + re.escape(term_lower) + r'\b'
-                for match in re.finditer(pattern, text_lower):
-                    start, end = match.span()
-                    overlap = False
-                    for pos in range(start, end):
-                        if pos in matched_positions:
-                            overlap = True
-                            break
-                    
-                    if not overlap:
-                        matched_terms.append({
-                            "term": term_info["term"],
-                            "definition": term_info["definition"]
-                        })
-                        for pos in range(start, end):
-                            matched_positions.add(pos)
+            if not isinstance(safe_text, str):
+                safe_text = str(safe_text)
+            matched_terms = [
+                {"term": match["term"], "definition": match["definition"]}
+                for match in self._match_terms(safe_text)
+            ]
             
             matched_terms.sort(key=lambda x: x["term"].lower())
             
@@ -532,26 +519,53 @@ class GlossaryService:
         if not isinstance(safe_text, str):
             return str(safe_text)
             
-        matched_terms = json.loads(self.find_terms_in_text(safe_text, output="json"))
+        if not self._terms_cache:
+            self._refresh_cache()
         
-        if not matched_terms:
-            return safe_text
+        # Splice markers around the matched spans instead of re-searching the text
+        parts = []
+        last_end = 0
+        for match in self._match_terms(safe_text):
+            parts.append(safe_text[last_end:match["start"]])
+            parts.append(f"**{safe_text[match['start']:match['end']]}**")
+            last_end = match["end"]
+        parts.append(safe_text[last_end:])
         
-        pattern_parts = []
-        for term_info in matched_terms:
-            term = term_info["term"]
-            pattern_parts.append(r'\b' + re.escape(term) + r'\b')
+        return "".join(parts)
+    
+    def find_terms_in_texts(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Tag many documents with glossary terms using one shared automaton.
         
-        pattern = '|'.join(pattern_parts)
+        Args:
+            texts: The texts to search for glossary terms
+            
+        Returns:
+            For each text, its non-overlapping matches in text order, each with
+            term, definition, start and end offsets
+        """
+        if not self._terms_cache:
+            self._refresh_cache()
         
-        highlighted_text = re.sub(
-            pattern,
-            r'**\g<0>**',
-            safe_text,
-            flags=re.IGNORECASE
-        )
+        return [self._match_terms(text) if text else [] for text in texts]
+    
+    def _match_terms(self, text: str) -> List[Dict[str, Any]]:
+        """Return the leftmost-longest whole-word term matches in `text`."""
+        if not self._terms_cache:
+            return []
+        if self._matcher is None:
+            self._matcher = TermMatcher(self._terms_cache.keys())
         
-        return highlighted_text
+        matches = []
+        for start, end, term_lower in self._matcher.find(text):
+            term_info = self._terms_cache[term_lower]
+            matches.append({
+                "term": term_info["term"],
+                "definition": term_info["definition"],
+                "start": start,
+                "end": end
+            })
+        return matches
     
     def _refresh_cache(self):
         """Refresh the in-memory cache of terms."""
@@ -591,7 +605,8 @@ class GlossaryService:
             logger.error(f"Error refreshing cache: {e}")
     
     def _rebuild_sorted_terms(self):
-        """Rebuild the sorted list of terms by length (descending)."""
+        """Rebuild the sorted list of terms by length (descending) and drop the stale matcher."""
+        self._matcher = None
         self._terms_by_length = sorted(
             self._terms_cache.items(),
             key=lambda x: len(x[0]),
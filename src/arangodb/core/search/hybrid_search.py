@@ -12,6 +12,8 @@ delivering the best results from multiple search paradigms using Reciprocal Rank
 - Optional graph traversal integration
 - Optional Perplexity API enrichment with structured output
 - Customizable weighting between search types
+- Concurrent search legs with per-leg timeouts and partial-result fusion
+- Single-round-trip server-side mode that fuses BM25 and vector scores in AQL
 - Multiple output formats (JSON, table)
 """
 
@@ -19,7 +21,8 @@ import sys
 import json
 import time
 import uuid
-from typing import Dict, Any, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable
 
 import litellm
 from pydantic import BaseModel, Field
@@ -60,6 +63,7 @@ from arangodb.core.search.bm25_search import bm25_search
 from arangodb.core.search.semantic_search import semantic_search, safe_semantic_search
 from arangodb.core.arango_setup import ensure_arangosearch_view
 from arangodb.core.search.search_config import SearchConfig, SearchConfigManager, SearchMethod
+from arangodb.core.search.result_cache import cache_search_results
 
 # Optional imports with fallbacks
 try:
@@ -78,6 +82,10 @@ except ImportError:
         logger.warning("Graph search called but module is not available")
         return {"results": [], "total": 0, "error": "Graph search module is not available"}
 
+# Default per-leg deadlines (seconds) for concurrent hybrid search; the semantic
+# leg includes query embedding, so it gets the most headroom
+DEFAULT_LEG_TIMEOUTS = {"bm25": 5.0, "semantic": 15.0, "graph": 5.0}
+
 # Helper functions
 def truncate_large_value(value, max_length=1000, max_list_elements_shown=10, max_str_len=None):
     """Truncate large values for better log readability."""
@@ -362,6 +370,272 @@ def enrich_with_perplexity(db, query_text, search_results, top_n=3):
         return search_results
 
 
+def leg_candidates(name: str, search_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Unwrap a search function's response for use as a leg's candidate list.
+
+    The search functions report failures as an {"error": ...} dict instead of
+    raising; re-raise so run_search_legs records the leg as failed and the
+    fused response is marked partial.
+    """
+    if search_results.get("error"):
+        raise RuntimeError(f"{name} search failed: {search_results['error']}")
+    return search_results.get("results", [])
+
+
+def run_search_legs(
+    legs: Dict[str, Callable[[], List[Dict[str, Any]]]],
+    timeouts: Optional[Union[float, Dict[str, float]]] = None,
+    concurrent: bool = True
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, float], List[str], Dict[str, str]]:
+    """
+    Run independent search legs, optionally in parallel with per-leg deadlines.
+
+    A leg that raises or misses its deadline contributes no candidates, so the
+    caller can fuse whatever the other legs returned. Timed-out legs keep running
+    in the background (a thread cannot be interrupted) but their results are dropped.
+    Each call gets its own executor, so an abandoned leg only holds its own
+    thread and cannot starve later searches of workers.
+
+    Args:
+        legs: Leg name -> callable returning that leg's candidate list
+        timeouts: Seconds per leg, one value for all legs or a dict per leg
+            (concurrent mode only; defaults to DEFAULT_LEG_TIMEOUTS)
+        concurrent: Run the legs on threads instead of in order
+
+    Returns:
+        Tuple of (results per leg, seconds per leg, timed out leg names, errors per leg)
+    """
+    if timeouts is None:
+        timeouts = DEFAULT_LEG_TIMEOUTS
+    if not isinstance(timeouts, dict):
+        timeouts = {name: float(timeouts) for name in legs}
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    timings: Dict[str, float] = {}
+    timed_out: List[str] = []
+    errors: Dict[str, str] = {}
+
+    def timed(fn):
+        # Runs on a worker; touches only its own locals so an abandoned leg
+        # never writes into the caller's dicts after this function returns
+        leg_start = time.time()
+        try:
+            return fn(), None, time.time() - leg_start
+        except Exception as e:
+            return None, e, time.time() - leg_start
+
+    def record(name, outcome):
+        result, error, elapsed = outcome
+        timings[name] = elapsed
+        if error is not None:
+            logger.error(f"{name} search leg failed: {error}")
+            errors[name] = str(error)
+        else:
+            results[name] = result
+
+    if not concurrent:
+        for name, fn in legs.items():
+            record(name, timed(fn))
+        return results, timings, timed_out, errors
+
+    started = time.time()
+    executor = ThreadPoolExecutor(max_workers=max(1, len(legs)), thread_name_prefix="hybrid-leg")
+    try:
+        futures = {name: executor.submit(timed, fn) for name, fn in legs.items()}
+        for name, future in futures.items():
+            deadline = started + timeouts.get(name, DEFAULT_LEG_TIMEOUTS.get(name, 10.0))
+            try:
+                record(name, future.result(timeout=max(0.0, deadline - time.time())))
+            except FutureTimeoutError:
+                timed_out.append(name)
+                timings[name] = time.time() - started
+                logger.warning(f"{name} search leg timed out after {timings[name]:.3f}s; fusing without it")
+    finally:
+        # Do not wait for abandoned legs; their threads exit when the leg returns
+        executor.shutdown(wait=False)
+    return results, timings, timed_out, errors
+
+
+def aql_hybrid_search(
+    db: StandardDatabase,
+    query_text: str,
+    collection_name: str = COLLECTION_NAME,
+    view_name: str = VIEW_NAME,
+    query_embedding: Optional[List[float]] = None,
+    filter_expr: Optional[str] = None,
+    tag_list: Optional[List[str]] = None,
+    require_all_tags: bool = False,
+    min_score: Optional[Dict[str, float]] = None,
+    weights: Optional[Dict[str, float]] = None,
+    top_n: int = 10,
+    initial_k: int = 20,
+    rrf_k: int = 60,
+    fields_to_return: Optional[List[str]] = None,
+    fields_to_search: Optional[List[str]] = None,
+    embedding_field: str = EMBEDDING_FIELD
+) -> Dict[str, Any]:
+    """
+    Hybrid search fused server-side in a single AQL query.
+
+    BM25 over the ArangoSearch view and APPROX_NEAR_COSINE over the collection
+    each produce up to `initial_k` document ids; weighted RRF (same formula as
+    `weighted_reciprocal_rank_fusion`) runs inside AQL and only the final `top_n`
+    documents are returned, with KEEP'd fields. Documents found by both legs are
+    therefore transferred once, and the search costs one round trip.
+
+    Args:
+        db: ArangoDB database connection
+        query_text: The user's search query
+        collection_name: Collection holding the embeddings
+        view_name: ArangoSearch view used for BM25
+        query_embedding: Precomputed query embedding (generated if None)
+        filter_expr: Optional AQL filter expression on `doc`
+        tag_list: Optional tags to filter by
+        require_all_tags: Whether all tags must be present
+        min_score: Minimum scores for each leg (bm25, semantic)
+        weights: Weights for each leg (bm25, semantic)
+        top_n: Number of fused results to return
+        initial_k: Candidates per leg fed into the fusion
+        rrf_k: Constant used in the RRF calculation
+        fields_to_return: Document fields to return
+        fields_to_search: Fields searched by BM25 (defaults to SEARCH_FIELDS)
+        embedding_field: Field containing the embeddings
+
+    Returns:
+        Dict with 'results' (doc, ranks, leg scores and hybrid_score), 'total'
+        fused candidates, 'time' and 'search_engine'
+    """
+    start_time = time.time()
+    min_score = min_score or {"bm25": 0.1, "semantic": 0.7}
+    weights = weights or {"bm25": 0.5, "semantic": 0.5}
+    if not fields_to_return:
+        fields_to_return = ["_key", "_id", "question", "problem", "solution", "context", "tags", "label", "validated"]
+
+    if query_embedding is None:
+        query_embedding = get_embedding(query_text)
+        if not query_embedding:
+            return {
+                "results": [],
+                "total": 0,
+                "query": query_text,
+                "time": time.time() - start_time,
+                "error": "Failed to generate embedding for semantic search",
+                "search_engine": "hybrid-failed"
+            }
+
+    filter_clauses = []
+    if filter_expr:
+        filter_clauses.append(f"({filter_expr})")
+    if tag_list:
+        filter_clauses.append(f"@tags {'ALL' if require_all_tags else 'ANY'} IN doc.tags")
+    filter_clause = f"FILTER {' AND '.join(filter_clauses)}" if filter_clauses else ""
+
+    search_fields = list(fields_to_search) if fields_to_search else list(set(list(SEARCH_FIELDS) + ["content"]))
+    search_field_conditions = " OR ".join(
+        f'ANALYZER(doc.{field} IN search_tokens, "{TEXT_ANALYZER}")' for field in search_fields
+    )
+
+    # APPROX_NEAR_COSINE needs SORT/LIMIT directly on the vector index, so
+    # filters run after an over-fetch, as in semantic_search
+    vector_limit = initial_k * 5 if filter_clause else initial_k
+
+    aql = f"""
+    LET search_tokens = TOKENS(@query, "{TEXT_ANALYZER}")
+    LET bm25_hits = (
+        FOR doc IN {view_name}
+        SEARCH {search_field_conditions}
+        {filter_clause}
+        LET score = BM25(doc)
+        FILTER score >= @bm25_min
+        SORT score DESC
+        LIMIT @initial_k
+        RETURN {{id: doc._id, score: score}}
+    )
+    LET vector_hits = (
+        FOR doc IN @@collection
+        LET score = APPROX_NEAR_COSINE(doc.{embedding_field}, @embedding)
+        SORT score DESC
+        LIMIT @vector_limit
+        {filter_clause}
+        FILTER score >= @semantic_min
+        LIMIT @initial_k
+        RETURN {{id: doc._id, score: score}}
+    )
+    LET bm25_ids = bm25_hits[*].id
+    LET vector_ids = vector_hits[*].id
+    LET candidate_ids = UNION_DISTINCT(bm25_ids, vector_ids)
+    LET ranked = (
+        FOR id IN candidate_ids
+        LET bm25_pos = POSITION(bm25_ids, id, true)
+        LET vector_pos = POSITION(vector_ids, id, true)
+        LET bm25_rank = bm25_pos >= 0 ? bm25_pos + 1 : LENGTH(bm25_ids) + 1
+        LET semantic_rank = vector_pos >= 0 ? vector_pos + 1 : LENGTH(vector_ids) + 1
+        LET hybrid_score = @bm25_weight / (@rrf_k + bm25_rank) + @semantic_weight / (@rrf_k + semantic_rank)
+        SORT hybrid_score DESC
+        LIMIT @top_n
+        RETURN {{
+            doc: KEEP(DOCUMENT(id), @fields),
+            bm25_rank: bm25_rank,
+            bm25_score: bm25_pos >= 0 ? bm25_hits[bm25_pos].score : 0,
+            semantic_rank: semantic_rank,
+            semantic_score: vector_pos >= 0 ? vector_hits[vector_pos].score : 0,
+            hybrid_score: hybrid_score
+        }}
+    )
+    RETURN {{total: LENGTH(candidate_ids), results: ranked}}
+    """
+    bind_vars = {
+        "query": query_text,
+        "@collection": collection_name,
+        "embedding": query_embedding,
+        "bm25_min": min_score.get("bm25", 0.1),
+        "semantic_min": min_score.get("semantic", 0.7),
+        "bm25_weight": weights.get("bm25", 0.5),
+        "semantic_weight": weights.get("semantic", 0.5),
+        "rrf_k": rrf_k,
+        "initial_k": initial_k,
+        "vector_limit": vector_limit,
+        "top_n": top_n,
+        "fields": fields_to_return
+    }
+    if tag_list:
+        bind_vars["tags"] = tag_list
+
+    try:
+        cursor = db.aql.execute(aql, bind_vars=bind_vars)
+        row = next(cursor, None) or {"total": 0, "results": []}
+    except (AQLQueryExecuteError, ArangoServerError) as e:
+        logger.error(f"Server-side hybrid search failed: {e}")
+        return {
+            "results": [],
+            "total": 0,
+            "query": query_text,
+            "time": time.time() - start_time,
+            "error": str(e),
+            "search_engine": "hybrid-failed"
+        }
+
+    search_time = time.time() - start_time
+    logger.info(f"Server-side hybrid search returned {len(row['results'])} of {row['total']} candidates in {search_time:.3f}s")
+    return {
+        "results": row["results"],
+        "total": row["total"],
+        "query": query_text,
+        "time": search_time,
+        "search_engine": "hybrid-aql-rrf",
+        "weights": weights
+    }
+
+
+def _graph_collections(params: Dict[str, Any]) -> List[str]:
+    """Edge collection read by graph-expanded hybrid searches."""
+    if not params.get("use_graph"):
+        return []
+    return [params.get("edge_collection_name") or EDGE_COLLECTION_NAME]
+
+
+@cache_search_results("hybrid", default_collections=[COLLECTION_NAME], dependent_collections=_graph_collections)
 def hybrid_search(
     db: StandardDatabase,
     query_text: str,
@@ -383,7 +657,10 @@ def hybrid_search(
     relationship_types: Optional[List[str]] = None,
     edge_collection_name: Optional[str] = None,
     use_perplexity: bool = False,
-    fields_to_search: Optional[List[str]] = None  # Add field flexibility
+    fields_to_search: Optional[List[str]] = None,  # Add field flexibility
+    concurrent: bool = True,
+    leg_timeouts: Optional[Union[float, Dict[str, float]]] = None,
+    server_side: bool = False
 ) -> Dict[str, Any]:
     """
     Performs hybrid search by combining BM25, Semantic search, and optionally
@@ -411,10 +688,17 @@ def hybrid_search(
         edge_collection_name: Custom edge collection name (uses default if None)
         use_perplexity: Whether to enrich results with Perplexity API
         fields_to_search: Optional list of fields to search in text searches (BM25/keyword)
+        concurrent: Run the BM25, semantic and graph legs in parallel threads
+        leg_timeouts: Seconds each leg may take in concurrent mode, either one value
+            for all legs or a dict per leg (defaults to DEFAULT_LEG_TIMEOUTS). Legs that
+            miss their deadline are left out of the fusion and listed in 'timed_out_legs'.
+        server_side: Fuse BM25 and semantic results inside a single AQL query
+            (see `aql_hybrid_search`); ignored when use_graph is set
 
     Returns:
         A dictionary containing the ranked 'results', 'total' unique documents found,
-        the 'query' for reference, and other metadata.
+        the 'query' for reference, per-leg 'leg_timings', the 'timed_out_legs' and
+        'leg_errors' that were left out of the fusion, and other metadata.
     """
     start_time = time.time()
     logger.info(f"Hybrid search for query: '{query_text}'")
@@ -476,6 +760,28 @@ def hybrid_search(
         for key in weights:
             weights[key] = weights[key] / total_weight
     
+    if server_side and not use_graph:
+        response = aql_hybrid_search(
+            db=db,
+            query_text=query_text,
+            collection_name=collections[0],
+            filter_expr=filter_expr,
+            tag_list=tag_list,
+            require_all_tags=require_all_tags,
+            min_score=min_score,
+            weights=weights,
+            top_n=top_n,
+            initial_k=initial_k,
+            rrf_k=rrf_k,
+            fields_to_return=fields_to_return,
+            fields_to_search=fields_to_search
+        )
+        response.update({"format": output_format, "tags": tag_list,
+                         "require_all_tags": require_all_tags if tag_list else None})
+        if use_perplexity and HAS_LITELLM and response["results"]:
+            response = enrich_with_perplexity(db, query_text, response)
+        return response
+
     try:
         # STEP 1: Run tag search first if tags are provided to pre-filter the dataset
         tag_filtered_ids = None
@@ -539,112 +845,112 @@ def hybrid_search(
                 
             logger.info(f"Created tag-filtered expression for {len(tag_filtered_ids)} documents")
         
-        # STEP 2: Run BM25 search without tag filtering (we're using tag_filtered_filter_expr instead)
-        bm25_time_start = time.time()
-        bm25_results = bm25_search(
-            db=db,
-            query_text=query_text,
-            collections=collections,
-            filter_expr=tag_filtered_filter_expr,  # Use our combined filter
-            min_score=min_score.get("bm25", 0.1),
-            top_n=initial_k,
-            tag_list=None,  # No tag filtering here, we've already handled it'
-            output_format="json",
-            fields_to_search=fields_to_search  # Pass through optional fields
+        # STEP 2-4: Run the BM25, semantic (embedding + vector search) and graph legs.
+        # The legs are independent round trips, so in concurrent mode they overlap
+        # and a slow leg is cut off at its deadline instead of delaying the others.
+        def run_bm25():
+            return leg_candidates("bm25", bm25_search(
+                db=db,
+                query_text=query_text,
+                collections=collections,
+                filter_expr=tag_filtered_filter_expr,  # Use our combined filter
+                min_score=min_score.get("bm25", 0.1),
+                top_n=initial_k,
+                tag_list=None,  # No tag filtering here, we've already handled it'
+                output_format="json",
+                fields_to_search=fields_to_search,  # Pass through optional fields
+                use_cache=False  # The fused hybrid response is cached instead
+            ))
+
+        def run_semantic():
+            # Embed once and search by vector so the query is not embedded twice
+            query_embedding = get_embedding(query_text)
+            if not query_embedding:
+                raise ValueError("Failed to generate embedding for semantic search")
+            return leg_candidates("semantic", safe_semantic_search(
+                db=db,
+                query=query_embedding,
+                collections=collections,
+                filter_expr=tag_filtered_filter_expr,  # Use our combined filter
+                min_score=min_score.get("semantic", 0.7),
+                top_n=initial_k,
+                tag_list=None,  # No tag filtering here, we've already handled it'
+                output_format="json",
+                use_cache=False
+            ))
+
+        def run_graph():
+            # Use default or custom edge collection
+            edge_col = edge_collection_name or EDGE_COLLECTION_NAME
+            if not db.has_collection(edge_col):
+                logger.warning(f"Edge collection '{edge_col}' does not exist, skipping graph search")
+                return []
+
+            graph_results = graph_rag_search(
+                db=db,
+                query_text=query_text,
+                min_depth=graph_min_depth,
+                max_depth=graph_max_depth,
+                direction=graph_direction,
+                relationship_types=relationship_types,
+                min_score=min_score.get("graph", 0.5),
+                top_n=initial_k,
+                output_format="json",
+                fields_to_return=fields_to_return,
+                edge_collection_name=edge_col,
+                filter_expr=tag_filtered_filter_expr  # Use our combined filter
+            )
+            candidates = list(leg_candidates("graph", graph_results))
+
+            # Add related documents as candidates with a slightly reduced score
+            for result in list(candidates):
+                for related in result.get("related", []):
+                    vertex = related.get("vertex", {})
+                    if vertex:
+                        candidates.append({
+                            "doc": vertex,
+                            "score": result.get("score", 0) * 0.8
+                        })
+            return candidates
+
+        legs = {"bm25": run_bm25, "semantic": run_semantic}
+        if use_graph:
+            logger.info(f"Running graph traversal search (depth: {graph_min_depth}-{graph_max_depth}, direction: {graph_direction})")
+            legs["graph"] = run_graph
+
+        leg_results, leg_timings, timed_out_legs, leg_errors = run_search_legs(
+            legs, timeouts=leg_timeouts, concurrent=concurrent
         )
-        bm25_time = time.time() - bm25_time_start
-        
-        # Extract BM25 candidates
-        bm25_candidates = bm25_results.get("results", [])
+
+        bm25_candidates = leg_results.get("bm25", [])
+        semantic_candidates = leg_results.get("semantic", [])
+        graph_candidates = leg_results.get("graph", [])
+        bm25_time = leg_timings.get("bm25", 0)
+        semantic_time = leg_timings.get("semantic", 0)
+        graph_time = leg_timings.get("graph", 0)
         logger.info(f"BM25 search found {len(bm25_candidates)} candidates in {bm25_time:.3f}s")
-        
-        # STEP 3: Run semantic search (without duplicate tag filtering)
-        semantic_time_start = time.time()
-        
-        # Get embedding for query
-        query_embedding = get_embedding(query_text)
-        if not query_embedding:
-            logger.error("Failed to generate embedding for query")
+        logger.info(f"Semantic search found {len(semantic_candidates)} candidates in {semantic_time:.3f}s")
+        if use_graph:
+            logger.info(f"Graph search found {len(graph_candidates)} candidates (including related docs)")
+
+        if len(leg_errors) + len(timed_out_legs) == len(legs):
+            error_msg = "; ".join(f"{name}: {err}" for name, err in leg_errors.items())
+            if timed_out_legs:
+                error_msg = "; ".join(filter(None, [error_msg, f"timed out: {', '.join(timed_out_legs)}"]))
+            logger.error(f"All hybrid search legs failed: {error_msg}")
             return {
                 "results": [],
                 "total": 0,
                 "query": query_text,
                 "time": time.time() - start_time,
-                "error": "Failed to generate embedding for semantic search",
+                "error": error_msg,
+                "leg_timings": leg_timings,
+                "timed_out_legs": timed_out_legs,
+                "leg_errors": leg_errors,
                 "search_engine": "hybrid-failed",
                 "format": output_format
             }
         
-        semantic_results = safe_semantic_search(
-            db=db,
-            query=query_text,
-            collections=collections,
-            filter_expr=tag_filtered_filter_expr,  # Use our combined filter
-            min_score=min_score.get("semantic", 0.7),
-            top_n=initial_k,
-            tag_list=None,  # No tag filtering here, we've already handled it'
-            output_format="json"
-        )
-        semantic_time = time.time() - semantic_time_start
-        
-        # Extract semantic candidates
-        semantic_candidates = semantic_results.get("results", [])
-        logger.info(f"Semantic search found {len(semantic_candidates)} candidates in {semantic_time:.3f}s")
-        
-        # STEP 4: Run graph traversal search if enabled
-        graph_candidates = []
-        graph_time = 0
-        
-        if use_graph:
-            logger.info(f"Running graph traversal search (depth: {graph_min_depth}-{graph_max_depth}, direction: {graph_direction})")
-            graph_time_start = time.time()
-            
-            # Use default or custom edge collection
-            edge_col = edge_collection_name or EDGE_COLLECTION_NAME
-            
-            # Check if edge collection exists
-            if not db.has_collection(edge_col):
-                logger.warning(f"Edge collection '{edge_col}' does not exist, skipping graph search")
-            else:
-                # Run graph traversal search
-                graph_results = graph_rag_search(
-                    db=db,
-                    query_text=query_text,
-                    min_depth=graph_min_depth,
-                    max_depth=graph_max_depth,
-                    direction=graph_direction,
-                    relationship_types=relationship_types,
-                    min_score=min_score.get("graph", 0.5),
-                    top_n=initial_k,
-                    output_format="json",
-                    fields_to_return=fields_to_return,
-                    edge_collection_name=edge_col,
-                    filter_expr=tag_filtered_filter_expr  # Use our combined filter
-                )
-                
-                # Extract graph candidates
-                graph_candidates = graph_results.get("results", [])
-                
-                # Process related documents to add them as candidates
-                # Create a copy of the original candidates to avoid modifying during iteration
-                original_graph_candidates = list(graph_candidates)
-                
-                for result in original_graph_candidates:
-                    # Add related documents as candidates
-                    related_docs = result.get("related", [])
-                    for related in related_docs:
-                        vertex = related.get("vertex", {})
-                        if vertex:
-                            # Add as a graph candidate with a reduced score from the original document
-                            graph_candidates.append({
-                                "doc": vertex,
-                                "score": result.get("score", 0) * 0.8  # Slightly reduce score for related docs
-                            })
-                
-                logger.info(f"Graph search found {len(graph_candidates)} candidates (including related docs)")
-            
-            graph_time = time.time() - graph_time_start
-        
         # STEP 5: Combine results using weighted RRF
         combined_weights = weights
         logger.info(f"Combining results with weights: {combined_weights}")
@@ -691,6 +997,10 @@ def hybrid_search(
             "time": search_time,
             "bm25_time": bm25_time,
             "semantic_time": semantic_time,
+            "leg_timings": leg_timings,
+            "timed_out_legs": timed_out_legs,
+            "leg_errors": leg_errors,
+            "partial": bool(timed_out_legs or leg_errors),
             "search_engine": "hybrid-bm25-semantic",
             "weights": weights,
             "format": output_format,
@@ -1057,6 +1367,15 @@ def search_with_config(
         if config.include_graph_context:
             weights["graph"] = 1.0 - config.bm25_weight - config.semantic_weight
         
+        # timeout_ms bounds the database legs; the semantic leg also embeds the
+        # query, so it keeps its own (longer) default unless the budget is larger
+        timeout = config.timeout_ms / 1000.0
+        leg_timeouts = {
+            "bm25": timeout,
+            "semantic": max(timeout, DEFAULT_LEG_TIMEOUTS["semantic"]),
+            "graph": timeout
+        }
+        
         return hybrid_search(
             db=db,
             query_text=query_text,
@@ -1071,7 +1390,8 @@ def search_with_config(
             fields_to_return=config.metadata_filters.get("fields_to_return"),
             use_graph=config.include_graph_context,
             graph_max_depth=config.graph_depth,
-            fields_to_search=config.metadata_filters.get("fields_to_search")
+            fields_to_search=config.metadata_filters.get("fields_to_search"),
+            leg_timeouts=leg_timeouts
         )
     
     else:
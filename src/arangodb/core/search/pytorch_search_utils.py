@@ -20,6 +20,7 @@ import sys
 import os
 import json
 import time
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Union, Tuple, Callable
 
 from loguru import logger
@@ -171,10 +172,11 @@ except ImportError:
     TQDM_AVAILABLE = False
     logger.warning("tqdm not available, progress bars will be disabled")
 
-# In-memory document cache
-_document_cache = {}
-_embedding_cache = {}
-_metadata_cache = {}
+# In-memory document cache, bounded to the most recently used filters
+_MAX_CACHED_FILTERS = 8
+_document_cache = OrderedDict()
+_embedding_cache = OrderedDict()
+_metadata_cache = OrderedDict()
 
 # Use dependency checker's flag for PyTorch availability
 def has_pytorch_available() -> bool:
@@ -194,11 +196,16 @@ def load_documents_from_arango(
     filter_conditions: str = "",
     fields_to_return: Optional[List[str]] = None,
     force_reload: bool = False,
-    show_progress: bool = True
+    show_progress: bool = True,
+    use_snapshot: bool = True,
+    snapshot_dir: Optional[str] = None
 ) -> Tuple[Optional[List], Optional[List], Optional[List], Optional[int]]:
     """
     Load documents and embeddings from ArangoDB with optional filtering.
     Uses in-memory caching to speed up repeated searches.
+
+    Unfiltered loads prefer a memory-mapped embedding snapshot when its
+    manifest still matches the collection's count and max `_rev`.
     
     Args:
         db: ArangoDB database connection
@@ -208,6 +215,8 @@ def load_documents_from_arango(
         fields_to_return: Fields to include in the result
         force_reload: Whether to force reload from the database
         show_progress: Whether to show a progress bar
+        use_snapshot: Whether to use a matching on-disk snapshot
+        snapshot_dir: Root directory for snapshots (defaults to EMBEDDING_SNAPSHOT_DIR)
         
     Returns:
         Tuple of:
@@ -220,6 +229,8 @@ def load_documents_from_arango(
     cache_key = f"{collection_name}_{embedding_field}_{filter_conditions}"
     if not force_reload and cache_key in _document_cache:
         logger.info(f"Using cached documents for {collection_name}")
+        for cache in (_embedding_cache, _document_cache, _metadata_cache):
+            cache.move_to_end(cache_key)
         return (_embedding_cache[cache_key],
                 _document_cache[cache_key],
                 _metadata_cache[cache_key],
@@ -241,6 +252,24 @@ def load_documents_from_arango(
             if field not in fields_to_return:
                 fields_to_return.append(field)
         
+        if use_snapshot and not filter_conditions:
+            from arangodb.core.search.embedding_snapshot import load_matching_snapshot
+            snapshot = load_matching_snapshot(
+                db, collection_name, embedding_field,
+                fields_to_return=fields_to_return,
+                snapshot_dir=snapshot_dir
+            )
+            # int8 snapshots without a float32 copy need scales, so they only seed resident indexes
+            if snapshot is not None and snapshot.float_embeddings is not None:
+                logger.info(f"Using embedding snapshot {snapshot.path} ({snapshot.count} documents)")
+                _embedding_cache[cache_key] = snapshot.float_embeddings
+                _document_cache[cache_key] = snapshot.ids
+                _metadata_cache[cache_key] = snapshot.metadata
+                while len(_document_cache) > _MAX_CACHED_FILTERS:
+                    for cache in (_embedding_cache, _document_cache, _metadata_cache):
+                        cache.popitem(last=False)
+                return snapshot.float_embeddings, snapshot.ids, snapshot.metadata, snapshot.dimension
+        
         # Build KEEP clause
         fields_str = '", "'.join(fields_to_return)
         fields_str = f'"{fields_str}"'
@@ -320,10 +349,13 @@ def load_documents_from_arango(
         load_time = time.time() - start_time
         logger.info(f"Loaded {len(embeddings)} documents in {load_time:.2f}s with embedding dimension {dimension}")
         
-        # Cache the results
+        # Cache the results, evicting the least recently used filter
         _embedding_cache[cache_key] = embeddings_np
         _document_cache[cache_key] = ids
         _metadata_cache[cache_key] = metadata
+        while len(_document_cache) > _MAX_CACHED_FILTERS:
+            for cache in (_embedding_cache, _document_cache, _metadata_cache):
+                cache.popitem(last=False)
         
         return embeddings_np, ids, metadata, dimension
     
@@ -335,12 +367,263 @@ def load_documents_from_arango(
 def clear_document_cache():
     """Clear the in-memory document cache to free up memory."""
     global _document_cache, _embedding_cache, _metadata_cache
-    _document_cache = {}
-    _embedding_cache = {}
-    _metadata_cache = {}
+    _document_cache = OrderedDict()
+    _embedding_cache = OrderedDict()
+    _metadata_cache = OrderedDict()
     logger.info("Document cache cleared")
 
 
+# Rows scored per GEMM in the top-k kernel; only the (batch x queries) score
+# block is materialised, so this can be much larger than a model batch.
+DEFAULT_SEARCH_BATCH_SIZE = 16384
+
+
+def _batch_scores_torch(batch, queries, distance_fn: str):
+    """Score a block of rows against every query (rows x queries)."""
+    import torch
+    if distance_fn == "cosine":
+        # Queries are pre-normalised; divide by row norms instead of copying a normalised matrix
+        norms = torch.linalg.vector_norm(batch, dim=1, keepdim=True).clamp_min(1e-12)
+        return torch.matmul(batch, queries.T) / norms
+    if distance_fn == "dot":
+        return torch.matmul(batch, queries.T)
+    if distance_fn == "l2":
+        # L2 distance (lower is better), negated so that higher is better
+        return -torch.cdist(batch, queries).pow(2)
+    raise ValueError(f"Unknown distance function: {distance_fn}")
+
+
+def _batch_scores_numpy(batch, queries, distance_fn: str):
+    """NumPy equivalent of `_batch_scores_torch`."""
+    import numpy as np
+    if distance_fn == "cosine":
+        norms = np.maximum(np.linalg.norm(batch, axis=1, keepdims=True), 1e-12)
+        return (batch @ queries.T) / norms
+    if distance_fn == "dot":
+        return batch @ queries.T
+    if distance_fn == "l2":
+        diff = batch[:, None, :] - queries[None, :, :]
+        return -np.einsum("bqd,bqd->bq", diff, diff)
+    raise ValueError(f"Unknown distance function: {distance_fn}")
+
+
+def _topk_indices_torch(embeddings, queries, threshold, top_k, batch_size, fp16, distance_fn, row_scales, pbar):
+    """Running top-k over row blocks with torch; returns (scores, indices) as (k x queries) arrays."""
+    import torch
+    import numpy as np
+
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    dtype = torch.float16 if fp16 and device.type == "cuda" else torch.float32
+    logger.debug(f"Using device: {device} for top-k search")
+
+    # Blocks are converted one at a time so the source matrix is never copied whole
+    matrix = embeddings if isinstance(embeddings, np.ndarray) else np.asarray(embeddings, dtype=np.float32)
+    query_tensor = torch.as_tensor(queries, dtype=torch.float32, device=device)
+    if distance_fn == "cosine":
+        query_tensor = torch.nn.functional.normalize(query_tensor, p=2, dim=1)
+    query_tensor = query_tensor.to(dtype)
+
+    num_queries = query_tensor.shape[0]
+    best_scores = torch.empty((0, num_queries), dtype=torch.float32, device=device)
+    best_indices = torch.empty((0, num_queries), dtype=torch.long, device=device)
+
+    with torch.inference_mode():
+        for start in range(0, matrix.shape[0], batch_size):
+            if pbar:
+                pbar.update(1)
+            block = np.ascontiguousarray(matrix[start:start + batch_size], dtype=np.float32)
+            if row_scales is not None:
+                # Dequantize per-vector scaled int8 rows block by block
+                block *= np.asarray(row_scales[start:start + batch_size], dtype=np.float32)[:, None]
+            batch = torch.from_numpy(block).to(device=device, dtype=dtype)
+            scores = _batch_scores_torch(batch, query_tensor, distance_fn).float()
+            scores = scores.masked_fill(scores < threshold, float("-inf"))
+
+            k = min(top_k, scores.shape[0])
+            values, indices = torch.topk(scores, k, dim=0)
+
+            # Merge the batch winners into the running top-k
+            merged_scores = torch.cat([best_scores, values])
+            merged_indices = torch.cat([best_indices, indices + start])
+            k = min(top_k, merged_scores.shape[0])
+            best_scores, order = torch.topk(merged_scores, k, dim=0)
+            best_indices = torch.gather(merged_indices, 0, order)
+
+    return best_scores.cpu().numpy(), best_indices.cpu().numpy()
+
+
+def _topk_indices_numpy(embeddings, queries, threshold, top_k, batch_size, distance_fn, row_scales, pbar):
+    """Running top-k over row blocks with NumPy argpartition."""
+    import numpy as np
+
+    matrix = embeddings if isinstance(embeddings, np.ndarray) else np.asarray(embeddings, dtype=np.float32)
+    query_matrix = np.asarray(queries, dtype=np.float32)
+    if distance_fn == "cosine":
+        norms = np.maximum(np.linalg.norm(query_matrix, axis=1, keepdims=True), 1e-12)
+        query_matrix = query_matrix / norms
+
+    num_queries = query_matrix.shape[0]
+    columns = np.arange(num_queries)
+    best_scores = np.empty((0, num_queries), dtype=np.float32)
+    best_indices = np.empty((0, num_queries), dtype=np.int64)
+
+    for start in range(0, matrix.shape[0], batch_size):
+        if pbar:
+            pbar.update(1)
+        block = np.asarray(matrix[start:start + batch_size], dtype=np.float32)
+        if row_scales is not None:
+            block = block * np.asarray(row_scales[start:start + batch_size], dtype=np.float32)[:, None]
+        scores = _batch_scores_numpy(block, query_matrix, distance_fn)
+        scores = np.where(scores < threshold, -np.inf, scores).astype(np.float32)
+
+        merged_scores = np.concatenate([best_scores, scores])
+        merged_indices = np.concatenate([
+            best_indices,
+            np.broadcast_to(np.arange(start, start + scores.shape[0])[:, None], scores.shape)
+        ])
+        k = min(top_k, merged_scores.shape[0])
+        if k < merged_scores.shape[0]:
+            part = np.argpartition(-merged_scores, k - 1, axis=0)[:k]
+            merged_scores = merged_scores[part, columns]
+            merged_indices = merged_indices[part, columns]
+        best_scores, best_indices = merged_scores, merged_indices
+
+    order = np.argsort(-best_scores, axis=0, kind="stable")
+    return best_scores[order, columns], best_indices[order, columns]
+
+
+def pytorch_topk_indices(
+    embeddings,
+    query_embeddings,
+    threshold: float = 0.7,
+    top_k: int = 10,
+    batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
+    fp16: bool = False,
+    distance_fn: str = "cosine",
+    row_scales=None,
+    show_progress: bool = False
+):
+    """
+    Running top-k row indices and scores for one or many queries.
+
+    Scores stay on-tensor: each block of rows is scored against all queries
+    in a single GEMM, the threshold is applied as a mask, and the block's
+    `torch.topk` winners are merged into a running top-k. Falls back to
+    NumPy `argpartition` when PyTorch is not installed.
+
+    Args:
+        embeddings: Document embedding matrix (n x d); float32, float16 or int8 codes
+        query_embeddings: A single query vector (d) or a query matrix (q x d)
+        threshold: Minimum similarity threshold
+        top_k: Maximum number of rows per query
+        batch_size: Rows scored per GEMM
+        fp16: Whether to use FP16 precision (CUDA only)
+        distance_fn: Distance function to use (cosine, dot, l2)
+        row_scales: Optional per-row scale factors for int8 codes
+        show_progress: Whether to show a progress bar
+
+    Returns:
+        Tuple of (scores, indices), each a (k x queries) array sorted best
+        first; masked slots have a score of -inf
+    """
+    import numpy as np
+
+    queries = np.asarray(query_embeddings, dtype=np.float32)
+    if queries.ndim == 1:
+        queries = queries[None, :]
+
+    num_docs = len(embeddings)
+    if num_docs == 0 or top_k <= 0:
+        return (np.empty((0, queries.shape[0]), dtype=np.float32),
+                np.empty((0, queries.shape[0]), dtype=np.int64))
+
+    num_batches = (num_docs + batch_size - 1) // batch_size
+    if TQDM_AVAILABLE and show_progress and num_batches > 1:
+        pbar = tqdm(total=num_batches, desc="Computing similarities", unit="batch")
+    else:
+        pbar = None
+
+    try:
+        if HAS_TORCH:
+            return _topk_indices_torch(
+                embeddings, queries, threshold, top_k, batch_size, fp16, distance_fn, row_scales, pbar
+            )
+        return _topk_indices_numpy(
+            embeddings, queries, threshold, top_k, batch_size, distance_fn, row_scales, pbar
+        )
+    finally:
+        if pbar:
+            pbar.close()
+
+
+def topk_results(scores, indices, ids: List[str], metadata: List[Dict]) -> List[List[Dict[str, Any]]]:
+    """Materialise result dicts for the rows returned by `pytorch_topk_indices`."""
+    all_results = []
+    for q in range(scores.shape[1]):
+        results = []
+        for score, idx in zip(scores[:, q].tolist(), indices[:, q].tolist()):
+            if score == float("-inf"):
+                # Columns are sorted, so the remaining rows were masked too
+                break
+            results.append({
+                "id": ids[idx],
+                "metadata": metadata[idx],
+                "similarity": score
+            })
+        all_results.append(results)
+    return all_results
+
+
+def pytorch_topk_search(
+    embeddings,
+    query_embeddings,
+    ids: List[str],
+    metadata: List[Dict],
+    threshold: float = 0.7,
+    top_k: int = 10,
+    batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
+    fp16: bool = False,
+    distance_fn: str = "cosine",
+    show_progress: bool = False,
+    row_scales=None
+) -> Tuple[List[List[Dict[str, Any]]], float]:
+    """
+    Vectorised top-k similarity search for one or many queries.
+
+    Result dicts are only built for the final top_k rows of each query; see
+    `pytorch_topk_indices` for how scores are computed.
+    
+    Args:
+        embeddings: Document embedding matrix (n x d)
+        query_embeddings: A single query vector (d) or a query matrix (q x d)
+        ids: Document IDs aligned with the embedding rows
+        metadata: Document metadata aligned with the embedding rows
+        threshold: Minimum similarity threshold
+        top_k: Maximum number of results per query
+        batch_size: Rows scored per GEMM
+        fp16: Whether to use FP16 precision (CUDA only)
+        distance_fn: Distance function to use (cosine, dot, l2)
+        show_progress: Whether to show a progress bar
+        row_scales: Optional per-row scale factors for int8 codes
+        
+    Returns:
+        Tuple of:
+            - results: One result list per query, best first
+            - search_time: Search execution time
+    """
+    start_time = time.time()
+
+    scores, indices = pytorch_topk_indices(
+        embeddings, query_embeddings, threshold, top_k, batch_size, fp16, distance_fn,
+        row_scales=row_scales, show_progress=show_progress
+    )
+    all_results = topk_results(scores, indices, ids, metadata)
+
+    search_time = time.time() - start_time
+    logger.debug(f"Top-k search over {len(ids)} docs for {len(all_results)} queries took {search_time:.3f}s")
+    return all_results, search_time
+
+
 def pytorch_vector_search(
     embeddings: List,
     query_embedding: List[float],
@@ -348,13 +631,15 @@ def pytorch_vector_search(
     metadata: List[Dict],
     threshold: float = 0.7,
     top_k: int = 10,
-    batch_size: int = 128,
+    batch_size: int = DEFAULT_SEARCH_BATCH_SIZE,
     fp16: bool = False,
     distance_fn: str = "cosine",
     show_progress: bool = True
 ) -> Tuple[List[Dict[str, Any]], float]:
     """
     Perform optimized similarity search using PyTorch.
+
+    Single-query wrapper around `pytorch_topk_search`.
     
     Args:
         embeddings: Document embeddings
@@ -373,90 +658,21 @@ def pytorch_vector_search(
             - results: List of search results
             - search_time: Search execution time
     """
+    start_time = time.time()
     try:
-        import torch
-        import numpy as np
-        
-        start_time = time.time()
-        
-        # Determine device
-        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        logger.info(f"Using device: {device} for search")
-        
-        # Convert embeddings to torch tensors
-        embeddings_tensor = torch.tensor(embeddings, device=device)
-        
-        # Convert query embedding to torch tensor
-        query_tensor = torch.tensor(query_embedding, device=device)
-        
-        # Use FP16 if requested and available
-        if fp16 and device.type == "cuda":
-            embeddings_tensor = embeddings_tensor.half()
-            query_tensor = query_tensor.half()
-        
-        # Normalize embeddings for cosine similarity
-        if distance_fn == "cosine":
-            embeddings_norm = torch.nn.functional.normalize(embeddings_tensor, p=2, dim=1)
-            query_norm = torch.nn.functional.normalize(query_tensor, p=2, dim=0)
-        else:
-            embeddings_norm = embeddings_tensor
-            query_norm = query_tensor
-        
-        # Calculate similarities
-        results = []
-        
-        # Process in batches to avoid OOM
-        num_docs = embeddings_norm.shape[0]
-        num_batches = (num_docs + batch_size - 1) // batch_size  # Ceiling division
-        
-        # Setup progress bar if available and requested
-        if TQDM_AVAILABLE and show_progress and num_batches > 1:
-            pbar = tqdm(total=num_batches, desc="Computing similarities", unit="batch")
-        else:
-            pbar = None
-        
-        for i in range(0, num_docs, batch_size):
-            if pbar:
-                pbar.update(1)
-                
-            batch_end = min(i + batch_size, num_docs)
-            batch = embeddings_norm[i:batch_end]
-            
-            # Calculate similarities based on distance function
-            if distance_fn == "cosine":
-                # Cosine similarity (higher is better)
-                similarities = torch.matmul(batch, query_norm)
-            elif distance_fn == "dot":
-                # Dot product (higher is better)
-                similarities = torch.matmul(batch, query_norm)
-            elif distance_fn == "l2":
-                # L2 distance (lower is better)
-                similarities = -torch.sum((batch - query_norm) ** 2, dim=1)
-            else:
-                raise ValueError(f"Unknown distance function: {distance_fn}")
-            
-            # Get indices and scores for the batch
-            for j, similarity in enumerate(similarities):
-                idx = i + j
-                score = similarity.item()
-                
-                # Only include results that meet the threshold
-                if score >= threshold:
-                    results.append({
-                        "id": ids[idx],
-                        "metadata": metadata[idx],
-                        "similarity": score
-                    })
-        
-        # Close progress bar
-        if pbar:
-            pbar.close()
-        
-        # Sort results by similarity (descending)
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        
-        # Limit to top_k results
-        results = results[:top_k]
+        results, _ = pytorch_topk_search(
+            embeddings=embeddings,
+            query_embeddings=query_embedding,
+            ids=ids,
+            metadata=metadata,
+            threshold=threshold,
+            top_k=top_k,
+            batch_size=batch_size,
+            fp16=fp16,
+            distance_fn=distance_fn,
+            show_progress=show_progress
+        )
+        results = results[0]
         
         search_time = time.time() - start_time
         logger.info(f"Search completed in {search_time:.3f}s, found {len(results)} results")
@@ -480,10 +696,15 @@ def pytorch_search(
     output_format: str = "table",
     fields_to_return: Optional[List[str]] = None,
     force_reload: bool = False,
-    show_progress: bool = True
+    show_progress: bool = True,
+    use_resident_index: bool = True,
+    quantization: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Perform semantic search using PyTorch for ArangoDB documents.
+
+    Unfiltered searches are served from the resident `VectorIndex` for the
+    collection, which is synced incrementally by `_rev` instead of reloaded.
     
     Args:
         db: ArangoDB database
@@ -498,6 +719,9 @@ def pytorch_search(
         fields_to_return: Fields to include in the result
         force_reload: Whether to force reload from the database
         show_progress: Whether to show a progress bar
+        use_resident_index: Serve unfiltered searches from the resident index
+        quantization: Store the resident index as "float16" or "int8";
+            candidates are re-scored against the float32 vectors in the database
         
     Returns:
         Dict with search results containing:
@@ -550,16 +774,33 @@ def pytorch_search(
     if filter_conditions:
         logger.info(f"Applying filter conditions: {filter_conditions}")
     
-    # Load documents with filtering
-    embeddings, ids, metadata, dimension = load_documents_from_arango(
-        db, collection_name, embedding_field,
-        filter_conditions=filter_conditions,
-        fields_to_return=fields_to_return,
-        force_reload=force_reload,
-        show_progress=show_progress
-    )
+    results = None
+    if use_resident_index and not filter_conditions:
+        # AQL filters cannot be applied in memory, so only unfiltered searches use the index
+        from arangodb.core.search.vector_index import get_vector_index
+        index = get_vector_index(db, collection_name, embedding_field, fields_to_return, quantization=quantization)
+        index.refresh(db, full=force_reload)
+        # index.search reads the shared rows under the index lock, so a concurrent
+        # refresh cannot reorder them mid-scan
+        results = index.search(
+            query_embedding,
+            top_k=top_n,
+            threshold=min_score,
+            exact_lookup=index.exact_lookup(db) if index.quantization else None
+        )
+        has_rows = len(index) > 0
+    else:
+        # Load documents with filtering
+        embeddings, ids, metadata, dimension = load_documents_from_arango(
+            db, collection_name, embedding_field,
+            filter_conditions=filter_conditions,
+            fields_to_return=fields_to_return,
+            force_reload=force_reload,
+            show_progress=show_progress
+        )
+        has_rows = embeddings is not None and len(embeddings) > 0
     
-    if embeddings is None or len(embeddings) == 0:
+    if not has_rows:
         logger.warning("No documents found matching the filter criteria")
         return {
             "results": [],
@@ -570,23 +811,23 @@ def pytorch_search(
             "search_engine": "pytorch-no-results"
         }
     
-    # Check if GPU is available
-    import torch
-    has_gpu = torch.cuda.is_available()
-    logger.info(f"GPU available: {has_gpu}")
-    
-    # Perform similarity search
-    results, search_time = pytorch_vector_search(
-        embeddings=embeddings,
-        query_embedding=query_embedding,
-        ids=ids,
-        metadata=metadata,
-        threshold=min_score,
-        top_k=top_n,
-        batch_size=128,
-        fp16=has_gpu,
-        show_progress=show_progress
-    )
+    if results is None:
+        # Check if GPU is available
+        import torch
+        has_gpu = torch.cuda.is_available()
+        logger.info(f"GPU available: {has_gpu}")
+
+        # Perform similarity search
+        results, search_time = pytorch_vector_search(
+            embeddings=embeddings,
+            query_embedding=query_embedding,
+            ids=ids,
+            metadata=metadata,
+            threshold=min_score,
+            top_k=top_n,
+            fp16=has_gpu,
+            show_progress=show_progress
+        )
     
     # Format results to match the expected output
     formatted_results = []
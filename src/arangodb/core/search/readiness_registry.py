@@ -0,0 +1,168 @@
+"""
+Semantic Search Readiness Registry
+Module: readiness_registry.py
+Description: Caches which collections passed the semantic search readiness check
+
+`semantic_search` validates a collection (EmbeddingValidator statistics, vector
+index check) before searching. The result rarely changes between queries, so
+this registry remembers collections that were found ready and lets searches
+skip the check until either:
+
+- the entry expires (READINESS_TTL seconds, default 600), or
+- a document in the collection is written through `db_operations`, which
+  invalidates the entry.
+
+Only the ready state is cached; a collection that failed the check is checked
+again on the next search so fixes are picked up immediately.
+
+External Dependencies:
+- loguru: https://github.com/Delgan/loguru
+
+Sample Input:
+>>> if not is_collection_ready(db, "memory_documents"):
+...     ok, info = prepare_collection_for_search(db, "memory_documents")
+...     if ok:
+...         mark_collection_ready(db, "memory_documents")
+>>> invalidate_collection_readiness("memory_documents")
+
+Expected Output:
+>>> is_collection_ready(db, "memory_documents")
+False
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from loguru import logger
+
+# Seconds a successful readiness check stays valid
+READINESS_TTL = float(os.getenv("READINESS_TTL", "600"))
+
+
+class ReadinessRegistry:
+    """Thread-safe map of (database, collection, embedding field) -> time validated."""
+
+    def __init__(self, ttl: float = READINESS_TTL):
+        self.ttl = ttl
+        self._ready: Dict[Tuple[str, str, str], float] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(db, collection_name: str, embedding_field: str) -> Tuple[str, str, str]:
+        return (getattr(db, "name", ""), collection_name, embedding_field)
+
+    def is_ready(self, db, collection_name: str, embedding_field: str = "embedding") -> bool:
+        """Return True if the collection was validated within the TTL."""
+        key = self._key(db, collection_name, embedding_field)
+        with self._lock:
+            validated_at = self._ready.get(key)
+            if validated_at is not None and time.time() - validated_at < self.ttl:
+                self.hits += 1
+                return True
+            if validated_at is not None:
+                del self._ready[key]
+            self.misses += 1
+            return False
+
+    def mark_ready(self, db, collection_name: str, embedding_field: str = "embedding") -> None:
+        """Record that the collection just passed the readiness check."""
+        with self._lock:
+            self._ready[self._key(db, collection_name, embedding_field)] = time.time()
+
+    def invalidate(self, collection_name: Optional[str] = None) -> int:
+        """
+        Forget validated state.
+
+        Args:
+            collection_name: Only forget this collection (all if None)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [k for k in self._ready if collection_name is None or k[1] == collection_name]
+            for key in keys:
+                del self._ready[key]
+            self.invalidations += len(keys)
+        if keys:
+            logger.debug(f"Invalidated semantic search readiness for {collection_name or 'all collections'}")
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return registry counters."""
+        with self._lock:
+            return {
+                "ready_collections": len(self._ready),
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "ttl": self.ttl,
+            }
+
+
+_registry = ReadinessRegistry()
+
+
+def get_readiness_registry() -> ReadinessRegistry:
+    """Return the process-wide readiness registry."""
+    return _registry
+
+
+def is_collection_ready(db, collection_name: str, embedding_field: str = "embedding") -> bool:
+    """Return True if `collection_name` was validated recently and not written since."""
+    return _registry.is_ready(db, collection_name, embedding_field)
+
+
+def mark_collection_ready(db, collection_name: str, embedding_field: str = "embedding") -> None:
+    """Record a successful readiness check for `collection_name`."""
+    _registry.mark_ready(db, collection_name, embedding_field)
+
+
+def invalidate_collection_readiness(collection_name: Optional[str] = None) -> int:
+    """Force the next search on `collection_name` (or all collections) to re-validate."""
+    return _registry.invalidate(collection_name)
+
+
+if __name__ == "__main__":
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    all_validation_failures = []
+    total_tests = 0
+
+    class _DB:
+        name = "test_db"
+
+    db = _DB()
+    registry = ReadinessRegistry(ttl=0.2)
+
+    # Test 1: marked collections are ready until invalidated
+    total_tests += 1
+    registry.mark_ready(db, "docs")
+    if not registry.is_ready(db, "docs") or registry.is_ready(db, "other"):
+        all_validation_failures.append("Marked collection not reported ready")
+    registry.invalidate("docs")
+    if registry.is_ready(db, "docs"):
+        all_validation_failures.append("Invalidated collection still reported ready")
+
+    # Test 2: entries expire
+    total_tests += 1
+    registry.mark_ready(db, "docs")
+    time.sleep(0.25)
+    if registry.is_ready(db, "docs"):
+        all_validation_failures.append("Expired entry still reported ready")
+
+    if all_validation_failures:
+        print(f"❌ VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"✅ VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
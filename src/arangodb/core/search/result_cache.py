@@ -0,0 +1,384 @@
+"""
+Search Result Cache Module
+Module: result_cache.py
+Description: Query-result cache for BM25, semantic and hybrid search
+
+Agents tend to repeat the same handful of queries, and every repeat costs a
+database round trip plus (for semantic and hybrid search) a query embedding.
+This module caches complete search responses keyed on:
+
+- the search function name,
+- the normalized query (Unicode NFKC, collapsed whitespace, case-folded),
+- every other call parameter, and
+- a collection version token per searched collection.
+
+The version token is the collection revision, which ArangoDB bumps on every
+write, so cached entries stop matching as soon as a searched collection
+changes; no explicit invalidation is needed. Entries also expire after a TTL.
+
+Two backends are provided: an in-process LRU (default) and a Redis backend
+(`SEARCH_CACHE_BACKEND=redis`) so several worker processes share entries.
+
+External Dependencies:
+- python-arango: https://python-arango.readthedocs.io/
+- redis (optional): https://redis.io/docs/clients/python/
+
+Sample Input:
+>>> @cache_search_results("bm25")
+... def bm25_search(db, query_text, collections=None, ...): ...
+>>> bm25_search(db, "  Vector   Search ")   # miss, runs the query
+>>> bm25_search(db, "vector search")        # hit, no query
+>>> get_search_cache().stats()
+
+Expected Output:
+>>> {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1, "backend": "memory", ...}
+"""
+
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Callable
+
+from loguru import logger
+
+from arangodb.core.utils.collection_utils import collection_version
+
+# Result cache configuration
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+SEARCH_CACHE_BACKEND = os.getenv("SEARCH_CACHE_BACKEND", "memory")
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+
+# Prefix for keys in shared backends
+CACHE_KEY_PREFIX = "arangodb:search:"
+
+
+def normalize_query(query: Any) -> Any:
+    """
+    Normalize query text so trivially different spellings share an entry.
+
+    Non-string queries (e.g. embedding vectors) are returned unchanged.
+    """
+    if not isinstance(query, str):
+        return query
+    return " ".join(unicodedata.normalize("NFKC", query).split()).casefold()
+
+
+class MemoryCacheBackend:
+    """In-process LRU with per-entry expiry; values are copied in and out."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = SEARCH_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Redis-compatible backend; values are stored as JSON with a server-side TTL."""
+
+    name = "redis"
+
+    def __init__(self, client=None):
+        if client is None:
+            import redis
+            client = redis.Redis(
+                host=os.getenv("REDIS_HOST", "localhost"),
+                port=int(os.getenv("REDIS_PORT", 6379)),
+                password=os.getenv("REDIS_PASSWORD", None),
+                socket_timeout=1,
+            )
+        self.client = client
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(CACHE_KEY_PREFIX + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.client.set(CACHE_KEY_PREFIX + key, json.dumps(value, default=str), ex=max(1, int(ttl)))
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=CACHE_KEY_PREFIX + "*"):
+            self.client.delete(key)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=CACHE_KEY_PREFIX + "*"))
+
+
+class SearchResultCache:
+    """
+    Response cache shared by the search entry points.
+
+    Backend errors are logged and treated as misses, so a broken Redis never
+    breaks search.
+    """
+
+    def __init__(self, backend=None, ttl: float = SEARCH_CACHE_TTL, enabled: bool = SEARCH_CACHE_ENABLED):
+        self.backend = backend or MemoryCacheBackend()
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._by_function: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, function_name: str, query: Any, params: Dict[str, Any], versions: Dict[str, Any]) -> str:
+        """Hash the normalized query, parameters and collection versions into a key."""
+        payload = json.dumps(
+            {"fn": function_name, "query": normalize_query(query), "params": params, "versions": versions},
+            sort_keys=True,
+            default=str,
+        )
+        return f"{function_name}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def _record(self, function_name: str, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            counters = self._by_function.setdefault(function_name, {"hits": 0, "misses": 0})
+            counters[outcome] += 1
+
+    def get(self, function_name: str, key: str) -> Optional[Any]:
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Search cache read failed: {e}")
+            self.errors += 1
+            value = None
+        self._record(function_name, "hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self.backend.set(key, value, self.ttl)
+        except Exception as e:
+            logger.warning(f"Search cache write failed: {e}")
+            self.errors += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters overall and per search function."""
+        lookups = self.hits + self.misses
+        try:
+            entries = len(self.backend)
+        except Exception:
+            entries = None
+        return {
+            "enabled": self.enabled,
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "errors": self.errors,
+            "entries": entries,
+            "evictions": self.backend.evictions,
+            "expirations": self.backend.expirations,
+            "ttl": self.ttl,
+            "by_function": {name: dict(c) for name, c in self._by_function.items()},
+        }
+
+
+def _create_default_cache() -> SearchResultCache:
+    backend = None
+    if SEARCH_CACHE_BACKEND == "redis":
+        try:
+            backend = RedisCacheBackend()
+            backend.client.ping()
+        except Exception as e:
+            logger.warning(f"Redis search cache unavailable ({e}); using in-process cache")
+            backend = None
+    return SearchResultCache(backend=backend)
+
+
+_search_cache: Optional[SearchResultCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchResultCache:
+    """Return the process-wide search result cache."""
+    global _search_cache
+    if _search_cache is None:
+        with _search_cache_lock:
+            if _search_cache is None:
+                _search_cache = _create_default_cache()
+    return _search_cache
+
+
+def set_search_cache(cache: Optional[SearchResultCache]) -> None:
+    """Replace the process-wide cache (None re-creates the default on next use)."""
+    global _search_cache
+    with _search_cache_lock:
+        _search_cache = cache
+
+
+def cache_search_results(
+    function_name: str,
+    query_arg: str = "query_text",
+    default_collections: Optional[List[str]] = None,
+    dependent_collections: Optional[Callable[[Dict[str, Any]], List[str]]] = None
+) -> Callable:
+    """
+    Decorate a search function `fn(db, <query_arg>, collections=..., ...)`.
+
+    The wrapped function accepts an extra `use_cache` keyword (default True).
+    Responses carrying an "error" or "leg_errors", or marked "partial", are not
+    cached. Hits are returned as copies with `cache_hit: True` so callers can
+    mutate them freely.
+
+    Args:
+        function_name: Name used in keys and metrics
+        query_arg: Name of the query parameter
+        default_collections: Collections searched when `collections` is None
+        dependent_collections: Maps the bound call arguments to any further
+            collections the result reads (e.g. an edge collection), whose
+            versions are also folded into the key
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, use_cache: bool = True, **kwargs):
+            cache = get_search_cache()
+            if not (use_cache and cache.enabled):
+                return fn(*args, **kwargs)
+
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return fn(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            db = params.pop("db")
+            query = params.pop(query_arg, None)
+            # **kwargs-style parameters are folded into the key as a dict
+            collections = params.get("collections") or params.get("kwargs", {}).get("collections") \
+                or default_collections or []
+            if dependent_collections:
+                collections = list(collections) + [
+                    name for name in dependent_collections(params) if name not in collections
+                ]
+
+            versions = {name: collection_version(db, name) for name in collections}
+            if any(v is None for v in versions.values()):
+                return fn(*args, **kwargs)
+
+            key = cache.make_key(function_name, query, params, versions)
+            cached = cache.get(function_name, key)
+            if cached is not None:
+                logger.debug(f"Search cache hit for {function_name} query {normalize_query(query)!r}")
+                return dict(cached, cache_hit=True)
+
+            result = fn(*args, **kwargs)
+            if isinstance(result, dict) and not any(result.get(flag) for flag in ("error", "leg_errors", "partial")):
+                cache.set(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    all_validation_failures = []
+    total_tests = 0
+
+    class _Collection:
+        def __init__(self):
+            self.rev = 1
+
+        def revision(self):
+            return str(self.rev)
+
+    class _DB:
+        def __init__(self):
+            self.col = _Collection()
+
+        def collection(self, name):
+            return self.col
+
+    calls = []
+    set_search_cache(SearchResultCache(ttl=60, enabled=True))
+
+    @cache_search_results("demo", default_collections=["docs"])
+    def demo_search(db, query_text, collections=None, top_n=10):
+        calls.append(query_text)
+        return {"results": [query_text], "total": 1}
+
+    db = _DB()
+
+    # Test 1: normalized repeats hit the cache
+    total_tests += 1
+    demo_search(db, "Vector  Search")
+    hit = demo_search(db, " vector search ")
+    if len(calls) != 1 or not hit.get("cache_hit"):
+        all_validation_failures.append(f"Expected one call and a hit, got calls={calls}")
+
+    # Test 2: a write to the collection invalidates the entry
+    total_tests += 1
+    db.col.rev += 1
+    demo_search(db, "vector search")
+    if len(calls) != 2:
+        all_validation_failures.append("Collection write did not invalidate the cache")
+
+    # Test 3: metrics
+    total_tests += 1
+    stats = get_search_cache().stats()
+    if stats["hits"] != 1 or stats["misses"] != 2:
+        all_validation_failures.append(f"Unexpected stats {stats}")
+
+    if all_validation_failures:
+        print(f"❌ VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"✅ VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
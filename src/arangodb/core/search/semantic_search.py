@@ -44,6 +44,9 @@ from arangodb.core.utils.vector_utils import (
 EMBEDDING_FIELD = "embedding"
 EMBEDDING_METADATA_FIELD = "embedding_metadata"
 from arangodb.core.utils.embedding_utils import get_embedding
+from arangodb.core.search.vector_index import get_vector_index
+from arangodb.core.search.result_cache import cache_search_results
+from arangodb.core.search.readiness_registry import is_collection_ready, mark_collection_ready
 
 
 @retry(
@@ -242,6 +245,7 @@ def prepare_collection_for_search(
     return result_info["ready"], result_info
 
 
+@cache_search_results("semantic", query_arg="query", default_collections=[COLLECTION_NAME])
 def semantic_search(
     db: StandardDatabase,
     query: Union[str, List[float]],
@@ -268,8 +272,10 @@ def semantic_search(
         min_score: Minimum similarity score threshold (0-1)
         top_n: Maximum number of results to return
         tag_list: Optional list of tags to filter by
+        force_pytorch: Serve the search from the resident in-process vector index
         output_format: Output format (table or json)
         validate_before_search: Whether to validate collection readiness before search
+            (a successful check is reused until it expires or the collection is written)
         auto_fix_embeddings: Whether to automatically fix embedding issues
         
     Returns:
@@ -285,8 +291,8 @@ def semantic_search(
     collection_name = collections[0]
     embedding_field = EMBEDDING_FIELD
     
-    # Validate collection readiness if requested
-    if validate_before_search:
+    # Validate collection readiness if requested; a recent successful check is reused
+    if validate_before_search and not is_collection_ready(db, collection_name, embedding_field):
         is_ready, status_info = prepare_collection_for_search(
             db=db,
             collection_name=collection_name,
@@ -305,6 +311,7 @@ def semantic_search(
                 "error": status_info["status"]["message"],
                 "collection_status": status_info
             }
+        mark_collection_ready(db, collection_name, embedding_field)
     
     # Get query embedding if query is text
     if isinstance(query, str):
@@ -342,6 +349,32 @@ def semantic_search(
     # Get more results initially if filters will be applied in Python
     initial_limit = top_n * 5 if tag_list else top_n * 2
     
+    if force_pytorch:
+        # Serve from the resident index; it syncs only documents whose _rev changed
+        index = get_vector_index(db, collection_name, embedding_field)
+        index.refresh(db)
+        results = []
+        for hit in index.search(query_embedding, top_k=initial_limit, threshold=min_score):
+            doc = hit["metadata"]
+            if tag_list and not any(tag in doc.get("tags", []) for tag in tag_list):
+                continue
+            results.append({
+                "doc": doc,
+                "similarity_score": hit["similarity"],
+                "score": hit["similarity"]
+            })
+            if len(results) >= top_n:
+                break
+        
+        return {
+            "results": results,
+            "total": len(results),
+            "query": query_text,
+            "time": time.time() - start_time,
+            "search_engine": "pytorch-resident-index",
+            "error": None
+        }
+    
     vector_query = f"""
     FOR doc IN {collection_name}
     LET score = APPROX_NEAR_COSINE(doc.{embedding_field}, @query_embedding)
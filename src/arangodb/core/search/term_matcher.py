@@ -0,0 +1,146 @@
+"""
+Term Matcher Module
+Module: term_matcher.py
+Description: Aho-Corasick automaton for whole-word, case-insensitive term matching
+
+Finds every occurrence of a set of terms in a single pass over the text,
+independent of the number of terms. Matches honour the same word boundaries as
+a `\\b<term>\\b` regex and are resolved leftmost-longest: among overlapping
+matches the one starting first wins, and at equal starts the longest term
+wins. The automaton is immutable once built; rebuild it when the term set
+changes.
+
+Sample Input:
+>>> matcher = TermMatcher(["primary color", "color", "RGB"])
+>>> matcher.find("The primary color and RGB color model")
+
+Expected Output:
+>>> [(4, 17, 'primary color'), (22, 25, 'RGB'), (26, 31, 'color')]
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    """Match the regex `\\w` class for str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+def casefold_same_length(text: str) -> str:
+    """
+    Lower-case `text` without changing its length.
+
+    Characters whose lower-case form is longer than one character are kept
+    as-is, so offsets into the result are offsets into `text`.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over lower-cased terms."""
+
+    def __init__(self, terms: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            terms: Terms to match; compared case-insensitively, empty terms are ignored
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Term ending at each node ("" if none) and nearest fail-ancestor ending a term
+        self._term: List[str] = [""]
+        self._output_link: List[int] = [-1]
+
+        for term in terms:
+            if term:
+                self._insert(term)
+        self._build_links()
+
+    def __len__(self) -> int:
+        return sum(1 for term in self._term if term)
+
+    def _insert(self, term: str) -> None:
+        node = 0
+        for ch in casefold_same_length(term):
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._term.append("")
+                self._output_link.append(-1)
+            node = next_node
+        self._term[node] = term
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                fail = self._fail[child]
+                self._output_link[child] = fail if self._term[fail] else self._output_link[fail]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Return every whole-word occurrence of every term, overlapping or not.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of (start, end, term) tuples, `term` as it was passed in
+        """
+        folded = casefold_same_length(text)
+        size = len(folded)
+        goto, fail, terms, output_link = self._goto, self._fail, self._term, self._output_link
+        matches = []
+        node = 0
+        for end, ch in enumerate(folded, start=1):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            hit = node if terms[node] else output_link[node]
+            while hit > 0:
+                term = terms[hit]
+                start = end - len(term)
+                if self._at_boundary(folded, start, size) and self._at_boundary(folded, end, size):
+                    matches.append((start, end, term))
+                hit = output_link[hit]
+        return matches
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Return the leftmost-longest, non-overlapping whole-word matches.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of (start, end, term) tuples in text order
+        """
+        selected = []
+        last_end = 0
+        for start, end, term in sorted(self.find_all(text), key=lambda m: (m[0], -m[1])):
+            if start >= last_end:
+                selected.append((start, end, term))
+                last_end = end
+        return selected
+
+    @staticmethod
+    def _at_boundary(text: str, pos: int, size: int) -> bool:
+        before = pos > 0 and _is_word_char(text[pos - 1])
+        after = pos < size and _is_word_char(text[pos])
+        return before != after
@@ -0,0 +1,667 @@
+"""
+Resident Vector Index
+Module: vector_index.py
+Description: In-process vector index with incremental sync from ArangoDB
+
+Holds the embeddings of one collection/embedding field as a single contiguous
+float32 matrix with an `_id` -> row offset table, so semantic search can be
+served from memory. Instead of re-downloading every vector on each cold cache,
+`refresh` compares the `_rev` of every document against the revisions held in
+memory and only fetches documents that were added or changed, dropping rows for
+documents that were deleted. The collection revision is checked first so an
+unchanged collection costs a single round trip.
+
+Rows can be stored quantized (`quantization="float16"` or `"int8"`) to cut
+resident memory; searches then over-fetch candidates from the quantized rows
+and re-score them against their float32 vectors.
+
+External Dependencies:
+- numpy: https://numpy.org/doc/stable/
+- python-arango: https://python-arango.readthedocs.io/
+
+Sample Input:
+>>> index = get_vector_index(db, "memory_documents")
+>>> index.refresh(db)
+>>> index.search(query_embedding, top_k=5, threshold=0.6)
+
+Expected Output:
+>>> {"added": 120, "updated": 0, "removed": 0, "unchanged": 0, "skipped": False}
+>>> [{"id": "memory_documents/123", "metadata": {...}, "similarity": 0.83}, ...]
+"""
+
+import sys
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple, Sequence
+
+import numpy as np
+from loguru import logger
+
+from arangodb.core.search.pytorch_search_utils import pytorch_topk_search
+from arangodb.core.search.embedding_snapshot import load_embedding_snapshot
+from arangodb.core.search.quantization import (
+    SUPPORTED_QUANTIZATIONS,
+    DEFAULT_RESCORE_FACTOR,
+    encode_vectors,
+    dequantize_int8,
+    quantized_topk_search,
+)
+
+# Fields kept alongside each vector when none are requested explicitly
+DEFAULT_INDEX_FIELDS = ["_key", "_id", "_rev", "title", "content", "question", "problem", "solution", "context", "tags"]
+
+# Number of documents fetched per round trip when syncing changed rows
+DEFAULT_FETCH_BATCH_SIZE = 1000
+
+# Cursor batch size for the lightweight `_id`/`_rev` listing
+DEFAULT_REVISION_BATCH_SIZE = 10000
+
+
+class VectorIndex:
+    """
+    Resident embedding matrix for a single collection and embedding field.
+
+    Rows are stored contiguously in `self._matrix[:self._size]`. Removing a row
+    moves the last row into the freed slot so the live region never has holes,
+    and the backing array grows geometrically so repeated `add` calls are
+    amortised O(1). int8 rows keep a per-row scale in `self._scales`, which is
+    grown and swapped together with the matrix.
+    """
+
+    def __init__(
+        self,
+        collection_name: str,
+        embedding_field: str = "embedding",
+        fields_to_return: Optional[List[str]] = None,
+        initial_capacity: int = 1024,
+        quantization: Optional[str] = None,
+    ):
+        if quantization is not None and quantization not in SUPPORTED_QUANTIZATIONS:
+            raise ValueError(f"Unsupported quantization {quantization!r}, expected one of {SUPPORTED_QUANTIZATIONS}")
+        self.collection_name = collection_name
+        self.quantization = quantization
+        self.embedding_field = embedding_field
+
+        fields = list(fields_to_return or DEFAULT_INDEX_FIELDS)
+        for field in ["_key", "_id", "_rev"]:
+            if field not in fields:
+                fields.append(field)
+        if embedding_field not in fields:
+            fields.append(embedding_field)
+        self.fields_to_return = fields
+
+        self._initial_capacity = max(1, initial_capacity)
+        self._dtype = np.dtype(quantization or "float32")
+        self._matrix: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+        self._size = 0
+        self._ids: List[str] = []
+        self._revs: List[Optional[str]] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._offsets: Dict[str, int] = {}
+        self._collection_revision: Optional[str] = None
+        self._last_refresh: Optional[float] = None
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Read-only views
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._offsets
+
+    @property
+    def dimension(self) -> int:
+        """Embedding dimension, or 0 while the index is empty."""
+        return self._matrix.shape[1] if self._matrix is not None else 0
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Contiguous view over the live rows (no copy)."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=self._dtype)
+        return self._matrix[:self._size]
+
+    @property
+    def scales(self) -> Optional[np.ndarray]:
+        """Per-row int8 scales aligned with `embeddings`, or None if not int8."""
+        if self._scales is None:
+            return None
+        return self._scales[:self._size]
+
+    @property
+    def ids(self) -> List[str]:
+        """Document `_id` for each row, aligned with `embeddings`."""
+        return self._ids
+
+    @property
+    def metadata(self) -> List[Dict[str, Any]]:
+        """Document fields (without the embedding) for each row."""
+        return self._metadata
+
+    @property
+    def last_refresh(self) -> Optional[float]:
+        """Unix timestamp of the last successful refresh."""
+        return self._last_refresh
+
+    def offset_of(self, doc_id: str) -> Optional[int]:
+        """Return the row offset of a document, or None if it is not indexed."""
+        return self._offsets.get(doc_id)
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def _ensure_capacity(self, dimension: int, required: int) -> None:
+        """Allocate or grow the backing matrix to hold `required` rows."""
+        if self._matrix is None:
+            capacity = max(self._initial_capacity, required)
+            self._matrix = np.empty((capacity, dimension), dtype=self._dtype)
+            if self.quantization == "int8":
+                self._scales = np.empty(capacity, dtype=np.float32)
+            return
+
+        if dimension != self._matrix.shape[1]:
+            raise ValueError(
+                f"Embedding dimension mismatch for {self.collection_name}: "
+                f"index has {self._matrix.shape[1]}, got {dimension}"
+            )
+
+        capacity = self._matrix.shape[0]
+        if required <= capacity:
+            return
+
+        new_capacity = max(required, capacity * 2)
+        grown = np.empty((new_capacity, dimension), dtype=self._dtype)
+        grown[:self._size] = self._matrix[:self._size]
+        self._matrix = grown
+        if self._scales is not None:
+            grown_scales = np.empty(new_capacity, dtype=np.float32)
+            grown_scales[:self._size] = self._scales[:self._size]
+            self._scales = grown_scales
+
+    def add(
+        self,
+        doc_id: str,
+        embedding: Sequence[float],
+        metadata: Optional[Dict[str, Any]] = None,
+        rev: Optional[str] = None,
+    ) -> None:
+        """
+        Insert or replace the vector for a document.
+
+        Args:
+            doc_id: Document `_id`
+            embedding: Embedding vector
+            metadata: Document fields to return with search hits
+            rev: Document `_rev`, used by `refresh` to detect changes
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1 or vector.size == 0:
+            raise ValueError(f"Embedding for {doc_id} must be a non-empty 1-D vector")
+        row, scales = encode_vectors(vector[None, :], self.quantization)
+
+        meta = dict(metadata or {})
+        meta.pop(self.embedding_field, None)
+        meta.setdefault("_id", doc_id)
+
+        with self._lock:
+            offset = self._offsets.get(doc_id)
+            is_new = offset is None
+            if is_new:
+                offset = self._size
+            self._ensure_capacity(vector.size, self._size + is_new)
+            self._matrix[offset] = row[0]
+            if scales is not None:
+                self._scales[offset] = scales[0]
+
+            if not is_new:
+                self._metadata[offset] = meta
+                self._revs[offset] = rev
+                return
+
+            self._ids.append(doc_id)
+            self._revs.append(rev)
+            self._metadata.append(meta)
+            self._offsets[doc_id] = offset
+            self._size += 1
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: Document `_id`
+
+        Returns:
+            True if the document was indexed and has been removed
+        """
+        with self._lock:
+            offset = self._offsets.pop(doc_id, None)
+            if offset is None:
+                return False
+
+            last = self._size - 1
+            if offset != last:
+                # Move the last row into the hole to keep rows contiguous
+                moved_id = self._ids[last]
+                self._matrix[offset] = self._matrix[last]
+                if self._scales is not None:
+                    self._scales[offset] = self._scales[last]
+                self._ids[offset] = moved_id
+                self._revs[offset] = self._revs[last]
+                self._metadata[offset] = self._metadata[last]
+                self._offsets[moved_id] = offset
+
+            self._ids.pop()
+            self._revs.pop()
+            self._metadata.pop()
+            self._size -= 1
+            return True
+
+    def clear(self) -> None:
+        """Drop all rows and forget the synced collection revision."""
+        with self._lock:
+            self._matrix = None
+            self._scales = None
+            self._size = 0
+            self._ids = []
+            self._revs = []
+            self._metadata = []
+            self._offsets = {}
+            self._collection_revision = None
+            self._last_refresh = None
+
+    def seed_from_snapshot(self, snapshot) -> int:
+        """
+        Populate an empty index from an on-disk embedding snapshot.
+
+        Rows keep the `_rev` recorded in the snapshot, so the next `refresh`
+        only downloads documents changed since the snapshot was exported.
+
+        Args:
+            snapshot: An `EmbeddingSnapshot` for this collection and field
+
+        Returns:
+            Number of rows loaded (0 if the snapshot lacks required fields)
+        """
+        missing = set(self.fields_to_return) - set(snapshot.manifest["fields"]) - {self.embedding_field}
+        if missing:
+            logger.debug(f"Not seeding {self.collection_name} from snapshot; missing fields {sorted(missing)}")
+            return 0
+
+        with self._lock:
+            self.clear()
+            if snapshot.count == 0:
+                return 0
+            self._load_snapshot_rows(snapshot)
+            self._size = snapshot.count
+            self._ids = list(snapshot.ids)
+            self._metadata = [dict(meta) for meta in snapshot.metadata]
+            self._revs = [meta.get("_rev") for meta in self._metadata]
+            self._offsets = {doc_id: i for i, doc_id in enumerate(self._ids)}
+
+        logger.info(f"Seeded vector index {self.collection_name} with {snapshot.count} rows from {snapshot.path}")
+        return snapshot.count
+
+    def _load_snapshot_rows(self, snapshot, chunk_size: int = 65536) -> None:
+        """Copy snapshot rows into a private matrix in this index's storage format."""
+        source_dtype = snapshot.manifest["dtype"]
+        if source_dtype == (self.quantization or "float32"):
+            # Same encoding on disk: copy the rows (and scales) as-is
+            self._matrix = np.array(snapshot.embeddings)
+            if snapshot.scales is not None:
+                self._scales = np.array(snapshot.scales, dtype=np.float32)
+            return
+
+        self._matrix = np.empty((snapshot.count, snapshot.dimension), dtype=self._dtype)
+        if self.quantization == "int8":
+            self._scales = np.empty(snapshot.count, dtype=np.float32)
+        source = snapshot.float_embeddings
+        for start in range(0, snapshot.count, chunk_size):
+            stop = min(start + chunk_size, snapshot.count)
+            if source is not None:
+                rows = np.asarray(source[start:stop], dtype=np.float32)
+            else:
+                rows = dequantize_int8(snapshot.embeddings[start:stop], snapshot.scales[start:stop])
+            encoded, scales = encode_vectors(rows, self.quantization)
+            self._matrix[start:stop] = encoded
+            if scales is not None:
+                self._scales[start:stop] = scales
+
+    # ------------------------------------------------------------------
+    # Synchronisation with ArangoDB
+    # ------------------------------------------------------------------
+
+    def _list_revisions(self, db, batch_size: int) -> Dict[str, str]:
+        """Return `_id` -> `_rev` for every document that has an embedding."""
+        query = """
+        FOR doc IN @@collection
+        FILTER doc[@field] != null
+        RETURN [doc._id, doc._rev]
+        """
+        cursor = db.aql.execute(
+            query,
+            bind_vars={"@collection": self.collection_name, "field": self.embedding_field},
+            batch_size=batch_size,
+            stream=True,
+        )
+        return {doc_id: rev for doc_id, rev in cursor}
+
+    def _fetch_documents(self, db, doc_ids: List[str], batch_size: int) -> int:
+        """Fetch documents by `_id` in chunks and upsert them into the index."""
+        query = """
+        FOR id IN @ids
+        LET doc = DOCUMENT(id)
+        FILTER doc != null AND doc[@field] != null
+        RETURN KEEP(doc, @fields)
+        """
+        loaded = 0
+        for start in range(0, len(doc_ids), batch_size):
+            chunk = doc_ids[start:start + batch_size]
+            cursor = db.aql.execute(
+                query,
+                bind_vars={
+                    "ids": chunk,
+                    "field": self.embedding_field,
+                    "fields": self.fields_to_return,
+                },
+                batch_size=batch_size,
+            )
+            for doc in cursor:
+                embedding = doc.pop(self.embedding_field)
+                self.add(doc["_id"], embedding, metadata=doc, rev=doc.get("_rev"))
+                loaded += 1
+        return loaded
+
+    def refresh(
+        self,
+        db,
+        full: bool = False,
+        fetch_batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+        revision_batch_size: int = DEFAULT_REVISION_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Bring the index in line with the collection.
+
+        Only documents whose `_rev` differs from the one held in memory are
+        downloaded; documents that no longer exist are removed.
+
+        Args:
+            db: ArangoDB database connection
+            full: Discard the resident rows and reload everything
+            fetch_batch_size: Documents fetched per round trip
+            revision_batch_size: Cursor batch size for the `_id`/`_rev` listing
+
+        Returns:
+            Dict with counts of added, updated, removed and unchanged rows, and
+            whether the sync was skipped because the collection was unchanged
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "skipped": False}
+        start_time = time.time()
+
+        with self._lock:
+            if full:
+                self.clear()
+
+            try:
+                collection_revision = db.collection(self.collection_name).revision()
+            except Exception as e:
+                logger.debug(f"Could not read revision of {self.collection_name}: {e}")
+                collection_revision = None
+
+            if (collection_revision is not None
+                    and collection_revision == self._collection_revision):
+                stats["unchanged"] = self._size
+                stats["skipped"] = True
+                return stats
+
+            server_revs = self._list_revisions(db, revision_batch_size)
+
+            for doc_id in [i for i in self._ids if i not in server_revs]:
+                self.remove(doc_id)
+                stats["removed"] += 1
+
+            to_fetch = []
+            for doc_id, rev in server_revs.items():
+                offset = self._offsets.get(doc_id)
+                if offset is None:
+                    stats["added"] += 1
+                    to_fetch.append(doc_id)
+                elif self._revs[offset] != rev:
+                    stats["updated"] += 1
+                    to_fetch.append(doc_id)
+                else:
+                    stats["unchanged"] += 1
+
+            if to_fetch:
+                self._fetch_documents(db, to_fetch, fetch_batch_size)
+
+            self._collection_revision = collection_revision
+            self._last_refresh = time.time()
+
+        logger.info(
+            f"Refreshed vector index {self.collection_name}.{self.embedding_field} in "
+            f"{time.time() - start_time:.2f}s: +{stats['added']} ~{stats['updated']} "
+            f"-{stats['removed']} ({self._size} rows)"
+        )
+        return stats
+
+    def exact_lookup(self, db, batch_size: int = DEFAULT_FETCH_BATCH_SIZE):
+        """
+        Build a callable that fetches float32 vectors for row offsets.
+
+        Used to re-score quantized candidates: all candidates of a search are
+        fetched in one round trip. Rows whose document has since been deleted
+        fall back to their dequantized vector.
+
+        Args:
+            db: ArangoDB database connection
+            batch_size: Cursor batch size
+
+        Returns:
+            Callable mapping an array of row offsets to a float32 matrix
+        """
+        query = """
+        FOR id IN @ids
+        LET doc = DOCUMENT(id)
+        RETURN doc[@field]
+        """
+
+        def lookup(offsets: np.ndarray) -> np.ndarray:
+            with self._lock:
+                doc_ids = [self._ids[i] for i in offsets]
+                fallback = np.asarray(self._matrix[offsets], dtype=np.float32)
+                if self._scales is not None:
+                    fallback *= self._scales[offsets][:, None]
+            cursor = db.aql.execute(
+                query,
+                bind_vars={"ids": doc_ids, "field": self.embedding_field},
+                batch_size=batch_size,
+            )
+            rows = fallback
+            for i, vector in enumerate(cursor):
+                if isinstance(vector, list) and len(vector) == rows.shape[1]:
+                    rows[i] = vector
+            return rows
+
+        return lookup
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        top_k: int = 10,
+        threshold: float = 0.0,
+        show_progress: bool = False,
+        exact_lookup=None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the resident rows by cosine similarity.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Maximum number of results to return
+            threshold: Minimum similarity score
+            exact_lookup: For quantized indexes, a callable returning float32
+                vectors for row offsets (see `exact_lookup`)
+
+        Returns:
+            List of dicts with `id`, `metadata` and `similarity`, best first
+        """
+        return self.search_many([query_embedding], top_k, threshold, show_progress, exact_lookup)[0]
+
+    def search_many(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        top_k: int = 10,
+        threshold: float = 0.0,
+        show_progress: bool = False,
+        exact_lookup=None,
+        rescore_factor: int = DEFAULT_RESCORE_FACTOR,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several queries against the resident rows in one GEMM per block.
+
+        Quantized indexes score the float32 queries against the stored rows
+        and, when `exact_lookup` is given, re-score `top_k * rescore_factor`
+        candidates exactly; without it the approximate scores are returned.
+
+        Args:
+            query_embeddings: Query embedding matrix (one row per query)
+            top_k: Maximum number of results per query
+            threshold: Minimum similarity score
+            exact_lookup: Callable returning float32 vectors for row offsets
+            rescore_factor: Candidates re-scored per requested result
+
+        Returns:
+            One result list per query, in input order
+        """
+        with self._lock:
+            if self._size == 0:
+                return [[] for _ in query_embeddings]
+            if self.quantization:
+                results, _ = quantized_topk_search(
+                    self.embeddings,
+                    np.asarray(query_embeddings, dtype=np.float32),
+                    ids=list(self._ids),
+                    metadata=list(self._metadata),
+                    threshold=threshold,
+                    top_k=top_k,
+                    scales=self.scales,
+                    exact_embeddings=exact_lookup,
+                    rescore_factor=rescore_factor,
+                    show_progress=show_progress,
+                )
+                return results
+            results, _ = pytorch_topk_search(
+                embeddings=self.embeddings,
+                query_embeddings=np.asarray(query_embeddings, dtype=np.float32),
+                ids=self._ids,
+                metadata=self._metadata,
+                threshold=threshold,
+                top_k=top_k,
+                show_progress=show_progress,
+            )
+        return results
+
+
+# Registry of resident indexes, keyed by database, collection, field, fields and quantization
+_indexes: Dict[Tuple[str, str, str, Tuple[str, ...], Optional[str]], VectorIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def get_vector_index(
+    db,
+    collection_name: str,
+    embedding_field: str = "embedding",
+    fields_to_return: Optional[List[str]] = None,
+    snapshot_dir: Optional[str] = None,
+    quantization: Optional[str] = None,
+) -> VectorIndex:
+    """
+    Return the process-wide index for a collection, creating it if needed.
+
+    A new index is seeded from the on-disk embedding snapshot when one
+    exists, even a stale one, since `refresh` only fetches the delta. The index
+    is not refreshed here; call `refresh(db)` before searching.
+
+    Args:
+        db: ArangoDB database connection
+        collection_name: Collection holding the documents
+        embedding_field: Field containing the embedding vectors
+        fields_to_return: Fields kept alongside each vector
+        snapshot_dir: Root directory for embedding snapshots
+        quantization: Row storage, None (float32), "float16" or "int8"
+
+    Returns:
+        The shared VectorIndex instance
+    """
+    fields_key = tuple(fields_to_return) if fields_to_return else ()
+    key = (getattr(db, "name", ""), collection_name, embedding_field, fields_key, quantization)
+    with _registry_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = VectorIndex(collection_name, embedding_field, fields_to_return, quantization=quantization)
+            snapshot = load_embedding_snapshot(collection_name, embedding_field, snapshot_dir)
+            if snapshot is not None:
+                index.seed_from_snapshot(snapshot)
+            _indexes[key] = index
+        return index
+
+
+def drop_vector_indexes(collection_name: Optional[str] = None) -> int:
+    """
+    Discard resident indexes to free memory.
+
+    Args:
+        collection_name: Only drop indexes for this collection (all if None)
+
+    Returns:
+        Number of indexes dropped
+    """
+    with _registry_lock:
+        keys = [k for k in _indexes if collection_name is None or k[1] == collection_name]
+        for key in keys:
+            del _indexes[key]
+    return len(keys)
+
+
+if __name__ == "__main__":
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: add / remove keep rows contiguous
+    total_tests += 1
+    index = VectorIndex("test_collection")
+    for i in range(5):
+        vec = np.zeros(4, dtype=np.float32)
+        vec[i % 4] = 1.0
+        index.add(f"test_collection/{i}", vec, {"_key": str(i)}, rev=f"r{i}")
+    index.remove("test_collection/1")
+    if len(index) != 4 or index.offset_of("test_collection/4") != 1:
+        all_validation_failures.append(f"Swap-remove failed: size={len(index)}, ids={index.ids}")
+
+    # Test 2: replacing a vector keeps the row count
+    total_tests += 1
+    index.add("test_collection/0", [0.0, 1.0, 0.0, 0.0], {"_key": "0"}, rev="r0b")
+    if len(index) != 4 or index.embeddings[index.offset_of("test_collection/0")][1] != 1.0:
+        all_validation_failures.append("Replacing an existing row failed")
+
+    if all_validation_failures:
+        print(f"❌ VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"✅ VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
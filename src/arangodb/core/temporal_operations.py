@@ -5,14 +5,42 @@ Description: Functions for temporal operations operations
 
 Provides functions for bi-temporal data management including
 point-in-time queries, temporal validation, and invalidation.
+
+`invalid_at` stays null for documents that are still valid, which is what the
+rest of the code base checks for. Alongside it every temporal document carries
+`invalid_until`: the same value, or a far-future sentinel while the document
+is open, so range predicates on (valid_at, invalid_until) can be answered
+from the compound persistent index. Documents written without it (by older
+code or writers that skip `ensure_temporal_fields`) are still matched, and
+`create_temporal_indexes` backfills the field on existing documents.
 """
 
+import json
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Union
+from itertools import islice
+from typing import Dict, List, Any, Optional, Union, Iterator, FrozenSet, Tuple
 from loguru import logger
 from arango.database import StandardDatabase
 from arango.exceptions import AQLQueryExecuteError
 
+from arangodb.core.utils.collection_utils import collection_version
+
+# Index-friendly end of validity; sorts after every real ISO timestamp
+INVALID_UNTIL_FIELD = "invalid_until"
+OPEN_INTERVAL_END = "9999-12-31T23:59:59+00:00"
+
+# Documents per page for the keyset-paginated iterators
+TEMPORAL_PAGE_SIZE = int(os.getenv("TEMPORAL_PAGE_SIZE", "1000"))
+
+# Number of (collection, timestamp, filters) snapshots kept in memory
+TEMPORAL_SNAPSHOT_CACHE_SIZE = int(os.getenv("TEMPORAL_SNAPSHOT_CACHE_SIZE", "32"))
+
+# Largest valid-key set worth sending to a search query as a bind variable
+TEMPORAL_KEY_FILTER_LIMIT = int(os.getenv("TEMPORAL_KEY_FILTER_LIMIT", "1000"))
+
 def ensure_temporal_fields(document: Dict[str, Any], valid_at: Optional[datetime] = None) -> Dict[str, Any]:
     """
     Ensure a document has proper temporal fields.
@@ -44,6 +72,9 @@ def ensure_temporal_fields(document: Dict[str, Any], valid_at: Optional[datetime
     elif document['invalid_at'] is not None and isinstance(document['invalid_at'], datetime):
         document['invalid_at'] = document['invalid_at'].isoformat()
     
+    # Mirror invalid_at into the sentinel-backed field used by range queries
+    document[INVALID_UNTIL_FIELD] = document['invalid_at'] or OPEN_INTERVAL_END
+    
     return document
 
 def create_temporal_entity(
@@ -114,6 +145,7 @@ def invalidate_entity(
         'invalid_at': (invalid_at or datetime.now(timezone.utc)).isoformat(),
         'invalidation_reason': reason
     }
+    update_data[INVALID_UNTIL_FIELD] = update_data['invalid_at']
     
     if invalidated_by:
         update_data['invalidated_by'] = invalidated_by
@@ -125,6 +157,125 @@ def invalidate_entity(
     
     return updated_doc
 
+def _filter_clause(filters: Optional[Dict[str, Any]], bind_vars: Dict[str, Any]) -> str:
+    """Render equality filters, binding values under names that cannot clash."""
+    clause = ""
+    for i, (key, value) in enumerate((filters or {}).items()):
+        bind_name = f"filter_{i}"
+        clause += f" FILTER doc.{key} == @{bind_name}"
+        bind_vars[bind_name] = value
+    return clause
+
+
+def _iter_keyset(
+    db: StandardDatabase,
+    collection_name: str,
+    predicate: str,
+    bind_vars: Dict[str, Any],
+    filters: Optional[Dict[str, Any]],
+    page_size: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream documents matching `predicate` in (valid_at, _key) order.
+
+    Each page resumes strictly after the last (valid_at, _key) seen, so pages
+    are stable under concurrent inserts and no OFFSET scan is needed.
+    """
+    bind_vars = dict(bind_vars)
+    filter_clause = _filter_clause(filters, bind_vars)
+    bind_vars['page_size'] = page_size
+    after: Optional[Tuple[str, str]] = None
+
+    while True:
+        query = f"FOR doc IN {collection_name} {predicate}{filter_clause}"
+        if after is not None:
+            query += """
+            FILTER doc.valid_at >= @after_valid_at
+            FILTER doc.valid_at > @after_valid_at OR doc._key > @after_key
+            """
+            bind_vars['after_valid_at'], bind_vars['after_key'] = after
+        query += " SORT doc.valid_at, doc._key LIMIT @page_size RETURN doc"
+
+        page = list(db.aql.execute(query, bind_vars=bind_vars, batch_size=page_size))
+        yield from page
+        if len(page) < page_size:
+            return
+        after = (page[-1]['valid_at'], page[-1]['_key'])
+
+
+# valid_at <= t < invalid_until is a range scan on the interval index. A
+# missing invalid_until still matches, so documents from writers that never
+# set it are not dropped; the invalid_at guard then decides their validity.
+_VALID_AT_PREDICATE = """
+    FILTER doc.valid_at <= @timestamp
+    FILTER doc.invalid_until > @timestamp OR doc.invalid_until == null
+    FILTER doc.invalid_at == null OR doc.invalid_at > @timestamp
+"""
+
+_RANGE_PREDICATE = """
+    FILTER doc.valid_at >= @start_time
+    FILTER doc.valid_at <= @end_time
+    FILTER doc.invalid_until > @end_time OR doc.invalid_until == null
+    FILTER doc.invalid_at == null OR doc.invalid_at > @end_time
+"""
+
+
+def iter_valid_at(
+    db: StandardDatabase,
+    collection_name: str,
+    timestamp: datetime,
+    filters: Optional[Dict[str, Any]] = None,
+    page_size: int = TEMPORAL_PAGE_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every entity valid at `timestamp`, ordered by (valid_at, _key).
+
+    Args:
+        db: ArangoDB database instance
+        collection_name: Name of the collection
+        timestamp: The point in time to query
+        filters: Additional equality filters to apply
+        page_size: Documents fetched per keyset page
+
+    Yields:
+        Entities valid at the specified time
+    """
+    yield from _iter_keyset(
+        db, collection_name, _VALID_AT_PREDICATE,
+        {'timestamp': timestamp.isoformat()}, filters, page_size
+    )
+
+
+def iter_temporal_range(
+    db: StandardDatabase,
+    collection_name: str,
+    start_time: datetime,
+    end_time: datetime,
+    filters: Optional[Dict[str, Any]] = None,
+    page_size: int = TEMPORAL_PAGE_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream entities that became valid within [start_time, end_time] and are
+    still valid at end_time, ordered by (valid_at, _key).
+
+    Args:
+        db: ArangoDB database instance
+        collection_name: Name of the collection
+        start_time: Start of the time range
+        end_time: End of the time range
+        filters: Additional equality filters to apply
+        page_size: Documents fetched per keyset page
+
+    Yields:
+        Entities valid during the specified time range
+    """
+    yield from _iter_keyset(
+        db, collection_name, _RANGE_PREDICATE,
+        {'start_time': start_time.isoformat(), 'end_time': end_time.isoformat()},
+        filters, page_size
+    )
+
+
 def point_in_time_query(
     db: StandardDatabase,
     collection_name: str,
@@ -143,27 +294,13 @@ def point_in_time_query(
         limit: Maximum number of results
     
     Returns:
-        List of entities valid at the specified time
+        List of entities valid at the specified time, ordered by (valid_at, _key)
     """
-    query = f"""
-    FOR doc IN {collection_name}
-        FILTER doc.valid_at <= @timestamp
-        FILTER doc.invalid_at == null OR doc.invalid_at > @timestamp
-    """
-    
-    bind_vars = {'timestamp': timestamp.isoformat()}
-    
-    # Add additional filters
-    if filters:
-        for key, value in filters.items():
-            query += f" FILTER doc.{key} == @{key}"
-            bind_vars[key] = value
-    
-    query += f" LIMIT {limit} RETURN doc"
-    
     try:
-        cursor = db.aql.execute(query, bind_vars=bind_vars)
-        results = list(cursor)
+        results = list(islice(
+            iter_valid_at(db, collection_name, timestamp, filters, page_size=min(limit, TEMPORAL_PAGE_SIZE)),
+            limit
+        ))
         logger.debug(f"Point-in-time query at {timestamp} returned {len(results)} results")
         return results
     except AQLQueryExecuteError as e:
@@ -190,37 +327,126 @@ def temporal_range_query(
         limit: Maximum number of results
     
     Returns:
-        List of entities valid during the specified time range
-    """
-    query = f"""
-    FOR doc IN {collection_name}
-        FILTER doc.valid_at >= @start_time
-        FILTER doc.valid_at <= @end_time
-        FILTER doc.invalid_at == null OR doc.invalid_at > @end_time
+        List of entities valid during the specified time range, ordered by (valid_at, _key)
     """
-    
-    bind_vars = {
-        'start_time': start_time.isoformat(),
-        'end_time': end_time.isoformat()
-    }
-    
-    # Add additional filters
-    if filters:
-        for key, value in filters.items():
-            query += f" FILTER doc.{key} == @{key}"
-            bind_vars[key] = value
-    
-    query += f" LIMIT {limit} RETURN doc"
-    
     try:
-        cursor = db.aql.execute(query, bind_vars=bind_vars)
-        results = list(cursor)
+        results = list(islice(
+            iter_temporal_range(
+                db, collection_name, start_time, end_time, filters,
+                page_size=min(limit, TEMPORAL_PAGE_SIZE)
+            ),
+            limit
+        ))
         logger.debug(f"Temporal range query from {start_time} to {end_time} returned {len(results)} results")
         return results
     except AQLQueryExecuteError as e:
         logger.error(f"Temporal range query failed: {e}")
         return []
 
+
+class _TemporalSnapshotCache:
+    """LRU of valid-key sets, each tagged with the collection revision it was read at."""
+
+    def __init__(self, max_entries: int = TEMPORAL_SNAPSHOT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[str, FrozenSet[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, revision: Optional[str]) -> Optional[FrozenSet[str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and revision is not None and entry[0] == revision:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, revision: Optional[str], keys: FrozenSet[str]) -> None:
+        if revision is None:
+            return
+        with self._lock:
+            self._entries[key] = (revision, keys)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_snapshot_cache = _TemporalSnapshotCache()
+
+# Cached in place of a key set that exceeded the caller's max_keys
+_OVERSIZED_SNAPSHOT: FrozenSet[str] = frozenset({"\x00oversized"})
+
+
+def clear_temporal_snapshot_cache() -> None:
+    """Drop every cached point-in-time snapshot."""
+    _snapshot_cache.clear()
+
+
+def snapshot_at_time(
+    db: StandardDatabase,
+    collection_name: str,
+    timestamp: datetime,
+    filters: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
+    max_keys: Optional[int] = None
+) -> Optional[FrozenSet[str]]:
+    """
+    Return the `_key`s of every entity valid at `timestamp`.
+
+    Snapshots are cached per (collection, timestamp, filters) and reused until
+    the collection revision changes, so hot timestamps are read once. With
+    `max_keys` the read stops after `max_keys + 1` keys, and a snapshot that
+    large is reported (and cached) as None, so callers only ever handle small
+    sets.
+
+    Args:
+        db: ArangoDB database instance
+        collection_name: Name of the collection
+        timestamp: The point in time to snapshot
+        filters: Additional equality filters to apply
+        use_cache: Whether to read and populate the snapshot cache
+        max_keys: Largest key set to return; bigger snapshots yield None
+
+    Returns:
+        Frozen set of document keys, or None if it would exceed `max_keys`
+    """
+    cache_key = (
+        getattr(db, "name", ""), collection_name, timestamp.isoformat(),
+        json.dumps(filters or {}, sort_keys=True, default=str), max_keys
+    )
+    revision = collection_version(db, collection_name) if use_cache else None
+    if use_cache:
+        cached = _snapshot_cache.get(cache_key, revision)
+        if cached is not None:
+            return None if cached is _OVERSIZED_SNAPSHOT else cached
+
+    bind_vars = {'timestamp': timestamp.isoformat()}
+    limit_clause = ""
+    if max_keys is not None:
+        limit_clause = " LIMIT @key_limit"
+        bind_vars['key_limit'] = max_keys + 1
+    query = (
+        f"FOR doc IN {collection_name} {_VALID_AT_PREDICATE}"
+        f"{_filter_clause(filters, bind_vars)}{limit_clause} RETURN doc._key"
+    )
+    keys = frozenset(db.aql.execute(query, bind_vars=bind_vars, batch_size=TEMPORAL_PAGE_SIZE))
+    oversized = max_keys is not None and len(keys) > max_keys
+
+    if use_cache:
+        _snapshot_cache.put(cache_key, revision, _OVERSIZED_SNAPSHOT if oversized else keys)
+    if oversized:
+        logger.debug(f"Snapshot of {collection_name} at {timestamp} exceeds {max_keys} documents")
+        return None
+    logger.debug(f"Snapshot of {collection_name} at {timestamp} holds {len(keys)} documents")
+    return keys
+
 def get_entity_history(
     db: StandardDatabase,
     collection_name: str,
@@ -264,6 +490,9 @@ def create_temporal_indexes(db: StandardDatabase, collection_name: str):
     """
     Create indexes for efficient temporal queries.
     
+    Also backfills `invalid_until` on documents written without it, so they
+    are served from the interval index.
+    
     Args:
         db: ArangoDB database instance
         collection_name: Name of the collection
@@ -282,13 +511,45 @@ def create_temporal_indexes(db: StandardDatabase, collection_name: str):
         name=f'{collection_name}_invalid_at_idx'
     )
     
-    # Composite index for temporal range queries
+    # Index for the sentinel field; also finds documents missing it
+    collection.add_persistent_index(
+        fields=[INVALID_UNTIL_FIELD],
+        name=f'{collection_name}_invalid_until_idx'
+    )
+    
+    # Composite interval index for point-in-time and range queries
     collection.add_persistent_index(
-        fields=['valid_at', 'invalid_at'],
-        name=f'{collection_name}_temporal_idx'
+        fields=['valid_at', INVALID_UNTIL_FIELD],
+        name=f'{collection_name}_temporal_interval_idx'
     )
     
     logger.info(f"Created temporal indexes for {collection_name}")
+    
+    backfill_invalid_until(db, collection_name)
+
+def backfill_invalid_until(db: StandardDatabase, collection_name: str) -> int:
+    """
+    Set `invalid_until` on documents written without it.
+    
+    Args:
+        db: ArangoDB database instance
+        collection_name: Name of the collection
+    
+    Returns:
+        Number of documents updated
+    """
+    query = f"""
+    FOR doc IN {collection_name}
+        FILTER doc.{INVALID_UNTIL_FIELD} == null
+        UPDATE doc WITH {{ {INVALID_UNTIL_FIELD}: doc.invalid_at || @open_end }} IN {collection_name}
+        COLLECT WITH COUNT INTO updated
+        RETURN updated
+    """
+    cursor = db.aql.execute(query, bind_vars={'open_end': OPEN_INTERVAL_END})
+    updated = next(iter(cursor), 0)
+    if updated:
+        logger.info(f"Backfilled {INVALID_UNTIL_FIELD} on {updated} documents in {collection_name}")
+    return updated
 
 # Validation functions
 def validate_temporal_consistency(
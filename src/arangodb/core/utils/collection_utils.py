@@ -0,0 +1,48 @@
+"""
+Collection Utilities Module
+Module: collection_utils.py
+Description: Cheap change-detection tokens for ArangoDB collections
+
+Caches in the search, graph and temporal layers key their entries on a
+collection version token so that any write to the collection invalidates
+them without explicit bookkeeping.
+
+External Dependencies:
+- python-arango: https://python-arango.readthedocs.io/
+
+Sample Input:
+>>> collection_version(db, "memory_documents")
+
+Expected Output:
+>>> "1706543210123456"
+"""
+
+from typing import Optional
+
+from loguru import logger
+
+
+def collection_version(db, collection_name: str) -> Optional[str]:
+    """
+    Return a cheap token that changes whenever the collection is written.
+
+    Uses the collection revision; if that is unavailable, falls back to the
+    document count plus the maximum `_rev`.
+
+    Returns:
+        Version token, or None if the collection cannot be inspected
+    """
+    try:
+        return str(db.collection(collection_name).revision())
+    except Exception as e:
+        logger.debug(f"Could not read revision of {collection_name}: {e}")
+    try:
+        cursor = db.aql.execute(
+            "FOR doc IN @@collection COLLECT AGGREGATE n = LENGTH(1), r = MAX(doc._rev) RETURN [n, r]",
+            bind_vars={"@collection": collection_name}
+        )
+        count, max_rev = next(cursor, [0, None])
+        return f"{count}:{max_rev}"
+    except Exception as e:
+        logger.debug(f"Could not compute version token of {collection_name}: {e}")
+        return None
@@ -22,20 +22,23 @@ Example Usage:
 # src/complexity/arangodb/embedding_utils.py
 import os
 import hashlib
+import importlib.util
+import sqlite3
+import threading
+from collections import OrderedDict
 import numpy as np
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Sequence
 import sys
 import time
 from loguru import logger
 
-# Import HuggingFace for BAAI/bge model
-try:
-    import torch
-    from transformers import AutoTokenizer, AutoModel
-    has_transformers = True
-    logger.info("Transformers library is available for embeddings")
-except ImportError:
-    has_transformers = False
+# HuggingFace for BAAI/bge model; torch and transformers are only imported when
+# the model is first initialized, so importing this module stays cheap
+has_transformers = (
+    importlib.util.find_spec("torch") is not None
+    and importlib.util.find_spec("transformers") is not None
+)
+if not has_transformers:
     logger.warning("Transformers library not available, will use fallback embedding method")
 
 # Import config
@@ -46,10 +49,141 @@ except ImportError:
     EMBEDDING_MODEL = "BAAI/bge-large-en-v1.5"
     EMBEDDING_DIMENSIONS = 1024
 
+# Embedding cache configuration; the SQLite store is only used when a path is set
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "10000"))
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH")
+DEFAULT_EMBEDDING_BATCH_SIZE = 32
+
 # Initialize BAAI/bge model if available
 _model = None
 _tokenizer = None
 
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding cache keyed by (model, SHA-256 of text).
+
+    An in-memory LRU sits in front of an optional SQLite store, so unchanged
+    text is never re-embedded, within a process or across re-ingests.
+    """
+
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_SIZE, db_path: Optional[str] = EMBEDDING_CACHE_PATH):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if db_path:
+            self._open(db_path)
+
+    def _open(self, db_path: str) -> None:
+        """Open (and create if needed) the SQLite store."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, text_hash TEXT NOT NULL, vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, text_hash)) WITHOUT ROWID"
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding disk cache disabled, could not open {db_path}: {e}")
+            self._conn = None
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: tuple, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Return cached vectors for `texts`, with None for misses."""
+        keys = [(model, self.text_hash(text)) for text in texts]
+        found: Dict[tuple, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+
+            pending = list({key[1] for key in keys if key not in found})
+            if pending and self._conn is not None:
+                for start in range(0, len(pending), 500):
+                    chunk = pending[start:start + 500]
+                    rows = self._conn.execute(
+                        f"SELECT text_hash, vector FROM embeddings WHERE model = ? "
+                        f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                        [model, *chunk]
+                    ).fetchall()
+                    for text_hash, blob in rows:
+                        key = (model, text_hash)
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+                        self._remember(key, found[key])
+
+            results = []
+            for key in keys:
+                vector = found.get(key)
+                if vector is None:
+                    self.misses += 1
+                    results.append(None)
+                else:
+                    self.hits += 1
+                    results.append(vector.tolist())
+            return results
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store vectors for `texts` in memory and, if enabled, on disk."""
+        rows = []
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                array = np.asarray(vector, dtype=np.float32)
+                key = (model, self.text_hash(text))
+                self._remember(key, array)
+                rows.append((model, key[1], array.tobytes()))
+            if rows and self._conn is not None:
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)", rows
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to write embeddings to disk cache: {e}")
+
+    def clear(self) -> None:
+        """Empty the in-memory tier and reset hit/miss counters."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_path": self.db_path if self._conn is not None else None
+            }
+
+
+_embedding_cache = EmbeddingCache()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache."""
+    return _embedding_cache
+
 def _initialize_model():
     """Initialize the BAAI/bge embedding model and tokenizer."""
     global _model, _tokenizer
@@ -59,6 +193,9 @@ def _initialize_model():
         return False
     
     try:
+        import torch
+        from transformers import AutoTokenizer, AutoModel
+        
         logger.info(f"Initializing embedding model: {EMBEDDING_MODEL}")
         _tokenizer = AutoTokenizer.from_pretrained(EMBEDDING_MODEL)
         _model = AutoModel.from_pretrained(EMBEDDING_MODEL)
@@ -75,6 +212,98 @@ def _initialize_model():
         logger.error(f"Error initializing embedding model: {e}")
         return False
 
+def _embed_batch(texts: List[str], batch_size: int) -> np.ndarray:
+    """
+    Embed texts with the BGE model in length-sorted, dynamically padded batches.
+
+    Sorting by length keeps texts of similar size together, so `padding=True`
+    (pad to the longest text in the batch) wastes little compute.
+    """
+    import torch
+
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    embeddings = None
+
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            encoded_input = _tokenizer([texts[i] for i in indices], padding=True, truncation=True,
+                                       return_tensors='pt', max_length=512)
+            encoded_input = {k: v.to(device) for k, v in encoded_input.items()}
+
+            model_output = _model(**encoded_input)
+            batch = model_output.last_hidden_state[:, 0, :].float().cpu().numpy()
+
+            if embeddings is None:
+                embeddings = np.empty((len(texts), batch.shape[1]), dtype=np.float32)
+            embeddings[indices] = batch
+
+    # Normalize embeddings
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.where(norms > 0, norms, 1.0)
+
+
+def get_embeddings(
+    texts: Sequence[str],
+    model: str = None,
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    use_cache: bool = True
+) -> List[Optional[List[float]]]:
+    """
+    Get embedding vectors for many texts using BAAI/bge model.
+
+    Cached texts are served from the embedding cache; the remaining unique
+    texts are embedded in length-sorted batches and written back to the cache.
+    
+    Args:
+        texts: The texts to embed
+        model: Optional model name (defaults to config value)
+        batch_size: Number of texts per forward pass
+        use_cache: Whether to read from and write to the embedding cache
+        
+    Returns:
+        List of embedding vectors, aligned with `texts`
+    """
+    texts = [text if isinstance(text, str) else str(text) for text in texts]
+    if not texts:
+        return []
+
+    # Embeddings always come from the configured model, so key the cache on it
+    model_name = EMBEDDING_MODEL
+    results = _embedding_cache.get_many(model_name, texts) if use_cache else [None] * len(texts)
+
+    # Deduplicate the misses so repeated texts are embedded once
+    pending: Dict[str, List[int]] = {}
+    for i, (text, vector) in enumerate(zip(texts, results)):
+        if vector is None:
+            pending.setdefault(text, []).append(i)
+    if not pending:
+        return results
+
+    unique_texts = list(pending)
+    logger.debug(f"Embedding {len(unique_texts)} texts ({len(texts) - sum(map(len, pending.values()))} cached)")
+
+    vectors = None
+    if has_transformers and (_model is not None and _tokenizer is not None or _initialize_model()):
+        try:
+            vectors = _embed_batch(unique_texts, batch_size).tolist()
+            if use_cache:
+                _embedding_cache.put_many(model_name, unique_texts, vectors)
+        except Exception as e:
+            logger.error(f"Error generating embeddings with {EMBEDDING_MODEL}: {e}")
+            vectors = None
+
+    if vectors is None:
+        # Fallback vectors are not cached so the real model is used once it is available
+        vectors = [_fallback_embedding(text) for text in unique_texts]
+
+    for text, vector in zip(unique_texts, vectors):
+        for i in pending[text]:
+            results[i] = list(vector)
+    return results
+
+
 def get_embedding(text: str, model: str = None) -> Optional[List[float]]:
     """
     Get an embedding vector for a text string using BAAI/bge model.
@@ -86,49 +315,8 @@ def get_embedding(text: str, model: str = None) -> Optional[List[float]]:
     Returns:
         List of embedding values or None if embedding failed
     """
-    global _model, _tokenizer
-    
-    # Use default model if not specified
-    model = model or EMBEDDING_MODEL
-    
-    logger.info(f"Generating embedding for text: {text[:50]}...")
-    
-    # We only use BGE model - no OpenAI
-    if has_transformers:
-        # Initialize model if not done yet
-        if _model is None or _tokenizer is None:
-            success = _initialize_model()
-            if not success:
-                return _fallback_embedding(text)
-        
-        try:
-            # Prepare inputs
-            encoded_input = _tokenizer(text, padding=True, truncation=True, 
-                                      return_tensors='pt', max_length=512)
-            
-            # Move inputs to GPU if available
-            if torch.cuda.is_available():
-                encoded_input = {k: v.to("cuda") for k, v in encoded_input.items()}
-            
-            # Compute embedding
-            with torch.no_grad():
-                model_output = _model(**encoded_input)
-                embedding = model_output.last_hidden_state[:, 0, :].cpu().numpy()[0]
-            
-            # Normalize embedding
-            norm = np.linalg.norm(embedding)
-            if norm > 0:
-                embedding = embedding / norm
-            
-            return embedding.tolist()
-        
-        except Exception as e:
-            logger.error(f"Error generating embedding with {EMBEDDING_MODEL}: {e}")
-            # Fall back to hash-based method
-            return _fallback_embedding(text)
-    
-    # Use fallback method if transformers not available
-    return _fallback_embedding(text)
+    logger.debug(f"Generating embedding for text: {text[:50]}...")
+    return get_embeddings([text], model=model)[0]
 
 def _fallback_embedding(text: str) -> List[float]:
     """
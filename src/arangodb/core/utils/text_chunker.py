@@ -13,6 +13,8 @@ Key features:
 4. Splits content into chunks of specified token size
 5. Maintains metadata across all chunks
 6. Generates stable hashes for each section
+7. Streams chunks for whole corpora via chunk_documents(), splitting sentences
+   with batched (optionally multi-process) spaCy nlp.pipe
 
 Sample Input:
     ```python
@@ -88,14 +90,23 @@ import re
 import datetime
 import hashlib
 import json
+from collections import OrderedDict, deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any, Set, Union
+from typing import List, Tuple, Optional, Dict, Any, Set, Union, Iterable, Iterator, Mapping
 from loguru import logger
 
 # Import required packages
 import tiktoken
 import spacy
 
+# Distinct strings whose token counts are remembered per chunker
+TOKEN_COUNT_CACHE_SIZE = int(os.getenv("TEXT_CHUNKER_TOKEN_CACHE_SIZE", "50000"))
+# Sections handed to spaCy per nlp.pipe batch in chunk_documents
+SPACY_BATCH_SIZE = int(os.getenv("TEXT_CHUNKER_SPACY_BATCH_SIZE", "64"))
+# Components sentence splitting does not need
+SPACY_UNUSED_PIPES = ("ner", "lemmatizer", "textcat")
+
 
 def hash_string(input_string: str) -> str:
     """
@@ -112,6 +123,71 @@ def hash_string(input_string: str) -> str:
     return hash_object.hexdigest()
 
 
+class TokenCountCache:
+    """
+    Bounded LRU of token counts keyed by a digest of the text.
+    
+    Keys are 16-byte blake2b digests, so memory per entry stays constant
+    no matter how long the counted strings are.
+    """
+
+    def __init__(self, max_entries: int = TOKEN_COUNT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._counts: "OrderedDict[bytes, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, text: str) -> Optional[int]:
+        """Return the cached count for text, or None."""
+        key = self._key(text)
+        count = self._counts.get(key)
+        if count is None:
+            self.misses += 1
+            return None
+        self._counts.move_to_end(key)
+        self.hits += 1
+        return count
+
+    def put(self, text: str, count: int) -> None:
+        """Remember the count for text, evicting the least recently used entry."""
+        if self.max_entries <= 0:
+            return
+        key = self._key(text)
+        self._counts[key] = count
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+@lru_cache(maxsize=None)
+def _load_spacy_model(model_name: str):
+    """Load a spaCy model once per process; chunkers share the pipeline."""
+    return spacy.load(model_name)
+
+
+def _split_sentences_regex(text: str) -> List[str]:
+    """Regex sentence splitting used when no spaCy model is available."""
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    return [s.strip() for s in sentences if s.strip()]
+
+
+def _unpack_document(document: Union[Mapping[str, Any], Tuple[str, ...], str]) -> Tuple[str, str, str]:
+    """Normalize a chunk_documents input item to (text, repo_link, file_path)."""
+    if isinstance(document, str):
+        return document, "", ""
+    if isinstance(document, Mapping):
+        return document["text"], document.get("repo_link", ""), document.get("file_path", "")
+    text, repo_link, file_path = document
+    return text, repo_link, file_path
+
+
 class SectionHierarchy:
     """
     Manages a stack representing the current section hierarchy path.
@@ -215,6 +291,7 @@ class TextChunker:
         min_overlap: int = 100,
         model_name: str = "gemini-2.5-pro-preview-03-25",
         spacy_model: str = "en_core_web_sm",
+        token_cache_size: int = TOKEN_COUNT_CACHE_SIZE,
     ):
         """
         Initialize the TextChunker.
@@ -224,6 +301,7 @@ class TextChunker:
             min_overlap: Minimum number of tokens to overlap between chunks.
             model_name: Name of the model for token counting.
             spacy_model: Name of the spaCy model for sentence splitting.
+            token_cache_size: Distinct strings whose token counts are cached.
         """
         self.max_tokens = max_tokens
         self.min_overlap = min_overlap
@@ -239,8 +317,8 @@ class TextChunker:
         # Initialize section hierarchy tracker
         self.section_hierarchy = SectionHierarchy()
         
-        # OPTIMIZATION: Add token count cache to avoid repeated calculations
-        self._token_count_cache = {}
+        # OPTIMIZATION: Bounded token count cache to avoid repeated calculations
+        self._token_count_cache = TokenCountCache(token_cache_size)
         
         logger.info(
             f"Initialized TextChunker with max_tokens={max_tokens}, "
@@ -268,7 +346,7 @@ class TextChunker:
     def _setup_sentence_splitter(self):
         """Set up the sentence splitter."""
         try:
-            self.nlp = spacy.load(self.spacy_model_name)
+            self.nlp = _load_spacy_model(self.spacy_model_name)
             logger.debug(f"Using spaCy model {self.spacy_model_name} for sentence splitting")
         except OSError:
             logger.warning(f"SpaCy model '{self.spacy_model_name}' not found. Using regex fallback.")
@@ -288,16 +366,12 @@ class TextChunker:
         Returns:
             The number of tokens in the text.
         """
-        # OPTIMIZATION: Check cache first before encoding
-        if text in self._token_count_cache:
-            return self._token_count_cache[text]
-            
-        # Only encode if not in cache
+        # OPTIMIZATION: Check the bounded cache before encoding
         if self.encoding is not None:
-            token_count = len(self.encoding.encode(text))
-            
-            # OPTIMIZATION: Cache result to avoid future encoding
-            self._token_count_cache[text] = token_count
+            token_count = self._token_count_cache.get(text)
+            if token_count is None:
+                token_count = len(self.encoding.encode(text))
+                self._token_count_cache.put(text, token_count)
             return token_count
         else:
             # Fallback to character-based estimation
@@ -318,8 +392,77 @@ class TextChunker:
             return [sent.text.strip() for sent in self.nlp(text).sents]
         else:
             # Fallback to regex-based sentence splitting if spaCy model failed to load
-            sentences = re.split(r'(?<=[.!?])\s+', text)
-            return [s.strip() for s in sentences if s.strip()]
+            return _split_sentences_regex(text)
+
+    def _sentence_stream(
+        self, texts: Iterable[str], batch_size: int, n_process: int
+    ) -> Iterator[List[str]]:
+        """
+        Split many texts into sentences, yielding one list per text in order.
+        
+        Args:
+            texts: Texts to split; consumed lazily.
+            batch_size: Texts per nlp.pipe batch.
+            n_process: spaCy worker processes.
+            
+        Yields:
+            The sentences of each text.
+        """
+        if self.nlp is None:
+            for text in texts:
+                yield _split_sentences_regex(text)
+            return
+
+        disable = [name for name in SPACY_UNUSED_PIPES if name in self.nlp.pipe_names]
+        for doc in self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disable):
+            yield [sent.text.strip() for sent in doc.sents]
+
+    def chunk_documents(
+        self,
+        documents: Iterable[Union[Mapping[str, Any], Tuple[str, str, str], str]],
+        batch_size: int = SPACY_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator[Dict]:
+        """
+        Chunk a stream of documents, yielding chunk dictionaries as they are ready.
+        
+        Section texts from consecutive documents are fed through one nlp.pipe
+        call, so spaCy batches (and with n_process > 1, parallelizes) sentence
+        splitting across document boundaries. Only the documents whose
+        sections are in flight are held in memory, so memory stays flat
+        regardless of corpus size. Each document is chunked exactly as
+        chunk_text would chunk it on a fresh chunker.
+        
+        Args:
+            documents: Dicts with "text" and optional "repo_link"/"file_path",
+                (text, repo_link, file_path) tuples, or plain strings.
+            batch_size: Sections per nlp.pipe batch.
+            n_process: spaCy worker processes (-1 for one per CPU).
+            
+        Yields:
+            Chunk dictionaries, grouped by document in input order.
+        """
+        # (text, repo_link, file_path, sections, sentence lists received so far)
+        pending: deque = deque()
+
+        def section_texts() -> Iterator[str]:
+            for document in documents:
+                text, repo_link, file_path = _unpack_document(document)
+                sections = self._split_by_sections(text)
+                pending.append((text, repo_link, file_path, sections, []))
+                for _, _, (start, end) in sections:
+                    yield text[start:end].strip()
+
+        document_count = 0
+        for sentences in self._sentence_stream(section_texts(), batch_size, n_process):
+            pending[0][4].append(sentences)
+            while pending and len(pending[0][4]) == len(pending[0][3]):
+                text, repo_link, file_path, sections, sentence_lists = pending.popleft()
+                self.section_hierarchy = SectionHierarchy()
+                yield from self._chunk_sections(text, sections, sentence_lists, repo_link, file_path)
+                document_count += 1
+
+        logger.info(f"Chunked {document_count} documents")
     
     def chunk_text(self, text: str, repo_link: str, file_path: str) -> List[Dict]:
         """
@@ -337,6 +480,31 @@ class TextChunker:
         
         # First, split the text into sections
         sections = self._split_by_sections(text)
+        extracted_data = self._chunk_sections(text, sections, None, repo_link, file_path)
+        logger.info(f"Generated {len(extracted_data)} chunks")
+        return extracted_data
+
+    def _chunk_sections(
+        self,
+        text: str,
+        sections: List[Tuple[str, str, Tuple[int, int]]],
+        sentence_lists: Optional[List[List[str]]],
+        repo_link: str,
+        file_path: str,
+    ) -> List[Dict]:
+        """
+        Chunk a document's sections in order, updating the section hierarchy.
+        
+        Args:
+            text: The full text.
+            sections: Output of _split_by_sections.
+            sentence_lists: Pre-split sentences per section, or None to split here.
+            repo_link: Link to the repository.
+            file_path: Path to the file within the repository.
+            
+        Returns:
+            A list of chunk dictionaries with metadata.
+        """
         extracted_data: List[Dict] = []
 
         if sections:
@@ -355,13 +523,13 @@ class TextChunker:
                         span,
                         repo_link,
                         file_path,
+                        sentences=sentence_lists[idx] if sentence_lists is not None else None,
                     )
                 )
         else:
             logger.warning("No sections found, using fallback chunking")
             extracted_data.extend(self._fallback_chunking(text, repo_link, file_path))
 
-        logger.info(f"Generated {len(extracted_data)} chunks")
         return extracted_data
 
     def _split_by_sections(self, text: str) -> List[Tuple[str, str, Tuple[int, int]]]:
@@ -445,10 +613,6 @@ class TextChunker:
         # Create section hash once
         section_hash = hash_string(chunk_content)
         
-        # Cache the section title token count
-        if section_title not in self._token_count_cache:
-            self.count_tokens(section_title)  # This will cache the result
-        
         # Create and return the chunk dictionary
         return {
             "file_path": file_path,
@@ -460,7 +624,7 @@ class TextChunker:
             "code_type": "text",
             "description": section_title,
             "code_token_count": token_count,
-            "description_token_count": self._token_count_cache.get(section_title, self.count_tokens(section_title)),
+            "description_token_count": self.count_tokens(section_title),
             "embedding_code": None,
             "embedding_description": None,
             "code_metadata": {},
@@ -478,6 +642,7 @@ class TextChunker:
         span: Tuple[int, int],
         repo_link: str,
         file_path: str,
+        sentences: Optional[List[str]] = None,
     ) -> List[Dict]:
         """
         Chunk a single section into smaller pieces based on token limit.
@@ -490,12 +655,14 @@ class TextChunker:
             span: The (start, end) character offsets in the original text.
             repo_link: Link to the repository.
             file_path: Path to the file within the repository.
+            sentences: Sentences of section_content if already split.
             
         Returns:
             A list of chunk dictionaries with metadata.
         """
         logger.info(f"Chunking section: {section_title!r}")
-        sentences = self.split_into_sentences(section_content)
+        if sentences is None:
+            sentences = self.split_into_sentences(section_content)
         chunks = []
         current_chunk = ""
         token_count = 0
@@ -19,7 +19,6 @@ import json
 from typing import Dict, List, Any, Optional, Union, Tuple, Set, Callable
 from loguru import logger
 from tqdm import tqdm
-import numpy as np
 
 from arango import ArangoClient
 from arango.database import StandardDatabase
@@ -27,7 +26,7 @@ from arango.collection import StandardCollection
 from arango.cursor import Cursor
 
 # Import embedding utilities
-from arangodb.core.utils.embedding_utils import get_embedding
+from arangodb.core.utils.embedding_utils import get_embedding, get_embeddings
 
 # Constants
 EMBEDDING_FIELD = "embedding"
@@ -258,6 +257,7 @@ def fix_collection_embeddings(
             batch_docs = list(cursor)
             
             fixed_docs = []
+            pending = []  # (doc, text_to_embed, reason) embedded together after the scan
             
             for doc in batch_docs:
                 doc_key = doc["_key"]
@@ -312,37 +312,7 @@ def fix_collection_embeddings(
                             results["details"].append(f"Skipped document {doc_key}: No text to embed")
                             continue
                         
-                        # Generate embedding
-                        new_embedding = get_embedding(text_to_embed, model=embedding_model)
-                        
-                        if not new_embedding:
-                            results["errors"] += 1
-                            results["details"].append(f"Failed to generate embedding for document {doc_key}")
-                            continue
-                        
-                        # Ensure proper format
-                        if isinstance(new_embedding, np.ndarray):
-                            new_embedding = new_embedding.tolist()
-                        
-                        # Truncate or pad if needed
-                        if len(new_embedding) > target_dimensions:
-                            new_embedding = new_embedding[:target_dimensions]
-                        elif len(new_embedding) < target_dimensions:
-                            # Pad with zeros (not ideal but better than nothing)
-                            new_embedding.extend([0.0] * (target_dimensions - len(new_embedding)))
-                        
-                        # Update document
-                        doc[embedding_field] = new_embedding
-                        doc[metadata_field] = {
-                            "model": embedding_model or "default",
-                            "dimensions": target_dimensions,
-                            "created_at": time.time(),
-                            "reason": reason
-                        }
-                        
-                        # Add to batch for update
-                        fixed_docs.append(doc)
-                        results["documents_fixed"] += 1
+                        pending.append((doc, text_to_embed, reason))
                     else:
                         results["documents_skipped"] += 1
                 
@@ -351,6 +321,40 @@ def fix_collection_embeddings(
                     results["errors"] += 1
                     results["details"].append(f"Error processing document {doc_key}: {str(e)}")
             
+            # Generate embeddings for the whole batch in one call
+            try:
+                new_embeddings = get_embeddings([text for _, text, _ in pending], model=embedding_model)
+            except Exception as e:
+                logger.error(f"Error generating embeddings for batch {batch+1}: {e}")
+                new_embeddings = [None] * len(pending)
+            
+            for (doc, _, reason), new_embedding in zip(pending, new_embeddings):
+                doc_key = doc["_key"]
+                if not new_embedding:
+                    results["errors"] += 1
+                    results["details"].append(f"Failed to generate embedding for document {doc_key}")
+                    continue
+                
+                # Truncate or pad if needed
+                if len(new_embedding) > target_dimensions:
+                    new_embedding = new_embedding[:target_dimensions]
+                elif len(new_embedding) < target_dimensions:
+                    # Pad with zeros (not ideal but better than nothing)
+                    new_embedding.extend([0.0] * (target_dimensions - len(new_embedding)))
+                
+                # Update document
+                doc[embedding_field] = new_embedding
+                doc[metadata_field] = {
+                    "model": embedding_model or "default",
+                    "dimensions": target_dimensions,
+                    "created_at": time.time(),
+                    "reason": reason
+                }
+                
+                # Add to batch for update
+                fixed_docs.append(doc)
+                results["documents_fixed"] += 1
+            
             # Update fixed documents in batch
             if fixed_docs:
                 try:
@@ -16,34 +16,41 @@ Components:
 """
 
 # Import and expose search operations
-from arangodb.mcp.search_operations import (
-    mcp_bm25_search,
-    mcp_semantic_search,
-    mcp_hybrid_search,
-    mcp_tag_search,
-    mcp_keyword_search,
-    mcp_graph_traverse
-)
+import importlib
 
-# Import and expose document operations
-from arangodb.mcp.document_operations import (
-    mcp_create_document,
-    mcp_get_document,
-    mcp_update_document,
-    mcp_delete_document,
-    mcp_create_relationship,
-    mcp_delete_relationship
-)
+# Operations are imported on first access; `arangodb.mcp.prompts` is used by
+# the CLI at startup and must not drag the search and memory stacks in
+_LAZY_EXPORTS = {
+    'mcp_bm25_search': 'arangodb.mcp.search_operations',
+    'mcp_semantic_search': 'arangodb.mcp.search_operations',
+    'mcp_hybrid_search': 'arangodb.mcp.search_operations',
+    'mcp_tag_search': 'arangodb.mcp.search_operations',
+    'mcp_keyword_search': 'arangodb.mcp.search_operations',
+    'mcp_graph_traverse': 'arangodb.mcp.search_operations',
+    'mcp_search_cache_stats': 'arangodb.mcp.search_operations',
+    
+    'mcp_create_document': 'arangodb.mcp.document_operations',
+    'mcp_get_document': 'arangodb.mcp.document_operations',
+    'mcp_update_document': 'arangodb.mcp.document_operations',
+    'mcp_delete_document': 'arangodb.mcp.document_operations',
+    'mcp_create_relationship': 'arangodb.mcp.document_operations',
+    'mcp_delete_relationship': 'arangodb.mcp.document_operations',
+    
+    'mcp_store_conversation': 'arangodb.mcp.memory_operations',
+    'mcp_get_conversation_history': 'arangodb.mcp.memory_operations',
+    'mcp_search_memory': 'arangodb.mcp.memory_operations',
+    'mcp_detect_contradictions': 'arangodb.mcp.memory_operations',
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
 
-# Import and expose memory operations
-from arangodb.mcp.memory_operations import (
-    mcp_store_conversation,
-    mcp_get_conversation_history,
-    mcp_search_memory,
-    mcp_detect_contradictions
-)
 
-# Exports
 __all__ = [
     # Search operations
     'mcp_bm25_search',
@@ -52,6 +59,7 @@ __all__ = [
     'mcp_tag_search',
     'mcp_keyword_search',
     'mcp_graph_traverse',
+    'mcp_search_cache_stats',
     
     # Document operations
     'mcp_create_document',
@@ -14,6 +14,7 @@ Operations include:
 - Tag search
 - Keyword search
 - Graph traversal
+- Search result cache metrics
 
 Sample Input:
 - MCP function call with parameters (e.g., query_text, min_score, etc.)
@@ -39,8 +40,8 @@ from arangodb.core.search import (
 # Import safe semantic search for better error handling
 from arangodb.core.search.semantic_search import safe_semantic_search as semantic_search
 
-# Import utilities for embedding generation
-from arangodb.core.utils.embedding_utils import get_embedding
+# Result cache in front of the BM25, semantic and hybrid searches
+from arangodb.core.search.result_cache import get_search_cache
 
 # Import constants from core
 from arangodb.core.constants import (
@@ -126,19 +127,10 @@ def mcp_semantic_search(
     try:
         db = get_db_connection()
         
-        # Generate query embedding
-        query_embedding = get_embedding(query_text)
-        if not query_embedding:
-            return {
-                "status": "error",
-                "message": "Failed to generate embedding for the query",
-                "data": None
-            }
-        
-        # Call the core layer semantic search function
+        # Pass the text so the query is only embedded on a result-cache miss
         results_data = semantic_search(
             db=db,
-            query_embedding=query_embedding,
+            query=query_text,
             top_n=top_n,
             min_score=min_score,
             tag_list=tag_list
@@ -198,9 +190,9 @@ def mcp_hybrid_search(
             query_text=query_text,
             top_n=top_n,
             initial_k=initial_k,
-            min_bm25_score=min_bm25_score,
-            min_semantic_score=min_semantic_score,
-            tag_list=tag_list
+            min_score={"bm25": min_bm25_score, "semantic": min_semantic_score},
+            tag_list=tag_list,
+            output_format="json"
         )
         
         # Apply reranking if requested
@@ -401,6 +393,35 @@ def mcp_graph_traverse(
         }
 
 
+def mcp_search_cache_stats(reset: bool = False) -> Dict[str, Any]:
+    """
+    Report hit/miss metrics of the search result cache.
+    
+    Args:
+        reset: Also drop all cached entries
+    
+    Returns:
+        Dictionary with cache statistics
+    """
+    try:
+        cache = get_search_cache()
+        stats = cache.stats()
+        if reset:
+            cache.clear()
+        return {
+            "status": "success",
+            "data": stats,
+            "message": f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)"
+        }
+    except Exception as e:
+        logger.error(f"MCP search cache stats failed: {e}", exc_info=True)
+        return {
+            "status": "error",
+            "message": str(e),
+            "data": None
+        }
+
+
 if __name__ == "__main__":
     """Test function for this module alone."""
     import sys
@@ -0,0 +1,86 @@
+"""
+Async database access for the Q&A pipeline.
+Module: async_db.py
+
+python-arango is synchronous, so calling `db.aql.execute` inside a coroutine
+blocks the event loop for the whole round trip and cursor drain. AsyncDatabase
+runs queries on a small dedicated thread pool and awaits the result, so
+fetching one document's data overlaps LLM calls for another.
+
+Sample Input:
+>>> adb = AsyncDatabase(db, max_workers=4)
+>>> rows = await adb.query("FOR d IN document_objects FILTER d.document_id == @id RETURN d", {"id": "doc1"})
+
+Expected Output:
+>>> [{"_key": "...", "document_id": "doc1", ...}, ...]
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+
+class AsyncDatabase:
+    """Executor-offloaded AQL access for coroutines."""
+
+    def __init__(self, db: Any, max_workers: int = 4):
+        """
+        Wrap a database handle.
+
+        Args:
+            db: StandardDatabase, or a DatabaseOperations wrapper around one
+            max_workers: Threads available for concurrent queries
+        """
+        # DatabaseOperations exposes the handle as `.db`
+        self.db = db if hasattr(db, "aql") or not hasattr(db, "db") else db.db
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="qa-db")
+        self._indexed: Set[Tuple[str, Tuple[str, ...]]] = set()
+        self._index_lock = threading.Lock()
+
+    async def query(
+        self,
+        aql: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute an AQL query off the event loop and return all rows.
+
+        Args:
+            aql: The AQL query
+            bind_vars: Query bind variables
+            batch_size: Rows per cursor round trip
+
+        Returns:
+            Result rows
+        """
+        def run():
+            return list(self.db.aql.execute(aql, bind_vars=bind_vars or {}, batch_size=batch_size))
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+
+    async def ensure_persistent_index(self, collection: str, fields: Sequence[str]) -> None:
+        """Try to create a persistent index once per (collection, fields) for this handle."""
+        key = (collection, tuple(fields))
+        if key in self._indexed:
+            return
+
+        def run():
+            with self._index_lock:
+                if key in self._indexed:
+                    return
+                try:
+                    self.db.collection(collection).add_persistent_index(fields=list(fields), unique=False, sparse=False)
+                except Exception as e:
+                    logger.warning(f"Could not ensure index {list(fields)} on {collection}: {e}")
+                # Attempted once either way; a failure is not retried per query
+                self._indexed.add(key)
+
+        await asyncio.get_running_loop().run_in_executor(self._executor, run)
+
+    def close(self) -> None:
+        """Shut the worker threads down."""
+        self._executor.shutdown(wait=False)
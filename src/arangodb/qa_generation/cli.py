@@ -10,7 +10,7 @@ from documents processed by Marker and stored in ArangoDB.
 import json
 import asyncio
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List, Any, Callable, Tuple, Union
 from enum import Enum
 import glob
 
@@ -51,6 +51,9 @@ from .edge_generator import QAEdgeGenerator
 from .enrichment import QAEdgeEnricher
 from .exporter import QAExporter
 
+if TYPE_CHECKING:
+    from .models import QABatch
+
 # Import constants
 try:
     from arangodb.core.constants import CONFIG, update_config
@@ -70,25 +73,30 @@ class QuestionTypes(str, Enum):
     ALL = "all"
 
 
-async def generate_qa_from_document(
-    document_id: str,
+async def generate_qa_from_documents(
+    document_ids: List[str],
     output_dir: Path,
     max_questions: int = 20,
-    question_types: str = "all",
-    validation_threshold: float = 0.97
-) -> tuple[Path, "QABatch"]:
+    validation_threshold: float = 0.97,
+    progress_callback: Optional[Callable[[str, Any], None]] = None
+) -> List[Union[Tuple[Path, "QABatch"], Exception]]:
     """
-    Generate Q&A pairs from a document in ArangoDB.
+    Generate Q&A pairs for several documents with one generator.
+    
+    Each document's data is prefetched while the previous one is being
+    generated. A failing document is reported in its slot and does not
+    stop the others.
     
     Args:
-        document_id: Document ID in ArangoDB
+        document_ids: Document IDs in ArangoDB
         output_dir: Output directory
-        max_questions: Maximum questions to generate
-        question_types: Types of questions to generate
+        max_questions: Maximum questions to generate per document
         validation_threshold: Validation threshold
+        progress_callback: Called with (document_id, batch or exception)
+            as each document finishes generating
         
     Returns:
-        Path to output file
+        (output path, QABatch) or the exception, per document in input order
     """
     from ..core.db_operations import DatabaseOperations
     from .generator import QAGenerator, QAGenerationConfig
@@ -106,17 +114,55 @@ async def generate_qa_from_document(
     )
     
     generator = QAGenerator(db, config)
-    exporter = QAExporter()
+    exporter = QAExporter(output_dir=str(output_dir))
     
-    # Generate Q&A pairs
-    qa_batch = await generator.generate_for_document(document_id, max_questions)
+    try:
+        batches = await generator.generate_for_documents(
+            document_ids, max_questions, return_exceptions=True, progress_callback=progress_callback
+        )
+    finally:
+        generator.close()
     
     # Export to UnSloth format
-    output_path = output_dir / f"{document_id}_qa.json"
-    unsloth_export_path = exporter.export_to_unsloth(qa_batch)
+    results = []
+    for document_id, qa_batch in zip(document_ids, batches):
+        if isinstance(qa_batch, Exception):
+            results.append(qa_batch)
+            continue
+        try:
+            export_paths = await exporter.export_to_unsloth(qa_batch, filename=f"{document_id}_qa.json")
+            output_path = Path(export_paths[0]) if export_paths else output_dir / f"{document_id}_qa.json"
+            results.append((output_path, qa_batch))
+        except Exception as e:
+            logger.error(f"Export failed for document {document_id}: {e}")
+            results.append(e)
+    return results
+
+
+async def generate_qa_from_document(
+    document_id: str,
+    output_dir: Path,
+    max_questions: int = 20,
+    question_types: str = "all",
+    validation_threshold: float = 0.97
+) -> tuple[Path, "QABatch"]:
+    """
+    Generate Q&A pairs from a document in ArangoDB.
     
-    # Return the output path and qa_batch
-    return output_path, qa_batch
+    Args:
+        document_id: Document ID in ArangoDB
+        output_dir: Output directory
+        max_questions: Maximum questions to generate
+        question_types: Types of questions to generate
+        validation_threshold: Validation threshold
+        
+    Returns:
+        Path to output file
+    """
+    result = (await generate_qa_from_documents([document_id], output_dir, max_questions, validation_threshold))[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
 
 
 async def generate_from_marker_output(
@@ -360,22 +406,25 @@ def batch(
         ) as progress:
             task = progress.add_task("Generating Q&A...", total=len(doc_ids))
             
-            for doc_id in doc_ids:
-                try:
-                    progress.update(task, description=f"Processing {doc_id}")
-                    output_path, qa_batch = asyncio.run(
-                        generate_qa_from_document(
-                            doc_id,
-                            output_dir,
-                            max_questions
-                        )
-                    )
-                    successful += 1
-                except Exception as e:
-                    console.print(f"[red]Failed {doc_id}:[/red] {e}")
-                    failed += 1
-                
+            def report(doc_id, result):
+                if isinstance(result, Exception):
+                    console.print(f"[red]Failed {doc_id}:[/red] {result}")
                 progress.advance(task)
+            
+            # One generator for the whole batch, prefetching the next document
+            results = asyncio.run(
+                generate_qa_from_documents(
+                    doc_ids,
+                    output_dir,
+                    max_questions,
+                    progress_callback=report
+                )
+            )
+            for doc_id, result in zip(doc_ids, results):
+                if isinstance(result, Exception):
+                    failed += 1
+                else:
+                    successful += 1
         
         # Summary
         console.print(f"\n[bold]Batch Complete:[/bold]")
@@ -21,7 +21,7 @@ from ..core.field_constants import (
     FROM_FIELD, TO_FIELD, TYPE_FIELD, CONTENT_FIELD,
     CONFIDENCE_FIELD, TIMESTAMP_FIELD, EMBEDDING_FIELD
 )
-from ..core.utils.embedding_utils import get_embedding
+from ..core.utils.embedding_utils import get_embedding, get_embeddings
 from ..core.graph.entity_resolution import find_exact_entity_matches, resolve_entity
 from ..core.graph.relationship_extraction import EntityExtractor
 from ..core.search.bm25_search import bm25_search
@@ -394,8 +394,9 @@ class QAEdgeGenerator:
         }
         
         # Add embeddings
-        edge[EMBEDDING_FIELD] = get_embedding(qa_pair.answer)
-        edge["question_embedding"] = get_embedding(qa_pair.question)
+        edge[EMBEDDING_FIELD], edge["question_embedding"] = get_embeddings(
+            [qa_pair.answer, qa_pair.question]
+        )
         
         return edge
     
@@ -10,7 +10,7 @@ import asyncio
 import json
 import random
 import time
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable, Union
 from datetime import datetime
 from loguru import logger
 from tqdm.asyncio import tqdm
@@ -28,6 +28,7 @@ from .models import (
 from .validator import QAValidator
 from .validation_models import QAValidationError, QARetryContext
 from .reversal_generator import ReversalGenerator, enhance_with_reversals
+from .async_db import AsyncDatabase
 from ..core.db_connection_wrapper import DatabaseOperations
 
 
@@ -57,14 +58,73 @@ class QAGenerator:
         """
         self.db = db
         self.config = config or QAGenerationConfig()
-        self.validator = QAValidator(db, self.config.validation_threshold)
+        self.adb = AsyncDatabase(db, self.config.db_workers)
+        self.validator = QAValidator(db, self.config.validation_threshold, async_db=self.adb)
         self.reversal_generator = ReversalGenerator()
         self._semaphore = asyncio.Semaphore(self.config.semaphore_limit)
     
+    def close(self) -> None:
+        """Shut down the database worker threads of the generator and its validator."""
+        self.validator.close()
+        self.adb.close()
+    
+    async def generate_for_documents(
+        self,
+        document_ids: List[str],
+        max_pairs: Optional[int] = None,
+        return_exceptions: bool = False,
+        progress_callback: Optional[Callable[[str, Union[QABatch, Exception]], None]] = None
+    ) -> List[Union[QABatch, Exception]]:
+        """
+        Generate Q&A pairs for several documents in order.
+        
+        The sections and relationships of the next document are fetched while
+        the current one is being generated.
+        
+        Args:
+            document_ids: The document IDs to process
+            max_pairs: Maximum number of pairs to generate per document
+            return_exceptions: Record a failed document's exception in its
+                slot and carry on, instead of raising it
+            progress_callback: Called with (document_id, batch or exception)
+                as each document finishes
+            
+        Returns:
+            One QABatch (or exception) per document, in input order
+        """
+        batches = []
+        next_data = asyncio.ensure_future(self._load_document_data(document_ids[0])) if document_ids else None
+        try:
+            for i, document_id in enumerate(document_ids):
+                data = next_data
+                next_data = (
+                    asyncio.ensure_future(self._load_document_data(document_ids[i + 1]))
+                    if i + 1 < len(document_ids) else None
+                )
+                try:
+                    result = await self.generate_for_document(document_id, max_pairs, document_data=await data)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    logger.error(f"Q&A generation failed for document {document_id}: {e}")
+                    result = e
+                batches.append(result)
+                if progress_callback:
+                    progress_callback(document_id, result)
+        finally:
+            # Never leave the prefetch dangling when a document fails
+            if next_data is not None:
+                if not next_data.done():
+                    next_data.cancel()
+                elif not next_data.cancelled():
+                    next_data.exception()
+        return batches
+    
     async def generate_for_document(
         self, 
         document_id: str,
-        max_pairs: Optional[int] = None
+        max_pairs: Optional[int] = None,
+        document_data: Optional[Tuple[List[Dict], List[Dict]]] = None
     ) -> QABatch:
         """
         Generate Q&A pairs for an entire document.
@@ -72,6 +132,7 @@ class QAGenerator:
         Args:
             document_id: The document ID to process
             max_pairs: Maximum number of pairs to generate
+            document_data: Prefetched (sections, relationships), fetched if None
             
         Returns:
             QABatch containing all generated pairs
@@ -80,8 +141,7 @@ class QAGenerator:
         logger.info(f"Starting Q&A generation for document: {document_id}")
         
         # Get document structure
-        sections = await self._get_document_sections(document_id)
-        relationships = await self._get_document_relationships(document_id)
+        sections, relationships = document_data or await self._load_document_data(document_id)
         
         # Generate Q&A pairs by type
         qa_pairs = []
@@ -679,6 +739,15 @@ class QAGenerator:
         
         return None
     
+    async def _load_document_data(self, document_id: str) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch a document's sections and relationships concurrently."""
+        await self.adb.ensure_persistent_index("document_objects", ["document_id", "_type"])
+        sections, relationships = await asyncio.gather(
+            self._get_document_sections(document_id),
+            self._get_document_relationships(document_id)
+        )
+        return sections, relationships
+    
     async def _get_document_sections(self, document_id: str) -> List[Dict]:
         """Get all sections from document."""
         query = """
@@ -705,29 +774,29 @@ class QAGenerator:
             }
         """
         
-        cursor = self.db.aql.execute(query, bind_vars={"doc_id": document_id})
-        return list(cursor)
+        return await self.adb.query(query, bind_vars={"doc_id": document_id})
     
     async def _get_document_relationships(self, document_id: str) -> List[Dict]:
         """Get all relationships from document."""
+        # Start from the document's own objects and follow the edge index on
+        # _from, instead of scanning every edge and dereferencing both ends
         query = """
-        FOR edge IN content_relationships
-            LET from_obj = DOCUMENT(edge._from)
-            LET to_obj = DOCUMENT(edge._to)
-            
+        FOR from_obj IN document_objects
             FILTER from_obj.document_id == @doc_id
-            FILTER edge.confidence >= 0.8
-            
-            RETURN {
-                _id: edge._key,
-                relationship_type: edge.relationship_type,
-                confidence: edge.confidence,
-                from_id: from_obj._key,
-                from_text: from_obj.text,
-                to_id: to_obj._key,
-                to_text: to_obj.text
-            }
+            FOR edge IN content_relationships
+                FILTER edge._from == from_obj._id
+                FILTER edge.confidence >= 0.8
+                LET to_obj = DOCUMENT(edge._to)
+                
+                RETURN {
+                    _id: edge._key,
+                    relationship_type: edge.relationship_type,
+                    confidence: edge.confidence,
+                    from_id: from_obj._key,
+                    from_text: from_obj.text,
+                    to_id: to_obj._key,
+                    to_text: to_obj.text
+                }
         """
         
-        cursor = self.db.aql.execute(query, bind_vars={"doc_id": document_id})
-        return list(cursor)
\ No newline at end of file
+        return await self.adb.query(query, bind_vars={"doc_id": document_id})
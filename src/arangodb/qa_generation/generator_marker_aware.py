@@ -340,7 +340,10 @@ async def generate_qa_from_marker_file(
     generator = MarkerAwareQAGenerator(db, config)
     
     # Generate Q&A pairs
-    qa_batch = await generator.generate_from_marker_document(marker_output)
+    try:
+        qa_batch = await generator.generate_from_marker_document(marker_output)
+    finally:
+        generator.close()
     
     # Export to UnSloth format
     from .exporter import QAExporter
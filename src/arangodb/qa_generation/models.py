@@ -109,6 +109,7 @@ class QAGenerationConfig(BaseModel):
     # Batch processing
     batch_size: int = Field(50, description="Number of concurrent requests")
     semaphore_limit: int = Field(10, description="Concurrent request limit")
+    db_workers: int = Field(4, description="Threads for non-blocking database queries")
     
     # Validation
     validation_threshold: float = Field(0.97, description="RapidFuzz validation threshold")
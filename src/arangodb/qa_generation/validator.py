@@ -12,24 +12,39 @@ from loguru import logger
 from rapidfuzz import fuzz, process
 
 from .models import QAPair, ValidationResult
+from .async_db import AsyncDatabase
 from ..core.db_connection_wrapper import DatabaseOperations
 
 
 class QAValidator:
     """Validates Q&A pairs against document corpus using RapidFuzz."""
     
-    def __init__(self, db: DatabaseOperations, threshold: float = 0.97):
+    def __init__(
+        self,
+        db: DatabaseOperations,
+        threshold: float = 0.97,
+        async_db: Optional[AsyncDatabase] = None
+    ):
         """
         Initialize the validator.
         
         Args:
             db: Database operations instance
             threshold: RapidFuzz similarity threshold (default: 97%)
+            async_db: Non-blocking access to `db`, shared with the generator
         """
         self.db = db
+        # Only an executor created here is shut down by close()
+        self._owns_adb = async_db is None
+        self.adb = async_db or AsyncDatabase(db, max_workers=1)
         self.threshold = threshold * 100  # RapidFuzz uses 0-100 scale
         self._corpus_cache = {}
     
+    def close(self) -> None:
+        """Shut down the database worker threads this validator created."""
+        if self._owns_adb:
+            self.adb.close()
+    
     async def validate_qa_pair(self, qa_pair: QAPair, document_id: str) -> ValidationResult:
         """
         Validate a single Q&A pair against document corpus.
@@ -128,11 +143,11 @@ class QAValidator:
                 }
             """
             
-            cursor = self.db.aql.execute(query, bind_vars={"doc_id": document_id})
+            rows = await self.adb.query(query, bind_vars={"doc_id": document_id})
             
             # Build corpus dict
             corpus = {}
-            for obj in cursor:
+            for obj in rows:
                 corpus[obj['id']] = obj['text']
             
             self._corpus_cache[document_id] = corpus
@@ -256,7 +256,8 @@ class MarkerConnector:
         Returns:
             Tuple of (document_id, qa_keys, relationship_keys)
         """
-        if qa_generator is None:
+        owns_generator = qa_generator is None
+        if owns_generator:
             # Import here to avoid circular imports
             from arangodb.qa_generation.generator_marker_aware import MarkerAwareQAGenerator
             from arangodb.qa_generation.models import QAGenerationConfig
@@ -274,10 +275,14 @@ class MarkerConnector:
             qa_generator = MarkerAwareQAGenerator(db_ops, config)
         
         # Generate Q&A pairs
-        qa_batch = await qa_generator.generate_from_marker_document(
-            marker_output,
-            max_pairs=max_pairs
-        )
+        try:
+            qa_batch = await qa_generator.generate_from_marker_document(
+                marker_output,
+                max_pairs=max_pairs
+            )
+        finally:
+            if owns_generator:
+                qa_generator.close()
         
         # Store in ArangoDB
         qa_keys, rel_keys = self.qa_connector.store_generated_batch(qa_batch)
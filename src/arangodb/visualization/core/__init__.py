@@ -2,13 +2,17 @@
 Module: __init__.py
 Description: Package initialization and exports
 
-Provides the main visualization engine, data transformers, and LLM recommender.
+Provides the main visualization engine, data transformers, server-side layouts, level-of-detail indexes, and LLM recommender.
 """
 
 from .d3_engine import D3VisualizationEngine
 from .data_transformer import DataTransformer
+from .layout_engine import LayoutEngine
+from .lod_index import GraphLODIndex
 
 __all__ = [
     "D3VisualizationEngine",
-    "DataTransformer"
+    "DataTransformer",
+    "LayoutEngine",
+    "GraphLODIndex"
 ]
\ No newline at end of file
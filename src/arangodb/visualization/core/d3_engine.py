@@ -42,6 +42,14 @@ except ImportError:
     OPTIMIZER_AVAILABLE = False
     logger.warning("Performance optimizer not available")
 
+# Import server-side layout engine
+try:
+    from .layout_engine import LayoutEngine, PRECOMPUTE_NODE_THRESHOLD
+    LAYOUT_ENGINE_AVAILABLE = True
+except ImportError:
+    LAYOUT_ENGINE_AVAILABLE = False
+    logger.warning("Layout engine not available")
+
 # Type definitions for layout types
 LayoutType = Literal["force", "tree", "radial", "sankey"]
 TreeOrientation = Literal["horizontal", "vertical"]
@@ -74,6 +82,10 @@ class VisualizationConfig:
     # Sankey-specific settings
     node_padding: int = 20
     node_alignment: str = "justify"  # left, right, center, justify
+    # Server-side layout for force graphs: None = automatic for large graphs
+    precompute_layout: Optional[bool] = None
+    layout_algorithm: str = "force"  # force, tree, radial
+    layout_iterations: Optional[int] = None
     custom_settings: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -119,6 +131,8 @@ class D3VisualizationEngine:
                 logger.warning(f"Failed to initialize performance optimizer: {e}")
                 self.optimize_performance = False
         
+        self.layout_engine = LayoutEngine() if LAYOUT_ENGINE_AVAILABLE else None
+        
         logger.info(f"D3VisualizationEngine initialized with template_dir: {self.template_dir}")
     
     def generate_visualization(
@@ -148,8 +162,10 @@ class D3VisualizationEngine:
         if not self._validate_graph_data(graph_data):
             raise ValueError("Invalid graph data structure")
         
-        # Apply performance optimization if enabled and needed
-        if self.performance_optimizer:
+        # Apply performance optimization if enabled and needed; graphs laid out
+        # server-side are rendered complete instead of being sampled
+        precomputed = layout == "force" and self._use_precomputed_layout(graph_data, config)
+        if self.performance_optimizer and not precomputed:
             node_count = len(graph_data.get('nodes', []))
             edge_count = len(graph_data.get('links', []))
             
@@ -188,6 +204,22 @@ class D3VisualizationEngine:
         logger.info(f"Visualization generated successfully for {len(graph_data.get('nodes', []))} nodes")
         return html
     
+    def _use_precomputed_layout(self, graph_data: Dict[str, Any], config: VisualizationConfig) -> bool:
+        """Decide whether node positions are computed server-side
+        
+        Args:
+            graph_data: Input graph data
+            config: Visualization configuration
+            
+        Returns:
+            True if the layout engine should position the nodes
+        """
+        if not self.layout_engine:
+            return False
+        if config.precompute_layout is not None:
+            return config.precompute_layout
+        return len(graph_data.get("nodes", [])) >= PRECOMPUTE_NODE_THRESHOLD
+    
     def _validate_graph_data(self, graph_data: Dict[str, Any]) -> bool:
         """Validate the structure of graph data
         
@@ -350,6 +382,19 @@ class D3VisualizationEngine:
         # Apply node and link transformations based on config
         processed_data = self._process_graph_data(graph_data, config)
         
+        # Fix node positions server-side so the browser skips the simulation
+        precomputed = self._use_precomputed_layout(processed_data, config)
+        if precomputed:
+            self.layout_engine.apply(
+                processed_data,
+                config.layout_algorithm,
+                width=config.width,
+                height=config.height,
+                iterations=config.layout_iterations,
+                orientation=config.tree_orientation,
+                angle_span=config.angle_span
+            )
+        
         # Replace template variables
         html = template.replace("{{ title or \"Force-Directed Graph\" }}", config.title or "Force-Directed Graph")
         html = html.replace("{{ graph_data | tojson | safe }}", json.dumps(processed_data))
@@ -363,6 +408,7 @@ class D3VisualizationEngine:
             "node_color_field": config.node_color_field,
             "node_size_field": config.node_size_field,
             "link_width_field": config.link_width_field,
+            "precomputed_layout": precomputed,
             **config.custom_settings
         }))
         
@@ -504,7 +550,7 @@ class D3VisualizationEngine:
         self, 
         graph_data: Dict[str, Any], 
         query: Optional[str] = None
-    ) -> Optional[VisualizationRecommendation]:
+    ) -> Optional["VisualizationRecommendation"]:
         """Get LLM recommendation for visualization type
         
         Args:
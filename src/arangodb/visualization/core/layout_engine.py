@@ -0,0 +1,506 @@
+"""Server-side graph layouts for D3.js visualizations
+Module: layout_engine.py
+
+This module computes fixed node coordinates on the server so the browser only
+renders. Without it the d3-force simulation has to converge from random
+positions in the tab, which freezes past a few thousand nodes. Supported
+algorithms:
+
+- force: ForceAtlas2-style solver (degree-weighted repulsion, linear edge
+  attraction, gravity) vectorized with NumPy. Repulsion is exact for small
+  graphs; larger graphs use a grid approximation in the spirit of Barnes-Hut
+  (far field from cell centres of mass, exact near field within fine cells).
+- tree: layered tidy layout of a BFS spanning forest.
+- radial: the same tree mapped to angles and rings around the centre.
+
+Results are cached by a hash of the graph structure and layout parameters.
+
+Links to third-party package documentation:
+- NumPy: https://numpy.org/doc/stable/
+- ForceAtlas2: https://doi.org/10.1371/journal.pone.0098679
+
+Sample input:
+{
+    "nodes": [{"id": "1"}, {"id": "2"}, {"id": "3"}],
+    "links": [{"source": "1", "target": "2"}, {"source": "2", "target": "3"}]
+}
+
+Expected output:
+Nodes annotated in place with "x" and "y" inside a width x height canvas
+"""
+
+import hashlib
+import math
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Literal
+from loguru import logger
+import numpy as np
+
+LayoutAlgorithm = Literal["force", "tree", "radial"]
+
+# Number of computed layouts kept in memory
+LAYOUT_CACHE_SIZE = int(os.getenv("VIZ_LAYOUT_CACHE_SIZE", "32"))
+
+# Graphs with at least this many nodes get server-side positions by default
+PRECOMPUTE_NODE_THRESHOLD = int(os.getenv("VIZ_PRECOMPUTE_NODE_THRESHOLD", "1000"))
+
+# Above this many nodes repulsion is approximated on a grid instead of all pairs
+EXACT_REPULSION_LIMIT = 500
+COARSE_GRID = 16
+NEAR_NEIGHBOURS = 8
+
+# ForceAtlas2 coefficients
+REPULSION = 2.0
+GRAVITY = 1.0
+
+MIN_DISTANCE2 = 1e-4
+CANVAS_MARGIN = 20.0
+
+
+def _node_id(endpoint: Any) -> Any:
+    """Endpoint of a link as an id (d3 replaces ids with node objects)."""
+    if isinstance(endpoint, dict):
+        return endpoint.get("id")
+    return endpoint
+
+
+def graph_arrays(graph_data: Dict[str, Any]) -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """Convert nodes/links into index arrays.
+
+    Links may name their endpoints by id or by node index (as produced by
+    PerformanceOptimizer). Self-loops and dangling links are dropped.
+
+    Args:
+        graph_data: Dictionary containing nodes and links
+
+    Returns:
+        Tuple of (node ids, source indices, target indices, link weights)
+    """
+    nodes = graph_data.get("nodes", [])
+    ids = [node.get("id", i) for i, node in enumerate(nodes)]
+    index = {node_id: i for i, node_id in enumerate(ids)}
+    n = len(ids)
+
+    src, dst, weights = [], [], []
+    for link in graph_data.get("links", []):
+        ends = []
+        for endpoint in (_node_id(link.get("source")), _node_id(link.get("target"))):
+            i = index.get(endpoint)
+            if i is None and isinstance(endpoint, int) and 0 <= endpoint < n:
+                i = endpoint
+            ends.append(i)
+        if ends[0] is None or ends[1] is None or ends[0] == ends[1]:
+            continue
+        value = link.get("value", 1)
+        src.append(ends[0])
+        dst.append(ends[1])
+        weights.append(float(value) if isinstance(value, (int, float)) and value > 0 else 1.0)
+
+    return (
+        ids,
+        np.asarray(src, dtype=np.int64),
+        np.asarray(dst, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64)
+    )
+
+
+def graph_hash(ids: Sequence[Any], src: np.ndarray, dst: np.ndarray, weights: np.ndarray) -> str:
+    """Stable hash of a graph's structure, used as the layout cache key."""
+    hasher = hashlib.sha1()
+    hasher.update("\x1f".join(map(str, ids)).encode("utf-8"))
+    for array in (src, dst, weights):
+        hasher.update(np.ascontiguousarray(array).tobytes())
+    return hasher.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Force-directed (ForceAtlas2-style)
+# ---------------------------------------------------------------------------
+
+def _cell_index(pos: np.ndarray, lo: np.ndarray, span: np.ndarray, grid: int) -> np.ndarray:
+    cells = np.minimum(((pos - lo) / span * grid).astype(np.int64), grid - 1)
+    return cells[:, 1] * grid + cells[:, 0]
+
+
+def _repulsion_exact(pos: np.ndarray, mass: np.ndarray) -> np.ndarray:
+    """All-pairs repulsion k * m_i * m_j / d, in row chunks to bound memory."""
+    n = len(pos)
+    x, y = pos[:, 0], pos[:, 1]
+    forces = np.empty_like(pos)
+    chunk = max(1, 1_000_000 // max(n, 1))
+    for start in range(0, n, chunk):
+        stop = min(n, start + chunk)
+        dx = x[start:stop, None] - x[None, :]
+        dy = y[start:stop, None] - y[None, :]
+        coef = np.maximum(dx * dx + dy * dy, MIN_DISTANCE2)
+        np.divide(mass[None, :], coef, out=coef)
+        forces[start:stop, 0] = (coef * dx).sum(axis=1)
+        forces[start:stop, 1] = (coef * dy).sum(axis=1)
+    forces *= REPULSION * mass[:, None]
+    return forces
+
+
+def _repulsion_grid(pos: np.ndarray, mass: np.ndarray) -> np.ndarray:
+    """Grid-approximated repulsion for large graphs.
+
+    The far field treats each occupied coarse cell as one body at its centre
+    of mass (softened by the cell size); the near field is exact between
+    nodes sharing a fine cell, up to NEAR_NEIGHBOURS neighbours each.
+    """
+    n = len(pos)
+    forces = np.zeros_like(pos)
+    lo = pos.min(axis=0)
+    span = np.maximum(pos.max(axis=0) - lo, 1e-9)
+
+    # Far field
+    cells = _cell_index(pos, lo, span, COARSE_GRID)
+    size = COARSE_GRID * COARSE_GRID
+    cell_mass = np.bincount(cells, weights=mass, minlength=size)
+    occupied = cell_mass > 0
+    centres = np.stack([
+        np.bincount(cells, weights=mass * pos[:, 0], minlength=size),
+        np.bincount(cells, weights=mass * pos[:, 1], minlength=size)
+    ], axis=1)[occupied] / cell_mass[occupied, None]
+    body_mass = cell_mass[occupied]
+    softening = float(((span / COARSE_GRID) ** 2).sum()) / 4.0
+
+    chunk = max(1, 1_000_000 // len(body_mass))
+    for start in range(0, n, chunk):
+        stop = min(n, start + chunk)
+        dx = pos[start:stop, 0, None] - centres[None, :, 0]
+        dy = pos[start:stop, 1, None] - centres[None, :, 1]
+        coef = body_mass[None, :] / (dx * dx + dy * dy + softening)
+        forces[start:stop, 0] = (coef * dx).sum(axis=1)
+        forces[start:stop, 1] = (coef * dy).sum(axis=1)
+    forces *= REPULSION * mass[:, None]
+
+    # Near field
+    fine = _cell_index(pos, lo, span, max(1, int(math.sqrt(n / 4))))
+    order = np.argsort(fine, kind="stable")
+    sorted_cells = fine[order]
+    for k in range(1, NEAR_NEIGHBOURS + 1):
+        same = sorted_cells[:-k] == sorted_cells[k:]
+        if not same.any():
+            break
+        a = order[:-k][same]
+        b = order[k:][same]
+        delta = pos[a] - pos[b]
+        d2 = np.maximum((delta * delta).sum(axis=1), MIN_DISTANCE2)
+        f = (REPULSION * mass[a] * mass[b] / d2)[:, None] * delta
+        for axis in (0, 1):
+            forces[:, axis] += np.bincount(a, weights=f[:, axis], minlength=n)
+            forces[:, axis] -= np.bincount(b, weights=f[:, axis], minlength=n)
+
+    return forces
+
+
+def force_layout(
+    n: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: np.ndarray,
+    iterations: Optional[int] = None,
+    seed: int = 0
+) -> np.ndarray:
+    """ForceAtlas2-style force-directed layout.
+
+    Args:
+        n: Number of nodes
+        src: Link source indices
+        dst: Link target indices
+        weights: Link weights (attraction multipliers)
+        iterations: Solver iterations (defaults by graph size)
+        seed: Seed for the initial positions
+
+    Returns:
+        (n, 2) array of positions in solver units
+    """
+    if n == 0:
+        return np.zeros((0, 2))
+    if iterations is None:
+        iterations = 300 if n <= EXACT_REPULSION_LIMIT else 150
+
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1.0, 1.0, size=(n, 2)) * math.sqrt(n)
+    mass = 1.0 + np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+    repulsion = _repulsion_exact if n <= EXACT_REPULSION_LIMIT else _repulsion_grid
+
+    start_temperature = max(1.0, math.sqrt(n))
+    for iteration in range(iterations):
+        forces = repulsion(pos, mass)
+
+        # Linear attraction along links
+        if len(src):
+            pull = weights[:, None] * (pos[dst] - pos[src])
+            for axis in (0, 1):
+                forces[:, axis] += np.bincount(src, weights=pull[:, axis], minlength=n)
+                forces[:, axis] -= np.bincount(dst, weights=pull[:, axis], minlength=n)
+
+        # Gravity towards the origin keeps components together
+        distance = np.maximum(np.linalg.norm(pos, axis=1), 1e-9)
+        forces -= (GRAVITY * mass / distance)[:, None] * pos
+
+        # Move at most the current temperature, cooling linearly
+        temperature = start_temperature * (1.0 - iteration / iterations) + 0.01
+        step = forces / mass[:, None]
+        length = np.maximum(np.linalg.norm(step, axis=1), 1e-12)
+        pos += step * np.minimum(1.0, temperature / length)[:, None]
+
+    return pos
+
+
+# ---------------------------------------------------------------------------
+# Tree and radial
+# ---------------------------------------------------------------------------
+
+def _spanning_forest(n: int, src: np.ndarray, dst: np.ndarray) -> Tuple[np.ndarray, List[List[int]], List[int]]:
+    """BFS spanning forest over undirected links, rooted at in-degree-0 nodes first.
+
+    Returns:
+        Tuple of (depth per node, children per node, roots in order)
+    """
+    ends = np.concatenate([src, dst])
+    others = np.concatenate([dst, src])
+    order = np.argsort(ends, kind="stable")
+    offsets = np.searchsorted(ends[order], np.arange(n + 1))
+    neighbours = others[order]
+
+    in_degree = np.bincount(dst, minlength=n)
+    candidates = [int(i) for i in np.flatnonzero(in_degree == 0)] + list(range(n))
+
+    depth = np.full(n, -1, dtype=np.int64)
+    children: List[List[int]] = [[] for _ in range(n)]
+    roots: List[int] = []
+    for root in candidates:
+        if depth[root] >= 0:
+            continue
+        roots.append(root)
+        depth[root] = 0
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            for neighbour in neighbours[offsets[node]:offsets[node + 1]]:
+                neighbour = int(neighbour)
+                if depth[neighbour] < 0:
+                    depth[neighbour] = depth[node] + 1
+                    children[node].append(neighbour)
+                    queue.append(neighbour)
+    return depth, children, roots
+
+
+def _breadth_slots(n: int, children: List[List[int]], roots: List[int]) -> Tuple[np.ndarray, int]:
+    """Leaves take consecutive slots; parents sit midway over their children."""
+    slots = np.zeros(n)
+    next_slot = 0
+    for root in roots:
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not children[node]:
+                slots[node] = next_slot
+                next_slot += 1
+            elif expanded:
+                slots[node] = (slots[children[node][0]] + slots[children[node][-1]]) / 2.0
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(children[node]))
+    return slots, max(next_slot, 1)
+
+
+def tree_layout(n: int, src: np.ndarray, dst: np.ndarray, orientation: str = "horizontal") -> np.ndarray:
+    """Layered tree layout; depth runs along x when horizontal, along y when vertical."""
+    if n == 0:
+        return np.zeros((0, 2))
+    depth, children, roots = _spanning_forest(n, src, dst)
+    slots, _ = _breadth_slots(n, children, roots)
+    if orientation == "vertical":
+        return np.stack([slots, depth.astype(float)], axis=1)
+    return np.stack([depth.astype(float), slots], axis=1)
+
+
+def radial_layout(
+    n: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    angle_span: Sequence[float] = (0.0, 2 * math.pi)
+) -> np.ndarray:
+    """Tree layout mapped to polar coordinates: depth is the ring, slot the angle."""
+    if n == 0:
+        return np.zeros((0, 2))
+    depth, children, roots = _spanning_forest(n, src, dst)
+    slots, slot_count = _breadth_slots(n, children, roots)
+    angle = angle_span[0] + (slots + 0.5) / slot_count * (angle_span[1] - angle_span[0])
+    ring = depth / max(int(depth.max()), 1)
+    return np.stack([ring * np.cos(angle), ring * np.sin(angle)], axis=1)
+
+
+def fit_to_canvas(pos: np.ndarray, width: float, height: float, keep_aspect: bool = True) -> np.ndarray:
+    """Scale and translate positions into a width x height canvas with a margin."""
+    if len(pos) == 0:
+        return pos
+    lo = pos.min(axis=0)
+    span = np.maximum(pos.max(axis=0) - lo, 1e-9)
+    box = np.array([max(width - 2 * CANVAS_MARGIN, 1.0), max(height - 2 * CANVAS_MARGIN, 1.0)])
+    scale = np.full(2, (box / span).min()) if keep_aspect else box / span
+    fitted = (pos - lo) * scale
+    # Centre within the canvas (also places a single node in the middle)
+    fitted += (np.array([width, height]) - (pos.max(axis=0) - lo) * scale) / 2.0
+    return fitted
+
+
+# ---------------------------------------------------------------------------
+# Cache and engine
+# ---------------------------------------------------------------------------
+
+class _LayoutCache:
+    """Small LRU of computed positions keyed by graph hash and parameters."""
+
+    def __init__(self, max_entries: int = LAYOUT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        with self._lock:
+            positions = self._entries.get(key)
+            if positions is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return positions
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, positions: np.ndarray) -> None:
+        positions.setflags(write=False)
+        with self._lock:
+            self._entries[key] = positions
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = _LayoutCache()
+
+
+def clear_layout_cache() -> None:
+    """Drop every cached layout."""
+    _cache.clear()
+
+
+class LayoutEngine:
+    """Compute and apply server-side node positions"""
+
+    def compute(
+        self,
+        graph_data: Dict[str, Any],
+        algorithm: LayoutAlgorithm = "force",
+        width: int = 960,
+        height: int = 600,
+        iterations: Optional[int] = None,
+        orientation: str = "horizontal",
+        angle_span: Sequence[float] = (0.0, 2 * math.pi),
+        use_cache: bool = True
+    ) -> np.ndarray:
+        """Compute canvas positions for every node, in node order
+
+        Args:
+            graph_data: Dictionary containing nodes and links
+            algorithm: force, tree or radial
+            width: Canvas width
+            height: Canvas height
+            iterations: Force solver iterations (defaults by graph size)
+            orientation: Tree orientation (horizontal or vertical)
+            angle_span: Radial start and end angle in radians
+            use_cache: Whether to reuse a layout computed for the same graph
+
+        Returns:
+            Read-only (n, 2) array of x/y positions
+        """
+        ids, src, dst, weights = graph_arrays(graph_data)
+        digest = graph_hash(ids, src, dst, weights)
+        key = (digest, algorithm, width, height, iterations, orientation, tuple(angle_span))
+
+        if use_cache:
+            cached = _cache.get(key)
+            if cached is not None:
+                logger.debug(f"Layout cache hit for {len(ids)} nodes ({algorithm})")
+                return cached
+
+        n = len(ids)
+        logger.info(f"Computing {algorithm} layout for {n} nodes, {len(src)} links")
+        if algorithm == "force":
+            seed = int(digest[:8], 16)
+            positions = fit_to_canvas(force_layout(n, src, dst, weights, iterations, seed), width, height)
+        elif algorithm == "tree":
+            positions = fit_to_canvas(tree_layout(n, src, dst, orientation), width, height, keep_aspect=False)
+        elif algorithm == "radial":
+            positions = fit_to_canvas(radial_layout(n, src, dst, angle_span), width, height)
+        else:
+            raise ValueError(f"Unsupported layout algorithm: {algorithm}")
+
+        if use_cache:
+            _cache.put(key, positions)
+        return positions
+
+    def apply(self, graph_data: Dict[str, Any], algorithm: LayoutAlgorithm = "force", **kwargs) -> Dict[str, Any]:
+        """Set fixed x/y on every node of graph_data (in place) and return it
+
+        Args:
+            graph_data: Dictionary containing nodes and links
+            algorithm: force, tree or radial
+            **kwargs: Passed to compute()
+
+        Returns:
+            The same graph_data with positioned nodes
+        """
+        positions = self.compute(graph_data, algorithm, **kwargs)
+        for node, (x, y) in zip(graph_data.get("nodes", []), positions.tolist()):
+            node["x"] = round(x, 2)
+            node["y"] = round(y, 2)
+        return graph_data
+
+
+if __name__ == "__main__":
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: Linked nodes end up closer than unlinked ones
+    total_tests += 1
+    chain = {
+        "nodes": [{"id": str(i)} for i in range(40)],
+        "links": [{"source": str(i), "target": str(i + 1)} for i in range(39)]
+    }
+    positions = LayoutEngine().compute(chain, "force")
+    linked = np.linalg.norm(positions[1:] - positions[:-1], axis=1).mean()
+    spread = np.linalg.norm(positions[0] - positions[-1])
+    if not linked < spread:
+        all_validation_failures.append(f"Force layout: chain not unfolded ({linked:.1f} vs {spread:.1f})")
+
+    # Test 2: Cache hit on the same graph
+    total_tests += 1
+    LayoutEngine().compute(chain, "force")
+    if _cache.hits < 1:
+        all_validation_failures.append("Cache: expected a hit")
+
+    # Test 3: Tree depth along x
+    total_tests += 1
+    tree = {"nodes": [{"id": "r"}, {"id": "a"}, {"id": "b"}], "links": [{"source": "r", "target": "a"}, {"source": "r", "target": "b"}]}
+    positions = LayoutEngine().compute(tree, "tree")
+    if not (positions[0, 0] < positions[1, 0] and positions[1, 0] == positions[2, 0]):
+        all_validation_failures.append(f"Tree layout: unexpected positions {positions.tolist()}")
+
+    if all_validation_failures:
+        print(f" VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        exit(1)
+    else:
+        print(f" VALIDATION PASSED - All {total_tests} tests produced expected results")
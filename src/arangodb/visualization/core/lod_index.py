@@ -0,0 +1,506 @@
+"""Hierarchical level-of-detail index for progressive graph exploration
+Module: lod_index.py
+
+This module precomputes a hierarchy of community supernodes over a laid-out
+graph so clients can explore very large graphs without downloading them:
+
+- Level 0 holds the original nodes at their layout positions.
+- Each coarser level merges the previous one by weighted label propagation
+  (communities), splitting oversized communities along a Z-order curve so a
+  supernode never has more than MAX_CHILDREN members. When propagation
+  stops reducing the graph, Z-order chunks are merged instead.
+- Every level keeps centroid positions, leaf counts, aggregated edges (CSR)
+  and a uniform grid for viewport queries.
+
+A tile is the set of items of one level inside a viewport, plus the edges
+among them. `tile()` picks the finest level whose items in the viewport fit
+a budget, so zooming in progressively replaces supernodes by their members.
+Tiles are encoded as compact NDJSON column chunks or binary frames.
+
+Links to third-party package documentation:
+- NumPy: https://numpy.org/doc/stable/
+
+Sample input:
+>>> index = GraphLODIndex.from_graph(graph_data)
+>>> tile = index.tile((0, 0, 480, 300), max_items=2000)
+
+Expected output:
+>>> tile.level, tile.count
+(2, 1740)
+"""
+
+import hashlib
+import json
+import math
+import struct
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+from loguru import logger
+import numpy as np
+
+from .layout_engine import LayoutEngine, graph_arrays, graph_hash
+
+# Supernodes at the coarsest level
+TOP_LEVEL_SIZE = 256
+# Members per supernode, which bounds the size of an expansion
+MAX_CHILDREN = 64
+# A level must shrink to this fraction of the previous one, else Z-order merge
+MIN_REDUCTION = 0.7
+MAX_LEVELS = 16
+PROPAGATION_ROUNDS = 6
+
+# Binary frame kinds
+FRAME_META = 0
+FRAME_NODES = 1
+FRAME_EDGES = 2
+FRAME_END = 3
+_FRAME_HEADER = struct.Struct("<BI")
+NODE_RECORD = np.dtype([("index", "<u4"), ("x", "<f4"), ("y", "<f4"), ("size", "<u4")])
+EDGE_RECORD = np.dtype([("source", "<u4"), ("target", "<u4"), ("weight", "<f4")])
+
+
+def _morton_codes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Z-order codes of positions quantised to 16 bits per axis."""
+    def quantise(values):
+        lo, hi = values.min(), values.max()
+        return ((values - lo) / max(hi - lo, 1e-9) * 65535).astype(np.uint64)
+
+    def spread(v):
+        v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+        v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+        return v
+
+    return spread(quantise(x)) | (spread(quantise(y)) << np.uint64(1))
+
+
+def _label_propagation(n: int, src: np.ndarray, dst: np.ndarray, weights: np.ndarray, seed: int = 0) -> np.ndarray:
+    """Weighted label propagation; each round half the nodes adopt their heaviest neighbour label."""
+    labels = np.arange(n)
+    if not len(src):
+        return labels
+    rng = np.random.default_rng(seed)
+    u = np.concatenate([src, dst])
+    v = np.concatenate([dst, src])
+    w = np.concatenate([weights, weights])
+
+    for _ in range(PROPAGATION_ROUNDS):
+        neighbour_labels = labels[v]
+        order = np.lexsort((neighbour_labels, u))
+        u_sorted, l_sorted = u[order], neighbour_labels[order]
+        starts = np.r_[True, (u_sorted[1:] != u_sorted[:-1]) | (l_sorted[1:] != l_sorted[:-1])]
+        group_weight = np.bincount(np.cumsum(starts) - 1, weights=w[order])
+        group_node, group_label = u_sorted[starts], l_sorted[starts]
+
+        best = np.lexsort((-group_weight, group_node))
+        first = np.r_[True, group_node[best][1:] != group_node[best][:-1]]
+        best_node, best_label = group_node[best][first], group_label[best][first]
+
+        update = rng.random(len(best_node)) < 0.5
+        changed = labels[best_node[update]] != best_label[update]
+        if not changed.any():
+            break
+        labels = labels.copy()
+        labels[best_node[update]] = best_label[update]
+
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def _split_oversized(labels: np.ndarray, morton: np.ndarray, cap: int) -> np.ndarray:
+    """Split clusters larger than `cap` into consecutive Z-order chunks."""
+    order = np.lexsort((morton, labels))
+    sorted_labels = labels[order]
+    starts = np.r_[0, np.flatnonzero(sorted_labels[1:] != sorted_labels[:-1]) + 1]
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(labels)]))
+    chunk = (np.arange(len(labels)) - group_start) // cap
+    split = np.empty_like(labels)
+    split[order] = np.unique(sorted_labels * (len(labels) // cap + 1) + chunk, return_inverse=True)[1]
+    return split
+
+
+def _given_positions(nodes: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+    """Node positions if every node carries numeric "x"/"y", else None."""
+    if nodes and all(isinstance(node.get("x"), (int, float)) and isinstance(node.get("y"), (int, float)) for node in nodes):
+        return np.array([[node["x"], node["y"]] for node in nodes], dtype=np.float64)
+    return None
+
+
+def _node_labels(nodes: List[Dict[str, Any]], ids: Sequence[Any]) -> List[str]:
+    return [str(node.get("name", node.get("label", ids[i]))) for i, node in enumerate(nodes)]
+
+
+def lod_graph_id(graph_data: Dict[str, Any]) -> str:
+    """Identify a graph by everything GraphLODIndex.from_graph reads
+
+    Covers the structure and link weights (via graph_hash), any given
+    positions and the node labels, so re-posting the same topology with
+    moved nodes, renamed labels or new weights builds a fresh index.
+
+    Args:
+        graph_data: Dictionary containing nodes and links
+
+    Returns:
+        Hex digest
+    """
+    nodes = graph_data.get("nodes", [])
+    ids, src, dst, weights = graph_arrays(graph_data)
+    hasher = hashlib.sha1(graph_hash(ids, src, dst, weights).encode("ascii"))
+    positions = _given_positions(nodes)
+    hasher.update(b"p" + (positions.tobytes() if positions is not None else b""))
+    hasher.update(b"l" + "\x1f".join(_node_labels(nodes, ids)).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+@dataclass
+class LODLevel:
+    """Items of one level of the hierarchy"""
+    x: np.ndarray
+    y: np.ndarray
+    size: np.ndarray            # leaf nodes under each item
+    representative: np.ndarray  # leaf index whose label names the item
+    edge_offsets: np.ndarray    # CSR over both edge directions
+    edge_targets: np.ndarray
+    edge_weights: np.ndarray
+    parent: Optional[np.ndarray] = None          # index in the next coarser level
+    child_offsets: Optional[np.ndarray] = None   # CSR into child_order (level - 1)
+    child_order: Optional[np.ndarray] = None
+    bounds: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+    grid: int = 1
+    cell_offsets: Optional[np.ndarray] = None
+    cell_order: Optional[np.ndarray] = None
+
+    @property
+    def count(self) -> int:
+        return len(self.x)
+
+
+@dataclass
+class Tile:
+    """Items of one level and the edges among them"""
+    level: int
+    index: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    size: np.ndarray
+    source: np.ndarray   # edge endpoints as item indices of `level`
+    target: np.ndarray
+    weight: np.ndarray
+    labels: Optional[List[str]] = None
+    ids: Optional[List[Any]] = None   # original node ids (level 0 only)
+
+    @property
+    def count(self) -> int:
+        return len(self.index)
+
+
+def _csr(n: int, src: np.ndarray, dst: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    u = np.concatenate([src, dst])
+    v = np.concatenate([dst, src])
+    w = np.concatenate([weights, weights])
+    order = np.argsort(u, kind="stable")
+    offsets = np.searchsorted(u[order], np.arange(n + 1))
+    return offsets, v[order].astype(np.int64), w[order].astype(np.float32)
+
+
+def _gather_ranges(offsets: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Positions covered by CSR rows, and the row each position belongs to."""
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    owner = np.repeat(np.arange(len(rows)), lengths)
+    position = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths) + np.repeat(starts, lengths)
+    return position, rows[owner]
+
+
+class GraphLODIndex:
+    """Hierarchy of community supernodes with viewport queries"""
+
+    def __init__(self, levels: List[LODLevel], labels: List[str], ids: List[Any], bounds: Tuple[float, float, float, float]):
+        self.levels = levels
+        self.labels = labels
+        self.ids = ids
+        self.bounds = bounds
+
+    @classmethod
+    def from_graph(cls, graph_data: Dict[str, Any], width: int = 1000, height: int = 1000) -> "GraphLODIndex":
+        """Build the hierarchy for a graph
+
+        Nodes that all carry numeric "x"/"y" keep those positions; otherwise
+        positions come from the server-side force layout.
+
+        Args:
+            graph_data: Dictionary containing nodes and links
+            width: Layout canvas width when positions are computed
+            height: Layout canvas height when positions are computed
+
+        Returns:
+            GraphLODIndex over the graph
+        """
+        nodes = graph_data.get("nodes", [])
+        ids, src, dst, weights = graph_arrays(graph_data)
+        n = len(ids)
+
+        positions = _given_positions(nodes)
+        if positions is None:
+            positions = LayoutEngine().compute(graph_data, "force", width=width, height=height)
+        x, y = positions[:, 0].copy(), positions[:, 1].copy()
+
+        labels = _node_labels(nodes, ids)
+        degree = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+
+        levels = [cls._make_level(x, y, np.ones(n, dtype=np.int64), np.arange(n), src, dst, weights)]
+        score = degree.astype(np.float64)
+        while levels[-1].count > TOP_LEVEL_SIZE and len(levels) < MAX_LEVELS:
+            level = levels[-1]
+            parent = cls._coarsen(level, src, dst, weights, seed=len(levels))
+            count = int(parent.max()) + 1
+
+            size = np.bincount(parent, weights=level.size, minlength=count)
+            cx = np.bincount(parent, weights=level.size * level.x, minlength=count) / size
+            cy = np.bincount(parent, weights=level.size * level.y, minlength=count) / size
+            best = np.lexsort((-score, parent))
+            first = np.r_[True, parent[best][1:] != parent[best][:-1]]
+            representative = level.representative[best[first]]
+
+            src, dst, weights = cls._aggregate_edges(parent, count, src, dst, weights)
+            level.parent = parent
+            coarser = cls._make_level(cx, cy, size.astype(np.int64), representative, src, dst, weights)
+            coarser.child_order = np.argsort(parent, kind="stable")
+            coarser.child_offsets = np.searchsorted(parent[coarser.child_order], np.arange(count + 1))
+            levels.append(coarser)
+            score = size
+
+        bounds = (float(x.min()), float(y.min()), float(x.max()), float(y.max())) if n else (0.0, 0.0, 0.0, 0.0)
+        logger.info(f"Built LOD index for {n} nodes: {[level.count for level in levels]} items per level")
+        return cls(levels, labels, ids, bounds)
+
+    @staticmethod
+    def _make_level(x, y, size, representative, src, dst, weights) -> LODLevel:
+        n = len(x)
+        offsets, targets, edge_weights = _csr(n, src, dst, weights)
+        level = LODLevel(
+            x=np.asarray(x, dtype=np.float64), y=np.asarray(y, dtype=np.float64),
+            size=size, representative=representative,
+            edge_offsets=offsets, edge_targets=targets, edge_weights=edge_weights
+        )
+        if n:
+            level.bounds = (float(level.x.min()), float(level.y.min()), float(level.x.max()), float(level.y.max()))
+        # Roughly 16 items per grid cell
+        level.grid = int(min(1024, max(1, math.sqrt(n / 16))))
+        cx, cy = GraphLODIndex._cell_coords(level, level.x, level.y)
+        cells = cy * level.grid + cx
+        level.cell_order = np.argsort(cells, kind="stable")
+        level.cell_offsets = np.searchsorted(cells[level.cell_order], np.arange(level.grid * level.grid + 1))
+        return level
+
+    @staticmethod
+    def _cell_coords(level: LODLevel, x, y) -> Tuple[np.ndarray, np.ndarray]:
+        x0, y0, x1, y1 = level.bounds
+        g = level.grid
+        cx = np.clip(((np.asarray(x) - x0) / max(x1 - x0, 1e-9) * g).astype(np.int64), 0, g - 1)
+        cy = np.clip(((np.asarray(y) - y0) / max(y1 - y0, 1e-9) * g).astype(np.int64), 0, g - 1)
+        return cx, cy
+
+    @staticmethod
+    def _coarsen(level: LODLevel, src, dst, weights, seed: int) -> np.ndarray:
+        """Parent assignment for the next level: communities, capped, with Z-order fallback."""
+        n = level.count
+        morton = _morton_codes(level.x, level.y)
+        labels = _split_oversized(_label_propagation(n, src, dst, weights, seed), morton, MAX_CHILDREN)
+        if labels.max() + 1 > MIN_REDUCTION * n:
+            # Propagation has converged (or the level is edgeless): merge neighbours in space
+            rank = np.empty(n, dtype=np.int64)
+            rank[np.argsort(morton, kind="stable")] = np.arange(n)
+            labels = rank // 8
+        return labels
+
+    @staticmethod
+    def _aggregate_edges(parent, count, src, dst, weights):
+        a, b = parent[src], parent[dst]
+        keep = a != b
+        lo, hi = np.minimum(a[keep], b[keep]), np.maximum(a[keep], b[keep])
+        keys, inverse = np.unique(lo.astype(np.int64) * count + hi, return_inverse=True)
+        return keys // count, keys % count, np.bincount(inverse, weights=weights[keep])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _in_viewport(self, level: LODLevel, viewport: Sequence[float]) -> np.ndarray:
+        """Indices of the level's items inside viewport (x0, y0, x1, y1)."""
+        x0, y0, x1, y1 = viewport
+        (cx0, cx1), (cy0, cy1) = [
+            np.sort(c) for c in self._cell_coords(level, [x0, x1], [y0, y1])
+        ]
+        rows = np.arange(cy0, cy1 + 1)
+        starts = level.cell_offsets[rows * level.grid + cx0]
+        stops = level.cell_offsets[rows * level.grid + cx1 + 1]
+        if not len(rows) or int((stops - starts).sum()) == 0:
+            return np.zeros(0, dtype=np.int64)
+        candidates = level.cell_order[np.concatenate([np.arange(s, e) for s, e in zip(starts, stops)])]
+        inside = (
+            (level.x[candidates] >= min(x0, x1)) & (level.x[candidates] <= max(x0, x1)) &
+            (level.y[candidates] >= min(y0, y1)) & (level.y[candidates] <= max(y0, y1))
+        )
+        return np.sort(candidates[inside])
+
+    def choose_level(self, viewport: Sequence[float], max_items: int) -> int:
+        """Finest level whose items inside the viewport fit max_items"""
+        for k, level in enumerate(self.levels):
+            if len(self._in_viewport(level, viewport)) <= max_items:
+                return k
+        return len(self.levels) - 1
+
+    def tile(
+        self,
+        viewport: Optional[Sequence[float]] = None,
+        max_items: int = 2000,
+        level: Optional[int] = None,
+        include_labels: bool = True
+    ) -> Tile:
+        """Items of one level inside a viewport
+
+        Args:
+            viewport: (x0, y0, x1, y1) in layout coordinates; None for everything
+            max_items: Budget used to pick the level when level is None
+            level: Explicit level (0 = original nodes)
+            include_labels: Whether to attach item labels
+
+        Returns:
+            Tile with positions, sizes and the edges among its items
+        """
+        viewport = viewport or self.bounds
+        if level is None:
+            level = self.choose_level(viewport, max_items)
+        level = max(0, min(level, len(self.levels) - 1))
+        return self._make_tile(level, self._in_viewport(self.levels[level], viewport), include_labels)
+
+    def children(self, level: int, items: Sequence[int], include_labels: bool = True) -> Tile:
+        """Members (at level - 1) of the given supernodes of `level`
+
+        Args:
+            level: Level of the supernodes (must be >= 1)
+            items: Supernode indices to expand
+            include_labels: Whether to attach item labels
+
+        Returns:
+            Tile of the members and the edges among them
+        """
+        if level < 1 or level >= len(self.levels):
+            raise ValueError(f"Level must be between 1 and {len(self.levels) - 1}")
+        coarse = self.levels[level]
+        items = np.unique(np.asarray(items, dtype=np.int64))
+        if len(items) and (items.min() < 0 or items.max() >= coarse.count):
+            raise ValueError(f"Item indices must be between 0 and {coarse.count - 1}")
+        positions, _ = _gather_ranges(coarse.child_offsets, items)
+        return self._make_tile(level - 1, np.sort(coarse.child_order[positions]), include_labels)
+
+    def _make_tile(self, k: int, index: np.ndarray, include_labels: bool) -> Tile:
+        level = self.levels[k]
+        positions, owners = _gather_ranges(level.edge_offsets, index)
+        targets = level.edge_targets[positions]
+        # Each undirected edge once, only when both ends are in the tile
+        selected = np.zeros(level.count, dtype=bool)
+        selected[index] = True
+        keep = selected[targets] & (owners < targets)
+        return Tile(
+            level=k,
+            index=index,
+            x=level.x[index],
+            y=level.y[index],
+            size=level.size[index],
+            source=owners[keep],
+            target=targets[keep],
+            weight=level.edge_weights[positions][keep],
+            labels=[self.labels[i] for i in level.representative[index]] if include_labels else None,
+            ids=[self.ids[i] for i in index] if k == 0 else None
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        """Summary of the hierarchy for clients"""
+        return {
+            "bounds": list(self.bounds),
+            "node_count": len(self.ids),
+            "levels": [
+                {"level": k, "items": level.count, "edges": int(len(level.edge_targets) // 2)}
+                for k, level in enumerate(self.levels)
+            ]
+        }
+
+
+# ----------------------------------------------------------------------
+# Encoding
+# ----------------------------------------------------------------------
+
+def _tile_meta(tile: Tile, index: GraphLODIndex) -> Dict[str, Any]:
+    return {
+        "type": "meta",
+        "level": tile.level,
+        "levels": len(index.levels),
+        "items": tile.count,
+        "edges": int(len(tile.source)),
+        "labels": tile.labels is not None
+    }
+
+
+def encode_ndjson(tile: Tile, index: GraphLODIndex, chunk_size: int = 5000) -> Iterator[bytes]:
+    """Stream a tile as newline-delimited JSON column chunks
+
+    Lines: one "meta", then "nodes" and "edges" chunks of parallel arrays,
+    then "end".
+    """
+    yield (json.dumps(_tile_meta(tile, index)) + "\n").encode("utf-8")
+    for start in range(0, tile.count, chunk_size):
+        stop = start + chunk_size
+        chunk = {
+            "type": "nodes",
+            "index": tile.index[start:stop].tolist(),
+            "x": np.round(tile.x[start:stop], 2).tolist(),
+            "y": np.round(tile.y[start:stop], 2).tolist(),
+            "size": tile.size[start:stop].tolist()
+        }
+        if tile.labels is not None:
+            chunk["label"] = tile.labels[start:stop]
+        if tile.ids is not None:
+            chunk["id"] = tile.ids[start:stop]
+        yield (json.dumps(chunk, default=str) + "\n").encode("utf-8")
+    for start in range(0, len(tile.source), chunk_size):
+        stop = start + chunk_size
+        yield (json.dumps({
+            "type": "edges",
+            "source": tile.source[start:stop].tolist(),
+            "target": tile.target[start:stop].tolist(),
+            "weight": np.round(tile.weight[start:stop], 3).tolist()
+        }) + "\n").encode("utf-8")
+    yield b'{"type": "end"}\n'
+
+
+def encode_binary(tile: Tile, index: GraphLODIndex, chunk_size: int = 65536) -> Iterator[bytes]:
+    """Stream a tile as binary frames
+
+    Each frame is a little-endian header (kind: u8, count: u32) followed by
+    the payload: META carries `count` bytes of JSON, NODES carries `count`
+    NODE_RECORDs, EDGES carries `count` EDGE_RECORDs, END is empty. Labels
+    and ids are only available in the JSON encoding.
+    """
+    meta = json.dumps(_tile_meta(tile, index)).encode("utf-8")
+    yield _FRAME_HEADER.pack(FRAME_META, len(meta)) + meta
+    for start in range(0, tile.count, chunk_size):
+        stop = min(tile.count, start + chunk_size)
+        records = np.empty(stop - start, dtype=NODE_RECORD)
+        records["index"] = tile.index[start:stop]
+        records["x"] = tile.x[start:stop]
+        records["y"] = tile.y[start:stop]
+        records["size"] = tile.size[start:stop]
+        yield _FRAME_HEADER.pack(FRAME_NODES, len(records)) + records.tobytes()
+    for start in range(0, len(tile.source), chunk_size):
+        stop = min(len(tile.source), start + chunk_size)
+        records = np.empty(stop - start, dtype=EDGE_RECORD)
+        records["source"] = tile.source[start:stop]
+        records["target"] = tile.target[start:stop]
+        records["weight"] = tile.weight[start:stop]
+        yield _FRAME_HEADER.pack(FRAME_EDGES, len(records)) + records.tobytes()
+    yield _FRAME_HEADER.pack(FRAME_END, 0)
@@ -0,0 +1,330 @@
+"""Two-tier cache for rendered visualizations
+Module: render_cache.py
+
+Rendered HTML is stored zlib-compressed under `viz:html:{key}` with its TTL,
+and access metrics live in a separate hash `viz:meta:{key}` that hits update
+with atomic HINCRBY/HSET. A hit never rewrites the HTML, so it costs one
+small pipelined round trip and cannot drop the entry's expiry or lose counts
+to concurrent readers. A bounded in-process LRU sits in front of the backend
+so hot entries skip the network and decompression entirely.
+
+The backend is a redis.Redis client created with decode_responses=False, or
+InMemoryCacheBackend, which implements the same subset of commands for tests
+and Redis-less deployments.
+
+Links to third-party package documentation:
+- Redis: https://redis-py.readthedocs.io/
+
+Sample input:
+>>> cache = RenderCache(InMemoryCacheBackend())
+>>> cache.put("abc", {"html": "<html>...</html>", "layout": "force", "title": "Graph"}, ttl=3600)
+>>> cache.get("abc")
+
+Expected output:
+{"html": "<html>...</html>", "layout": "force", "title": "Graph", "access_count": 2, ...}
+"""
+
+import fnmatch
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from loguru import logger
+
+# Entries kept decoded in the in-process tier
+LOCAL_CACHE_SIZE = int(os.getenv("VIZ_LOCAL_CACHE_SIZE", "64"))
+COMPRESSION_LEVEL = 6
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+class InMemoryCacheBackend:
+    """Process-local stand-in for the Redis commands RenderCache uses"""
+
+    def __init__(self):
+        self._values: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def _live(self, name: str) -> bool:
+        expires = self._expires.get(name)
+        if expires is not None and expires <= time.time():
+            self._values.pop(name, None)
+            self._expires.pop(name, None)
+        return name in self._values
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            return self._values.get(name) if self._live(name) else None
+
+    def set(self, name: str, value: Any, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            self._values[name] = value if isinstance(value, bytes) else str(value).encode("utf-8")
+            self._expires.pop(name, None)
+            if ex:
+                self._expires[name] = time.time() + ex
+            return True
+
+    def strlen(self, name: str) -> int:
+        value = self.get(name)
+        return len(value) if value is not None else 0
+
+    def hset(self, name: str, key: Optional[str] = None, value: Any = None, mapping: Optional[Dict[str, Any]] = None) -> int:
+        with self._lock:
+            if not self._live(name):
+                self._values[name] = {}
+            fields = self._values[name]
+            items = dict(mapping or {})
+            if key is not None:
+                items[key] = value
+            for field_name, field_value in items.items():
+                fields[field_name.encode("utf-8")] = str(field_value).encode("utf-8")
+            return len(items)
+
+    def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        with self._lock:
+            if not self._live(name):
+                self._values[name] = {}
+            fields = self._values[name]
+            field_name = key.encode("utf-8")
+            count = int(fields.get(field_name, b"0")) + amount
+            fields[field_name] = str(count).encode("utf-8")
+            return count
+
+    def hget(self, name: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._values[name].get(key.encode("utf-8")) if self._live(name) else None
+
+    def hgetall(self, name: str) -> Dict[bytes, bytes]:
+        with self._lock:
+            return dict(self._values[name]) if self._live(name) else {}
+
+    def expire(self, name: str, seconds: int) -> bool:
+        with self._lock:
+            if not self._live(name):
+                return False
+            self._expires[name] = time.time() + seconds
+            return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            removed = 0
+            for name in names:
+                if self._live(name):
+                    removed += 1
+                self._values.pop(name, None)
+                self._expires.pop(name, None)
+            return removed
+
+    def scan_iter(self, match: str = "*") -> Iterator[bytes]:
+        with self._lock:
+            names = [name for name in list(self._values) if self._live(name) and fnmatch.fnmatchcase(name, match)]
+        return iter(name.encode("utf-8") for name in names)
+
+    def pipeline(self, transaction: bool = True) -> "_InMemoryPipeline":
+        return _InMemoryPipeline(self)
+
+
+class _InMemoryPipeline:
+    """Buffers commands and runs them in order on execute()"""
+
+    def __init__(self, backend: InMemoryCacheBackend):
+        self._backend = backend
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, command: str):
+        def queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> List[Any]:
+        with self._backend._lock:
+            results = [getattr(self._backend, command)(*args, **kwargs) for command, args, kwargs in self._commands]
+        self._commands.clear()
+        return results
+
+
+class RenderCache:
+    """Compressed render cache with atomic access metrics and a local LRU tier"""
+
+    def __init__(self, backend: Optional[Any] = None, local_size: int = LOCAL_CACHE_SIZE, prefix: str = "viz"):
+        """Initialize the cache
+
+        Args:
+            backend: redis.Redis (decode_responses=False) or InMemoryCacheBackend;
+                None keeps only the local tier
+            local_size: Entries kept decoded in process
+            prefix: Key namespace in the backend
+        """
+        self.backend = backend
+        self.local_size = local_size
+        self.prefix = prefix
+        # key -> (entry, expires_at epoch seconds)
+        self._local: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+
+    def _html_key(self, key: str) -> str:
+        return f"{self.prefix}:html:{key}"
+
+    def _meta_key(self, key: str) -> str:
+        return f"{self.prefix}:meta:{key}"
+
+    def _local_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cached = self._local.get(key)
+            if cached is None:
+                return None
+            entry, expires_at = cached
+            if expires_at <= time.time():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return entry
+
+    def _local_put(self, key: str, entry: Dict[str, Any], expires_at: float) -> None:
+        if self.local_size <= 0:
+            return
+        with self._lock:
+            self._local[key] = (entry, expires_at)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a rendered visualization and record the access
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry dict (html, layout, title, recommendation, created_at,
+            access_count, last_accessed) or None
+        """
+        entry = self._local_get(key)
+        if entry is not None:
+            self.local_hits += 1
+        elif self.backend is not None:
+            try:
+                blob = self.backend.get(self._html_key(key))
+            except Exception as e:
+                logger.error(f"Cache retrieval error: {e}")
+                blob = None
+            if blob is not None:
+                entry = json.loads(zlib.decompress(blob))
+                self._local_put(key, entry, entry.get("expires_at", time.time()))
+                self.backend_hits += 1
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        now = datetime.now().isoformat()
+        access_count = self._record_access(key, entry, now)
+        return {**entry, "access_count": access_count, "last_accessed": now}
+
+    def _record_access(self, key: str, entry: Dict[str, Any], now: str) -> int:
+        """Atomically bump the access counter; the HTML itself is never rewritten."""
+        if self.backend is None:
+            with self._lock:
+                entry["access_count"] = entry.get("access_count", 1) + 1
+                return entry["access_count"]
+        try:
+            pipe = self.backend.pipeline(transaction=False)
+            pipe.hincrby(self._meta_key(key), "access_count", 1)
+            pipe.hset(self._meta_key(key), "last_accessed", now)
+            return int(pipe.execute()[0])
+        except Exception as e:
+            logger.error(f"Cache metrics error: {e}")
+            return entry.get("access_count", 1)
+
+    def put(self, key: str, entry: Dict[str, Any], ttl: int = 3600) -> None:
+        """Store a rendered visualization
+
+        Args:
+            key: Cache key
+            entry: html, layout, title and recommendation
+            ttl: Time to live in seconds
+        """
+        now = datetime.now()
+        expires_at = time.time() + ttl
+        stored = {**entry, "created_at": now.isoformat(), "expires_at": expires_at}
+        self._local_put(key, {**stored, "access_count": 1}, expires_at)
+        if self.backend is None:
+            return
+
+        try:
+            blob = zlib.compress(json.dumps(stored, default=str).encode("utf-8"), COMPRESSION_LEVEL)
+            pipe = self.backend.pipeline(transaction=False)
+            pipe.set(self._html_key(key), blob, ex=ttl)
+            pipe.hset(self._meta_key(key), mapping={
+                "access_count": 1,
+                "created_at": now.isoformat(),
+                "last_accessed": now.isoformat()
+            })
+            pipe.expire(self._meta_key(key), ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Cache storage error: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend and local-tier statistics"""
+        result: Dict[str, Any] = {
+            "local_entries": len(self._local),
+            "local_hits": self.local_hits,
+            "backend_hits": self.backend_hits,
+            "misses": self.misses,
+            "cache_available": self.backend is not None
+        }
+        if self.backend is None:
+            with self._lock:
+                entries = [entry for entry, _ in self._local.values()]
+            sizes = [len(entry.get("html", "").encode("utf-8")) for entry in entries]
+            access_counts = [entry.get("access_count", 1) for entry in entries]
+        else:
+            keys = [_text(name) for name in self.backend.scan_iter(match=self._html_key("*"))]
+            pipe = self.backend.pipeline(transaction=False)
+            for name in keys:
+                pipe.strlen(name)
+                pipe.hget(self._meta_key(name[len(self._html_key("")):]), "access_count")
+            values = pipe.execute() if keys else []
+            sizes = [int(size or 0) for size in values[0::2]]
+            access_counts = [int(_text(count) or 0) for count in values[1::2]]
+
+        total_size = sum(sizes)
+        result.update({
+            "total_cached": len(sizes),
+            "total_size_bytes": total_size,
+            "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "total_accesses": sum(access_counts),
+            "average_accesses": round(sum(access_counts) / len(access_counts), 2) if access_counts else 0
+        })
+        return result
+
+    def clear(self) -> int:
+        """Drop every cached visualization, locally and in the backend
+
+        Returns:
+            Number of cached visualizations removed from the backend
+        """
+        with self._lock:
+            local_count = len(self._local)
+            self._local.clear()
+        if self.backend is None:
+            return local_count
+        names = [_text(name) for name in self.backend.scan_iter(match=f"{self.prefix}:*")]
+        cleared = sum(1 for name in names if name.startswith(self._html_key("")))
+        for start in range(0, len(names), 500):
+            self.backend.delete(*names[start:start + 500])
+        return cleared
@@ -2,7 +2,9 @@
 Module: visualization_server.py
 
 This module provides REST endpoints for generating and serving D3.js visualizations
-with Redis caching for improved performance.
+with a two-tier (in-process LRU + Redis) render cache, plus level-of-detail endpoints that
+stream viewport tiles of a precomputed supernode hierarchy for graphs too large
+to ship whole.
 
 Links to third-party package documentation:
 - FastAPI: https://fastapi.tiangolo.com/
@@ -12,24 +14,30 @@ Sample input: POST request with graph data
 Expected output: HTML visualization or JSON metadata
 """
 
-import json
 import hashlib
 import asyncio
-from typing import Dict, Any, Optional, List
+import os
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Body, Query
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Body, Query, Request
+from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 import redis
 from loguru import logger
 import uvicorn
 
 # Import visualization engine
 from ..core.d3_engine import D3VisualizationEngine, VisualizationConfig, LayoutType
+from ..core.lod_index import GraphLODIndex, encode_ndjson, encode_binary, lod_graph_id
+from .render_cache import RenderCache
+
+# Number of level-of-detail indexes kept in memory
+LOD_INDEX_CACHE_SIZE = int(os.getenv("VIZ_LOD_INDEX_CACHE_SIZE", "4"))
 
 
 # Pydantic models for API
@@ -57,9 +65,18 @@ class VisualizationResponse(BaseModel):
     title: str
     recommendation: Optional[Dict[str, Any]] = None
     cache_hit: bool = False
+    cache_key: Optional[str] = None
     generated_at: datetime = Field(default_factory=datetime.now)
 
 
+class LODGraphResponse(BaseModel):
+    """Level-of-detail index summary"""
+    graph_id: str
+    node_count: int
+    bounds: List[float]
+    levels: List[Dict[str, int]]
+
+
 class CachedVisualization(BaseModel):
     """Cached visualization data"""
     html: str
@@ -94,7 +111,7 @@ try:
         host='localhost', 
         port=6379, 
         db=0, 
-        decode_responses=True
+        decode_responses=False  # cached HTML is stored compressed
     )
     redis_client.ping()
     logger.info("Redis connection established")
@@ -102,35 +119,36 @@ except Exception as e:
     logger.warning(f"Redis not available: {e}")
     redis_client = None
 
+# Rendered HTML: local LRU tier in front of Redis (local tier only without Redis)
+render_cache = RenderCache(redis_client)
+
 # Initialize visualization engine
 engine = D3VisualizationEngine(use_llm=True)
 
+# Level-of-detail indexes by graph id, least recently used first
+lod_indexes: "OrderedDict[str, GraphLODIndex]" = OrderedDict()
+
 # Static file serving
 static_dir = Path("/home/graham/workspace/experiments/arangodb/static")
 if static_dir.exists():
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 
-def generate_cache_key(data: Dict[str, Any], layout: str, config: Optional[Dict] = None) -> str:
-    """Generate cache key from request data
+async def read_hashed_body(request: Request) -> Tuple[str, bytes]:
+    """Read a request body while hashing it chunk by chunk
     
     Args:
-        data: Graph data
-        layout: Layout type
-        config: Optional configuration
+        request: Incoming request
         
     Returns:
-        SHA256 hash as cache key
+        (hex digest of the raw body, body bytes)
     """
-    cache_data = {
-        "nodes": sorted([n["id"] for n in data.get("nodes", [])]),
-        "links": sorted([(l.get("source"), l.get("target")) for l in data.get("links", [])]),
-        "layout": layout,
-        "config": config or {}
-    }
-    
-    data_str = json.dumps(cache_data, sort_keys=True)
-    return hashlib.sha256(data_str.encode()).hexdigest()
+    digest = hashlib.blake2b(digest_size=32)
+    chunks = []
+    async for chunk in request.stream():
+        digest.update(chunk)
+        chunks.append(chunk)
+    return digest.hexdigest(), b"".join(chunks)
 
 
 async def get_cached_visualization(cache_key: str) -> Optional[CachedVisualization]:
@@ -142,19 +160,10 @@ async def get_cached_visualization(cache_key: str) -> Optional[CachedVisualizati
     Returns:
         CachedVisualization or None
     """
-    if not redis_client:
-        return None
-    
     try:
-        cached_data = redis_client.get(f"viz:{cache_key}")
-        if cached_data:
-            data = json.loads(cached_data)
-            # Update access metrics
-            data["access_count"] += 1
-            data["last_accessed"] = datetime.now().isoformat()
-            redis_client.set(f"viz:{cache_key}", json.dumps(data))
-            
-            return CachedVisualization(**data)
+        cached = render_cache.get(cache_key)
+        if cached:
+            return CachedVisualization(**cached)
     except Exception as e:
         logger.error(f"Cache retrieval error: {e}")
     
@@ -179,27 +188,16 @@ async def cache_visualization(
         recommendation: LLM recommendation data
         ttl: Time to live in seconds
     """
-    if not redis_client:
-        return
-    
-    try:
-        cache_data = CachedVisualization(
-            html=html,
-            layout=layout,
-            title=title,
-            recommendation=recommendation,
-            created_at=datetime.now(),
-            access_count=1,
-            last_accessed=datetime.now()
-        )
-        
-        redis_client.setex(
-            f"viz:{cache_key}",
-            ttl,
-            json.dumps(cache_data.dict(), default=str)
-        )
-    except Exception as e:
-        logger.error(f"Cache storage error: {e}")
+    render_cache.put(
+        cache_key,
+        {
+            "html": html,
+            "layout": layout,
+            "title": title,
+            "recommendation": recommendation
+        },
+        ttl
+    )
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -236,6 +234,21 @@ async def root():
                 <p>List available layout types</p>
             </div>
             
+            <div class="endpoint">
+                <span class="method">POST</span> <code>/lod/graphs</code>
+                <p>Build a level-of-detail index for a large graph</p>
+            </div>
+            
+            <div class="endpoint">
+                <span class="method">GET</span> <code>/lod/graphs/{graph_id}/tile</code>
+                <p>Stream the supernodes or nodes inside a viewport</p>
+            </div>
+            
+            <div class="endpoint">
+                <span class="method">GET</span> <code>/lod/graphs/{graph_id}/children</code>
+                <p>Stream the members of supernodes</p>
+            </div>
+            
             <div class="endpoint">
                 <span class="method">GET</span> <code>/cache/stats</code>
                 <p>Get cache statistics</p>
@@ -247,39 +260,52 @@ async def root():
     """
 
 
-@app.post("/visualize", response_model=VisualizationResponse)
-async def create_visualization(request: VisualizationRequest):
+@app.post(
+    "/visualize",
+    response_model=VisualizationResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": VisualizationRequest.model_json_schema()}}
+        }
+    }
+)
+async def create_visualization(raw_request: Request):
     """Create a new visualization
     
+    The cache key is a hash of the raw request body taken while it streams
+    in, so a repeated request is answered from cache without being parsed.
+    
     Args:
-        request: Visualization request with graph data
+        raw_request: Request whose JSON body is a VisualizationRequest
         
     Returns:
         VisualizationResponse with HTML and metadata
     """
+    cache_key, body = await read_hashed_body(raw_request)
+    
+    # Check cache first
+    cached = await get_cached_visualization(cache_key)
+    if cached:
+        logger.info(f"Cache hit for key: {cache_key}")
+        return VisualizationResponse(
+            html=cached.html,
+            layout=cached.layout,
+            title=cached.title,
+            recommendation=cached.recommendation,
+            cache_hit=True,
+            cache_key=cache_key
+        )
+    
+    try:
+        request = VisualizationRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    
     try:
         # Convert graph data to dict
         graph_dict = request.graph_data.dict()
         
-        # Generate cache key
-        cache_key = generate_cache_key(
-            graph_dict,
-            request.layout,
-            request.config
-        )
-        
-        # Check cache first
-        cached = await get_cached_visualization(cache_key)
-        if cached:
-            logger.info(f"Cache hit for key: {cache_key}")
-            return VisualizationResponse(
-                html=cached.html,
-                layout=cached.layout,
-                title=cached.title,
-                recommendation=cached.recommendation,
-                cache_hit=True
-            )
-        
         # Generate visualization
         if request.use_llm and engine.llm_recommender:
             # Use LLM recommendation
@@ -347,7 +373,8 @@ async def create_visualization(request: VisualizationRequest):
             layout=layout,
             title=title,
             recommendation=rec_data,
-            cache_hit=False
+            cache_hit=False,
+            cache_key=cache_key
         )
         
     except Exception as e:
@@ -410,6 +437,141 @@ async def list_layouts():
     }
 
 
+def get_lod_index(graph_id: str) -> GraphLODIndex:
+    """Look up a level-of-detail index, marking it recently used
+    
+    Args:
+        graph_id: Id returned when the index was built
+        
+    Returns:
+        GraphLODIndex or raises 404
+    """
+    index = lod_indexes.get(graph_id)
+    if index is None:
+        raise HTTPException(status_code=404, detail="LOD index not found; POST the graph to /lod/graphs first")
+    lod_indexes.move_to_end(graph_id)
+    return index
+
+
+def stream_tile(tile, index: GraphLODIndex, zoom: float, labels: Optional[bool], format: str) -> StreamingResponse:
+    """Stream a tile as NDJSON chunks or binary frames
+    
+    Args:
+        tile: Tile to send
+        index: Index the tile came from
+        zoom: Client zoom level, used to decide on labels
+        labels: Force labels on or off (None lets the optimizer decide)
+        format: "json" or "binary"
+        
+    Returns:
+        StreamingResponse with the encoded tile
+    """
+    if labels is None:
+        optimizer = engine.performance_optimizer
+        labels = optimizer.should_render_labels(zoom, tile.count) if optimizer else tile.count <= 200
+    if not labels:
+        tile.labels = None
+    
+    if format == "binary":
+        return StreamingResponse(encode_binary(tile, index), media_type="application/octet-stream")
+    return StreamingResponse(encode_ndjson(tile, index), media_type="application/x-ndjson")
+
+
+@app.post("/lod/graphs", response_model=LODGraphResponse)
+async def create_lod_index(graph_data: GraphData):
+    """Build (or reuse) the level-of-detail index for a graph
+    
+    Nodes carrying numeric x/y keep their positions; otherwise the
+    server-side force layout places them.
+    
+    Args:
+        graph_data: Graph to index
+        
+    Returns:
+        LODGraphResponse with the graph id and per-level sizes
+    """
+    graph_dict = graph_data.dict()
+    graph_id = lod_graph_id(graph_dict)
+    
+    index = lod_indexes.get(graph_id)
+    if index is None:
+        try:
+            loop = asyncio.get_running_loop()
+            index = await loop.run_in_executor(None, GraphLODIndex.from_graph, graph_dict)
+        except Exception as e:
+            logger.error(f"LOD index build error: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+        lod_indexes[graph_id] = index
+        while len(lod_indexes) > LOD_INDEX_CACHE_SIZE:
+            lod_indexes.popitem(last=False)
+    lod_indexes.move_to_end(graph_id)
+    
+    return LODGraphResponse(graph_id=graph_id, **index.describe())
+
+
+@app.get("/lod/graphs/{graph_id}", response_model=LODGraphResponse)
+async def describe_lod_index(graph_id: str):
+    """Summary of a level-of-detail index
+    
+    Args:
+        graph_id: Id returned by POST /lod/graphs
+        
+    Returns:
+        LODGraphResponse
+    """
+    return LODGraphResponse(graph_id=graph_id, **get_lod_index(graph_id).describe())
+
+
+@app.get("/lod/graphs/{graph_id}/tile")
+async def get_lod_tile(
+    graph_id: str,
+    x0: Optional[float] = Query(None, description="Viewport left (layout coordinates)"),
+    y0: Optional[float] = Query(None, description="Viewport top"),
+    x1: Optional[float] = Query(None, description="Viewport right"),
+    y1: Optional[float] = Query(None, description="Viewport bottom"),
+    level: Optional[int] = Query(None, ge=0, description="Explicit level; chosen from max_items if omitted"),
+    max_items: int = Query(2000, ge=1, le=200000, description="Item budget for the viewport"),
+    zoom: float = Query(1.0, gt=0, description="Client zoom, used to decide on labels"),
+    labels: Optional[bool] = Query(None, description="Force labels on or off"),
+    format: str = Query("json", pattern="^(json|binary)$")
+):
+    """Stream the items inside a viewport at the finest level that fits the budget
+    
+    Coarse levels hold community supernodes; zooming into a smaller viewport
+    lets finer levels fit, down to the original nodes.
+    
+    Returns:
+        NDJSON column chunks or binary frames (see lod_index.encode_*)
+    """
+    index = get_lod_index(graph_id)
+    viewport = None if None in (x0, y0, x1, y1) else (x0, y0, x1, y1)
+    tile = index.tile(viewport, max_items=max_items, level=level)
+    return stream_tile(tile, index, zoom, labels, format)
+
+
+@app.get("/lod/graphs/{graph_id}/children")
+async def get_lod_children(
+    graph_id: str,
+    level: int = Query(..., ge=1, description="Level of the supernodes to expand"),
+    items: str = Query(..., description="Comma-separated supernode indices"),
+    zoom: float = Query(1.0, gt=0, description="Client zoom, used to decide on labels"),
+    labels: Optional[bool] = Query(None, description="Force labels on or off"),
+    format: str = Query("json", pattern="^(json|binary)$")
+):
+    """Stream the members of supernodes (one level finer)
+    
+    Returns:
+        NDJSON column chunks or binary frames (see lod_index.encode_*)
+    """
+    index = get_lod_index(graph_id)
+    try:
+        item_ids = [int(item) for item in items.split(",") if item.strip()]
+        tile = index.children(level, item_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return stream_tile(tile, index, zoom, labels, format)
+
+
 @app.get("/cache/stats")
 async def cache_statistics():
     """Get cache statistics
@@ -417,29 +579,8 @@ async def cache_statistics():
     Returns:
         Cache usage statistics
     """
-    if not redis_client:
-        return {"error": "Cache not available"}
-    
     try:
-        keys = redis_client.keys("viz:*")
-        total_size = 0
-        access_counts = []
-        
-        for key in keys:
-            data = redis_client.get(key)
-            if data:
-                total_size += len(data)
-                cached = json.loads(data)
-                access_counts.append(cached.get("access_count", 0))
-        
-        return {
-            "total_cached": len(keys),
-            "total_size_bytes": total_size,
-            "total_size_mb": round(total_size / (1024 * 1024), 2),
-            "total_accesses": sum(access_counts),
-            "average_accesses": round(sum(access_counts) / len(access_counts), 2) if access_counts else 0,
-            "cache_available": True
-        }
+        return render_cache.stats()
     except Exception as e:
         logger.error(f"Cache stats error: {e}")
         return {"error": str(e)}
@@ -452,14 +593,9 @@ async def clear_cache():
     Returns:
         Confirmation message
     """
-    if not redis_client:
-        return {"error": "Cache not available"}
-    
     try:
-        keys = redis_client.keys("viz:*")
-        if keys:
-            redis_client.delete(*keys)
-        return {"message": f"Cleared {len(keys)} cached visualizations"}
+        cleared = render_cache.clear()
+        return {"message": f"Cleared {cleared} cached visualizations"}
     except Exception as e:
         logger.error(f"Cache clear error: {e}")
         return {"error": str(e)}
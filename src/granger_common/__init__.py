@@ -1,18 +1,20 @@
 """Granger Common - Standardized components for the Granger ecosystem.
 
 This package contains:
-- rate_limiter.py: Thread-safe rate limiting for external APIs
+- rate_limiter.py: Token-bucket rate limiting for external APIs, optionally shared across processes
 - pdf_handler.py: Smart PDF processing with memory management
 - schema_manager.py: Schema versioning and migration
 """
 
-from .rate_limiter import RateLimiter, get_rate_limiter
+from .rate_limiter import RateLimiter, get_rate_limiter, is_rate_limit_error, retry_after_seconds
 from .pdf_handler import SmartPDFHandler
 from .schema_manager import SchemaManager, SchemaVersion
 
 __all__ = [
     "RateLimiter",
-    "get_rate_limiter", 
+    "get_rate_limiter",
+    "is_rate_limit_error",
+    "retry_after_seconds",
     "SmartPDFHandler",
     "SchemaManager",
     "SchemaVersion"
@@ -6,11 +6,16 @@ Description: Standardized rate limiter for all Granger modules to use with exter
 This module provides a consistent rate limiting implementation that all Granger
 projects should use when making external API calls.
 
+Limiters are token buckets. Set GRANGER_RATE_LIMIT_DIR (or
+GRANGER_RATE_LIMIT_REDIS_URL) so the pre-configured limiters keep their bucket
+outside the process and N local workers share one quota instead of N.
+
 External Dependencies:
 - asyncio: Built-in async support
 - time: Built-in time tracking
 - threading: Built-in thread safety
-- collections: Built-in deque for sliding window
+- fcntl/mmap: Built-in cross-process bucket sharing (POSIX)
+- redis: Optional shared bucket across hosts (https://redis-py.readthedocs.io/)
 
 Sample Input:
 >>> limiter = RateLimiter(calls_per_second=3, burst_size=10)
@@ -38,19 +43,137 @@ Example Usage:
 >>> # Use in async code
 >>> if await api_limiter.acquire_async():
 ...     response = await httpx.get(api_url)
+>>> 
+>>> # Feed 429s back so the rate adapts
+>>> if response.status_code == 429:
+...     api_limiter.report_throttled(float(response.headers.get("Retry-After", 1)))
 """
 
 import asyncio
-import time
+import email.utils
+import mmap
+import os
+import struct
 import threading
+import time
+import weakref
 from collections import deque
-from typing import Optional, Union
+from typing import Any, Callable, List, Optional, Tuple
 from loguru import logger
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# When set, the pre-configured limiters keep their buckets here (file lock +
+# mmap) or in Redis, so every local worker draws from one budget per API
+SHARED_STATE_DIR = os.getenv("GRANGER_RATE_LIMIT_DIR")
+SHARED_STATE_REDIS_URL = os.getenv("GRANGER_RATE_LIMIT_REDIS_URL")
+
+# Adaptive rate: multiply by THROTTLE_BACKOFF on a 429, then recover by
+# RECOVERY_STEP of the configured rate per successful call
+THROTTLE_BACKOFF = 0.5
+RECOVERY_STEP = 0.05
+MIN_RATE_FRACTION = 0.05
+
+# Bucket state shared by every backend: [tokens, updated, rate].
+# `updated` may lie in the future while the bucket is paused by Retry-After;
+# a rate of 0 marks a bucket nobody has used yet.
+BucketState = List[float]
+
+
+class LocalBucketBackend:
+    """Bucket state held in this process."""
+
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self):
+        self._state: BucketState = [0.0, 0.0, 0.0]
+        self._lock = threading.Lock()
+
+    def transact(self, fn: Callable[[BucketState], Any]) -> Any:
+        """Apply `fn` to the state atomically and return its result."""
+        with self._lock:
+            return fn(self._state)
+
+
+class FileBucketBackend:
+    """Bucket state in a memory-mapped file, serialised across processes with flock."""
+
+    clock = staticmethod(time.time)
+    _LAYOUT = struct.Struct("3d")
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the shared bucket file.
+
+        Args:
+            path: Bucket file; every process using the same path shares one budget
+        """
+        if fcntl is None:
+            raise RuntimeError("FileBucketBackend requires fcntl (POSIX only)")
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < self._LAYOUT.size:
+            os.ftruncate(self._fd, self._LAYOUT.size)
+        self._map = mmap.mmap(self._fd, self._LAYOUT.size)
+        # flock is per open file, so threads of this process also need a lock
+        self._lock = threading.Lock()
+
+    def transact(self, fn: Callable[[BucketState], Any]) -> Any:
+        """Apply `fn` to the state under an exclusive file lock and return its result."""
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                state = list(self._LAYOUT.unpack_from(self._map))
+                result = fn(state)
+                self._LAYOUT.pack_into(self._map, 0, *state)
+                return result
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+class RedisBucketBackend:
+    """Bucket state in a Redis hash, updated with optimistic WATCH/MULTI transactions."""
+
+    clock = staticmethod(time.time)
+
+    def __init__(self, client: Any, key: str):
+        """
+        Args:
+            client: redis.Redis (or any client exposing `transaction` and `hmget`/`hset`)
+            key: Hash key holding the bucket
+        """
+        self.client = client
+        self.key = key
+
+    def transact(self, fn: Callable[[BucketState], Any]) -> Any:
+        """Apply `fn` to the state atomically, retrying if another worker wrote first."""
+        result = None
+
+        def run(pipe):
+            nonlocal result
+            raw = pipe.hmget(self.key, "tokens", "updated", "rate")
+            state = [float(v) if v is not None else 0.0 for v in raw]
+            result = fn(state)
+            pipe.multi()
+            pipe.hset(self.key, mapping={"tokens": state[0], "updated": state[1], "rate": state[2]})
+
+        self.client.transaction(run, self.key)
+        return result
+
 
 class RateLimiter:
     """
-    Thread-safe rate limiter using sliding window algorithm.
+    Token-bucket rate limiter with FIFO async waiters and adaptive rate.
+    
+    Tokens refill at `calls_per_second` up to `burst_size`. Synchronous callers
+    reserve a token and sleep exactly until it is due. Async callers queue a
+    future; one scheduler task per event loop grants tokens in arrival order,
+    so no waiter polls. `report_throttled` lowers the rate and pauses the
+    bucket after a 429, and `report_success` recovers it gradually.
     
     This implementation ensures consistent rate limiting across all Granger modules.
     """
@@ -61,7 +184,8 @@ class RateLimiter:
         burst_size: Optional[int] = None,
         name: str = "default",
         retry_on_limit: bool = True,
-        max_retry_wait: float = 60.0
+        max_retry_wait: float = 60.0,
+        backend: Optional[Any] = None
     ):
         """
         Initialize rate limiter.
@@ -72,54 +196,55 @@ class RateLimiter:
             name: Name for logging purposes
             retry_on_limit: Whether to wait and retry when rate limited
             max_retry_wait: Maximum time to wait for retry (seconds)
+            backend: Where the bucket lives (defaults to this process only)
         """
         self.calls_per_second = calls_per_second
         self.burst_size = burst_size or int(calls_per_second * 3)
         self.name = name
         self.retry_on_limit = retry_on_limit
         self.max_retry_wait = max_retry_wait
+        self.min_rate = calls_per_second * MIN_RATE_FRACTION
         
         # Calculate minimum interval between calls
         self.min_interval = 1.0 / calls_per_second
         
-        # Thread-safe call history
-        self._call_times = deque(maxlen=self.burst_size)
+        self._backend = backend or LocalBucketBackend()
         self._lock = threading.Lock()
+        # Per event loop: queued futures and the task serving them
+        self._waiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, deque]" = weakref.WeakKeyDictionary()
+        self._schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = weakref.WeakKeyDictionary()
         
         logger.info(
             f"RateLimiter '{name}' initialized: "
             f"{calls_per_second} calls/sec, burst={self.burst_size}"
+            f"{'' if backend is None else f', shared via {type(backend).__name__}'}"
         )
     
-    def _can_proceed(self) -> tuple[bool, float]:
+    def _refill(self, state: BucketState, now: float) -> None:
+        """Add the tokens earned since the last update."""
+        if state[2] <= 0:
+            state[:] = [float(self.burst_size), now, self.calls_per_second]
+        elif now > state[1]:
+            state[0] = min(float(self.burst_size), state[0] + (now - state[1]) * state[2])
+            state[1] = now
+    
+    def _take(self, max_wait: float) -> Tuple[bool, float]:
         """
-        Check if we can proceed with a call.
+        Reserve a token if it will be available within `max_wait` seconds.
         
         Returns:
-            Tuple of (can_proceed, wait_time_if_not)
+            Tuple of (reserved, seconds_until_the_token_is_due)
         """
-        now = time.time()
+        def op(state: BucketState) -> Tuple[bool, float]:
+            now = self._backend.clock()
+            self._refill(state, now)
+            wait = max(0.0, state[1] - now) + max(0.0, 1.0 - state[0]) / state[2]
+            if wait > max_wait:
+                return False, wait
+            state[0] -= 1.0
+            return True, wait
         
-        with self._lock:
-            # Remove old calls outside the window
-            cutoff = now - (self.burst_size / self.calls_per_second)
-            while self._call_times and self._call_times[0] < cutoff:
-                self._call_times.popleft()
-            
-            # Check if we're under the limit
-            if len(self._call_times) < self.burst_size:
-                # Check minimum interval since last call
-                if self._call_times:
-                    time_since_last = now - self._call_times[-1]
-                    if time_since_last < self.min_interval:
-                        wait_time = self.min_interval - time_since_last
-                        return False, wait_time
-                
-                return True, 0.0
-            
-            # Calculate when the oldest call will expire
-            wait_time = self._call_times[0] + (self.burst_size / self.calls_per_second) - now
-            return False, wait_time
+        return self._backend.transact(op)
     
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """
@@ -131,103 +256,240 @@ class RateLimiter:
         Returns:
             True if acquired, False if timed out
         """
-        start_time = time.time()
         timeout = timeout or (self.max_retry_wait if self.retry_on_limit else 0)
         
-        while True:
-            can_proceed, wait_time = self._can_proceed()
-            
-            if can_proceed:
-                with self._lock:
-                    self._call_times.append(time.time())
-                logger.debug(f"RateLimiter '{self.name}': Call acquired")
-                return True
-            
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed + wait_time > timeout:
-                logger.warning(
-                    f"RateLimiter '{self.name}': "
-                    f"Timeout after {elapsed:.1f}s (would need {wait_time:.1f}s more)"
-                )
-                return False
-            
-            # Wait before retry
+        reserved, wait_time = self._take(timeout)
+        if not reserved:
+            logger.warning(
+                f"RateLimiter '{self.name}': "
+                f"Timeout of {timeout:.1f}s (would need {wait_time:.1f}s)"
+            )
+            return False
+        
+        if wait_time > 0:
             logger.debug(f"RateLimiter '{self.name}': Waiting {wait_time:.3f}s")
             time.sleep(wait_time)
+        logger.debug(f"RateLimiter '{self.name}': Call acquired")
+        return True
     
     async def acquire_async(self, timeout: Optional[float] = None) -> bool:
         """
         Acquire permission to make a call (asynchronous).
         
+        Waiters are served in arrival order by a single scheduler task.
+        
         Args:
             timeout: Maximum time to wait (None for retry_on_limit behavior)
             
         Returns:
             True if acquired, False if timed out
         """
-        start_time = time.time()
         timeout = timeout or (self.max_retry_wait if self.retry_on_limit else 0)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            queue = self._waiters.setdefault(loop, deque())
         
-        while True:
-            can_proceed, wait_time = self._can_proceed()
-            
-            if can_proceed:
-                with self._lock:
-                    self._call_times.append(time.time())
+        # Nobody is ahead of us, so a free token can be taken right away
+        if not queue:
+            reserved, _ = self._take(0.0)
+            if reserved:
                 logger.debug(f"RateLimiter '{self.name}': Call acquired (async)")
                 return True
+        if timeout <= 0:
+            logger.warning(f"RateLimiter '{self.name}': No capacity and no timeout (async)")
+            return False
+        
+        future = loop.create_future()
+        queue.append(future)
+        with self._lock:
+            scheduler = self._schedulers.get(loop)
+            if scheduler is None or scheduler.done():
+                self._schedulers[loop] = loop.create_task(self._serve(queue))
+        
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"RateLimiter '{self.name}': Timeout after {timeout:.1f}s (async)")
+            return False
+        logger.debug(f"RateLimiter '{self.name}': Call acquired (async)")
+        return True
+    
+    async def _serve(self, queue: deque) -> None:
+        """Grant tokens to queued futures in order; exits when the queue drains."""
+        while queue:
+            head = queue[0]
+            if head.done():
+                # Timed out or cancelled; its place passes to the next waiter
+                queue.popleft()
+                continue
+            reserved, wait_time = self._take(0.0)
+            if reserved:
+                queue.popleft()
+                head.set_result(True)
+            else:
+                await asyncio.sleep(wait_time)
+    
+    def report_throttled(self, retry_after: Optional[float] = None) -> float:
+        """
+        Record a 429 from the API: lower the rate and pause the bucket.
+        
+        Throttles reported while the bucket is already paused only extend the
+        pause, so a burst of in-flight requests failing together backs off once.
+        
+        Args:
+            retry_after: Seconds from the Retry-After header, if any
             
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed + wait_time > timeout:
-                logger.warning(
-                    f"RateLimiter '{self.name}': "
-                    f"Timeout after {elapsed:.1f}s (would need {wait_time:.1f}s more)"
-                )
-                return False
-            
-            # Wait before retry
-            logger.debug(f"RateLimiter '{self.name}': Waiting {wait_time:.3f}s (async)")
-            await asyncio.sleep(wait_time)
+        Returns:
+            The new rate in calls per second
+        """
+        def op(state: BucketState) -> float:
+            now = self._backend.clock()
+            self._refill(state, now)
+            if state[1] <= now:
+                state[2] = max(self.min_rate, state[2] * THROTTLE_BACKOFF)
+            pause = retry_after if retry_after is not None else 1.0 / state[2]
+            state[0] = min(state[0], 0.0)
+            state[1] = max(state[1], now + pause)
+            return state[2]
+        
+        rate = self._backend.transact(op)
+        logger.warning(
+            f"RateLimiter '{self.name}': Throttled by API, "
+            f"rate now {rate:.2f} calls/sec"
+            f"{f', paused {retry_after:.1f}s' if retry_after is not None else ''}"
+        )
+        return rate
+    
+    def report_success(self) -> None:
+        """Record a successful call, recovering the rate towards `calls_per_second`."""
+        def op(state: BucketState) -> None:
+            if 0 < state[2] < self.calls_per_second:
+                self._refill(state, self._backend.clock())
+                state[2] = min(self.calls_per_second, state[2] + self.calls_per_second * RECOVERY_STEP)
+        
+        self._backend.transact(op)
     
     def get_stats(self) -> dict:
         """Get current rate limiter statistics."""
+        def op(state: BucketState) -> Tuple[float, float]:
+            self._refill(state, self._backend.clock())
+            return state[0], state[2]
+        
+        tokens, rate = self._backend.transact(op)
+        available = max(0, int(tokens))
         with self._lock:
-            current_calls = len(self._call_times)
+            waiting = sum(len(queue) for queue in self._waiters.values())
             
         return {
             "name": self.name,
             "calls_per_second": self.calls_per_second,
+            "current_rate": rate,
             "burst_size": self.burst_size,
-            "current_calls": current_calls,
-            "available_capacity": self.burst_size - current_calls
+            "current_calls": self.burst_size - available,
+            "available_capacity": available,
+            "waiting": waiting
         }
 
 
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether an exception (litellm, httpx, requests, ...) represents an HTTP 429."""
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None) or getattr(response, "status_code", None)
+    return status == 429 or type(exc).__name__ == "RateLimitError"
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """
+    Read the Retry-After delay carried by a rate-limit exception.
+    
+    Args:
+        exc: Exception with a `response` (or `headers`) attribute
+        
+    Returns:
+        Seconds to wait, or None when the server gave no hint
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None) or getattr(exc, "headers", None)
+    if not headers:
+        return None
+    headers = {str(k).lower(): v for k, v in dict(headers).items()}
+    
+    if "retry-after-ms" in headers:
+        try:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000.0)
+        except (TypeError, ValueError):
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        # HTTP-date form
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _shared_backend(api_name: str) -> Optional[Any]:
+    """Backend shared by every local process for `api_name`, if one is configured."""
+    if SHARED_STATE_REDIS_URL:
+        try:
+            import redis
+            client = redis.Redis.from_url(SHARED_STATE_REDIS_URL)
+            return RedisBucketBackend(client, f"granger:rate_limit:{api_name}")
+        except Exception as e:
+            logger.warning(f"Shared Redis rate limit state unavailable for '{api_name}': {e}")
+    if SHARED_STATE_DIR:
+        try:
+            return FileBucketBackend(os.path.join(SHARED_STATE_DIR, f"{api_name}.bucket"))
+        except Exception as e:
+            logger.warning(f"Shared file rate limit state unavailable for '{api_name}': {e}")
+    return None
+
+
 # Pre-configured rate limiters for common APIs
 RATE_LIMITERS = {
     "nvd": RateLimiter(
         calls_per_second=3.0,  # NVD allows ~3 requests/sec
         burst_size=10,
-        name="NVD_API"
+        name="NVD_API",
+        backend=_shared_backend("nvd")
     ),
     "arxiv": RateLimiter(
         calls_per_second=3.0,  # ArXiv recommends 3 requests/sec
         burst_size=10,
-        name="ArXiv_API"
+        name="ArXiv_API",
+        backend=_shared_backend("arxiv")
     ),
     "youtube": RateLimiter(
         calls_per_second=10.0,  # YouTube API has higher limits
         burst_size=50,
-        name="YouTube_API"
+        name="YouTube_API",
+        backend=_shared_backend("youtube")
     ),
     "github": RateLimiter(
         calls_per_second=5.0,  # GitHub API allows 5 requests/sec for authenticated
         burst_size=20,
-        name="GitHub_API"
+        name="GitHub_API",
+        backend=_shared_backend("github")
+    ),
+    # LLM providers; the rate adapts downwards from here on 429s
+    "openai": RateLimiter(
+        calls_per_second=10.0,
+        burst_size=20,
+        name="OpenAI_API",
+        backend=_shared_backend("openai")
+    ),
+    "vertex": RateLimiter(
+        calls_per_second=10.0,
+        burst_size=20,
+        name="Vertex_API",
+        backend=_shared_backend("vertex")
     )
 }
+_RATE_LIMITERS_LOCK = threading.Lock()
 
 
 def get_rate_limiter(api_name: str) -> RateLimiter:
@@ -235,16 +497,16 @@ def get_rate_limiter(api_name: str) -> RateLimiter:
     Get a pre-configured rate limiter for a specific API.
     
     Args:
-        api_name: Name of the API (nvd, arxiv, youtube, github)
+        api_name: Name of the API (nvd, arxiv, youtube, github, openai, vertex)
         
     Returns:
-        Configured RateLimiter instance
+        Configured RateLimiter instance, the same one on every call
     """
-    if api_name not in RATE_LIMITERS:
-        logger.warning(f"No pre-configured rate limiter for '{api_name}', using default")
-        return RateLimiter(name=api_name)
-    
-    return RATE_LIMITERS[api_name]
+    with _RATE_LIMITERS_LOCK:
+        if api_name not in RATE_LIMITERS:
+            logger.warning(f"No pre-configured rate limiter for '{api_name}', using default")
+            RATE_LIMITERS[api_name] = RateLimiter(name=api_name, backend=_shared_backend(api_name))
+        return RATE_LIMITERS[api_name]
 
 
 if __name__ == "__main__":
@@ -279,4 +541,13 @@ if __name__ == "__main__":
     
     asyncio.run(test_async())
     
+    print("\nTest 4: Shared bucket and 429 feedback")
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "test.bucket")
+    first = RateLimiter(calls_per_second=2, burst_size=2, name="shared_a", backend=FileBucketBackend(path))
+    second = RateLimiter(calls_per_second=2, burst_size=2, name="shared_b", backend=FileBucketBackend(path))
+    print(f"  Burst taken via A: {first.acquire(timeout=0.01) and first.acquire(timeout=0.01)}")
+    print(f"  B sees empty bucket: {not second.acquire(timeout=0.01)}")
+    print(f"  Rate after 429: {first.report_throttled(retry_after=0.5):.2f} calls/sec")
+    
     print("\n✅ RateLimiter validation complete!")
\ No newline at end of file
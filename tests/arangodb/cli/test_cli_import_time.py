@@ -0,0 +1,76 @@
+"""
+Module: test_cli_import_time.py
+Description: Import-time budget for the `arangodb` CLI entry point
+
+Runs `python -X importtime -c "import arangodb.cli.main"` in a fresh
+interpreter and fails if startup imports a heavy stack or exceeds the budget.
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # CLI_IMPORT_BUDGET_MS=800 pytest tests/arangodb/cli/test_cli_import_time.py
+
+Expected Output:
+>>> # Passes when no heavy module is imported and the budget is met
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+
+# Cumulative import time allowed for the CLI entry point, in milliseconds
+IMPORT_BUDGET_MS = float(os.getenv("CLI_IMPORT_BUDGET_MS", "1500"))
+
+# Top-level packages that must only load when a command needs them
+HEAVY_MODULES = {
+    "torch",
+    "transformers",
+    "sentence_transformers",
+    "spacy",
+    "litellm",
+}
+
+# Project subpackages that belong to individual commands
+DEFERRED_PACKAGES = (
+    "arangodb.core.search",
+    "arangodb.core.memory",
+    "arangodb.qa_generation",
+    "arangodb.visualization",
+)
+
+
+def profile_cli_import():
+    """Return {module: cumulative microseconds} for a fresh CLI import."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(src_path), os.getenv("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import arangodb.cli.main"],
+        capture_output=True, text=True, env=env, timeout=120
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def test_cli_startup_skips_heavy_modules_and_meets_budget():
+    timings = profile_cli_import()
+
+    heavy = sorted(name for name in timings if name.split(".")[0] in HEAVY_MODULES)
+    assert not heavy, f"CLI startup imported heavy modules: {heavy}"
+
+    deferred = sorted(name for name in timings if name.startswith(DEFERRED_PACKAGES))
+    assert not deferred, f"CLI startup imported command modules: {deferred}"
+
+    total_ms = timings["arangodb.cli.main"] / 1000
+    assert total_ms < IMPORT_BUDGET_MS, f"CLI import took {total_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
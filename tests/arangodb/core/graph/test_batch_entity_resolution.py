@@ -0,0 +1,92 @@
+"""
+Module: test_batch_entity_resolution.py
+Description: Test suite for blocking-based batch entity resolution
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.core.graph.batch_entity_resolution import resolve_entities_batch
+
+EXISTING = [
+    {"_key": "js", "_id": "entities/js", "name": "John Smith", "type": "Person",
+     "attributes": {"age": 30}, "embedding": [1.0, 0.0, 0.0]},
+    {"_key": "acme", "_id": "entities/acme", "name": "Acme Corporation", "type": "Organization",
+     "attributes": {}, "embedding": [0.0, 1.0, 0.0]},
+]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.updated = []
+        self.inserted = []
+
+    def update_many(self, docs, silent=False, merge=False):
+        self.updated.extend(docs)
+        return [{"_key": doc["_key"]} for doc in docs]
+
+    def insert_many(self, docs, silent=False):
+        self.inserted.extend(docs)
+        return [{"_key": f"new{i}", "_id": f"entities/new{i}"} for i in range(len(docs))]
+
+
+class FakeAQL:
+    def __init__(self):
+        self.queries = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        self.queries.append(query)
+        if "KEEP" in query:
+            return iter([{k: doc[k] for k in ("_key", "_id", "name", "type", "embedding")} for doc in EXISTING])
+        return iter([dict(doc) for doc in EXISTING if doc["_key"] in bind_vars["keys"]])
+
+
+class FakeDB:
+    def __init__(self):
+        self.aql = FakeAQL()
+        self.entities = FakeCollection()
+
+    def collection(self, name):
+        return self.entities
+
+
+def test_batch_resolution_blocks_scores_and_writes_in_bulk():
+    """Exact, semantic and in-batch duplicates resolve with one read and bulk writes."""
+    db = FakeDB()
+    batch = [
+        {"name": "Smith, John", "type": "Person", "attributes": {"email": "j@example.com"}, "embedding": [0.0, 0.0, 1.0]},
+        {"name": "ACME Corp.", "type": "Organization", "attributes": {}, "embedding": [0.05, 0.99, 0.0]},
+        {"name": "Widget Co", "type": "Organization", "attributes": {"city": "Oslo"}, "embedding": [0.0, 0.0, 1.0]},
+        {"name": "widget co", "type": "Organization", "attributes": {"size": 10}, "embedding": [0.0, 0.0, 1.0]},
+        {"type": "Person"},
+    ]
+
+    decisions = resolve_entities_batch(db, batch, "entities")
+
+    assert [d["action"] for d in decisions] == ["merged", "merged", "created", "merged_in_batch", "error"]
+    assert decisions[0]["match"]["match_type"] == "exact"
+    assert decisions[1]["match"]["match_type"] == "semantic"
+    assert decisions[0]["entity"]["attributes"] == {"age": 30, "email": "j@example.com"}
+
+    # One projection load, one target fetch, one update_many and one insert_many
+    assert len(db.aql.queries) == 2
+    assert sorted(doc["_key"] for doc in db.entities.updated) == ["acme", "js"]
+    assert len(db.entities.inserted) == 1
+    assert db.entities.inserted[0]["attributes"] == {"city": "Oslo", "size": 10}
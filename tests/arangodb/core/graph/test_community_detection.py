@@ -0,0 +1,150 @@
+"""
+Module: test_community_detection.py
+Description: Test suite for Louvain community detection over CSR adjacency
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+- numpy: https://numpy.org/doc/stable/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import numpy as np
+from arango.exceptions import ArangoError
+
+from arangodb.core.graph.community_detection import CommunityDetector, louvain, modularity
+from arangodb.core.graph.graph_snapshot import build_csr, clear_graph_snapshot_cache
+
+
+def two_cliques(size=5):
+    """Two cliques of `size` nodes joined by a single weak edge."""
+    edges = []
+    for offset in (0, size):
+        for i in range(size):
+            for j in range(i + 1, size):
+                edges.append((offset + i, offset + j, 1.0))
+    edges.append((0, size, 0.1))
+    return edges
+
+
+class FakeCollection:
+    def __init__(self):
+        self.inserted = []
+        self.updated = []
+
+    def revision(self):
+        return "1"
+
+    def truncate(self):
+        self.inserted = []
+
+    def insert_many(self, docs):
+        self.inserted.extend(docs)
+
+    def update_many(self, docs):
+        self.updated.extend(docs)
+
+
+class FakeAQL:
+    def __init__(self, entities, relationships):
+        self.entities = entities
+        self.relationships = relationships
+        self.queries = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        self.queries.append(query)
+        if "@@vertices" in query:
+            return iter([e["_id"] for e in self.entities])
+        if "@@edges" in query:
+            return iter([[r["_from"], r["_to"], r["confidence"]] for r in self.relationships])
+        return iter([[e["_key"], e["name"]] for e in self.entities if e["_key"] in bind_vars["keys"]])
+
+
+class FakeDB:
+    def __init__(self, entities, relationships):
+        self.aql = FakeAQL(entities, relationships)
+        self.collections = {}
+
+    def has_collection(self, name):
+        return True
+
+    def collection(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+
+def test_louvain_separates_cliques():
+    """Each clique becomes one community and modularity matches the hand computation."""
+    edges = two_cliques()
+    src, dst, w = zip(*edges)
+    indptr, indices, data = build_csr(10, src, dst, w)
+
+    membership = louvain(indptr, indices, data)
+
+    assert len(set(membership[:5].tolist())) == 1
+    assert len(set(membership[5:].tolist())) == 1
+    assert membership[0] != membership[5]
+
+    two_m = 2 * sum(w)
+    expected = 2 * (20 / two_m - ((20.1) / two_m) ** 2)
+    assert abs(modularity(membership, indptr, indices, data) - expected) < 1e-9
+
+
+def test_resolution_controls_granularity():
+    """A very low resolution merges the weakly linked cliques."""
+    edges = two_cliques()
+    src, dst, w = zip(*edges)
+    indptr, indices, data = build_csr(10, src, dst, w)
+
+    assert len(np.unique(louvain(indptr, indices, data, resolution=0.001))) == 1
+
+
+def test_detect_communities_stores_in_bulk():
+    """Detection maps entity keys to member keys and writes with bulk operations."""
+    entities = [{"_key": f"e{i}", "_id": f"agent_entities/e{i}", "name": f"E{i}"} for i in range(11)]
+    relationships = [
+        {"_from": f"agent_entities/e{s}", "_to": f"agent_entities/e{t}", "confidence": c}
+        for s, t, c in two_cliques()
+    ]
+    db = FakeDB(entities, relationships)
+    clear_graph_snapshot_cache()
+
+    communities = CommunityDetector(db).detect_communities(min_size=3)
+
+    # e10 has no relationships, so it stays a singleton community
+    assert len(set(communities.values())) == 3
+    assert communities["e1"] == communities["e4"] != communities["e6"]
+    assert communities["e1"] in {"e0", "e1", "e2", "e3", "e4"}
+
+    stored = db.collection("agent_communities").inserted
+    assert sorted(doc["member_count"] for doc in stored) == [1, 5, 5]
+    assert len(db.collection("agent_entities").updated) == 11
+    assert any("E0" in doc["sample_members"] for doc in stored)
+
+
+def test_detect_communities_returns_empty_on_database_error():
+    """A failed graph load is logged and yields no communities, as before snapshots."""
+    db = FakeDB([], [])
+
+    def fail(query, bind_vars=None, **kwargs):
+        raise ArangoError("connection lost")
+
+    db.aql.execute = fail
+    clear_graph_snapshot_cache()
+
+    assert CommunityDetector(db).detect_communities() == {}
+    assert db.collection("agent_communities").inserted == []
@@ -0,0 +1,103 @@
+"""
+Module: test_contradiction_batch.py
+Description: Test suite for set-based batch contradiction detection and resolution
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.core.graph.contradiction_detection import resolve_contradictions_batch
+
+EXISTING = [
+    {"_key": "old1", "_from": "e/a", "_to": "e/b", "type": "WORKS_AT",
+     "created_at": "2023-01-01T00:00:00+00:00", "valid_at": "2023-01-01T00:00:00+00:00", "invalid_at": None},
+    {"_key": "old2", "_from": "e/c", "_to": "e/d", "type": "WORKS_AT",
+     "created_at": "2023-01-01T00:00:00+00:00", "valid_at": "2023-01-01T00:00:00+00:00", "invalid_at": None},
+]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.indexes = []
+        self.updates = []
+
+    def add_persistent_index(self, fields, **kwargs):
+        self.indexes.append(fields)
+
+    def update_many(self, docs, **kwargs):
+        self.updates.append(docs)
+        return [{"_key": doc["_key"]} for doc in docs]
+
+
+class FakeAQL:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        self.calls.append(bind_vars)
+        rows = []
+        for c in bind_vars["candidates"]:
+            for e in EXISTING:
+                if (e["_from"], e["_to"], e["type"]) == (c["from"], c["to"], c["type"]) and e["_key"] != c["key"]:
+                    rows.append({"i": c["i"], "edge": dict(e)})
+        return iter(rows)
+
+
+class FakeDB:
+    name = "test_db"
+
+    def __init__(self):
+        self.aql = FakeAQL()
+        self.edges = FakeCollection()
+
+    def collection(self, name):
+        return self.edges
+
+
+def new_edge(key, source, target, valid_at):
+    return {"_key": key, "_from": source, "_to": target, "type": "WORKS_AT",
+            "created_at": "2024-06-01T00:00:00+00:00", "valid_at": valid_at, "invalid_at": None}
+
+
+def test_batch_resolution_uses_one_query_and_one_update():
+    """All triples go out in one bind variable and resolutions in one update_many."""
+    db = FakeDB()
+    edges = [
+        new_edge("new1", "e/a", "e/b", "2024-01-01T00:00:00+00:00"),
+        new_edge("new2", "e/a", "e/b", "2024-02-01T00:00:00+00:00"),
+        new_edge("new3", "e/c", "e/d", "2024-03-01T00:00:00+00:00"),
+        new_edge("new4", "e/x", "e/y", "2024-03-01T00:00:00+00:00"),
+    ]
+
+    results, success = resolve_contradictions_batch(db, "relationships", edges)
+
+    assert success
+    assert len(db.aql.calls) == 1
+    assert len(db.aql.calls[0]["candidates"]) == 4
+    assert db.edges.indexes == [["_from", "_to", "type", "invalid_at"]]
+
+    # old1 is invalidated by new1 only; new2 no longer sees it as a contradiction
+    assert [len(r) for r in results] == [1, 0, 1, 0]
+    assert results[0][0]["action"] == "invalidate_old"
+    assert len(db.edges.updates) == 1
+    patches = {doc["_key"]: doc for doc in db.edges.updates[0]}
+    assert set(patches) == {"old1", "old2"}
+    assert patches["old1"]["invalid_at"] == "2024-01-01T00:00:00+00:00"
+    assert patches["old1"]["invalidated_by"] == "new1"
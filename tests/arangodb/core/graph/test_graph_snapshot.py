@@ -0,0 +1,80 @@
+"""
+Module: test_graph_snapshot.py
+Description: Test suite for the CSR graph snapshot loader
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+- numpy: https://numpy.org/doc/stable/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import numpy as np
+
+from arangodb.core.graph.graph_snapshot import clear_graph_snapshot_cache, load_graph_snapshot
+
+
+class FakeCollection:
+    def __init__(self, db):
+        self.db = db
+
+    def revision(self):
+        return str(self.db.revision)
+
+
+class FakeAQL:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, query, bind_vars=None, batch_size=None, stream=False):
+        self.calls.append((query, bind_vars, batch_size, stream))
+        if "@@vertices" in query:
+            return iter(["v/a", "v/b", "v/c"])
+        return iter([["v/a", "v/b", 0.5], ["v/b", "v/a", 0.25], ["v/c", "v/c", 1.0], ["v/a", "other/x", 1.0]])
+
+
+class FakeDB:
+    name = "test_db"
+
+    def __init__(self):
+        self.aql = FakeAQL()
+        self.revision = 1
+
+    def collection(self, name):
+        return FakeCollection(self)
+
+
+def test_snapshot_csr_and_revision_cache():
+    """Projections are streamed into CSR and reused until a revision changes."""
+    clear_graph_snapshot_cache()
+    db = FakeDB()
+
+    snapshot = load_graph_snapshot(db, "v", "e", batch_size=1000)
+
+    assert snapshot.indptr.tolist() == [0, 1, 2, 3]
+    assert snapshot.indices.dtype == np.int32
+    # Parallel edges are summed and the self-loop counts twice
+    assert snapshot.weights.tolist() == [0.75, 0.75, 2.0]
+    assert snapshot.dropped_edges == 1
+    assert snapshot.keys() == ["a", "b", "c"]
+    assert all(stream and batch_size == 1000 for _, _, batch_size, stream in db.aql.calls)
+    assert "e[@weight_field]" in db.aql.calls[1][0]
+
+    assert load_graph_snapshot(db, "v", "e") is snapshot
+    db.revision = 2
+    assert load_graph_snapshot(db, "v", "e") is not snapshot
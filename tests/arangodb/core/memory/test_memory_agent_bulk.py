@@ -0,0 +1,169 @@
+"""
+Module: test_memory_agent_bulk.py
+Description: Test suite for MemoryAgent.store_conversations_bulk
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+import importlib
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arango.exceptions import DocumentInsertError
+
+memory_agent_module = importlib.import_module("arangodb.core.memory.memory_agent")
+MemoryAgent = memory_agent_module.MemoryAgent
+
+
+class FakeCollection:
+    def __init__(self, name, store, fail_contents=()):
+        self.name = name
+        self.store = store
+        self.fail_contents = fail_contents
+        self.insert_many_calls = 0
+
+    def insert_many(self, docs, silent=False):
+        self.insert_many_calls += 1
+        results = []
+        for doc in docs:
+            if doc.get("content") in self.fail_contents:
+                results.append(DocumentInsertError.__new__(DocumentInsertError))
+                continue
+            self.store[doc["_key"] if "_key" in doc else str(len(self.store))] = doc
+            results.append({"_key": doc.get("_key"), "_id": f"{self.name}/{doc.get('_key', len(self.store))}"})
+        return results
+
+    def delete_many(self, docs, silent=True):
+        for doc in docs:
+            self.store.pop(doc["_key"], None)
+
+
+class FakeTransaction:
+    def __init__(self, db):
+        self.db = db
+        self.committed = False
+
+    def collection(self, name):
+        return self.db.collection(name)
+
+    def commit_transaction(self):
+        self.committed = True
+        self.db.commits += 1
+
+    def abort_transaction(self):
+        pass
+
+
+class FakeDB:
+    def __init__(self, fail_contents=()):
+        self.stores = {}
+        self.collections = {}
+        self.fail_contents = fail_contents
+        self.commits = 0
+
+    def has_collection(self, name):
+        return True
+
+    def views(self):
+        return [{"name": name} for name in ("memory_view", "compacted_summaries_view", "agent_memory_view")]
+
+    def create_arangosearch_view(self, *args, **kwargs):
+        pass
+
+    def collection(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(name, self.stores.setdefault(name, {}), self.fail_contents)
+        return self.collections[name]
+
+    def begin_transaction(self, write=None, allow_implicit=True):
+        return FakeTransaction(self)
+
+
+def test_bulk_store_chunks_and_reports_errors(monkeypatch):
+    """Exchanges are embedded per chunk, written in bulk, and failures are isolated."""
+    embed_calls = []
+
+    def fake_get_embeddings(texts, batch_size=None, **kwargs):
+        embed_calls.append(len(texts))
+        return [[0.1, 0.2] for _ in texts]
+
+    monkeypatch.setattr(memory_agent_module, "get_embeddings", fake_get_embeddings)
+    db = FakeDB(fail_contents=("broken",))
+    agent = MemoryAgent(db)
+
+    def exchanges():
+        for i in range(5):
+            yield {"user_message": f"question {i}", "agent_response": "broken" if i == 3 else f"answer {i}",
+                   "conversation_id": "conv_bulk", "point_in_time": "2024-01-01T00:00:00+00:00"}
+        yield {"user_message": "missing response"}
+
+    reports = []
+    totals = agent.store_conversations_bulk(exchanges(), chunk_size=2, progress_callback=reports.append)
+
+    assert totals["processed"] == 6
+    assert totals["stored"] == 4
+    assert totals["failed"] == 2
+    assert totals["chunks"] == 3
+    assert embed_calls == [4, 4, 2]
+    assert [error["index"] for report in reports for error in report["errors"]] == [3, 5]
+
+    messages = db.stores[memory_agent_module.MEMORY_MESSAGE_COLLECTION]
+    edges = db.stores[memory_agent_module.MEMORY_EDGE_COLLECTION]
+    # The failed exchange's user message was removed again
+    assert len(messages) == 8
+    assert len(edges) == 4
+    assert all(doc["embedding"] == [0.1, 0.2] for doc in messages.values())
+    stored_ids = {f"{memory_agent_module.MEMORY_MESSAGE_COLLECTION}/{key}" for key in messages}
+    assert all(edge["_from"] in stored_ids and edge["_to"] in stored_ids for edge in edges.values())
+    assert db.commits == 3
+
+
+def test_search_at_time_only_binds_small_key_sets(monkeypatch):
+    """Small valid sets are searched by key; large ones keep the temporal predicate."""
+    from datetime import datetime, timezone
+
+    queries = []
+
+    class RecordingAQL:
+        def execute(self, query, bind_vars=None, **kwargs):
+            queries.append((query, bind_vars))
+            return iter([])
+
+    db = FakeDB()
+    db.aql = RecordingAQL()
+    agent = MemoryAgent(db)
+    when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(memory_agent_module, "snapshot_at_time", lambda *a, **kw: frozenset({"m1", "m2"}))
+    agent.search_at_time("hello", when)
+    query, bind_vars = queries[-1]
+    assert "@valid_keys" in query and sorted(bind_vars["valid_keys"]) == ["m1", "m2"]
+
+    # Oversized snapshots come back as None
+    monkeypatch.setattr(memory_agent_module, "snapshot_at_time", lambda *a, **kw: None)
+    agent.search_at_time("hello", when, conversation_id="c1")
+    query, bind_vars = queries[-1]
+    assert "valid_keys" not in bind_vars
+    assert "invalid_until > @point_in_time OR doc.invalid_until == null" in query
+    assert "doc.invalid_at == null OR doc.invalid_at > @point_in_time" in query
+    assert bind_vars["conversation_id"] == "c1"
+
+    monkeypatch.setattr(memory_agent_module, "snapshot_at_time", lambda *a, **kw: frozenset())
+    count = len(queries)
+    assert agent.search_at_time("hello", when) == []
+    assert len(queries) == count
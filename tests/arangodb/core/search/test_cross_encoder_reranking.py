@@ -0,0 +1,78 @@
+"""
+Module: test_cross_encoder_reranking.py
+Description: Test suite for batched cross-encoder reranking and the pair-score cache
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+import importlib
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import pytest
+
+# The package re-exports functions under their module's names
+reranking = importlib.import_module("arangodb.core.search.cross_encoder_reranking")
+
+
+class FakeCrossEncoder:
+    """Scores a pair by passage length so the expected order is known."""
+
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=True):
+        self.batches.append([passage for _, passage in pairs])
+        return [len(passage) / 100.0 for _, passage in pairs]
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeCrossEncoder()
+    monkeypatch.setattr(reranking, "get_cross_encoder", lambda model_name=None: fake)
+    reranking.clear_rerank_cache()
+    yield fake
+    reranking.clear_rerank_cache()
+
+
+def test_rerank_batches_pairs_and_caches_scores(model):
+    """Pairs are scored in length-sorted batches and reused from the cache."""
+    passages = [{"doc": {"_id": str(i), "content": "x" * (10 + i)}, "score": 0.1} for i in range(5)]
+
+    reranked = reranking.cross_encoder_rerank("query", passages, batch_size=2)
+
+    assert [p["doc"]["_id"] for p in reranked] == ["4", "3", "2", "1", "0"]
+    assert [len(batch) for batch in model.batches] == [2, 2, 1]
+    assert [len(passage) for passage in model.batches[0]] == [14, 13]
+    assert reranked[0]["cross_encoder_score"] == pytest.approx(0.14)
+
+    reranking.cross_encoder_rerank("query", passages, batch_size=2)
+    assert len(model.batches) == 3
+    assert reranking.get_rerank_cache_stats()["hits"] == 5
+
+    # A different query is a different pair
+    reranking.cross_encoder_rerank("other query", passages[:1])
+    assert len(model.batches) == 4
+
+
+def test_duplicate_passages_scored_once(model):
+    """Identical passage texts share one model evaluation."""
+    scores = reranking.compute_cross_encoder_scores("q", ["same text", "same text", "other"])
+
+    assert scores[0] == scores[1]
+    assert sum(len(batch) for batch in model.batches) == 2
@@ -0,0 +1,111 @@
+"""
+Module: test_embedding_snapshot.py
+Description: Test suite for memory-mapped embedding snapshots
+
+External Dependencies:
+- numpy: https://numpy.org/doc/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import pytest
+import numpy as np
+
+from arangodb.core.search.embedding_snapshot import (
+    export_embedding_snapshot,
+    load_embedding_snapshot,
+    load_matching_snapshot,
+)
+from arangodb.core.search.vector_index import VectorIndex
+
+
+class FakeAQL:
+    """Answers the state and export queries from a list of documents."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        if "COLLECT AGGREGATE" in query:
+            if not self.docs:
+                return iter([])
+            return iter([{"count": len(self.docs), "max_rev": max(d["_rev"] for d in self.docs)}])
+        fields = bind_vars["fields"]
+        return iter([
+            dict({k: v for k, v in d.items() if k in fields}, __embedding=d["embedding"])
+            for d in self.docs
+        ])
+
+
+class FakeDB:
+    def __init__(self, docs):
+        self.aql = FakeAQL(docs)
+
+
+def make_docs(n, dim=8):
+    rng = np.random.default_rng(0)
+    return [
+        {
+            "_id": f"docs/{i}",
+            "_key": str(i),
+            "_rev": f"_r{i:04d}",
+            "content": f"document {i}",
+            "embedding": rng.normal(size=dim).tolist(),
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float16"])
+def test_round_trip_is_memory_mapped(tmp_path, dtype):
+    docs = make_docs(20)
+    manifest = export_embedding_snapshot(FakeDB(docs), "docs", snapshot_dir=str(tmp_path), dtype=dtype)
+
+    assert manifest["count"] == 20
+    assert manifest["dimension"] == 8
+    assert manifest["max_rev"] == "_r0019"
+
+    snapshot = load_matching_snapshot(FakeDB(docs), "docs", snapshot_dir=str(tmp_path))
+    assert isinstance(snapshot.embeddings, np.memmap)
+    assert snapshot.embeddings.dtype == np.dtype(dtype)
+    assert snapshot.ids == [d["_id"] for d in docs]
+    assert snapshot.metadata[3]["content"] == "document 3"
+    np.testing.assert_allclose(snapshot.embeddings[5], docs[5]["embedding"], rtol=1e-2, atol=1e-3)
+
+
+def test_stale_or_incomplete_snapshot_is_rejected(tmp_path):
+    docs = make_docs(5)
+    export_embedding_snapshot(FakeDB(docs), "docs", snapshot_dir=str(tmp_path))
+
+    changed = docs[:4] + [dict(docs[4], _rev="_r9999")]
+    assert load_matching_snapshot(FakeDB(changed), "docs", snapshot_dir=str(tmp_path)) is None
+    assert load_matching_snapshot(
+        FakeDB(docs), "docs", fields_to_return=["summary"], snapshot_dir=str(tmp_path)
+    ) is None
+
+
+def test_seed_vector_index_keeps_revisions(tmp_path):
+    docs = make_docs(6)
+    export_embedding_snapshot(FakeDB(docs), "docs", snapshot_dir=str(tmp_path))
+    snapshot = load_embedding_snapshot("docs", snapshot_dir=str(tmp_path))
+
+    index = VectorIndex("docs", fields_to_return=["content"])
+    assert index.seed_from_snapshot(snapshot) == 6
+    assert index.offset_of("docs/2") == 2
+    assert index._revs[2] == "_r0002"
+    assert index.search(docs[2]["embedding"], top_k=1)[0]["id"] == "docs/2"
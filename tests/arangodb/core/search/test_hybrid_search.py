@@ -0,0 +1,190 @@
+"""
+Module: test_hybrid_search.py
+Description: Test suite for concurrent and server-side hybrid search
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import importlib
+
+from arangodb.core.search.hybrid_search import hybrid_search, run_search_legs, aql_hybrid_search
+
+# The package re-exports the function under the module's name
+hybrid_module = importlib.import_module("arangodb.core.search.hybrid_search")
+
+
+def test_legs_overlap_and_slow_leg_is_cut_off():
+    def leg(delay, value):
+        def run():
+            time.sleep(delay)
+            return [value]
+        return run
+
+    def broken():
+        raise RuntimeError("boom")
+
+    start = time.time()
+    results, timings, timed_out, errors = run_search_legs(
+        {"a": leg(0.2, "a"), "b": leg(0.2, "b"), "slow": leg(2.0, "slow"), "broken": broken},
+        timeouts={"a": 1.0, "b": 1.0, "slow": 0.3, "broken": 1.0},
+    )
+
+    assert time.time() - start < 0.6
+    assert results == {"a": ["a"], "b": ["b"]}
+    assert timed_out == ["slow"]
+    assert errors == {"broken": "boom"}
+    assert set(timings) == {"a", "b", "slow", "broken"}
+
+    # The abandoned leg finishing later must not touch the returned timings
+    slow_timing = timings["slow"]
+    time.sleep(1.8)
+    assert timings["slow"] == slow_timing
+
+
+def test_abandoned_legs_do_not_starve_later_searches():
+    release = threading.Event()
+
+    def stuck():
+        release.wait(5)
+        return []
+
+    try:
+        for _ in range(10):
+            run_search_legs({"stuck": stuck}, timeouts=0.01)
+        results, _, timed_out, _ = run_search_legs({"fast": lambda: ["ok"]}, timeouts=0.5)
+    finally:
+        release.set()
+
+    assert results == {"fast": ["ok"]} and timed_out == []
+
+
+def test_hybrid_search_fuses_partial_results(monkeypatch):
+    doc = {"_key": "1", "_id": "docs/1", "content": "x"}
+    monkeypatch.setattr(hybrid_module, "bm25_search",
+                        lambda **kwargs: {"results": [{"doc": doc, "score": 1.0}]})
+    # The semantic leg blocks until released, then fails without reaching the database
+    release = threading.Event()
+    monkeypatch.setattr(hybrid_module, "get_embedding", lambda text: release.wait(5) and None)
+
+    try:
+        result = hybrid_search(None, "query", output_format="json",
+                               leg_timeouts={"bm25": 1.0, "semantic": 0.1})
+    finally:
+        release.set()
+
+    assert [r["doc"]["_key"] for r in result["results"]] == ["1"]
+    assert result["timed_out_legs"] == ["semantic"]
+    assert result["partial"] is True
+    assert set(result["leg_timings"]) == {"bm25", "semantic"}
+
+
+def test_leg_error_dict_marks_response_partial(monkeypatch):
+    doc = {"_key": "1", "_id": "docs/1", "content": "x"}
+    monkeypatch.setattr(hybrid_module, "bm25_search",
+                        lambda **kwargs: {"results": [{"doc": doc, "score": 1.0}]})
+    monkeypatch.setattr(hybrid_module, "get_embedding", lambda text: [0.1, 0.2])
+    # The search functions report failures as an error dict instead of raising
+    monkeypatch.setattr(hybrid_module, "safe_semantic_search",
+                        lambda **kwargs: {"results": [], "error": "vector index missing"})
+
+    result = hybrid_search(None, "query", output_format="json", use_cache=False)
+
+    assert [r["doc"]["_key"] for r in result["results"]] == ["1"]
+    assert "vector index missing" in result["leg_errors"]["semantic"]
+    assert result["partial"] is True
+
+def test_degraded_response_is_not_cached(monkeypatch):
+    from arangodb.core.search.result_cache import MemoryCacheBackend, SearchResultCache, set_search_cache
+
+    class FakeCollection:
+        def revision(self):
+            return "1"
+
+    class FakeDB:
+        name = "test_db"
+
+        def collection(self, name):
+            return FakeCollection()
+
+    doc = {"_key": "1", "_id": "docs/1", "content": "x"}
+    bm25_calls = []
+
+    def bm25(**kwargs):
+        bm25_calls.append(kwargs["query_text"])
+        return {"results": [{"doc": doc, "score": 1.0}]}
+
+    semantic = {"results": [], "error": "vector index missing"}
+    monkeypatch.setattr(hybrid_module, "bm25_search", bm25)
+    monkeypatch.setattr(hybrid_module, "get_embedding", lambda text: [0.1, 0.2])
+    monkeypatch.setattr(hybrid_module, "safe_semantic_search", lambda **kwargs: semantic)
+    set_search_cache(SearchResultCache(backend=MemoryCacheBackend(max_entries=8), ttl=60, enabled=True))
+    try:
+        db = FakeDB()
+        # BM25-only after a semantic failure must not be served as a complete answer
+        first = hybrid_search(db, "query", output_format="json")
+        second = hybrid_search(db, "query", output_format="json")
+        assert first["partial"] is True and not second.get("cache_hit")
+        assert len(bm25_calls) == 2
+
+        semantic = {"results": [{"doc": doc, "similarity_score": 0.9}]}
+        hybrid_search(db, "query", output_format="json")
+        assert hybrid_search(db, "query", output_format="json")["cache_hit"] is True
+        assert len(bm25_calls) == 3
+    finally:
+        set_search_cache(None)
+
+def test_search_with_config_keeps_semantic_leg_budget(monkeypatch):
+    from arangodb.core.search.search_config import SearchConfig, SearchMethod
+
+    captured = {}
+    monkeypatch.setattr(hybrid_module, "hybrid_search", lambda **kwargs: captured.update(kwargs) or {})
+
+    hybrid_module.search_with_config(None, "query", SearchConfig(preferred_method=SearchMethod.HYBRID, timeout_ms=2000))
+    assert captured["leg_timeouts"] == {
+        "bm25": 2.0, "semantic": hybrid_module.DEFAULT_LEG_TIMEOUTS["semantic"], "graph": 2.0
+    }
+
+    hybrid_module.search_with_config(None, "query", SearchConfig(preferred_method=SearchMethod.HYBRID, timeout_ms=30000))
+    assert captured["leg_timeouts"]["semantic"] == 30.0
+
+def test_server_side_mode_is_one_round_trip():
+    class FakeAQL:
+        def __init__(self):
+            self.calls = []
+
+        def execute(self, query, bind_vars=None, **kwargs):
+            self.calls.append((query, bind_vars))
+            return iter([{"total": 3, "results": [{"doc": {"_key": "1"}, "hybrid_score": 0.02}]}])
+
+    class FakeDB:
+        aql = FakeAQL()
+
+    result = aql_hybrid_search(FakeDB, "query", query_embedding=[0.1, 0.2], tag_list=["a"], top_n=1)
+
+    assert len(FakeDB.aql.calls) == 1
+    query, bind_vars = FakeDB.aql.calls[0]
+    assert "APPROX_NEAR_COSINE" in query and "BM25(doc)" in query
+    assert "@tags ANY IN doc.tags" in query
+    assert bind_vars["top_n"] == 1 and bind_vars["tags"] == ["a"]
+    assert result["total"] == 3
+    assert result["search_engine"] == "hybrid-aql-rrf"
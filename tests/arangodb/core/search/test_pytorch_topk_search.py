@@ -0,0 +1,87 @@
+"""
+Module: test_pytorch_topk_search.py
+Description: Test suite for the vectorised top-k search kernel
+
+External Dependencies:
+- numpy: https://numpy.org/doc/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import pytest
+import numpy as np
+
+from arangodb.core.search import pytorch_search_utils
+from arangodb.core.search.pytorch_search_utils import pytorch_topk_search, pytorch_vector_search
+
+
+def brute_force(embeddings, query, threshold, top_k):
+    normed = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    scores = normed @ (query / np.linalg.norm(query))
+    order = [i for i in np.argsort(-scores) if scores[i] >= threshold]
+    return order[:top_k], scores
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(7)
+    embeddings = rng.normal(size=(1000, 32)).astype(np.float32)
+    ids = [f"docs/{i}" for i in range(len(embeddings))]
+    metadata = [{"_key": str(i)} for i in range(len(embeddings))]
+    queries = rng.normal(size=(3, 32)).astype(np.float32)
+    return embeddings, ids, metadata, queries
+
+
+@pytest.mark.parametrize("use_torch", [True, False])
+def test_matches_brute_force_for_query_matrix(corpus, monkeypatch, use_torch):
+    embeddings, ids, metadata, queries = corpus
+    if use_torch and not pytorch_search_utils.HAS_TORCH:
+        pytest.skip("PyTorch not installed")
+    monkeypatch.setattr(pytorch_search_utils, "HAS_TORCH", use_torch)
+
+    results, _ = pytorch_topk_search(
+        embeddings, queries, ids, metadata, threshold=0.1, top_k=7, batch_size=64
+    )
+
+    assert len(results) == len(queries)
+    for query, hits in zip(queries, results):
+        expected, scores = brute_force(embeddings, query, 0.1, 7)
+        assert [h["id"] for h in hits] == [ids[i] for i in expected]
+        for hit, idx in zip(hits, expected):
+            assert hit["similarity"] == pytest.approx(scores[idx], abs=1e-4)
+
+
+@pytest.mark.parametrize("use_torch", [True, False])
+def test_threshold_masks_all_results(corpus, monkeypatch, use_torch):
+    embeddings, ids, metadata, queries = corpus
+    if use_torch and not pytorch_search_utils.HAS_TORCH:
+        pytest.skip("PyTorch not installed")
+    monkeypatch.setattr(pytorch_search_utils, "HAS_TORCH", use_torch)
+
+    results, _ = pytorch_topk_search(embeddings, queries[0], ids, metadata, threshold=1.01, top_k=5)
+    assert results == [[]]
+
+
+def test_vector_search_wrapper_returns_single_list(corpus):
+    embeddings, ids, metadata, queries = corpus
+    results, _ = pytorch_vector_search(
+        embeddings, queries[0].tolist(), ids, metadata, threshold=0.0, top_k=3, show_progress=False
+    )
+    expected, _ = brute_force(embeddings, queries[0], 0.0, 3)
+    assert [r["id"] for r in results] == [ids[i] for i in expected]
+    assert results[0]["metadata"] == metadata[expected[0]]
@@ -0,0 +1,73 @@
+"""
+Module: test_quantization.py
+Description: Test suite for quantized embedding storage and re-scored search
+
+External Dependencies:
+- numpy: https://numpy.org/doc/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import pytest
+import numpy as np
+
+from arangodb.core.search.pytorch_search_utils import pytorch_topk_search
+from arangodb.core.search.quantization import quantize_int8, quantized_topk_search
+from arangodb.core.search.vector_index import VectorIndex
+
+
+@pytest.fixture
+def corpus():
+    rng = np.random.default_rng(3)
+    embeddings = rng.normal(size=(1500, 48)).astype(np.float32)
+    ids = [f"docs/{i}" for i in range(len(embeddings))]
+    metadata = [{"_key": str(i)} for i in range(len(embeddings))]
+    queries = rng.normal(size=(4, 48)).astype(np.float32)
+    return embeddings, ids, metadata, queries
+
+
+def test_int8_rescored_search_matches_float32(corpus):
+    embeddings, ids, metadata, queries = corpus
+    codes, scales = quantize_int8(embeddings)
+
+    exact, _ = pytorch_topk_search(embeddings, queries, ids, metadata, threshold=0.2, top_k=10)
+    approx, _ = quantized_topk_search(
+        codes, queries, ids, metadata, threshold=0.2, top_k=10, scales=scales, exact_embeddings=embeddings
+    )
+
+    for expected, hits in zip(exact, approx):
+        assert [h["id"] for h in hits] == [h["id"] for h in expected]
+        for hit, ref in zip(hits, expected):
+            assert hit["similarity"] == pytest.approx(ref["similarity"], abs=1e-5)
+
+
+@pytest.mark.parametrize("quantization", ["float16", "int8"])
+def test_quantized_index_survives_removal(corpus, quantization):
+    embeddings, ids, metadata, _ = corpus
+    index = VectorIndex("docs", quantization=quantization, initial_capacity=4)
+    for doc_id, vector in zip(ids[:50], embeddings[:50]):
+        index.add(doc_id, vector)
+    index.remove("docs/3")
+
+    assert index.embeddings.dtype == np.dtype(quantization)
+    assert index.embeddings.nbytes < embeddings[:49].nbytes
+
+    lookup = lambda offsets: embeddings[[int(index.ids[i].split("/")[1]) for i in offsets]]
+    hit = index.search(embeddings[49], top_k=1, exact_lookup=lookup)[0]
+    assert hit["id"] == "docs/49"
+    assert hit["similarity"] == pytest.approx(1.0, abs=1e-5)
@@ -0,0 +1,66 @@
+"""
+Module: test_readiness_registry.py
+Description: Test suite for the semantic search readiness registry
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+import importlib
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.core.db_operations import create_document
+from arangodb.core.search.readiness_registry import invalidate_collection_readiness, is_collection_ready
+
+# The package re-exports the function under the module's name
+semantic_module = importlib.import_module("arangodb.core.search.semantic_search")
+
+
+class FakeCollection:
+    def insert(self, document, return_new=True):
+        return {"new": dict(document, _id=f"docs/{document['_key']}")}
+
+
+class FakeDB:
+    name = "test_db"
+
+    def collection(self, name):
+        return FakeCollection()
+
+
+def test_validation_runs_once_until_a_write(monkeypatch):
+    checks = []
+
+    def fake_prepare(db, collection_name, embedding_field, fix_embeddings):
+        checks.append(collection_name)
+        return True, {"status": {"message": "ready"}}
+
+    monkeypatch.setattr(semantic_module, "prepare_collection_for_search", fake_prepare)
+    invalidate_collection_readiness()
+    db = FakeDB()
+
+    for _ in range(3):
+        # An invalid query vector stops the search right after validation
+        semantic_module.semantic_search(db, [], collections=["docs"], use_cache=False)
+    assert checks == ["docs"]
+    assert is_collection_ready(db, "docs")
+
+    create_document(db, "docs", {"content": "new"})
+    assert not is_collection_ready(db, "docs")
+    semantic_module.semantic_search(db, [], collections=["docs"], use_cache=False)
+    assert checks == ["docs", "docs"]
@@ -0,0 +1,130 @@
+"""
+Module: test_result_cache.py
+Description: Test suite for the search result cache
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import pytest
+
+from arangodb.core.search.result_cache import (
+    SearchResultCache,
+    MemoryCacheBackend,
+    cache_search_results,
+    set_search_cache,
+)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.rev = 1
+
+    def revision(self):
+        return str(self.rev)
+
+
+class FakeDB:
+    def __init__(self):
+        self.docs = FakeCollection()
+        self.edges = FakeCollection()
+
+    def collection(self, name):
+        return self.edges if name == "edges" else self.docs
+
+
+@pytest.fixture
+def cache():
+    cache = SearchResultCache(backend=MemoryCacheBackend(max_entries=8), ttl=60, enabled=True)
+    set_search_cache(cache)
+    yield cache
+    set_search_cache(None)
+
+
+def make_search(calls):
+    @cache_search_results("demo", default_collections=["docs"])
+    def search(db, query_text, collections=None, top_n=10, output_format="table"):
+        calls.append(query_text)
+        if query_text == "broken":
+            return {"results": [], "error": "boom"}
+        return {"results": [{"doc": {"_key": query_text}}], "total": 1}
+    return search
+
+
+def test_normalized_repeat_hits_and_write_invalidates(cache):
+    calls = []
+    search = make_search(calls)
+    db = FakeDB()
+
+    first = search(db, "Graph  Search")
+    first["results"].clear()  # callers may mutate what they get back
+    hit = search(db, " graph search ")
+    assert calls == ["Graph  Search"]
+    assert hit["cache_hit"] is True and hit["results"] == [{"doc": {"_key": "Graph  Search"}}]
+
+    search(db, "graph search", top_n=5)
+    db.docs.rev += 1
+    search(db, "graph search")
+    assert len(calls) == 3
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+    assert stats["by_function"]["demo"] == {"hits": 1, "misses": 3}
+
+
+def test_errors_and_opt_out_bypass_cache(cache):
+    calls = []
+    search = make_search(calls)
+    db = FakeDB()
+
+    search(db, "broken")
+    search(db, "broken")
+    search(db, "fine", use_cache=False)
+    search(db, "fine", use_cache=False)
+    assert calls == ["broken", "broken", "fine", "fine"]
+
+
+def test_dependent_collection_writes_invalidate(cache):
+    calls = []
+
+    @cache_search_results(
+        "demo", default_collections=["docs"],
+        dependent_collections=lambda params: ["edges"] if params["use_graph"] else []
+    )
+    def search(db, query_text, collections=None, use_graph=False):
+        calls.append(use_graph)
+        return {"results": [], "total": 0}
+
+    db = FakeDB()
+    search(db, "q", use_graph=True)
+    search(db, "q")
+    db.edges.rev += 1
+    search(db, "q", use_graph=True)
+    search(db, "q")
+    assert calls == [True, False, True]
+
+
+def test_entries_expire_after_ttl():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", {"x": 1}, ttl=0.01)
+    time.sleep(0.02)
+    assert backend.get("a") is None
+    assert backend.expirations == 1
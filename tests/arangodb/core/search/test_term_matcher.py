@@ -0,0 +1,62 @@
+"""
+Module: test_term_matcher.py
+Description: Test suite for the Aho-Corasick glossary term matcher
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.core.search.term_matcher import TermMatcher
+
+
+def test_leftmost_longest_whole_word_matches():
+    """Longer terms win at the same start and partial words never match."""
+    matcher = TermMatcher(["primary color", "color", "RGB", "col"])
+
+    matches = matcher.find("The Primary Color and RGB color model, not colors or rgbs.")
+
+    assert matches == [(4, 17, "primary color"), (22, 25, "RGB"), (26, 31, "color")]
+
+
+def test_terms_with_punctuation_follow_regex_boundaries():
+    matcher = TermMatcher(["c++", "node.js"])
+
+    text = "c++ and node.js, but not xnode.js"
+    expected = [(m.start(), m.end()) for m in re.finditer(r"\bnode\.js\b|\bc\+\+\b", text)]
+
+    assert [(s, e) for s, e, _ in matcher.find_all(text)] == expected
+
+
+def test_find_all_agrees_with_per_term_regex():
+    """Every occurrence found by a \\b...\\b regex per term is found in one pass."""
+    rng = random.Random(7)
+    words = ["red", "blue", "green", "light", "dark", "blue green", "light blue", "re"]
+    text = " ".join(rng.choice(words + ["x", "redx", "_blue"]) for _ in range(300))
+    matcher = TermMatcher(words)
+
+    expected = sorted(
+        (m.start(), m.end(), term)
+        for term in words
+        for m in re.finditer(r"\b" + re.escape(term) + r"\b", text)
+    )
+
+    assert sorted(matcher.find_all(text)) == expected
@@ -0,0 +1,142 @@
+"""
+Module: test_vector_index.py
+Description: Test suite for the resident vector index
+
+External Dependencies:
+- numpy: https://numpy.org/doc/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import pytest
+import numpy as np
+
+from arangodb.core.search.vector_index import VectorIndex
+
+
+class FakeCollection:
+    def __init__(self, store):
+        self.store = store
+
+    def revision(self):
+        return str(self.store["revision"])
+
+
+class FakeAQL:
+    """Answers the two queries issued by VectorIndex.refresh from a dict of documents."""
+
+    def __init__(self, store):
+        self.store = store
+        self.fetched = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        docs = self.store["docs"]
+        if "DOCUMENT(id)" in query:
+            self.fetched.extend(bind_vars["ids"])
+            return iter([
+                {k: v for k, v in docs[i].items() if k in bind_vars["fields"]}
+                for i in bind_vars["ids"] if i in docs
+            ])
+        return iter([[d["_id"], d["_rev"]] for d in docs.values()])
+
+
+class FakeDB:
+    name = "test_db"
+
+    def __init__(self, docs):
+        self.store = {"docs": {d["_id"]: d for d in docs}, "revision": 1}
+        self.aql = FakeAQL(self.store)
+
+    def collection(self, name):
+        return FakeCollection(self.store)
+
+    def write(self, doc=None, delete=None):
+        if doc is not None:
+            self.store["docs"][doc["_id"]] = doc
+        if delete is not None:
+            del self.store["docs"][delete]
+        self.store["revision"] += 1
+
+
+def make_doc(i, rev="1", vector=None):
+    return {
+        "_id": f"docs/{i}",
+        "_key": str(i),
+        "_rev": rev,
+        "content": f"document {i}",
+        "embedding": vector if vector is not None else np.eye(4)[i % 4].tolist(),
+    }
+
+
+def test_add_remove_keeps_rows_contiguous():
+    index = VectorIndex("docs", initial_capacity=2)
+    for i in range(5):
+        index.add(f"docs/{i}", np.eye(4)[i % 4], {"_key": str(i)})
+
+    assert len(index) == 5
+    assert index.embeddings.shape == (5, 4)
+
+    assert index.remove("docs/1")
+    assert not index.remove("docs/1")
+    assert len(index) == 4
+    # The last row was moved into the freed slot
+    assert index.offset_of("docs/4") == 1
+    assert index.ids[1] == "docs/4"
+    np.testing.assert_array_equal(index.embeddings[1], np.eye(4)[0])
+
+
+def test_add_rejects_dimension_mismatch():
+    index = VectorIndex("docs")
+    index.add("docs/0", [1.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        index.add("docs/1", [1.0, 0.0])
+
+
+def test_refresh_only_fetches_changed_documents():
+    db = FakeDB([make_doc(i) for i in range(3)])
+    index = VectorIndex("docs", fields_to_return=["content"])
+
+    stats = index.refresh(db)
+    assert stats["added"] == 3
+    assert len(index) == 3
+    assert "embedding" not in index.metadata[0]
+
+    # Unchanged collection revision short-circuits the sync
+    db.aql.fetched.clear()
+    assert index.refresh(db)["skipped"]
+    assert db.aql.fetched == []
+
+    db.write(doc=make_doc(1, rev="2", vector=[0.0, 0.0, 0.0, 1.0]))
+    db.write(delete="docs/0")
+    db.write(doc=make_doc(7))
+    stats = index.refresh(db)
+
+    assert sorted(db.aql.fetched) == ["docs/1", "docs/7"]
+    assert (stats["added"], stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 1, 1)
+    assert "docs/0" not in index
+    np.testing.assert_array_equal(index.embeddings[index.offset_of("docs/1")], [0, 0, 0, 1])
+
+
+def test_search_returns_best_match_first():
+    index = VectorIndex("docs")
+    for i in range(4):
+        index.add(f"docs/{i}", np.eye(4)[i], {"_key": str(i)})
+
+    results = index.search([0.1, 0.0, 0.9, 0.0], top_k=2, threshold=0.0)
+    assert results[0]["id"] == "docs/2"
+    assert len(results) == 2
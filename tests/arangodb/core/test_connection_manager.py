@@ -0,0 +1,103 @@
+"""
+Module: test_connection_manager.py
+Description: Test suite for pooled connections and cached schema checks
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.core.connection_manager import ConnectionManager
+
+
+class FakeDB:
+    def __init__(self, name="memory_bank", db_id="101"):
+        self.name = name
+        self.db_id = db_id
+        self.property_calls = 0
+
+    def properties(self):
+        self.property_calls += 1
+        return {"id": self.db_id, "name": self.name}
+
+
+class CountingSetup:
+    def __init__(self, result=True):
+        self.calls = 0
+        self.result = result
+
+    def __call__(self, db):
+        self.calls += 1
+        return self.result
+
+
+def test_schema_checks_run_once_per_process(tmp_path):
+    manager = ConnectionManager(schema_cache_dir=str(tmp_path))
+    db = FakeDB()
+    setup = CountingSetup()
+
+    assert manager.ensure_schema(db, "cli", setup)
+    assert manager.ensure_schema(db, "cli", setup)
+    assert manager.ensure_schema(db, "cli", setup)
+
+    assert setup.calls == 1
+    assert db.property_calls == 1
+
+
+def test_fingerprint_marker_is_shared_across_processes(tmp_path):
+    setup = CountingSetup()
+    ConnectionManager(schema_cache_dir=str(tmp_path)).ensure_schema(FakeDB(), "cli", setup)
+
+    ConnectionManager(schema_cache_dir=str(tmp_path)).ensure_schema(FakeDB(), "cli", setup)
+    assert setup.calls == 1
+
+    # A recreated database has a new id and is checked again
+    ConnectionManager(schema_cache_dir=str(tmp_path)).ensure_schema(FakeDB(db_id="202"), "cli", setup)
+    assert setup.calls == 2
+
+
+def test_failed_setup_is_retried(tmp_path):
+    manager = ConnectionManager(schema_cache_dir=str(tmp_path))
+    db = FakeDB()
+    failing = CountingSetup(result=False)
+
+    assert not manager.ensure_schema(db, "cli", failing)
+    assert not manager.ensure_schema(db, "cli", failing)
+    assert failing.calls == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disabled_cache_always_runs_setup(tmp_path):
+    manager = ConnectionManager(schema_cache_dir=str(tmp_path), schema_cache_enabled=False)
+    setup = CountingSetup()
+
+    manager.ensure_schema(FakeDB(), "cli", setup)
+    manager.ensure_schema(FakeDB(), "cli", setup)
+
+    assert setup.calls == 2
+
+
+def test_clients_are_pooled_per_host():
+    manager = ConnectionManager(pool_size=4)
+
+    client = manager.get_client("http://localhost:8529")
+
+    assert manager.get_client("http://localhost:8529") is client
+    assert manager.get_client("http://other:8529") is not client
+    manager.close()
@@ -0,0 +1,178 @@
+"""
+Module: test_temporal_operations.py
+Description: Test suite for interval-indexed temporal queries and snapshots
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.core import temporal_operations
+from arangodb.core.temporal_operations import (
+    OPEN_INTERVAL_END,
+    create_temporal_indexes,
+    ensure_temporal_fields,
+    iter_valid_at,
+    point_in_time_query,
+    snapshot_at_time,
+)
+
+
+def ts(month):
+    return datetime(2024, month, 1, tzinfo=timezone.utc)
+
+
+def make_docs():
+    docs = []
+    for i in range(7):
+        doc = ensure_temporal_fields({"_key": f"k{i}", "group": "a" if i % 2 else "b"}, ts(1 + i % 3))
+        docs.append(doc)
+    # Invalidated before the query time
+    docs[0]["invalid_at"] = docs[0]["invalid_until"] = ts(2).isoformat()
+    return docs
+
+
+class FakeCollection:
+    def __init__(self):
+        self.indexes = []
+
+    def add_persistent_index(self, fields, **kwargs):
+        self.indexes.append(fields)
+
+    def revision(self):
+        return "1"
+
+
+class FakeAQL:
+    """Evaluates the temporal predicates and keyset cursor in Python."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.calls = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        self.calls.append((query, dict(bind_vars or {})))
+        bind_vars = bind_vars or {}
+        if "UPDATE doc" in query:
+            return iter([0])
+        t = bind_vars["timestamp"]
+        rows = [
+            d for d in self.docs
+            if d["valid_at"] <= t
+            and (d.get("invalid_until") is None or t < d["invalid_until"])
+            and (d["invalid_at"] is None or d["invalid_at"] > t)
+            and all(d["group"] == v for k, v in bind_vars.items() if k.startswith("filter_"))
+        ]
+        rows.sort(key=lambda d: (d["valid_at"], d["_key"]))
+        if "after_key" in bind_vars:
+            after = (bind_vars["after_valid_at"], bind_vars["after_key"])
+            rows = [d for d in rows if (d["valid_at"], d["_key"]) > after]
+        if "RETURN doc._key" in query:
+            return iter([d["_key"] for d in rows][:bind_vars.get("key_limit")])
+        return iter(rows[:bind_vars["page_size"]])
+
+
+class FakeDB:
+    name = "test_db"
+
+    def __init__(self, docs):
+        self.aql = FakeAQL(docs)
+        self.coll = FakeCollection()
+
+    def collection(self, name):
+        return self.coll
+
+
+def setup_function():
+    temporal_operations.clear_temporal_snapshot_cache()
+
+
+def test_open_documents_get_sentinel():
+    doc = ensure_temporal_fields({"name": "x"}, ts(1))
+    assert doc["invalid_at"] is None
+    assert doc["invalid_until"] == OPEN_INTERVAL_END
+
+
+def test_keyset_pages_are_stable_and_complete():
+    db = FakeDB(make_docs())
+
+    keys = [d["_key"] for d in iter_valid_at(db, "things", ts(6), page_size=2)]
+
+    assert keys == ["k3", "k6", "k1", "k4", "k2", "k5"]
+    assert all("invalid_until > @timestamp" in q for q, _ in db.aql.calls)
+
+
+def test_documents_without_invalid_until_are_still_matched():
+    docs = make_docs()
+    # Written by code that never calls ensure_temporal_fields
+    docs.append({"_key": "legacy", "group": "a", "valid_at": ts(1).isoformat(), "invalid_at": None})
+    docs.append({"_key": "legacy_closed", "group": "a", "valid_at": ts(1).isoformat(), "invalid_at": ts(2).isoformat()})
+    db = FakeDB(docs)
+
+    keys = [d["_key"] for d in point_in_time_query(db, "things", ts(6))]
+
+    assert "legacy" in keys and "legacy_closed" not in keys
+    # Reads neither create indexes nor rewrite the collection
+    assert db.coll.indexes == []
+    assert not any("UPDATE" in q for q, _ in db.aql.calls)
+
+
+def test_create_temporal_indexes_backfills_invalid_until():
+    db = FakeDB(make_docs())
+
+    create_temporal_indexes(db, "things")
+
+    assert ["valid_at", "invalid_until"] in db.coll.indexes
+    assert any("UPDATE doc" in q for q, _ in db.aql.calls)
+
+
+def test_point_in_time_query_respects_limit_and_filters():
+    db = FakeDB(make_docs())
+
+    results = point_in_time_query(db, "things", ts(6), filters={"group": "a"}, limit=2)
+
+    assert [d["_key"] for d in results] == ["k3", "k1"]
+
+
+def test_snapshot_cached_until_revision_changes():
+    db = FakeDB(make_docs())
+
+    first = snapshot_at_time(db, "things", ts(6))
+    queries = len(db.aql.calls)
+    second = snapshot_at_time(db, "things", ts(6))
+
+    assert first == second == frozenset({"k1", "k2", "k3", "k4", "k5", "k6"})
+    assert len(db.aql.calls) == queries
+
+    db.coll.revision = lambda: "2"
+    snapshot_at_time(db, "things", ts(6))
+    assert len(db.aql.calls) == queries + 1
+
+
+def test_snapshot_with_max_keys_reports_large_sets_as_none():
+    db = FakeDB(make_docs())
+
+    assert snapshot_at_time(db, "things", ts(6), max_keys=10) == frozenset({"k1", "k2", "k3", "k4", "k5", "k6"})
+    assert snapshot_at_time(db, "things", ts(6), max_keys=3) is None
+    # The read stops after max_keys + 1 keys, and the oversized result is cached
+    assert db.aql.calls[-1][1]["key_limit"] == 4
+    queries = len(db.aql.calls)
+    assert snapshot_at_time(db, "things", ts(6), max_keys=3) is None
+    assert len(db.aql.calls) == queries
@@ -0,0 +1,71 @@
+"""
+Module: test_embedding_cache.py
+Description: Test suite for batched embeddings and the embedding cache
+
+External Dependencies:
+- numpy: https://numpy.org/doc/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import numpy as np
+
+from arangodb.core.utils import embedding_utils
+from arangodb.core.utils.embedding_utils import EmbeddingCache, get_embeddings
+
+
+def test_lru_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2, db_path=None)
+    cache.put_many("m", ["a", "b"], [[1.0], [2.0]])
+    cache.get_many("m", ["a"])
+    cache.put_many("m", ["c"], [[3.0]])
+
+    assert cache.get_many("m", ["a", "b", "c"]) == [[1.0], None, [3.0]]
+    assert cache.get_many("other-model", ["a"]) == [None]
+
+
+def test_disk_store_survives_new_instance(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite")
+    EmbeddingCache(max_entries=10, db_path=path).put_many("m", ["hello"], [[0.5, 0.25]])
+
+    fresh = EmbeddingCache(max_entries=10, db_path=path)
+    assert fresh.get_many("m", ["hello", "bye"]) == [[0.5, 0.25], None]
+    assert fresh.stats()["hits"] == 1
+
+
+def test_get_embeddings_embeds_each_unique_text_once(monkeypatch):
+    calls = []
+
+    def fake_embed_batch(texts, batch_size):
+        calls.append(list(texts))
+        return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+
+    monkeypatch.setattr(embedding_utils, "_embedding_cache", EmbeddingCache(max_entries=100, db_path=None))
+    monkeypatch.setattr(embedding_utils, "has_transformers", True)
+    monkeypatch.setattr(embedding_utils, "_model", object())
+    monkeypatch.setattr(embedding_utils, "_tokenizer", object())
+    monkeypatch.setattr(embedding_utils, "_embed_batch", fake_embed_batch)
+
+    first = get_embeddings(["aa", "b", "aa"])
+    assert calls == [["aa", "b"]]
+    assert first[0] == first[2] == [2.0, 1.0]
+
+    # Re-embedding unchanged text costs nothing
+    second = get_embeddings(["b", "aa", "ccc"])
+    assert calls[-1] == ["ccc"]
+    assert second[:2] == [[1.0, 1.0], [2.0, 1.0]]
@@ -0,0 +1,129 @@
+"""
+Module: test_text_chunker.py
+Description: Test suite for the streaming multi-document chunking pipeline and token count cache
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+- spacy: https://spacy.io/api
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+import types
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+pytest.importorskip("tiktoken")
+
+from arangodb.core.utils.text_chunker import TextChunker, TokenCountCache
+
+DOCUMENT = """
+**1. Introduction**
+
+This is a sample document. It has multiple sections with different levels.
+
+**1.1 Purpose**
+
+The purpose of this document is to verify chunking. Sections keep their hierarchy.
+
+**2. Features**
+
+The chunker has several features. """ + "Long sentences get split into word chunks " * 20 + """.
+"""
+
+# Deterministic stand-in for a tiktoken encoding: one token per word
+WORD_ENCODING = types.SimpleNamespace(encode=lambda text: text.split())
+
+
+def make_chunker(nlp=None, **kwargs):
+    chunker = TextChunker(max_tokens=40, spacy_model="not_installed_model", **kwargs)
+    chunker.encoding = WORD_ENCODING
+    chunker.nlp = nlp
+    return chunker
+
+
+def sentencizer():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+def without_dates(chunks):
+    return [{k: v for k, v in chunk.items() if k != "extraction_date"} for chunk in chunks]
+
+
+@pytest.mark.parametrize("nlp_factory", [lambda: None, sentencizer])
+def test_chunk_documents_matches_chunk_text_per_document(nlp_factory):
+    nlp = nlp_factory()
+    documents = [
+        {"text": DOCUMENT, "repo_link": "https://example.com/a", "file_path": "a.md"},
+        ("Plain text without headers. Second sentence.", "https://example.com/b", "b.md"),
+        DOCUMENT.replace("Introduction", "Overview"),
+    ]
+
+    expected = []
+    for document in documents:
+        if isinstance(document, dict):
+            args = (document["text"], document["repo_link"], document["file_path"])
+        elif isinstance(document, tuple):
+            args = document
+        else:
+            args = (document, "", "")
+        expected.extend(make_chunker(nlp).chunk_text(*args))
+
+    streamed = list(make_chunker(nlp).chunk_documents(iter(documents), batch_size=2))
+
+    assert without_dates(streamed) == without_dates(expected)
+    assert all(chunk["code_token_count"] <= 40 for chunk in streamed)
+
+
+def test_chunk_documents_is_lazy():
+    consumed = []
+
+    def documents():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"**1. Doc {i}**\n\nBody of document {i}."
+
+    stream = make_chunker(sentencizer()).chunk_documents(documents(), batch_size=4)
+    first = next(stream)
+
+    assert first["section_path"] == ["1 Doc 0"]
+    assert len(consumed) < 20
+
+
+def test_token_count_cache_is_bounded_lru():
+    cache = TokenCountCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_count_tokens_uses_bounded_cache():
+    chunker = make_chunker(token_cache_size=3)
+    for word in ["one two", "three", "four five six", "seven"]:
+        chunker.count_tokens(word)
+
+    assert len(chunker._token_count_cache) == 3
+    assert chunker.count_tokens("four five six") == 3
+    assert chunker._token_count_cache.hits == 1
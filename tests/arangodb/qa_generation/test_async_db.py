@@ -0,0 +1,194 @@
+"""
+Module: test_async_db.py
+Description: Test suite for executor-offloaded database access in the Q&A pipeline
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.qa_generation.async_db import AsyncDatabase
+
+
+class SlowAQL:
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = []
+
+    def execute(self, query, bind_vars=None, batch_size=None):
+        self.calls.append(bind_vars)
+        time.sleep(self.delay)
+        return iter([{"query": query, **(bind_vars or {})}])
+
+
+class FakeCollection:
+    def __init__(self, db):
+        self.db = db
+
+    def add_persistent_index(self, fields, unique=False, sparse=False):
+        self.db.index_calls += 1
+        raise RuntimeError("index exists")
+
+
+class FakeDB:
+    def __init__(self, delay=0.0):
+        self.aql = SlowAQL(delay)
+        self.index_calls = 0
+
+    def collection(self, name):
+        return FakeCollection(self)
+
+
+class Wrapper:
+    """Stands in for DatabaseOperations, which exposes the handle as `.db`."""
+
+    def __init__(self, db):
+        self.db = db
+
+
+def test_queries_do_not_block_the_event_loop():
+    adb = AsyncDatabase(FakeDB(delay=0.2), max_workers=2)
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(ticker())
+        start = time.perf_counter()
+        rows = await asyncio.gather(adb.query("Q", {"doc_id": "a"}), adb.query("Q", {"doc_id": "b"}))
+        elapsed = time.perf_counter() - start
+        task.cancel()
+        return rows, ticks, elapsed
+
+    rows, ticks, elapsed = asyncio.run(run())
+    adb.close()
+
+    assert [r[0]["doc_id"] for r in rows] == ["a", "b"]
+    # Both queries ran concurrently and the loop kept ticking meanwhile
+    assert elapsed < 0.35
+    assert ticks >= 5
+
+
+def test_wrapper_is_unwrapped_and_index_attempted_once():
+    db = FakeDB()
+    adb = AsyncDatabase(Wrapper(db))
+
+    async def run():
+        for _ in range(3):
+            await adb.ensure_persistent_index("document_objects", ["document_id", "_type"])
+        return await adb.query("Q")
+
+    rows = asyncio.run(run())
+    adb.close()
+
+    assert rows == [{"query": "Q"}]
+    assert db.index_calls == 1
+
+
+
+def make_generator():
+    from arangodb.qa_generation.generator import QAGenerator
+
+    return QAGenerator(Wrapper(FakeDB()))
+
+
+def test_generate_for_documents_prefetches_and_collects_failures():
+    generator = make_generator()
+    loaded, seen = [], []
+
+    async def load(document_id):
+        loaded.append(document_id)
+        return [{"_key": document_id}], []
+
+    async def generate(document_id, max_pairs=None, document_data=None):
+        if document_id == "bad":
+            raise ValueError("boom")
+        return document_id, document_data
+
+    generator._load_document_data = load
+    generator.generate_for_document = generate
+
+    results = asyncio.run(generator.generate_for_documents(
+        ["a", "bad", "c"],
+        return_exceptions=True,
+        progress_callback=lambda document_id, result: seen.append(document_id)
+    ))
+    generator.close()
+
+    assert results[0] == ("a", ([{"_key": "a"}], []))
+    assert isinstance(results[1], ValueError)
+    assert results[2] == ("c", ([{"_key": "c"}], []))
+    assert loaded == ["a", "bad", "c"]
+    assert seen == ["a", "bad", "c"]
+
+
+def test_failed_document_cancels_pending_prefetch():
+    generator = make_generator()
+    prefetches = {}
+
+    async def load(document_id):
+        prefetches[document_id] = asyncio.current_task()
+        if document_id != "a":
+            await asyncio.sleep(10)
+        return [], []
+
+    async def generate(document_id, max_pairs=None, document_data=None):
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    generator._load_document_data = load
+    generator.generate_for_document = generate
+
+    start = time.perf_counter()
+    try:
+        asyncio.run(generator.generate_for_documents(["a", "b"]))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected the document failure to propagate")
+    generator.close()
+
+    assert time.perf_counter() - start < 5
+    assert prefetches["b"].cancelled()
+
+
+def test_close_shuts_down_generator_and_validator_executors():
+    from arangodb.qa_generation.validator import QAValidator
+
+    generator = make_generator()
+    generator.close()
+    assert generator.adb._executor._shutdown
+
+    validator = QAValidator(Wrapper(FakeDB()))
+    validator.close()
+    assert validator.adb._executor._shutdown
+
+    # A validator never shuts down a handle it was given
+    shared = AsyncDatabase(FakeDB())
+    borrowing = QAValidator(Wrapper(FakeDB()), async_db=shared)
+    borrowing.close()
+    assert not shared._executor._shutdown
+    shared.close()
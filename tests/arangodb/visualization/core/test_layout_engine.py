@@ -0,0 +1,109 @@
+"""
+Module: test_layout_engine.py
+Description: Test suite for server-side graph layouts
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+- numpy: https://numpy.org/doc/stable/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.visualization.core import layout_engine
+from arangodb.visualization.core.layout_engine import LayoutEngine, clear_layout_cache
+
+
+def make_communities(n_per_group=300, groups=4, seed=0):
+    """Dense groups with a few links between them."""
+    rng = np.random.default_rng(seed)
+    n = n_per_group * groups
+    links = []
+    for i in range(n):
+        group = i // n_per_group
+        for _ in range(2):
+            j = group * n_per_group + int(rng.integers(0, n_per_group))
+            if j != i:
+                links.append({"source": str(i), "target": str(j)})
+    for g in range(groups - 1):
+        links.append({"source": str(g * n_per_group), "target": str((g + 1) * n_per_group)})
+    return {"nodes": [{"id": str(i)} for i in range(n)], "links": links}
+
+
+def test_force_layout_separates_communities_on_canvas():
+    clear_layout_cache()
+    graph = make_communities()
+
+    positions = LayoutEngine().compute(graph, "force", width=800, height=600)
+
+    assert positions.shape == (1200, 2)
+    assert positions[:, 0].min() >= 0 and positions[:, 0].max() <= 800
+    assert positions[:, 1].min() >= 0 and positions[:, 1].max() <= 600
+
+    groups = positions.reshape(4, 300, 2)
+    spread = np.linalg.norm(groups - groups.mean(axis=1, keepdims=True), axis=2).mean()
+    centres = groups.mean(axis=1)
+    separation = np.linalg.norm(centres[:, None] - centres[None, :], axis=2)[np.triu_indices(4, 1)].min()
+    assert separation > spread
+
+
+def test_layouts_are_cached_by_graph_hash():
+    clear_layout_cache()
+    graph = make_communities(n_per_group=50, groups=2)
+    engine = LayoutEngine()
+
+    first = engine.compute(graph, "force")
+    hits = layout_engine._cache.hits
+    # Same structure in a fresh payload hits the cache
+    second = engine.compute(make_communities(n_per_group=50, groups=2), "force")
+
+    assert layout_engine._cache.hits == hits + 1
+    assert second is first
+    assert not second.flags.writeable
+
+
+def test_tree_and_radial_coordinates():
+    graph = {
+        "nodes": [{"id": "root"}, {"id": "a"}, {"id": "b"}, {"id": "a1"}],
+        "links": [
+            {"source": "root", "target": "a"},
+            {"source": "root", "target": "b"},
+            {"source": "a", "target": "a1"}
+        ]
+    }
+    engine = LayoutEngine()
+
+    tree = engine.compute(graph, "tree", width=400, height=300)
+    # Depth grows along x; siblings share a column
+    assert tree[0, 0] < tree[1, 0] == tree[2, 0] < tree[3, 0]
+
+    radial = engine.compute(graph, "radial", width=400, height=400)
+    distance = np.linalg.norm(radial - radial[0], axis=1)
+    assert distance[1] > 0 and np.isclose(distance[1], distance[2]) and distance[3] > distance[1]
+
+
+def test_apply_sets_positions_and_skips_dangling_links():
+    graph = {
+        "nodes": [{"id": "a"}, {"id": "b"}],
+        "links": [{"source": "a", "target": "b"}, {"source": "a", "target": "missing"}]
+    }
+
+    LayoutEngine().apply(graph, "force", width=200, height=100)
+
+    assert all("x" in node and "y" in node for node in graph["nodes"])
@@ -0,0 +1,137 @@
+"""
+Module: test_lod_index.py
+Description: Test suite for the level-of-detail supernode hierarchy and tile encoding
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+- numpy: https://numpy.org/doc/stable/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import json
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.visualization.core.lod_index import (
+    EDGE_RECORD,
+    MAX_CHILDREN,
+    NODE_RECORD,
+    TOP_LEVEL_SIZE,
+    GraphLODIndex,
+    encode_binary,
+    encode_ndjson,
+    lod_graph_id,
+)
+
+
+def make_clustered_graph(n=20000, groups=40, seed=0):
+    """Communities placed around random centres, mostly linked internally."""
+    rng = np.random.default_rng(seed)
+    community = rng.integers(0, groups, n)
+    centres = rng.uniform(0, 10000, (groups, 2))
+    positions = centres[community] + rng.normal(0, 60, (n, 2))
+    members = [np.flatnonzero(community == c) for c in range(groups)]
+    links = []
+    for i in range(n):
+        for j in rng.choice(members[community[i]], 3):
+            if j != i:
+                links.append({"source": f"n{i}", "target": f"n{j}"})
+    nodes = [
+        {"id": f"n{i}", "name": f"Node {i}", "x": float(positions[i, 0]), "y": float(positions[i, 1])}
+        for i in range(n)
+    ]
+    return {"nodes": nodes, "links": links}
+
+
+GRAPH = make_clustered_graph()
+INDEX = GraphLODIndex.from_graph(GRAPH)
+
+
+def test_hierarchy_shrinks_to_top_level_with_bounded_fanout():
+    counts = [level.count for level in INDEX.levels]
+
+    assert counts[0] == 20000
+    assert counts == sorted(counts, reverse=True)
+    assert counts[-1] <= TOP_LEVEL_SIZE
+    for level in INDEX.levels[1:]:
+        assert np.diff(level.child_offsets).max() <= MAX_CHILDREN
+        # Every leaf is accounted for at every level
+        assert level.size.sum() == 20000
+
+
+def test_viewport_budget_selects_finer_levels_when_zoomed():
+    overview = INDEX.tile(max_items=1000)
+    assert overview.level > 0
+    assert overview.count <= 1000
+
+    x, y = GRAPH["nodes"][0]["x"], GRAPH["nodes"][0]["y"]
+    zoomed = INDEX.tile((x - 100, y - 100, x + 100, y + 100), max_items=1000)
+    assert zoomed.level == 0
+    assert "n0" in zoomed.ids
+    assert ((zoomed.x >= x - 100) & (zoomed.x <= x + 100)).all()
+
+
+def test_children_expand_supernodes_with_internal_edges():
+    top = len(INDEX.levels) - 1
+    members = INDEX.children(top, [0])
+
+    assert members.level == top - 1
+    assert members.size.sum() == INDEX.levels[top].size[0]
+    assert set(members.source.tolist()) | set(members.target.tolist()) <= set(members.index.tolist())
+
+
+def test_encodings_round_trip():
+    tile = INDEX.tile(max_items=500)
+
+    lines = [json.loads(line) for line in b"".join(encode_ndjson(tile, INDEX, chunk_size=100)).splitlines()]
+    assert lines[0]["type"] == "meta" and lines[-1]["type"] == "end"
+    assert sum(len(line["index"]) for line in lines if line["type"] == "nodes") == tile.count
+    assert sum(len(line["source"]) for line in lines if line["type"] == "edges") == len(tile.source)
+
+    payload = b"".join(encode_binary(tile, INDEX))
+    offset, nodes, edges = 0, 0, 0
+    while True:
+        kind, count = struct.unpack_from("<BI", payload, offset)
+        offset += 5
+        if kind == 1:
+            nodes += count
+            offset += count * NODE_RECORD.itemsize
+        elif kind == 2:
+            edges += count
+            offset += count * EDGE_RECORD.itemsize
+        else:
+            offset += count
+        if kind == 3:
+            break
+    assert (nodes, edges, offset) == (tile.count, len(tile.source), len(payload))
+
+
+def test_graph_id_covers_positions_labels_and_weights():
+    graph = make_clustered_graph(n=50, groups=2)
+    base = lod_graph_id(graph)
+    assert lod_graph_id(json.loads(json.dumps(graph))) == base
+
+    moved = json.loads(json.dumps(graph))
+    moved["nodes"][0]["x"] += 1.0
+    renamed = json.loads(json.dumps(graph))
+    renamed["nodes"][0]["name"] = "Renamed"
+    weighted = json.loads(json.dumps(graph))
+    weighted["links"][0]["value"] = 5
+
+    assert len({base, lod_graph_id(moved), lod_graph_id(renamed), lod_graph_id(weighted)}) == 4
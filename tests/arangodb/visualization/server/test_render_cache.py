@@ -0,0 +1,128 @@
+"""
+Module: test_render_cache.py
+Description: Test suite for the two-tier visualization render cache
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from arangodb.visualization.server.render_cache import InMemoryCacheBackend, RenderCache
+
+HTML = "<html><body>" + "<circle r='5'></circle>" * 500 + "</body></html>"
+ENTRY = {"html": HTML, "layout": "force", "title": "Graph", "recommendation": None}
+
+
+def test_html_stored_compressed_apart_from_metrics():
+    backend = InMemoryCacheBackend()
+    cache = RenderCache(backend)
+    cache.put("k", ENTRY, ttl=60)
+
+    blob = backend.get("viz:html:k")
+    assert len(blob) < len(HTML) / 10
+    assert HTML in zlib.decompress(blob).decode()
+    assert backend.hget("viz:meta:k", "access_count") == b"1"
+
+
+def test_hit_keeps_ttl_and_does_not_rewrite_html():
+    backend = InMemoryCacheBackend()
+    cache = RenderCache(backend, local_size=0)
+    cache.put("k", ENTRY, ttl=60)
+    blob = backend.get("viz:html:k")
+    expires = backend._expires["viz:html:k"]
+
+    entry = cache.get("k")
+    assert entry["html"] == HTML
+    assert entry["access_count"] == 2
+    assert backend.get("viz:html:k") is blob
+    assert backend._expires["viz:html:k"] == expires
+    assert "viz:meta:k" in backend._expires
+
+
+def test_concurrent_hits_are_all_counted():
+    backend = InMemoryCacheBackend()
+    cache = RenderCache(backend)
+    cache.put("k", ENTRY, ttl=60)
+
+    def hit():
+        for _ in range(50):
+            cache.get("k")
+
+    threads = [threading.Thread(target=hit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert int(backend.hget("viz:meta:k", "access_count")) == 1 + 8 * 50
+
+
+def test_local_tier_serves_hits_and_backend_refills_it():
+    backend = InMemoryCacheBackend()
+    cache = RenderCache(backend, local_size=1)
+    cache.put("a", ENTRY, ttl=60)
+    cache.get("a")
+    assert cache.local_hits == 1 and cache.backend_hits == 0
+
+    # Evicts "a" from the local tier; the backend still has it
+    cache.put("b", ENTRY, ttl=60)
+    assert cache.get("a")["title"] == "Graph"
+    assert cache.backend_hits == 1
+
+    # A different process sees the same entry through the backend
+    other = RenderCache(backend)
+    assert other.get("b")["access_count"] == 2
+
+
+def test_expired_entries_miss():
+    cache = RenderCache(InMemoryCacheBackend())
+    cache.put("k", ENTRY, ttl=1)
+    time.sleep(1.1)
+    assert cache.get("k") is None
+    assert cache.misses == 1
+
+
+def test_stats_and_clear():
+    backend = InMemoryCacheBackend()
+    cache = RenderCache(backend)
+    cache.put("a", ENTRY, ttl=60)
+    cache.put("b", ENTRY, ttl=60)
+    cache.get("a")
+    backend.set("viz:legacy", b"{}")
+
+    stats = cache.stats()
+    assert stats["total_cached"] == 2
+    assert stats["total_accesses"] == 3
+    assert stats["cache_available"] is True
+
+    assert cache.clear() == 2
+    assert list(backend.scan_iter(match="viz:*")) == []
+    assert cache.get("a") is None
+
+
+def test_without_backend_uses_local_tier_only():
+    cache = RenderCache(None)
+    cache.put("k", ENTRY, ttl=60)
+    assert cache.get("k")["access_count"] == 2
+    stats = cache.stats()
+    assert stats["cache_available"] is False
+    assert stats["total_cached"] == 1
@@ -0,0 +1,14 @@
+"""
+Module: __init__.py
+Description: Package initialization and exports
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
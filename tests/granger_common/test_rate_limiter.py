@@ -0,0 +1,128 @@
+"""
+Module: test_rate_limiter.py
+Description: Test suite for the token-bucket rate limiter and its shared backends
+
+External Dependencies:
+- pytest: https://docs.pytest.org/
+
+Sample Input:
+>>> # See function docstrings for specific examples
+
+Expected Output:
+>>> # See function docstrings for expected results
+
+Example Usage:
+>>> # Import and use as needed based on module functionality
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent / "src"
+if src_path.exists() and str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from granger_common.rate_limiter import (
+    FileBucketBackend,
+    RateLimiter,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code=429, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = FakeResponse(headers=headers)
+
+
+def test_burst_then_sustained_rate():
+    limiter = RateLimiter(calls_per_second=20, burst_size=3, name="test")
+
+    start = time.perf_counter()
+    assert all(limiter.acquire(timeout=1.0) for _ in range(3))
+    assert time.perf_counter() - start < 0.02
+
+    assert limiter.acquire(timeout=1.0)
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_acquire_fails_fast_when_wait_exceeds_timeout():
+    limiter = RateLimiter(calls_per_second=1, burst_size=1, name="test")
+    assert limiter.acquire(timeout=0.01)
+
+    start = time.perf_counter()
+    assert not limiter.acquire(timeout=0.01)
+    assert time.perf_counter() - start < 0.01
+
+
+def test_async_waiters_are_served_in_order():
+    limiter = RateLimiter(calls_per_second=50, burst_size=1, name="test")
+    order = []
+
+    async def call(i):
+        assert await limiter.acquire_async(timeout=2.0)
+        order.append(i)
+
+    async def run():
+        await asyncio.gather(*[call(i) for i in range(6)])
+
+    asyncio.run(run())
+    assert order == list(range(6))
+    assert limiter.get_stats()["waiting"] == 0
+
+
+def test_async_timeout_releases_place_in_queue():
+    limiter = RateLimiter(calls_per_second=5, burst_size=1, name="test")
+
+    async def run():
+        assert await limiter.acquire_async(timeout=1.0)
+        timed_out = await limiter.acquire_async(timeout=0.01)
+        later = await limiter.acquire_async(timeout=1.0)
+        return timed_out, later
+
+    assert asyncio.run(run()) == (False, True)
+
+
+def test_throttle_lowers_rate_once_and_pauses():
+    limiter = RateLimiter(calls_per_second=10, burst_size=5, name="test")
+
+    assert limiter.report_throttled(retry_after=0.2) == 5
+    # Further 429s from the same burst only extend the pause
+    assert limiter.report_throttled(retry_after=0.2) == 5
+    assert not limiter.acquire(timeout=0.05)
+
+    for _ in range(200):
+        limiter.report_success()
+    assert limiter.get_stats()["current_rate"] == 10
+
+
+def test_file_backend_shares_budget_between_limiters(tmp_path):
+    path = str(tmp_path / "api.bucket")
+    first = RateLimiter(calls_per_second=1, burst_size=2, name="a", backend=FileBucketBackend(path))
+    second = RateLimiter(calls_per_second=1, burst_size=2, name="b", backend=FileBucketBackend(path))
+
+    assert first.acquire(timeout=0.01)
+    assert second.acquire(timeout=0.01)
+    assert not first.acquire(timeout=0.01)
+    assert not second.acquire(timeout=0.01)
+
+    first.report_throttled(retry_after=5)
+    assert second.get_stats()["current_rate"] == 0.5
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds(FakeRateLimitError({"Retry-After": "3"})) == 3.0
+    assert retry_after_seconds(FakeRateLimitError({"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(FakeRateLimitError({})) is None
+    assert is_rate_limit_error(FakeRateLimitError({}))
+    assert not is_rate_limit_error(ValueError("boom"))